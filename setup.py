@@ -58,6 +58,10 @@ setup(
         "rdp": ["rdp>=0.8"],
         "arrow": ["pyarrow>=17.0.0,<18.0"],
         "mssql": ["pyodbc>=4"],
+        "polars": ["polars>=1.0,<2.0"],
+        "calamine": ["python-calamine>=0.2,<1.0"],
+        "zstd": ["zstandard>=0.22,<1.0"],
+        "lz4": ["lz4>=4.3,<5.0"],
     },
     cmdclass={"build_py": NPMInstall},
 )
@@ -342,8 +342,8 @@ class Config:
         Parameters:
             storage_type (str): The default storage type for all data node configurations.
                 The possible values are *"pickle"* (the default value), *"csv"*, *"excel"*,
-                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"generic"*,
-                or *"s3_object"*.
+                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"npy"*,
+                *"arrow_ipc"*, *"generic"*, or *"s3_object"*.
             scope (Optional[Scope^]): The default scope for all data node configurations.<br/>
                 The default value is `Scope.SCENARIO`.
             validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
@@ -394,8 +394,8 @@ class Config:
                 are None (which is the default value of *"pickle"*, unless it has been overloaded by the
                 *storage_type* value set in the default data node configuration
                 (see `(Config.)set_default_data_node_configuration()^`)), *"pickle"*, *"csv"*, *"excel"*,
-                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"mongo_collection"*, *"in_memory"*, or
-                *"generic"*.
+                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"npy"*, *"arrow_ipc"*, *"mongo_collection"*,
+                *"in_memory"*, or *"generic"*.
             scope (Optional[Scope^]): The scope of the data node configuration.<br/>
                 The default value is `Scope.SCENARIO` (or the one specified in
                 `(Config.)set_default_data_node_configuration()^`).
@@ -405,7 +405,16 @@ class Config:
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
-            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.<br/>
+                The *shared_memory* property (bool) can be set to True so that the data is read once
+                and mapped by all the worker processes reading it in *"standalone"* mode (see the
+                *shared_memory_budget* parameter of `(Config.)configure_job_executions()^`). Only
+                NumPy arrays and pandas dataframes are shared, and only the arrays and the numeric
+                dataframe columns without missing values are mapped without copy.
+                The *read_cache* property (bool) can be set to True so that the data read is kept in
+                memory until it is edited (see the *read_cache_budget* and *read_cache_mode* parameters of
+                `(Config.)configure_core()^`). The *read_cache_mode* property (str) overrides the
+                *read_cache_mode* of the core configuration for this data node.
 
         Returns:
             The new data node configuration.
@@ -430,7 +439,8 @@ class Config:
             default_path (Optional[str]): The default path of the CSV file.
             encoding (Optional[str]): The encoding of the CSV file.
             has_header (Optional[bool]): If True, indicates that the CSV file has a header.
-            exposed_type (Optional[str]): The exposed type of the data read from CSV file.<br/>
+            exposed_type (Optional[str]): The exposed type of the data read from CSV file. Possible values
+                are *"pandas"*, *"numpy"*, *"arrow"* (`pyarrow.Table`), *"polars"*, or a custom class.<br/>
                 The default value is `pandas`.
             scope (Optional[Scope^]): The scope of the CSV data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
@@ -456,6 +466,9 @@ class Config:
         decoder: Optional[json.JSONDecoder] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        format: Optional[str] = None,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new JSON data node configuration.
@@ -474,6 +487,15 @@ class Config:
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            format (Optional[str]): The format of the file: *"json"* for a single JSON document, or
+                *"jsonl"* for JSON Lines (one JSON value per line).<br/>
+                The default value is *"json"*. Appending to a JSON Lines file only writes the new lines.
+            compression (Optional[str]): The algorithm used to compress the file: *"zstd"*, *"lz4"*,
+                *"gzip"*, or None for an uncompressed file.<br/>
+                The default value is None. The *"zstd"* and *"lz4"* algorithms require the `zstandard` and
+                `lz4` packages.
+            compression_level (Optional[int]): The compression level. If None, the default level of the
+                algorithm is used.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -492,6 +514,7 @@ class Config:
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        partition_cols: Optional[List[str]] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new Parquet data node configuration.
@@ -510,7 +533,8 @@ class Config:
                 `pandas.DataFrame.write_parquet()` function.<br/>
                 The parameters in *read_kwargs* and *write_kwargs* have a **higher precedence** than the
                 top-level parameters which are also passed to Pandas.
-            exposed_type (Optional[str]): The exposed type of the data read from Parquet file.<br/>
+            exposed_type (Optional[str]): The exposed type of the data read from Parquet file. Possible values
+                are *"pandas"*, *"numpy"*, *"arrow"* (`pyarrow.Table`), *"polars"*, or a custom class.<br/>
                 The default value is `pandas`.
             scope (Optional[Scope^]): The scope of the Parquet data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
@@ -520,12 +544,88 @@ class Config:
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            partition_cols (Optional[List[str]]): The columns used to partition the data in a directory
+                per value (Hive layout).<br/>
+                With the *"pyarrow"* engine, appending data writes new files in the matching partitions
+                without rewriting the existing ones, and filters on the partition columns only read the
+                matching directories. *default_path* is then the root directory of the dataset.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
             The new Parquet data node configuration.
         """  # noqa: E501
 
+    @classmethod
+    def configure_npy_data_node(
+        cls,
+        id: str,
+        default_path: Optional[str] = None,
+        mmap_mode: Optional[str] = None,
+        scope: Optional[Scope] = None,
+        validity_period: Optional[timedelta] = None,
+        **properties,
+    ) -> "DataNodeConfig":
+        """Configure a new NumPy `.npy` data node configuration.
+
+        The arrays read from the data nodes are memory-mapped from their file.
+
+        Parameters:
+            id (str): The unique identifier of the new `.npy` data node configuration.
+            default_path (Optional[str]): The default path of the `.npy` file.
+            mmap_mode (Optional[str]): The mode used to memory-map the file when reading it. Possible
+                values are *"r"* (read-only) or *"c"* (copy-on-write).<br/>
+                The default value is *"r"*. On Windows, where a memory-mapped file cannot be replaced until
+                the arrays read from it are released, the array is loaded in memory by default.
+            scope (Optional[Scope^]): The scope of the `.npy` data node configuration.<br/>
+                The default value is `Scope.SCENARIO`.
+            validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
+                considered up-to-date. Once the validity period has passed, the data node is considered stale and
+                relevant tasks will run even if they are skippable (see the Task configuration
+                [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
+                for more details).
+                If *validity_period* is set to None, the data node is always up-to-date.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+
+        Returns:
+            The new `.npy` data node configuration.
+        """  # noqa: E501
+
+    @classmethod
+    def configure_arrow_ipc_data_node(
+        cls,
+        id: str,
+        default_path: Optional[str] = None,
+        exposed_type: Optional[str] = None,
+        scope: Optional[Scope] = None,
+        validity_period: Optional[timedelta] = None,
+        **properties,
+    ) -> "DataNodeConfig":
+        """Configure a new Arrow IPC data node configuration.
+
+        The files of the data nodes are memory-mapped when they are read, except on Windows where a
+        memory-mapped file cannot be replaced.
+
+        Parameters:
+            id (str): The unique identifier of the new Arrow IPC data node configuration.
+            default_path (Optional[str]): The default path of the Arrow IPC file.
+            exposed_type (Optional[str]): The exposed type of the data read from the Arrow IPC file. Possible
+                values are *"arrow"* (`pyarrow.Table`), *"polars"*, *"pandas"*, *"numpy"*, or a custom
+                class.<br/>
+                The default value is *"arrow"*. The *"arrow"* and *"polars"* exposed types do not copy the data.
+            scope (Optional[Scope^]): The scope of the Arrow IPC data node configuration.<br/>
+                The default value is `Scope.SCENARIO`.
+            validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
+                considered up-to-date. Once the validity period has passed, the data node is considered stale and
+                relevant tasks will run even if they are skippable (see the Task configuration
+                [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
+                for more details).
+                If *validity_period* is set to None, the data node is always up-to-date.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+
+        Returns:
+            The new Arrow IPC data node configuration.
+        """  # noqa: E501
+
     @classmethod
     def configure_excel_data_node(
         cls,
@@ -536,6 +636,8 @@ class Config:
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        engine: Optional[str] = None,
+        lazy_sheets: Optional[bool] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new Excel data node configuration.
@@ -556,6 +658,13 @@ class Config:
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            engine (Optional[str]): The library used to read the Excel file. Possible values are
+                *"openpyxl"* or *"calamine"*.<br/>
+                The default value is *"openpyxl"*. The *"calamine"* engine parses large workbooks much
+                faster. It requires the *python-calamine* package and pandas 2.2 or higher.
+            lazy_sheets (Optional[bool]): If True, reading several sheets returns a read-only mapping
+                where each sheet is only parsed when it is first accessed.<br/>
+                The default value is False.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -638,6 +747,9 @@ class Config:
         default_data: Optional[Any] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        out_of_band: bool = False,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new pickle data node configuration.
@@ -657,6 +769,16 @@ class Config:
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            compression (Optional[str]): The algorithm used to compress the file: *"zstd"*, *"lz4"*,
+                *"gzip"*, or None for an uncompressed file.<br/>
+                The default value is None. The *"zstd"* and *"lz4"* algorithms require the `zstandard` and
+                `lz4` packages.
+            compression_level (Optional[int]): The compression level. If None, the default level of the
+                algorithm is used.
+            out_of_band (bool): If True, the contiguous buffers of NumPy arrays and pandas objects are written
+                out-of-band, directly from the memory of the objects to the file.<br/>
+                The default value is False. The files that are compressed or written with out-of-band buffers
+                can only be read by a pickle data node.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -681,6 +803,9 @@ class Config:
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        insert_batch_size: Optional[int] = None,
+        db_pool_size: Optional[int] = None,
+        db_max_overflow: Optional[int] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new SQL table data node configuration.
@@ -706,7 +831,8 @@ class Config:
                 The default value is ".db".
             db_extra_args (Optional[dict[str, any]]): A dictionary of additional arguments to be passed
                 into database connection string.
-            exposed_type (Optional[str]): The exposed type of the data read from SQL table.<br/>
+            exposed_type (Optional[str]): The exposed type of the data read from SQL table. Possible values
+                are *"pandas"*, *"numpy"*, *"arrow"* (`pyarrow.Table`), *"polars"*, or a custom class.<br/>
                 The default value is "pandas".
             scope (Optional[Scope^]): The scope of the SQL data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
@@ -716,6 +842,15 @@ class Config:
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            insert_batch_size (Optional[int]): The maximum number of rows sent to the database in a single
+                insert statement when writing or appending data.<br/>
+                The default value is 10000.
+            db_pool_size (Optional[int]): The number of connections kept open in the connection pool shared
+                by the data nodes of the same database.<br/>
+                The default value is the SQLAlchemy default of the database engine.
+            db_max_overflow (Optional[int]): The number of connections that can be opened beyond *db_pool_size*
+                when all the pooled connections are in use.<br/>
+                The default value is the SQLAlchemy default of the database engine.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -742,6 +877,8 @@ class Config:
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        db_pool_size: Optional[int] = None,
+        db_max_overflow: Optional[int] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new SQL data node configuration.
@@ -752,6 +889,9 @@ class Config:
             db_engine (str): The database engine. Possible values are *"sqlite"*, *"mssql"*, *"mysql"*,
                 or *"postgresql"*.
             read_query (str): The SQL query string used to read the data from the database.
+                The query is selected from to filter, sort, and page the rows on the database server. With
+                the *"mssql"* engine, a query with an ORDER BY clause but no TOP, OFFSET, or FOR XML clause
+                cannot be selected from, so its rows are filtered, sorted, and paged in memory.
             write_query_builder (Callable): A callback function that takes the data as an input parameter
                 and returns a list of SQL queries to be executed when writing data to the data node.
             append_query_builder (Optional[Callable]): A callback function that takes the data as an input parameter
@@ -771,7 +911,8 @@ class Config:
                 The default value is ".db".
             db_extra_args (Optional[dict[str, any]]): A dictionary of additional arguments to be passed
                 into database connection string.
-            exposed_type (Optional[str]): The exposed type of the data read from SQL query.<br/>
+            exposed_type (Optional[str]): The exposed type of the data read from SQL query. Possible values
+                are *"pandas"*, *"numpy"*, *"arrow"* (`pyarrow.Table`), *"polars"*, or a custom class.<br/>
                 The default value is "pandas".
             scope (Optional[Scope^]): The scope of the SQL data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
@@ -781,6 +922,12 @@ class Config:
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            db_pool_size (Optional[int]): The number of connections kept open in the connection pool shared
+                by the data nodes of the same database.<br/>
+                The default value is the SQLAlchemy default of the database engine.
+            db_max_overflow (Optional[int]): The number of connections that can be opened beyond *db_pool_size*
+                when all the pooled connections are in use.<br/>
+                The default value is the SQLAlchemy default of the database engine.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -802,6 +949,10 @@ class Config:
         db_extra_args: Optional[Dict[str, Any]] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        batch_size: Optional[int] = None,
+        id_field: Optional[str] = None,
+        projection: Optional[List[str]] = None,
+        indexes: Optional[List[Union[str, List, Dict[str, Any]]]] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new Mongo collection data node configuration.
@@ -832,6 +983,18 @@ class Config:
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            batch_size (Optional[int]): The number of documents fetched per round trip when reading, and
+                sent per request when writing.<br/>
+                If not provided, the default batch size of the driver is used for reading and the documents
+                are written in a single request.
+            id_field (Optional[str]): The document field that identifies the documents. If provided, the
+                documents are upserted on this field, and writing the data node deletes the documents
+                that are not written again instead of dropping the collection.
+            projection (Optional[list[str]]): The fields of the documents that are read.<br/>
+                If not provided, all the fields are read.
+            indexes (Optional[list]): The indexes created on the collection before writing to it. Each
+                index is a field name, a list of (field name, direction) pairs, or a dictionary with the
+                *keys* of the index and the pymongo index options (*unique*, *name*, ...).
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -884,6 +1047,8 @@ class Config:
         input: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         output: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         skippable: bool = False,
+        input_columns: Optional[Dict[str, List]] = None,
+        incremental: Optional[bool] = None,
         **properties,
     ) -> "TaskConfig":
         """Configure a new task configuration.
@@ -900,6 +1065,20 @@ class Config:
             skippable (bool): If True, indicates that the task can be skipped if no change has
                 been made on inputs.<br/>
                 The default value is False.
+            input_columns (Optional[Dict[str, List]]): The columns the function reads from its
+                input data nodes, indexed by the input data node configuration id. Only these
+                columns are loaded from the storage of the corresponding data nodes.<br/>
+                The default value is None, meaning all the columns are read.
+            incremental (Optional[bool]): If True, the task is incremental: instead of the full data of
+                its inputs, the function receives the rows appended to each input since the last
+                successful execution of the task, followed by the data of its outputs as written by
+                that execution. The function returns the new data of the outputs, computed from the
+                previous one and the appended rows.<br/>
+                The inputs are read in full, and the function receives None for its outputs, on the
+                first execution, or when an input or an output was edited otherwise than by appending
+                rows (with `DataNode.append()^`) since the last execution. The inputs that are not made
+                of rows, such as parameters, are always read in full.<br/>
+                The default value is None, meaning the task is not incremental.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -940,7 +1119,11 @@ class Config:
 
     @staticmethod
     def configure_job_executions(
-        mode: Optional[str] = None, max_nb_of_workers: Optional[Union[int, str]] = None, **properties
+        mode: Optional[str] = None,
+        max_nb_of_workers: Optional[Union[int, str]] = None,
+        task_fusion: Optional[Union[bool, str]] = None,
+        shared_memory_budget: Optional[Union[int, str]] = None,
+        **properties,
     ) -> "JobConfig":
         """Configure job execution.
 
@@ -953,6 +1136,19 @@ class Config:
                 A string can be provided to dynamically set the value using an environment
                 variable. The string must follow the pattern: `ENV[&lt;env_var&gt;]` where
                 `&lt;env_var&gt;` is the name of an environment variable.
+            task_fusion (Optional[bool, str]): If True, the chains of tasks whose intermediate data nodes are
+                not read by any other task of the submission are executed one after the other by a single
+                worker. The intermediate data are handed over in memory instead of being read back from
+                the storage. Each task still gets its own job.<br/>
+                The default value is False.
+            shared_memory_budget (Optional[int, str]): Parameter used only in *"standalone"* mode.
+                The maximum number of bytes of shared memory used to broadcast the inputs of the jobs to
+                the worker processes. The data nodes configured with the `shared_memory` property set to
+                True are read once, and their data (a NumPy array or a pandas DataFrame) is mapped
+                by all the workers reading the same data node version. The arrays and the numeric
+                dataframe columns without missing values are mapped without copy; the other dataframe
+                columns and the index are copied by each worker.<br/>
+                The default value is None, which disables the shared memory cache.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -970,6 +1166,9 @@ class Config:
         mode: Optional[str] = None,
         version_number: Optional[str] = None,
         force: Optional[bool] = None,
+        read_cache_budget: Optional[Union[int, str]] = None,
+        read_cache_mode: Optional[str] = None,
+        deduplicate_files: Optional[Union[bool, str]] = None,
         **properties,
     ) -> "CoreSection":
         """Configure the Orchestrator service.
@@ -998,6 +1197,23 @@ class Config:
                  In development mode, the version number is ignored.
             force (Optional[bool]): If True, Taipy will override a version even if the configuration
                 has changed and run the application.
+            read_cache_budget (Optional[int, str]): The maximum number of bytes of data kept in memory by
+                the read cache. The data nodes configured with the `read_cache` property set to True keep
+                the data they read (a pandas DataFrame or Series, or a NumPy array) until it is edited, so
+                that reading it again does not access the storage. The least recently used data is evicted
+                first.<br/>
+                The default value is None, which disables the read cache.
+            read_cache_mode (Optional[str]): How the cached data is returned. Possible values are *"copy"*
+                (a copy of the cached data) or *"view"* (a read-only view of NumPy arrays, or a shallow copy
+                of pandas objects that must not be modified in place). A data node can override it with its
+                `read_cache_mode` property.<br/>
+                The default value is "copy".
+            deduplicate_files (Optional[bool]): If True, the files generated by the file-based data nodes
+                are stored once per content: a file written is hashed and becomes a hard link to a file of
+                the "blobs" folder of the storage folder named after its SHA-256 digest, which the data
+                nodes with byte-identical files share. The blob is removed when no data node references
+                it anymore.<br/>
+                The default value is False.
             **properties (Dict[str, Any]): A keyworded variable length list of additional arguments configure the
                 behavior of the `Orchestrator^` service.
 
@@ -12,8 +12,6 @@
 import math
 from typing import Any, Dict, List, Tuple
 
-import networkx as nx
-
 
 class _Node:
     def __init__(self, entity: Any, x, y):
@@ -30,12 +28,12 @@ class _Edge:
 
 
 class _DAG:
-    def __init__(self, dag: nx.DiGraph):
-        self._sorted_nodes = list(nx.topological_generations(dag))
+    def __init__(self, sorted_nodes: List[List[Any]], edges: List[Tuple[Any, Any]]):
+        self._sorted_nodes = sorted_nodes
         self._length, self._width = self.__compute_size()
         self._grid_length, self._grid_width = self.__compute_grid_size()
         self._nodes = self.__compute_nodes()
-        self._edges = self.__compute_edges(dag)
+        self._edges = self.__compute_edges(edges)
 
     @property
     def width(self) -> int:
@@ -79,5 +77,5 @@ class _DAG:
             x += 1
         return nodes
 
-    def __compute_edges(self, dag) -> List[_Edge]:
-        return [_Edge(self.nodes[edge[0].id], self.nodes[edge[1].id]) for edge in dag.edges()]
+    def __compute_edges(self, edges: List[Tuple[Any, Any]]) -> List[_Edge]:
+        return [_Edge(self.nodes[src.id], self.nodes[dest.id]) for src, dest in edges]
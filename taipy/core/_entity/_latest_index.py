@@ -0,0 +1,80 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+
+class _LatestIndex:
+    """In-process index of the most recently created entity of each key.
+
+    A manager owns one index and gives it the function returning the key of its entities, such as the
+    task id of a job. The index is filled from the repository on the first lookup, then updated each time
+    the manager saves or deletes an entity. Deleting the latest entity of a key empties the index, which is
+    filled again on the next lookup.
+
+    Other processes may save entities too. The index is therefore filled again whenever the change marker
+    of the repository differs from the one the index was filled with, or is None.
+    """
+
+    def __init__(self, key: Callable[[Any], str]):
+        self.__key = key
+        self.__latest: Optional[Dict[str, Tuple[float, str]]] = None
+        self.__latest_ids: Set[str] = set()
+        self.__marker: Optional[Any] = None
+
+    def _get_latest(
+        self,
+        key: str,
+        marker: Optional[Any],
+        load_all: Callable[[], Iterable[Any]],
+        load: Callable[[str], Any],
+    ) -> Any:
+        """Return the latest entity of a key, or None if there is none.
+
+        The entity is loaded with *load*. If it no longer exists, or if *marker*, the change marker of the
+        repository read before the call, is None or differs from the marker of the index, the index is filled
+        again with *load_all*.
+        """
+        if marker is None or marker != self.__marker:
+            self._clear()
+        for _ in range(2):
+            if self.__latest is None:
+                self.__latest = {}
+                self.__marker = marker
+                for entity in load_all():
+                    self._update(entity)
+            if (latest := self.__latest.get(key)) is None:
+                return None
+            if (entity := load(latest[1])) is not None:
+                return entity
+            self._clear()
+        return None
+
+    def _update(self, entity: Any) -> None:
+        if self.__latest is None:
+            return
+        key = self.__key(entity)
+        timestamp = entity.creation_date.timestamp()
+        latest = self.__latest.get(key)
+        if latest is None or timestamp > latest[0]:
+            if latest is not None:
+                self.__latest_ids.discard(latest[1])
+            self.__latest[key] = (timestamp, entity.id)
+            self.__latest_ids.add(entity.id)
+
+    def _remove(self, ids: Iterable[str]) -> None:
+        if not self.__latest_ids.isdisjoint(ids):
+            self._clear()
+
+    def _clear(self) -> None:
+        self.__latest = None
+        self.__latest_ids = set()
+        self.__marker = None
@@ -0,0 +1,110 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import networkx as nx
+
+if TYPE_CHECKING:
+    from ..task.task import Task
+
+_NodeKey = Tuple[str, str]
+_Shape = Tuple[Tuple[_NodeKey, Tuple[_NodeKey, ...], Tuple[_NodeKey, ...]], ...]
+
+
+class _Topology:
+    """Topology of the DAG of a set of tasks, computed on node keys instead of entities.
+
+    The nodes of a submittable are keyed by their configuration identifiers, so that all the scenarios
+    created from the same scenario configuration, and all the sequences with the same definition, share
+    a single topology. It is computed once and cached, and the entities are mapped onto its nodes.
+    """
+
+    __TASK = "TASK"
+    __DATA_NODE = "DATANODE"
+    __CACHE_SIZE = 256
+    __cache: Dict[_Shape, "_Topology"] = {}
+
+    def __init__(self, shape: _Shape) -> None:
+        graph = nx.DiGraph()
+        for task_key, input_keys, output_keys in shape:
+            graph.add_node(task_key)
+            graph.add_edges_from((input_key, task_key) for input_key in input_keys)
+            graph.add_edges_from((task_key, output_key) for output_key in output_keys)
+
+        self._edges: List[Tuple[_NodeKey, _NodeKey]] = list(graph.edges)
+        self._generations: List[List[_NodeKey]] = [list(nodes) for nodes in nx.topological_generations(graph)]
+        self._data_nodes: Set[_NodeKey] = {node for node in graph.nodes if self.__is_data_node(node)}
+        self._inputs: Set[_NodeKey] = {node for node in self._data_nodes if graph.in_degree(node) == 0}
+        self._outputs: Set[_NodeKey] = {node for node in self._data_nodes if graph.out_degree(node) == 0}
+        self._intermediates: Set[_NodeKey] = self._data_nodes - self._inputs - self._outputs
+
+        # The input data nodes do not delay the tasks that read them.
+        graph.remove_nodes_from(self._inputs)
+        self._task_generations: List[List[_NodeKey]] = [
+            tasks
+            for nodes in nx.topological_generations(graph)
+            if (tasks := [node for node in nodes if not self.__is_data_node(node)])
+        ]
+
+    @classmethod
+    def _get(cls, tasks: Iterable["Task"]) -> Tuple["_Topology", Dict[_NodeKey, Any]]:
+        """Return the topology of a set of tasks, and the entities mapped by node key."""
+        tasks = list(tasks)
+        entities: Dict[_NodeKey, Any] = {}
+        if (shape := cls.__get_shape(tasks, entities, lambda entity: entity.config_id)) is None:
+            # Several entities share a configuration: the topology is computed on their ids and not cached.
+            entities.clear()
+            return cls(cls.__get_shape(tasks, entities, lambda entity: entity.id)), entities  # type: ignore
+        if (topology := cls.__cache.get(shape)) is None:
+            if len(cls.__cache) >= cls.__CACHE_SIZE:
+                cls.__cache.pop(next(iter(cls.__cache)))
+            topology = cls.__cache[shape] = cls(shape)
+        return topology, entities
+
+    @classmethod
+    def _clear(cls) -> None:
+        cls.__cache.clear()
+
+    @classmethod
+    def __get_shape(
+        cls, tasks: List["Task"], entities: Dict[_NodeKey, Any], key: Callable[[Any], str]
+    ) -> Optional[_Shape]:
+        shape = []
+        for task in tasks:
+            task_key = cls.__add(entities, (cls.__TASK, key(task)), task)
+            input_keys = cls.__add_data_nodes(entities, task.input.values(), key)
+            output_keys = cls.__add_data_nodes(entities, task.output.values(), key)
+            if task_key is None or input_keys is None or output_keys is None:
+                return None
+            shape.append((task_key, input_keys, output_keys))
+        return tuple(sorted(shape))
+
+    @classmethod
+    def __add_data_nodes(
+        cls, entities: Dict[_NodeKey, Any], data_nodes: Iterable[Any], key: Callable[[Any], str]
+    ) -> Optional[Tuple[_NodeKey, ...]]:
+        node_keys = []
+        for dn in data_nodes:
+            if (node_key := cls.__add(entities, (cls.__DATA_NODE, key(dn)), dn)) is None:
+                return None
+            node_keys.append(node_key)
+        return tuple(sorted(node_keys))
+
+    @staticmethod
+    def __add(entities: Dict[_NodeKey, Any], node_key: _NodeKey, entity: Any) -> Optional[_NodeKey]:
+        if entities.setdefault(node_key, entity).id != entity.id:
+            return None
+        return node_key
+
+    @classmethod
+    def __is_data_node(cls, node_key: _NodeKey) -> bool:
+        return node_key[0] == cls.__DATA_NODE
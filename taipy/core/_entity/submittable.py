@@ -11,7 +11,7 @@
 from __future__ import annotations
 
 import abc
-from typing import Any, Callable, List, Optional, Set, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import networkx as nx
 
@@ -23,6 +23,7 @@ from ..reason import DataNodeEditInProgress, DataNodeIsNotWritten, ReasonCollect
 from ..submission.submission import Submission
 from ..task.task import Task
 from ._dag import _DAG
+from ._topology import _Topology
 
 
 class Submittable:
@@ -41,8 +42,8 @@ class Submittable:
         Returns:
             The set of input data nodes.
         """
-        dag = self._build_dag()
-        return self.__get_inputs(dag)
+        topology, entities = self._get_topology()
+        return {entities[node] for node in topology._inputs}
 
     def get_outputs(self) -> Set[DataNode]:
         """Return the set of output data nodes of the submittable entity.
@@ -50,8 +51,8 @@ class Submittable:
         Returns:
             The set of output data nodes.
         """
-        dag = self._build_dag()
-        return self.__get_outputs(dag)
+        topology, entities = self._get_topology()
+        return {entities[node] for node in topology._outputs}
 
     def get_intermediate(self) -> Set[DataNode]:
         """Return the set of intermediate data nodes of the submittable entity.
@@ -59,9 +60,8 @@ class Submittable:
         Returns:
             The set of intermediate data nodes.
         """
-        dag = self._build_dag()
-        all_data_nodes_in_dag = {node for node in dag.nodes if isinstance(node, DataNode)}
-        return all_data_nodes_in_dag - self.__get_inputs(dag) - self.__get_outputs(dag)
+        topology, entities = self._get_topology()
+        return {entities[node] for node in topology._intermediates}
 
     def is_ready_to_run(self) -> ReasonCollection:
         """Indicate if the entity is ready to be run.
@@ -87,8 +87,8 @@ class Submittable:
         Returns:
             The set of data nodes that are being edited.
         """
-        dag = self._build_dag()
-        return {node for node in dag.nodes if isinstance(node, DataNode) and node.edit_in_progress}
+        topology, entities = self._get_topology()
+        return {entities[node] for node in topology._data_nodes if entities[node].edit_in_progress}
 
     @abc.abstractmethod
     def submit(
@@ -112,20 +112,20 @@ class Submittable:
     def _get_set_of_tasks(self) -> Set[Task]:
         raise NotImplementedError
 
-    @staticmethod
-    def __get_inputs(dag: nx.DiGraph) -> Set[DataNode]:
-        return {node for node, degree in dict(dag.in_degree).items() if degree == 0 and isinstance(node, DataNode)}
-
-    @staticmethod
-    def __get_outputs(dag: nx.DiGraph) -> set[DataNode]:
-        return {node for node, degree in dict(dag.out_degree).items() if degree == 0 and isinstance(node, DataNode)}
+    def _get_topology(self) -> Tuple[_Topology, Dict[Any, Any]]:
+        return _Topology._get(self._get_set_of_tasks())
 
     def _get_dag(self) -> _DAG:
-        return _DAG(self._build_dag())
+        topology, entities = self._get_topology()
+        return _DAG(
+            [[entities[node] for node in nodes] for nodes in topology._generations],
+            [(entities[src], entities[dest]) for src, dest in topology._edges],
+        )
 
-    def _build_dag(self) -> nx.DiGraph:
+    def _build_dag(self, tasks: Optional[Iterable[Task]] = None) -> nx.DiGraph:
         graph = nx.DiGraph()
-        tasks = self._get_set_of_tasks()
+        if tasks is None:
+            tasks = self._get_set_of_tasks()
         for task in tasks:
             if has_input := task.input:
                 for predecessor in task.input.values():
@@ -138,10 +138,8 @@ class Submittable:
         return graph
 
     def _get_sorted_tasks(self) -> List[List[Task]]:
-        dag = self._build_dag()
-        remove = [node for node, degree in dict(dag.in_degree).items() if degree == 0 and isinstance(node, DataNode)]
-        dag.remove_nodes_from(remove)
-        return [nodes for nodes in nx.topological_generations(dag) if (Task in (type(node) for node in nodes))]
+        topology, entities = self._get_topology()
+        return [[entities[node] for node in nodes] for nodes in topology._task_generations]
 
     def _add_subscriber(self, callback: Callable, params: Optional[List[Any]] = None) -> None:
         params = [] if params is None else params
@@ -33,6 +33,7 @@ from .taipy import (
     compare_scenarios,
     create_global_data_node,
     create_scenario,
+    create_scenarios,
     delete,
     delete_job,
     delete_jobs,
@@ -96,6 +96,13 @@ class _Manager(Generic[EntityType]):
         """
         cls._repository._save(entity)
 
+    @classmethod
+    def _set_many(cls, entities: Iterable[EntityType]):
+        """
+        Save or update several entities.
+        """
+        cls._repository._save_many(entities)
+
     @classmethod
     def _get_all(cls, version_number: Optional[str] = "all") -> List[EntityType]:
         """
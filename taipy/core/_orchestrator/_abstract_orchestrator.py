@@ -31,6 +31,11 @@ class _AbstractOrchestrator:
     def blocked_jobs(self):
         pass
 
+    @property
+    @abstractmethod
+    def fused_jobs(self):
+        pass
+
     @classmethod
     @abstractmethod
     def initialize(cls):
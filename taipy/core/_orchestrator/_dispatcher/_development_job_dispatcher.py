@@ -9,12 +9,12 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Optional
+from typing import List, Optional
 
 from ...job.job import Job
 from .._abstract_orchestrator import _AbstractOrchestrator
 from ._job_dispatcher import _JobDispatcher
-from ._task_function_wrapper import _TaskFunctionWrapper
+from ._task_function_wrapper import _FusedTaskFunctionWrapper, _TaskFunctionWrapper
 
 
 class _DevelopmentJobDispatcher(_JobDispatcher):
@@ -46,3 +46,13 @@ class _DevelopmentJobDispatcher(_JobDispatcher):
         """
         rs = _TaskFunctionWrapper(job.id, job.task).execute()
         self._update_job_status(job, rs)
+
+    def _dispatch_fused(self, jobs: List[Job]):
+        """Dispatches the given chain of `Job^`s for execution one after the other.
+
+        Parameters:
+            jobs (List[Job^]): The chain of jobs to execute.
+        """
+        wrapper = _FusedTaskFunctionWrapper([job.id for job in jobs], [job.task for job in jobs], force=jobs[0].force)
+        rs = wrapper.execute()
+        self._update_fused_jobs_status(jobs, rs)
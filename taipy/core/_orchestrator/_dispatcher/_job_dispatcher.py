@@ -14,7 +14,7 @@ import time
 import traceback
 from abc import abstractmethod
 from queue import Empty
-from typing import Optional
+from typing import List, Optional
 
 from taipy.common.config import Config
 from taipy.common.logger._taipy_logger import _TaipyLogger
@@ -24,6 +24,7 @@ from ...job._job_manager_factory import _JobManagerFactory
 from ...job.job import Job
 from ...task.task import Task
 from .._abstract_orchestrator import _AbstractOrchestrator
+from ._task_function_wrapper import _FusedTaskFunctionWrapper
 
 
 class _JobDispatcher(threading.Thread):
@@ -96,10 +97,17 @@ class _JobDispatcher(threading.Thread):
         if job.force or self._needs_to_run(job.task):
             if job.force:
                 self._logger.info(f"job {job.id} is forced to be executed.")
-            job.running()
-            self._dispatch(job)
+            if fused_jobs := self.orchestrator._pop_fused_jobs(job):  # type: ignore
+                jobs = [job, *fused_jobs]
+                for j in jobs:
+                    j.running()
+                self._dispatch_fused(jobs)
+            else:
+                job.running()
+                self._dispatch(job)
         else:
             job._unlock_edit_on_outputs()
+            self.orchestrator._release_fused_jobs(job)  # type: ignore
             job.skipped()
             self._logger.info(f"job {job.id} is skipped.")
 
@@ -147,6 +155,28 @@ class _JobDispatcher(threading.Thread):
         """
         raise NotImplementedError
 
+    def _dispatch_fused(self, jobs: List[Job]):
+        """
+        Dispatches the given chain of `Job^`s on a single available worker for execution.
+
+        Parameters:
+            jobs (List[Job^]): The chain of jobs to execute one after the other.
+        """
+        raise NotImplementedError
+
+    def _update_fused_jobs_status(self, jobs: List[Job], results):
+        """Update the status of each job of a fused chain based on its own execution result."""
+        for job, exceptions in zip(jobs, results):
+            if exceptions is None:
+                job.abandoned()
+                self.orchestrator._fail_subsequent_jobs(job)  # type: ignore
+            elif exceptions == _FusedTaskFunctionWrapper._SKIPPED:
+                job._unlock_edit_on_outputs()
+                job.skipped()
+                self._logger.info(f"job {job.id} is skipped.")
+            else:
+                self._update_job_status(job, exceptions)
+
     @staticmethod
     def _update_job_status(job: Job, exceptions):
         """Update the job status based on the success or the failure of its execution."""
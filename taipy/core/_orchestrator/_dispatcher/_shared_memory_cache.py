@@ -0,0 +1,200 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from multiprocessing import shared_memory
+from threading import Lock
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from taipy.common.logger._taipy_logger import _TaipyLogger
+
+from ...data._data_manager_factory import _DataManagerFactory
+from ...data.data_node_id import DataNodeId
+from ...task.task import Task
+
+
+class _SharedBlock(NamedTuple):
+    """Picklable description of a data node value materialized in a shared memory block."""
+
+    name: str
+    kind: str
+    size: int
+    dtype: Optional[str] = None
+    shape: Optional[Tuple[int, ...]] = None
+
+
+class _SharedMemoryCache:
+    """Materializes large read-only inputs in shared memory so worker processes can map them without copy.
+
+    The cache lives in the process dispatching the jobs. An input data node is materialized once per
+    (data node id, last edit date). Blocks are evicted in a least recently used order to stay under the
+    memory budget. Only NumPy arrays (raw buffer) and pandas dataframes (Arrow IPC stream) are shared.
+
+    The workers map NumPy arrays without copy. For dataframes, only the integer and floating point columns
+    without missing values are mapped without copy; the other columns and the index are copied by each
+    worker when the stream is converted back to pandas. The data mapped without copy is read-only.
+    """
+
+    _SHARED_MEMORY_KEY = "shared_memory"
+    _NDARRAY = "ndarray"
+    _DATAFRAME = "dataframe"
+
+    __logger = _TaipyLogger._get_logger()
+
+    def __init__(self, budget: int):
+        self._budget = budget
+        self._size = 0
+        self._blocks: OrderedDict[Tuple[DataNodeId, datetime], Tuple[shared_memory.SharedMemory, _SharedBlock]] = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    def _prepare(self, tasks: Iterable[Task]) -> Dict[DataNodeId, _SharedBlock]:
+        """Return the shared memory blocks of the task inputs opted in, materializing the missing ones."""
+        data_manager = _DataManagerFactory._build_manager()
+        tasks = list(tasks)
+        produced_dn_ids = {dn.id for task in tasks for dn in task.output.values()}
+        shared_blocks = {}
+        for task in tasks:
+            for dn in task.input.values():
+                if dn.id in produced_dn_ids:
+                    continue
+                data_node = data_manager._get(dn.id)
+                if not data_node.properties.get(self._SHARED_MEMORY_KEY) or not data_node.last_edit_date:
+                    continue
+                if block := self._get_or_create(data_node.id, data_node.last_edit_date, data_node.read_or_raise):
+                    shared_blocks[data_node.id] = block
+        return shared_blocks
+
+    def _get_or_create(self, dn_id: DataNodeId, last_edit_date: datetime, read) -> Optional[_SharedBlock]:
+        key = (dn_id, last_edit_date)
+        with self._lock:
+            if key in self._blocks:
+                self._blocks.move_to_end(key)
+                return self._blocks[key][1]
+            for stale_key in [k for k in self._blocks if k[0] == dn_id]:
+                self.__evict(stale_key)
+            try:
+                shm, block = self.__materialize(read())
+            except Exception as e:
+                self.__logger.warning(f"Data node {dn_id} cannot be shared in memory: {e}")
+                return None
+            if shm is None or block is None:
+                return None
+            self._blocks[key] = (shm, block)
+            self._size += block.size
+            return block
+
+    def __materialize(self, data: Any) -> Tuple[Optional[shared_memory.SharedMemory], Optional[_SharedBlock]]:
+        if isinstance(data, np.ndarray) and not data.dtype.hasobject:
+            if not self.__make_room(data.nbytes):
+                return None, None
+            shm = self.__create_block(data.nbytes)
+            np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)[...] = data
+            return shm, _SharedBlock(shm.name, self._NDARRAY, data.nbytes, data.dtype.str, data.shape)
+        if isinstance(data, pd.DataFrame):
+            table = pa.Table.from_pandas(data)
+            mock_sink = pa.MockOutputStream()
+            with pa.ipc.new_stream(mock_sink, table.schema) as writer:
+                writer.write_table(table)
+            size = mock_sink.size()
+            if not self.__make_room(size):
+                return None, None
+            shm = self.__create_block(size)
+            with pa.ipc.new_stream(pa.FixedSizeBufferWriter(pa.py_buffer(shm.buf)), table.schema) as writer:
+                writer.write_table(table)
+            return shm, _SharedBlock(shm.name, self._DATAFRAME, size)
+        return None, None
+
+    def __make_room(self, size: int) -> bool:
+        if size > self._budget:
+            return False
+        while self._size + size > self._budget and self._blocks:
+            self.__evict(next(iter(self._blocks)))
+        return True
+
+    @staticmethod
+    def __create_block(size: int) -> shared_memory.SharedMemory:
+        return shared_memory.SharedMemory(name=f"taipy_{uuid.uuid4().hex[:20]}", create=True, size=max(size, 1))
+
+    def __evict(self, key: Tuple[DataNodeId, datetime]):
+        shm, block = self._blocks.pop(key)
+        self._size -= block.size
+        shm.close()
+        shm.unlink()
+
+    def _clear(self):
+        with self._lock:
+            for key in list(self._blocks):
+                self.__evict(key)
+
+
+_attached_blocks: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _read_shared_block(block: _SharedBlock) -> Any:
+    """Map a block created by the `_SharedMemoryCache^` of the dispatcher. Raise FileNotFoundError if evicted."""
+    if (shm := _attached_blocks.get(block.name)) is None:
+        shm = _attached_blocks[block.name] = shared_memory.SharedMemory(name=block.name)
+    buffer = shm.buf[: block.size]  # type: ignore[index]
+    if block.kind == _SharedMemoryCache._NDARRAY:
+        array: np.ndarray = np.ndarray(block.shape, dtype=np.dtype(block.dtype), buffer=buffer)  # type: ignore
+        array.flags.writeable = False
+        return array
+    return _to_pandas(pa.ipc.open_stream(pa.py_buffer(buffer)).read_all())
+
+
+def _to_pandas(table: pa.Table) -> pd.DataFrame:
+    """Convert an Arrow table to pandas, mapping the numeric columns without missing values without copy."""
+    index_fields = {f for f in (table.schema.pandas_metadata or {}).get("index_columns", []) if isinstance(f, str)}
+    data_fields = [name for name in table.schema.names if name not in index_fields]
+    zero_copy_fields = {name for name in data_fields if _is_zero_copy(table.column(name))}
+    if not zero_copy_fields:
+        return table.to_pandas(split_blocks=True)
+    labels = table.slice(0, 0).to_pandas().columns
+    others = table.drop_columns(list(zero_copy_fields)).to_pandas(split_blocks=True)
+    columns: Dict[int, pd.Series] = {}
+    position = 0
+    for i, name in enumerate(data_fields):
+        if name in zero_copy_fields:
+            array = table.column(name).chunk(0).to_numpy(zero_copy_only=True)
+            columns[i] = pd.Series(array, index=others.index, copy=False)
+        else:
+            columns[i] = others.iloc[:, position]
+            position += 1
+    frame = pd.DataFrame(columns, index=others.index, copy=False)
+    frame.columns = labels
+    return frame
+
+
+def _is_zero_copy(column: pa.ChunkedArray) -> bool:
+    return (
+        column.num_chunks == 1
+        and column.null_count == 0
+        and (pa.types.is_integer(column.type) or pa.types.is_floating(column.type))
+    )
+
+
+def _release_shared_blocks(names: List[str]):
+    """Close the mappings that are no longer referenced by any data."""
+    for name in names:
+        if shm := _attached_blocks.get(name):
+            try:
+                shm.close()
+                del _attached_blocks[name]
+            except BufferError:  # The data is still referenced, e.g. by a result kept in a global variable.
+                pass
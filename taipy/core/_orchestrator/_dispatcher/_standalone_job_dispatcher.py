@@ -13,7 +13,7 @@ import multiprocessing as mp
 from concurrent.futures import Executor, ProcessPoolExecutor
 from functools import partial
 from threading import Lock
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
 from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
@@ -21,7 +21,8 @@ from taipy.common.config._serializer._toml_serializer import _TomlSerializer
 from ...job.job import Job
 from .._abstract_orchestrator import _AbstractOrchestrator
 from ._job_dispatcher import _JobDispatcher
-from ._task_function_wrapper import _TaskFunctionWrapper
+from ._shared_memory_cache import _SharedMemoryCache
+from ._task_function_wrapper import _FusedTaskFunctionWrapper, _TaskFunctionWrapper
 
 
 class _StandaloneJobDispatcher(_JobDispatcher):
@@ -29,6 +30,7 @@ class _StandaloneJobDispatcher(_JobDispatcher):
 
     _nb_available_workers_lock = Lock()
     _DEFAULT_MAX_NB_OF_WORKERS = 2
+    _shared_memory_cache: Optional[_SharedMemoryCache] = None
 
     def __init__(self, orchestrator: _AbstractOrchestrator, subproc_initializer: Optional[Callable] = None):
         super().__init__(orchestrator)
@@ -37,6 +39,8 @@ class _StandaloneJobDispatcher(_JobDispatcher):
             max_workers=max_workers, initializer=subproc_initializer, mp_context=mp.get_context("spawn")
         )
         self._nb_available_workers = self._executor._max_workers  # type: ignore
+        shared_memory_budget = Config.job_config.shared_memory_budget
+        self._shared_memory_cache = _SharedMemoryCache(int(shared_memory_budget)) if shared_memory_budget else None
 
     def _can_execute(self) -> bool:
         """Returns True if the dispatcher have resources to dispatch a job."""
@@ -47,6 +51,8 @@ class _StandaloneJobDispatcher(_JobDispatcher):
     def run(self):
         with self._executor:
             super().run()
+        if self._shared_memory_cache:
+            self._shared_memory_cache._clear()
         self._logger.debug("Standalone job dispatcher: Pool executor shut down.")
 
     def _dispatch(self, job: Job):
@@ -60,9 +66,35 @@ class _StandaloneJobDispatcher(_JobDispatcher):
             self._logger.debug(f"Setting nb_available_workers to {self._nb_available_workers} in the dispatch method.")
         config_as_string = _TomlSerializer()._serialize(Config._applied_config)  # type: ignore[attr-defined]
 
-        future = self._executor.submit(_TaskFunctionWrapper(job.id, job.task), config_as_string=config_as_string)
+        shared_inputs = self._shared_memory_cache._prepare([job.task]) if self._shared_memory_cache else None
+        future = self._executor.submit(
+            _TaskFunctionWrapper(job.id, job.task, shared_inputs), config_as_string=config_as_string
+        )
         future.add_done_callback(partial(self._update_job_status_from_future, job))
 
+    def _dispatch_fused(self, jobs: List[Job]):
+        """Dispatches the given chain of `Job^`s on a single available worker for execution.
+
+        Parameters:
+            jobs (List[Job^]): The chain of jobs to execute one after the other on the same worker.
+        """
+        with self._nb_available_workers_lock:
+            self._nb_available_workers -= 1
+            self._logger.debug(f"Setting nb_available_workers to {self._nb_available_workers} in the dispatch method.")
+        config_as_string = _TomlSerializer()._serialize(Config._applied_config)  # type: ignore[attr-defined]
+
+        tasks = [job.task for job in jobs]
+        shared_inputs = self._shared_memory_cache._prepare(tasks) if self._shared_memory_cache else None
+        wrapper = _FusedTaskFunctionWrapper([job.id for job in jobs], tasks, shared_inputs, jobs[0].force)
+        future = self._executor.submit(wrapper, config_as_string=config_as_string)
+        future.add_done_callback(partial(self._update_fused_jobs_status_from_future, jobs))
+
+    def _update_fused_jobs_status_from_future(self, jobs: List[Job], ft):
+        with self._nb_available_workers_lock:
+            self._nb_available_workers += 1
+            self._logger.debug(f"Setting nb_available_workers to {self._nb_available_workers} in the callback method.")
+        self._update_fused_jobs_status(jobs, ft.result())
+
     def _update_job_status_from_future(self, job: Job, ft):
         with self._nb_available_workers_lock:
             self._nb_available_workers += 1
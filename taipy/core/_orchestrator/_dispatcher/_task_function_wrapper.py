@@ -9,17 +9,21 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Any, List
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
+from ...config.task_config import TaskConfig
 from ...data._data_manager_factory import _DataManagerFactory
+from ...data._filter import _FilterDataNode
 from ...data.data_node import DataNode
+from ...data.data_node_id import DataNodeId
 from ...exceptions import DataNodeWritingError
 from ...job.job_id import JobId
 from ...task.task import Task
+from ._shared_memory_cache import _read_shared_block, _release_shared_blocks, _SharedBlock
 
 logger = _TaipyLogger._get_logger()
 
@@ -27,13 +31,20 @@ logger = _TaipyLogger._get_logger()
 class _TaskFunctionWrapper:
     """Wrapper around task function."""
 
-    def __init__(self, job_id: JobId, task: Task):
+    # The edits of the outputs of an incremental task record the position of each input consumed by the task.
+    _INCREMENTAL_INPUTS_KEY = "incremental_inputs"
+
+    def __init__(self, job_id: JobId, task: Task, shared_inputs: Optional[Dict[DataNodeId, _SharedBlock]] = None):
         self.job_id = job_id
         self.task = task
+        self.shared_inputs = shared_inputs or {}
+        self._edit_options: Dict[str, Any] = {}
 
     def __call__(self, **kwargs):
         """Make this object callable as a function. Actually calls `execute`."""
-        return self.execute(**kwargs)
+        results = self.execute(**kwargs)
+        _release_shared_blocks([block.name for block in self.shared_inputs.values()])
+        return results
 
     def execute(self, **kwargs):
         """Execute the wrapped function. If `config_as_string` is given, then it will be reapplied to the config."""
@@ -45,16 +56,111 @@ class _TaskFunctionWrapper:
             inputs = list(self.task.input.values())
             outputs = list(self.task.output.values())
 
-            arguments = self._read_inputs(inputs)
+            arguments = self._read_arguments(inputs, outputs)
             results = self._execute_fct(arguments)
             return self._write_data(outputs, results, self.job_id)
         except Exception as e:
             logger.error("Error during task function execution!", exc_info=1)
             return [e]
 
+    def _read_arguments(self, inputs: List[DataNode], outputs: List[DataNode]) -> List[Any]:
+        self._edit_options = {}
+        if not self.task._properties.get(TaskConfig._INCREMENTAL_KEY):
+            return self._read_inputs(inputs)
+        return self._read_increments(inputs, outputs)
+
+    def _read_increments(self, inputs: List[DataNode], outputs: List[DataNode]) -> List[Any]:
+        """Read the rows appended to the inputs since the last execution of the task, and its outputs.
+
+        The position of each input is its number of edits and its number of rows. It is taken before
+        reading the input, and the rows read are bounded by it, so that the rows appended meanwhile are
+        read by the next execution.
+        """
+        data_manager = _DataManagerFactory._build_manager()
+        inputs = [data_manager._get(dn.id) for dn in inputs]
+        outputs = [data_manager._get(dn.id) for dn in outputs]
+        positions = {dn.id: [len(dn._edits), dn._get_row_count()] for dn in inputs}
+        starts = self.__get_starts(inputs, outputs)
+
+        arguments = []
+        for dn in inputs:
+            start, position = starts[dn.id] if starts else (0, None)
+            stop = positions[dn.id][1]
+            if start is None or stop is None:
+                arguments.append(self._read_input(data_manager, dn))
+            elif start == 0:
+                data = self._read_input(data_manager, dn)
+                if _FilterDataNode._count_rows(data) == stop or len(data_manager._get(dn.id)._edits) > len(dn._edits):
+                    # The rows appended since the position was taken are left to the next execution.
+                    data = _FilterDataNode._slice_rows(data, 0, stop)
+                else:
+                    # The data was edited outside of Taipy: its rows cannot be tracked by the edits.
+                    positions[dn.id][1] = None
+                arguments.append(data)
+            else:
+                arguments.append(dn._read_rows(start, stop, self._get_input_columns(dn), position))
+        arguments.extend(dn.read() if starts else None for dn in outputs)
+
+        self._edit_options = {self._INCREMENTAL_INPUTS_KEY: positions}
+        return arguments
+
+    def __get_starts(self, inputs: List[DataNode], outputs: List[DataNode]) -> Optional[Dict[str, Tuple]]:
+        """Return the row from which each input is read, or None if the task must process the full inputs.
+
+        The inputs are read from the position recorded by the last execution of the task if the outputs have
+        not been edited since then, and if the inputs have only been appended rows. The start of each input
+        is the index of its first row to read, with the position of that row in the storage if the append
+        recorded it. An input that is not made of rows is read in full (its start is None) if it has not
+        been edited.
+        """
+        if not outputs:
+            return None
+        last_edits = [dn.get_last_edit() for dn in outputs]
+        last_positions = [edit.get(self._INCREMENTAL_INPUTS_KEY) if edit else None for edit in last_edits]
+        previous_positions = last_positions[0]
+        if not previous_positions or any(positions != previous_positions for positions in last_positions):
+            return None
+        if set(previous_positions) != {dn.id for dn in inputs}:
+            return None
+
+        starts: Dict[str, Tuple] = {}
+        for dn in inputs:
+            edit_count, row_count = previous_positions[dn.id]
+            if edit_count > len(dn._edits):
+                return None
+            new_edits = dn._edits[edit_count:]
+            if row_count is None:
+                if new_edits:
+                    return None
+                starts[dn.id] = (None, None)
+                continue
+            position = new_edits[0].get(DataNode._EDIT_POSITION_KEY) if new_edits else dn._get_end_position()
+            starts[dn.id] = (row_count, position)
+            for edit in new_edits:
+                if edit.get(DataNode._EDIT_OFFSET_KEY) != row_count or edit.get(DataNode._EDIT_ROWS_KEY) is None:
+                    return None
+                row_count += edit[DataNode._EDIT_ROWS_KEY]
+        return starts
+
     def _read_inputs(self, inputs: List[DataNode]) -> List[Any]:
         data_manager = _DataManagerFactory._build_manager()
-        return [data_manager._get(dn.id).read_or_raise() for dn in inputs]
+        return [self._read_input(data_manager, dn) for dn in inputs]
+
+    def _read_input(self, data_manager, dn: DataNode) -> Any:
+        columns = self._get_input_columns(dn)
+        if block := self.shared_inputs.get(dn.id):
+            try:
+                return self._select_columns(_read_shared_block(block), columns)
+            except FileNotFoundError:
+                logger.info(f"The shared memory block of data node {dn.id} has been evicted.")
+        return data_manager._get(dn.id).read_or_raise(columns)
+
+    def _get_input_columns(self, dn: DataNode) -> Optional[List]:
+        return (self.task._properties.get(TaskConfig._INPUT_COLUMNS_KEY) or {}).get(dn.config_id)
+
+    @staticmethod
+    def _select_columns(data: Any, columns: Optional[List]) -> Any:
+        return data if columns is None else _FilterDataNode._select_columns(data, columns)
 
     def _write_data(self, outputs: List[DataNode], results, job_id: JobId):
         data_manager = _DataManagerFactory._build_manager()
@@ -65,7 +171,7 @@ class _TaskFunctionWrapper:
                 for res, dn in zip(_results, outputs):
                     try:
                         data_node = data_manager._get(dn.id)
-                        data_node.write(res, job_id=job_id)
+                        data_node.write(res, job_id=job_id, **self._edit_options)
                     except Exception as e:
                         logger.error("Error during write", exc_info=1)
                         exceptions.append(DataNodeWritingError(f"Error writing in datanode id {dn.id}: {e}"))
@@ -81,3 +187,74 @@ class _TaskFunctionWrapper:
         if len(_results) != len(outputs):
             raise DataNodeWritingError("Error: wrong number of result or task output")
         return _results
+
+
+class _FusedTaskFunctionWrapper(_TaskFunctionWrapper):
+    """Wrapper around a linear chain of task functions executed one after the other in the same worker.
+
+    The data written by a task of the chain is handed over in memory to the next tasks of the chain, so it is
+    persisted once but never read back from the storage. Unless the chain is forced, the tasks following the
+    head of the chain are skipped when they do not need to run, as if they were dispatched on their own.
+    """
+
+    _SKIPPED = "skipped"
+
+    def __init__(
+        self,
+        job_ids: List[JobId],
+        tasks: List[Task],
+        shared_inputs: Optional[Dict[DataNodeId, _SharedBlock]] = None,
+        force: bool = False,
+    ):
+        super().__init__(job_ids[0], tasks[0], shared_inputs)
+        self.job_ids = job_ids
+        self.tasks = tasks
+        self.force = force
+        self._handed_over: Dict[DataNodeId, Any] = {}
+
+    def execute(self, **kwargs):
+        """Execute the wrapped functions of the chain in order.
+
+        Returns:
+            One list of exceptions per task of the chain. The tasks that have not been executed because a
+            previous task of the chain failed get None, and the tasks skipped get `_SKIPPED`.
+        """
+        from ._job_dispatcher import _JobDispatcher
+
+        results: List[Union[None, str, List[Exception]]] = [None] * len(self.tasks)
+        try:
+            if config_as_string := kwargs.pop("config_as_string", None):
+                Config._applied_config._update(_TomlSerializer()._deserialize(config_as_string))
+                Config.block_update()
+        except Exception as e:
+            logger.error("Error during task function execution!", exc_info=1)
+            results[0] = [e]
+            return results
+
+        for index, (job_id, task) in enumerate(zip(self.job_ids, self.tasks)):
+            self.job_id, self.task = job_id, task
+            try:
+                if index > 0 and not self.force and not _JobDispatcher._needs_to_run(task):
+                    results[index] = self._SKIPPED
+                    continue
+                inputs = list(task.input.values())
+                outputs = list(task.output.values())
+
+                arguments = self._read_arguments(inputs, outputs)
+                fct_results = self._execute_fct(arguments)
+                exceptions = self._write_data(outputs, fct_results, job_id) or []
+                if outputs and not exceptions:
+                    _results = self._extract_results(outputs, fct_results)
+                    self._handed_over.update((dn.id, res) for dn, res in zip(outputs, _results))
+            except Exception as e:
+                logger.error("Error during task function execution!", exc_info=1)
+                exceptions = [e]
+            results[index] = exceptions
+            if exceptions:
+                break
+        return results
+
+    def _read_input(self, data_manager, dn: DataNode) -> Any:
+        if dn.id in self._handed_over:
+            return self._select_columns(self._handed_over[dn.id], self._get_input_columns(dn))
+        return super()._read_input(data_manager, dn)
@@ -14,7 +14,7 @@ from datetime import datetime
 from queue import Queue
 from threading import Lock
 from time import sleep
-from typing import Callable, Iterable, List, Optional, Set, Union
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
 
 from taipy.common.config import Config
 from taipy.common.logger._taipy_logger import _TaipyLogger
@@ -37,6 +37,7 @@ class _Orchestrator(_AbstractOrchestrator):
 
     jobs_to_run: Queue = Queue()
     blocked_jobs: List[Job] = []
+    fused_jobs: Dict[JobId, List[Job]] = {}
 
     lock = Lock()
     __logger = _TaipyLogger._get_logger()
@@ -95,7 +96,10 @@ class _Orchestrator(_AbstractOrchestrator):
                     for task in ts
                 )
             submission.jobs = jobs  # type: ignore
-            cls._orchestrate_job_to_run_or_block(jobs)
+            if Config.job_config.is_task_fusion_enabled:
+                cls._orchestrate_job_to_run_or_block(cls._fuse_jobs(jobs))
+            else:
+                cls._orchestrate_job_to_run_or_block(jobs)
         if Config.job_config.is_development:
             cls._check_and_execute_jobs_if_development_mode()
         elif wait:
@@ -185,6 +189,68 @@ class _Orchestrator(_AbstractOrchestrator):
 
             cls.__logger.error(f"Job {job.id} status: {job.status}")
 
+    @classmethod
+    def _fuse_jobs(cls, jobs: List[Job]) -> List[Job]:
+        """Group the jobs of linear task chains so each chain is executed by a single dispatch.
+
+        A job is fused to the job of its predecessor when the predecessor is the only job of the submission
+        producing its inputs, and when none of the predecessor's outputs is read by another job of the
+        submission. The following jobs of a chain are blocked and kept aside in `fused_jobs`, indexed by
+        the id of the first job of the chain.
+
+        Parameters:
+            jobs (List[Job^]): The jobs of a submission, sorted in a topological order.
+
+        Returns:
+            The jobs to orchestrate, that is the jobs that are not fused behind a predecessor.
+        """
+        producers: Dict[str, Job] = {}
+        readers: Dict[str, List[Job]] = {}
+        for job in jobs:
+            for dn in job.task.output.values():
+                producers[dn.id] = job
+            for dn in job.task.input.values():
+                readers.setdefault(dn.id, []).append(job)
+
+        chain_heads: Dict[JobId, Job] = {}
+        chains: Dict[JobId, List[Job]] = {}
+        jobs_to_orchestrate = []
+        for job in jobs:
+            predecessors = {producers[dn.id] for dn in job.task.input.values() if dn.id in producers}
+            if len(predecessors) == 1:
+                predecessor = predecessors.pop()
+                head = chain_heads.get(predecessor.id, predecessor)
+                chain = chains.setdefault(head.id, [head])
+                if chain[-1] == predecessor and all(
+                    readers.get(dn.id, [job]) == [job] for dn in predecessor.task.output.values()
+                ):
+                    chain.append(job)
+                    chain_heads[job.id] = head
+                    continue
+            jobs_to_orchestrate.append(job)
+
+        for head_id, chain in chains.items():
+            if followers := chain[1:]:
+                for job in followers:
+                    job.blocked()
+                cls.fused_jobs[head_id] = followers
+                cls.__logger.debug(f"Jobs {[j.id for j in followers]} are fused behind job {head_id}.")
+        return jobs_to_orchestrate
+
+    @classmethod
+    def _pop_fused_jobs(cls, job: Job) -> List[Job]:
+        """Remove and return the jobs fused behind the given job, in execution order."""
+        with cls.lock:
+            return cls.fused_jobs.pop(job.id, [])
+
+    @classmethod
+    def _release_fused_jobs(cls, job: Job) -> None:
+        """Orchestrate the jobs fused behind the given job as regular jobs, e.g. when the job is skipped."""
+        with cls.lock:
+            if released_jobs := cls.fused_jobs.pop(job.id, []):
+                cls.__logger.debug(f"Releasing jobs fused behind job {job.id}.")
+                cls._orchestrate_job_to_run_or_block(released_jobs)
+
     @classmethod
     def _orchestrate_job_to_run_or_block(cls, jobs: List[Job]) -> None:
         blocked_jobs = []
@@ -230,9 +296,15 @@ class _Orchestrator(_AbstractOrchestrator):
              obj (Union[Task^, Job^]): The job or task entity to run.
 
         Returns:
-             True if one of its input data nodes is blocked.
+             True if one of its input data nodes is blocked. For a job heading a fused chain, the inputs
+             of the following jobs of the chain are checked as well.
         """
-        input_data_nodes = obj.task.input.values() if isinstance(obj, Job) else obj.input.values()
+        input_data_nodes = list(obj.task.input.values() if isinstance(obj, Job) else obj.input.values())
+        if isinstance(obj, Job) and (followers := cls.fused_jobs.get(obj.id)):
+            chain_outputs = {dn.id for job in [obj, *followers] for dn in job.task.output.values()}
+            input_data_nodes.extend(
+                dn for job in followers for dn in job.task.input.values() if dn.id not in chain_outputs
+            )
         data_manager = _DataManagerFactory._build_manager()
         return any(not data_manager._get(dn.id).is_ready_for_reading for dn in input_data_nodes)
 
@@ -254,7 +326,7 @@ class _Orchestrator(_AbstractOrchestrator):
     def __unblock_jobs(cls) -> None:
         with cls.lock:
             cls.__logger.debug("Acquiring lock to unblock jobs.")
-            for job in cls.blocked_jobs:
+            for job in list(cls.blocked_jobs):
                 if not cls._is_blocked(job):
                     cls.__logger.debug(f"Unblocking job: {job.id}.")
                     job.pending()
@@ -283,6 +355,11 @@ class _Orchestrator(_AbstractOrchestrator):
                 cls.__logger.debug(f"Acquiring lock to cancel job {job.id}.")
                 to_cancel_or_abandon_jobs = {job}
                 to_cancel_or_abandon_jobs.update(cls.__find_subsequent_jobs(job.submit_id, set(job.task.output.keys())))
+                for fused_job in cls.__remove_fused_jobs_from(job):
+                    to_cancel_or_abandon_jobs.add(fused_job)
+                    to_cancel_or_abandon_jobs.update(
+                        cls.__find_subsequent_jobs(fused_job.submit_id, set(fused_job.task.output.keys()))
+                    )
                 cls.__remove_blocked_jobs(to_cancel_or_abandon_jobs)
                 cls.__remove_jobs_to_run(to_cancel_or_abandon_jobs)
                 cls._cancel_jobs(job.id, to_cancel_or_abandon_jobs)
@@ -303,6 +380,22 @@ class _Orchestrator(_AbstractOrchestrator):
             )
         return subsequent_jobs
 
+    @classmethod
+    def __remove_fused_jobs_from(cls, job: Job) -> List[Job]:
+        """Cut the fused chain containing the given job so that neither the job nor its followers get executed."""
+        if followers := cls.fused_jobs.pop(job.id, []):
+            return followers
+        for head_id, followers in cls.fused_jobs.items():
+            if job in followers:
+                index = followers.index(job)
+                removed_jobs = followers[index:]
+                if index == 0:
+                    del cls.fused_jobs[head_id]
+                else:
+                    cls.fused_jobs[head_id] = followers[:index]
+                return removed_jobs
+        return []
+
     @classmethod
     def __remove_blocked_jobs(cls, jobs: Set[Job]) -> None:
         for job in jobs:
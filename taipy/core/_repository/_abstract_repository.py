@@ -12,7 +12,7 @@
 import json
 import pathlib
 from abc import abstractmethod
-from typing import Any, Dict, Generic, Iterable, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, TypeVar, Union
 
 from ..exceptions import FileCannotBeRead
 from ._decoder import _Decoder
@@ -32,6 +32,16 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    def _save_many(self, entities: Iterable[Entity]):
+        """
+        Save several entities in the repository.
+
+        Parameters:
+            entities: The entities to save.
+        """
+        for entity in entities:
+            self._save(entity)
+
     @abstractmethod
     def _exists(self, entity_id: str) -> bool:
         """
@@ -66,6 +76,49 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def _load_page(
+        self,
+        filters: Optional[List[Dict]] = None,
+        predicate: Optional[Callable[[ModelType], bool]] = None,
+        sort_key: Optional[Callable[[ModelType], Any]] = None,
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Entity]:
+        """
+        Retrieve a page of the entities matching the filters and the predicate, in the order of the sort key.
+
+        The predicate and the sort key are applied to the models so that only the entities of the page
+        are built.
+
+        Parameters:
+            filters: The filters on the stored attributes.
+            predicate: An optional function selecting the models to keep.
+            sort_key: An optional function returning the sort key of a model.
+            descending: If True, sort the models in descending order.
+            offset: The non-negative number of matching models to skip.
+            limit: The non-negative maximum number of entities to return. If None, all the remaining entities
+                are returned.
+
+        Returns:
+            A list of entities.
+        """
+        raise NotImplementedError
+
+    def _get_change_marker(self) -> Optional[Any]:
+        """
+        Return a value that changes each time an entity is added to or removed from the repository.
+
+        The in-process indexes built from the repository compare it to the value they were built with, so
+        that they are rebuilt after the entities are changed by another process.
+
+        Returns:
+            The change marker, or None if the repository cannot provide one. The indexes are then rebuilt on
+            every lookup.
+        """
+        return None
+
     @abstractmethod
     def _delete(self, entity_id: str):
         """
@@ -13,7 +13,8 @@ import copy
 import json
 import pathlib
 import shutil
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Type, Union
 
 from taipy.common.config import Config
 
@@ -40,6 +41,8 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     """
 
     __EXCEPTIONS_TO_RETRY = (FileCannotBeRead, FileEmpty)
+    # Some file systems only record modification times to the nearest 2 seconds.
+    __MTIME_RESOLUTION_NS = 2_000_000_000
 
     def __init__(self, model_type: Type[ModelType], converter: Type[Converter], dir_name: str):
         self.model_type = model_type
@@ -66,6 +69,16 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
             encoding="UTF-8",
         )
 
+    def _save_many(self, entities: Iterable[Entity]):
+        self.__create_directory_if_not_exists()
+        dir_path = self.dir_path
+        for entity in entities:
+            model = self.converter._entity_to_model(entity)  # type: ignore
+            (dir_path / f"{model.id}.json").write_text(
+                json.dumps(model.to_dict(), ensure_ascii=False, indent=0, cls=_Encoder, check_circular=False),
+                encoding="UTF-8",
+            )
+
     def _exists(self, entity_id: str) -> bool:
         return self.__get_path(entity_id).exists()
 
@@ -89,6 +102,43 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
             pass
         return entities
 
+    def _load_page(
+        self,
+        filters: Optional[List[Dict]] = None,
+        predicate: Optional[Callable[[ModelType], bool]] = None,
+        sort_key: Optional[Callable[[ModelType], Any]] = None,
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Entity]:
+        models = []
+        try:
+            for f in self.dir_path.iterdir():
+                if data := self.__filter_by(f, filters):
+                    model = self.model_type.from_dict(data)  # type: ignore
+                    if predicate is None or predicate(model):
+                        models.append(model)
+        except FileNotFoundError:
+            pass
+        if sort_key is not None:
+            models.sort(key=sort_key, reverse=descending)
+        end = None if limit is None else offset + limit
+        return [self.converter._model_to_entity(model) for model in models[offset:end]]  # type: ignore
+
+    def _get_change_marker(self) -> Optional[int]:
+        """Return the modification time of the folder, which changes when a file is created or removed.
+
+        None is returned if the folder does not exist, or if it was modified so recently that a later
+        change may not change its modification time.
+        """
+        try:
+            mtime = self.dir_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        if time.time_ns() - mtime < self.__MTIME_RESOLUTION_NS:
+            return None
+        return mtime
+
     def _delete(self, entity_id: str):
         try:
             self.__get_path(entity_id).unlink()
@@ -23,6 +23,10 @@ def _check_dependency_is_installed(module_name: str, package_name: str) -> None:
     extras = {
         "boto3": "s3",
         "pymongo": "mongo",
+        "polars": "polars",
+        "python_calamine": "calamine",
+        "zstandard": "zstd",
+        "lz4": "lz4",
     }
     if not util.find_spec(package_name):
         raise RuntimeError(
@@ -17,7 +17,15 @@ from ..data import DataNode
 
 
 def _warn_if_inputs_not_ready(inputs: Iterable[DataNode]):
-    from ..data import CSVDataNode, ExcelDataNode, JSONDataNode, ParquetDataNode, PickleDataNode
+    from ..data import (
+        ArrowIPCDataNode,
+        CSVDataNode,
+        ExcelDataNode,
+        JSONDataNode,
+        NpyDataNode,
+        ParquetDataNode,
+        PickleDataNode,
+    )
     from ..data._data_manager_factory import _DataManagerFactory
 
     logger = _TaipyLogger._get_logger()
@@ -31,6 +39,8 @@ def _warn_if_inputs_not_ready(inputs: Iterable[DataNode]):
                 JSONDataNode.storage_type(),
                 PickleDataNode.storage_type(),
                 ParquetDataNode.storage_type(),
+                NpyDataNode.storage_type(),
+                ArrowIPCDataNode.storage_type(),
             ]:
                 logger.warning(
                     f"{dn.id} cannot be read because it has never been written. "
@@ -49,6 +49,8 @@ _inject_section(
         ("configure_csv_data_node", DataNodeConfig._configure_csv),
         ("configure_json_data_node", DataNodeConfig._configure_json),
         ("configure_parquet_data_node", DataNodeConfig._configure_parquet),
+        ("configure_npy_data_node", DataNodeConfig._configure_npy),
+        ("configure_arrow_ipc_data_node", DataNodeConfig._configure_arrow_ipc),
         ("configure_sql_table_data_node", DataNodeConfig._configure_sql_table),
         ("configure_sql_data_node", DataNodeConfig._configure_sql),
         ("configure_mongo_collection_data_node", DataNodeConfig._configure_mongo_collection),
@@ -28,6 +28,7 @@ class _CoreSectionChecker(_ConfigChecker):
         if core_section := self._config._unique_sections.get(CoreSection.name):
             core_section = cast(CoreSection, core_section)
             self._check_repository_type(core_section)
+            self._check_read_cache_mode(core_section)
         return self._collector
 
     def _check_repository_type(self, core_section: CoreSection):
@@ -39,3 +40,13 @@ class _CoreSectionChecker(_ConfigChecker):
                 f'Value "{value}" for field {core_section._REPOSITORY_TYPE_KEY} of the CoreSection is not supported. '
                 f'Default value "filesystem" is applied.',
             )
+
+    def _check_read_cache_mode(self, core_section: CoreSection):
+        value = core_section.read_cache_mode
+        if value not in core_section._READ_CACHE_MODES:
+            self._error(
+                core_section._READ_CACHE_MODE_KEY,
+                value,
+                f'Value "{value}" for field {core_section._READ_CACHE_MODE_KEY} of the CoreSection is not supported. '
+                f"Possible values are {core_section._READ_CACHE_MODES}.",
+            )
@@ -227,5 +227,16 @@ class _DataNodeConfigChecker(_ConfigChecker):
                 data_node_config._EXPOSED_TYPE_KEY,
                 data_node_config.exposed_type,
                 f"The `{data_node_config._EXPOSED_TYPE_KEY}` of DataNodeConfig `{data_node_config_id}` "
-                f'must be either "pandas", "numpy", or a custom type.',
+                f'must be either "pandas", "numpy", "arrow", "polars", or a custom type.',
+            )
+        elif (
+            data_node_config.exposed_type in [DataNodeConfig._EXPOSED_TYPE_ARROW, DataNodeConfig._EXPOSED_TYPE_POLARS]
+            and data_node_config.storage_type not in DataNodeConfig._ARROW_EXPOSED_TYPES_STORAGE_TYPES
+        ):
+            self._error(
+                data_node_config._EXPOSED_TYPE_KEY,
+                data_node_config.exposed_type,
+                f"The `{data_node_config._EXPOSED_TYPE_KEY}` of DataNodeConfig `{data_node_config_id}` "
+                f'can only be "{data_node_config.exposed_type}" for the '
+                f"{', '.join(DataNodeConfig._ARROW_EXPOSED_TYPES_STORAGE_TYPES)} storage types.",
             )
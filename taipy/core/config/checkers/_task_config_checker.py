@@ -40,6 +40,7 @@ class _TaskConfigChecker(_ConfigChecker):
                 self._check_existing_function(task_config_id, task_config)
                 self._check_inputs(task_config_id, task_config)
                 self._check_outputs(task_config_id, task_config)
+                self._check_input_columns(task_config_id, task_config)
                 self._check_if_children_config_id_is_overlapping_with_properties(task_config_id, task_config)
         return self._collector
 
@@ -74,6 +75,33 @@ class _TaskConfigChecker(_ConfigChecker):
             TaskConfig, task_config_id, task_config._OUTPUT_KEY, task_config.output_configs, DataNodeConfig
         )
 
+    def _check_input_columns(self, task_config_id: str, task_config: TaskConfig):
+        input_columns = task_config.input_columns
+        if not isinstance(input_columns, dict):
+            self._error(
+                task_config._INPUT_COLUMNS_KEY,
+                input_columns,
+                f"{task_config._INPUT_COLUMNS_KEY} field of TaskConfig `{task_config_id}` must be populated with a "
+                f"dictionary of column lists indexed by input data node config ids.",
+            )
+            return
+        input_ids = {dn_config.id for dn_config in task_config.input_configs if isinstance(dn_config, DataNodeConfig)}
+        for dn_config_id, columns in input_columns.items():
+            if dn_config_id not in input_ids:
+                self._error(
+                    task_config._INPUT_COLUMNS_KEY,
+                    dn_config_id,
+                    f"{task_config._INPUT_COLUMNS_KEY} field of TaskConfig `{task_config_id}` refers to "
+                    f"`{dn_config_id}` which is not an input of the task.",
+                )
+            elif not isinstance(columns, (list, tuple)):
+                self._error(
+                    task_config._INPUT_COLUMNS_KEY,
+                    columns,
+                    f"{task_config._INPUT_COLUMNS_KEY} field of TaskConfig `{task_config_id}` must be populated "
+                    f"with a list of columns for input `{dn_config_id}`.",
+                )
+
     def _check_existing_function(self, task_config_id: str, task_config: TaskConfig):
         if not task_config.function:
             self._error(
@@ -64,6 +64,14 @@ class CoreSection(UniqueSection):
     _CORE_VERSION_KEY = "core_version"
     _CURRENT_CORE_VERSION = _read_version()
 
+    _READ_CACHE_BUDGET_KEY = "read_cache_budget"
+    _READ_CACHE_MODE_KEY = "read_cache_mode"
+    _DEFAULT_READ_CACHE_MODE = "copy"
+    _READ_CACHE_MODES = ["copy", "view"]
+
+    _DEDUPLICATE_FILES_KEY = "deduplicate_files"
+    _DEFAULT_DEDUPLICATE_FILES = False
+
     def __init__(
         self,
         root_folder: Optional[str] = None,
@@ -247,6 +255,34 @@ class CoreSection(UniqueSection):
         """The version of the Taipy core library."""
         return _tpl._replace_templates(self._core_version)
 
+    @property
+    def read_cache_budget(self) -> Optional[int]:
+        """The maximum number of bytes of data kept in the read cache of the data nodes.
+
+        The default value is None, which disables the read cache.
+        """
+        budget = _tpl._replace_templates(self._properties.get(self._READ_CACHE_BUDGET_KEY), type=int, required=False)
+        return int(budget) if budget else None
+
+    @property
+    def read_cache_mode(self) -> str:
+        """How the data nodes return the cached data: *"copy"* or *"view"*.
+
+        The default value is "copy".
+        """
+        mode = self._properties.get(self._READ_CACHE_MODE_KEY)
+        return _tpl._replace_templates(mode) if mode else self._DEFAULT_READ_CACHE_MODE
+
+    @property
+    def deduplicate_files(self) -> bool:
+        """If True, the files generated by the file-based data nodes are stored once per content.
+
+        The default value is False.
+        """
+        return _tpl._replace_templates(
+            self._properties.get(self._DEDUPLICATE_FILES_KEY, self._DEFAULT_DEDUPLICATE_FILES), type=bool
+        )
+
     @classmethod
     def default_config(cls) -> "CoreSection":
         """Return a core section with all the default values.
@@ -386,6 +422,9 @@ class CoreSection(UniqueSection):
         mode: Optional[str] = None,
         version_number: Optional[str] = None,
         force: Optional[bool] = None,
+        read_cache_budget: Optional[Union[int, str]] = None,
+        read_cache_mode: Optional[str] = None,
+        deduplicate_files: Optional[Union[bool, str]] = None,
         **properties,
     ) -> "CoreSection":
         """Configure the Orchestrator service.
@@ -414,12 +453,35 @@ class CoreSection(UniqueSection):
                  In development mode, the version number is ignored.
             force (Optional[bool]): If True, Taipy will override a version even if the configuration
                 has changed and run the application.
+            read_cache_budget (Optional[int, str]): The maximum number of bytes of data kept in memory by
+                the read cache. The data nodes configured with the `read_cache` property set to True keep
+                the data they read (a pandas DataFrame or Series, or a NumPy array) until it is edited, so
+                that reading it again does not access the storage. The least recently used data is evicted
+                first.<br/>
+                The default value is None, which disables the read cache.
+            read_cache_mode (Optional[str]): How the cached data is returned. Possible values are *"copy"*
+                (a copy of the cached data) or *"view"* (a read-only view of NumPy arrays, or a shallow copy
+                of pandas objects that must not be modified in place). A data node can override it with its
+                `read_cache_mode` property.<br/>
+                The default value is "copy".
+            deduplicate_files (Optional[bool]): If True, the files generated by the file-based data nodes
+                are stored once per content: a file written is hashed and becomes a hard link to a file of
+                the "blobs" folder of the storage folder named after its SHA-256 digest, which the data
+                nodes with byte-identical files share. The blob is removed when no data node references
+                it anymore.<br/>
+                The default value is False.
             **properties (Dict[str, Any]): A keyworded variable length list of additional arguments configure the
                 behavior of the `Orchestrator^` service.
 
         Returns:
             The Core configuration.
         """
+        if read_cache_budget is not None:
+            properties[CoreSection._READ_CACHE_BUDGET_KEY] = read_cache_budget
+        if read_cache_mode is not None:
+            properties[CoreSection._READ_CACHE_MODE_KEY] = read_cache_mode
+        if deduplicate_files is not None:
+            properties[CoreSection._DEDUPLICATE_FILES_KEY] = deduplicate_files
         section = CoreSection(
             root_folder=root_folder,
             storage_folder=storage_folder,
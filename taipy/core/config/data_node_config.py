@@ -33,7 +33,21 @@ class DataNodeConfig(Section):
     needed to create an actual data node.
 
     Attributes:
-        **properties (dict[str, any]): A dictionary of additional properties.
+        **properties (dict[str, any]): A dictionary of additional properties.<br/>
+            Besides the properties of each storage type, the following properties are available
+            for all the data node configurations:
+
+            - *shared_memory* (bool): If True, the data is read once and mapped by all the worker
+              processes reading it in *"standalone"* mode, within the *shared_memory_budget* of the
+              job executions. Only NumPy arrays and pandas dataframes are shared, and only the arrays
+              and the numeric dataframe columns without missing values are mapped without copy.
+              The default value is False.
+            - *read_cache* (bool): If True, the data read (a pandas DataFrame or Series, or a NumPy
+              array) is kept in memory until it is edited, within the *read_cache_budget* of the core
+              configuration, so that reading it again does not access the storage. The default value
+              is False.
+            - *read_cache_mode* (str): How the cached data is returned, *"copy"* or *"view"*. The
+              default value is the *read_cache_mode* of the core configuration.
     """
 
     name = "DATA_NODE"
@@ -49,6 +63,8 @@ class DataNodeConfig(Section):
     _STORAGE_TYPE_VALUE_GENERIC = "generic"
     _STORAGE_TYPE_VALUE_JSON = "json"
     _STORAGE_TYPE_VALUE_PARQUET = "parquet"
+    _STORAGE_TYPE_VALUE_NPY = "npy"
+    _STORAGE_TYPE_VALUE_ARROW_IPC = "arrow_ipc"
     _STORAGE_TYPE_VALUE_S3_OBJECT = "s3_object"
 
     _DEFAULT_STORAGE_TYPE = _STORAGE_TYPE_VALUE_PICKLE
@@ -63,6 +79,8 @@ class DataNodeConfig(Section):
         _STORAGE_TYPE_VALUE_GENERIC,
         _STORAGE_TYPE_VALUE_JSON,
         _STORAGE_TYPE_VALUE_PARQUET,
+        _STORAGE_TYPE_VALUE_NPY,
+        _STORAGE_TYPE_VALUE_ARROW_IPC,
         _STORAGE_TYPE_VALUE_S3_OBJECT,
     ]
 
@@ -70,11 +88,22 @@ class DataNodeConfig(Section):
     _EXPOSED_TYPE_PANDAS = "pandas"
     _EXPOSED_TYPE_MODIN = "modin"  # Deprecated in favor of pandas since 3.1.0
     _EXPOSED_TYPE_NUMPY = "numpy"
+    _EXPOSED_TYPE_ARROW = "arrow"
+    _EXPOSED_TYPE_POLARS = "polars"
     _DEFAULT_EXPOSED_TYPE = _EXPOSED_TYPE_PANDAS
 
     _ALL_EXPOSED_TYPES = [
         _EXPOSED_TYPE_PANDAS,
         _EXPOSED_TYPE_NUMPY,
+        _EXPOSED_TYPE_ARROW,
+        _EXPOSED_TYPE_POLARS,
+    ]
+    _ARROW_EXPOSED_TYPES_STORAGE_TYPES = [
+        _STORAGE_TYPE_VALUE_CSV,
+        _STORAGE_TYPE_VALUE_PARQUET,
+        _STORAGE_TYPE_VALUE_ARROW_IPC,
+        _STORAGE_TYPE_VALUE_SQL,
+        _STORAGE_TYPE_VALUE_SQL_TABLE,
     ]
 
     _OPTIONAL_ENCODING_PROPERTY = "encoding"
@@ -94,6 +123,8 @@ class DataNodeConfig(Section):
     _OPTIONAL_DEFAULT_PATH_EXCEL_PROPERTY = "default_path"
     _OPTIONAL_HAS_HEADER_EXCEL_PROPERTY = "has_header"
     _OPTIONAL_SHEET_NAME_EXCEL_PROPERTY = "sheet_name"
+    _OPTIONAL_ENGINE_EXCEL_PROPERTY = "engine"
+    _OPTIONAL_LAZY_SHEETS_EXCEL_PROPERTY = "lazy_sheets"
     # In memory
     _OPTIONAL_DEFAULT_DATA_IN_MEMORY_PROPERTY = "default_data"
     # SQL
@@ -109,8 +140,11 @@ class DataNodeConfig(Section):
     _OPTIONAL_DRIVER_SQL_PROPERTY = "db_driver"
     _OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY = "db_extra_args"
     _OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY = "exposed_type"
+    _OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY = "db_pool_size"
+    _OPTIONAL_DB_MAX_OVERFLOW_SQL_PROPERTY = "db_max_overflow"
     # SQL_TABLE
     _REQUIRED_TABLE_NAME_SQL_TABLE_PROPERTY = "table_name"
+    _OPTIONAL_INSERT_BATCH_SIZE_SQL_TABLE_PROPERTY = "insert_batch_size"
     # SQL
     _REQUIRED_READ_QUERY_SQL_PROPERTY = "read_query"
     _REQUIRED_WRITE_QUERY_BUILDER_SQL_PROPERTY = "write_query_builder"
@@ -125,13 +159,23 @@ class DataNodeConfig(Section):
     _OPTIONAL_PORT_MONGO_PROPERTY = "db_port"
     _OPTIONAL_DRIVER_MONGO_PROPERTY = "db_driver"
     _OPTIONAL_DB_EXTRA_ARGS_MONGO_PROPERTY = "db_extra_args"
+    _OPTIONAL_BATCH_SIZE_MONGO_PROPERTY = "batch_size"
+    _OPTIONAL_ID_FIELD_MONGO_PROPERTY = "id_field"
+    _OPTIONAL_PROJECTION_MONGO_PROPERTY = "projection"
+    _OPTIONAL_INDEXES_MONGO_PROPERTY = "indexes"
     # Pickle
     _OPTIONAL_DEFAULT_PATH_PICKLE_PROPERTY = "default_path"
     _OPTIONAL_DEFAULT_DATA_PICKLE_PROPERTY = "default_data"
+    _OPTIONAL_COMPRESSION_PICKLE_PROPERTY = "compression"
+    _OPTIONAL_COMPRESSION_LEVEL_PICKLE_PROPERTY = "compression_level"
+    _OPTIONAL_OUT_OF_BAND_PICKLE_PROPERTY = "out_of_band"
     # JSON
     _OPTIONAL_ENCODER_JSON_PROPERTY = "encoder"
     _OPTIONAL_DECODER_JSON_PROPERTY = "decoder"
     _OPTIONAL_DEFAULT_PATH_JSON_PROPERTY = "default_path"
+    _OPTIONAL_FORMAT_JSON_PROPERTY = "format"
+    _OPTIONAL_COMPRESSION_JSON_PROPERTY = "compression"
+    _OPTIONAL_COMPRESSION_LEVEL_JSON_PROPERTY = "compression_level"
     # Parquet
     _OPTIONAL_EXPOSED_TYPE_PARQUET_PROPERTY = "exposed_type"
     _OPTIONAL_DEFAULT_PATH_PARQUET_PROPERTY = "default_path"
@@ -139,6 +183,13 @@ class DataNodeConfig(Section):
     _OPTIONAL_COMPRESSION_PARQUET_PROPERTY = "compression"
     _OPTIONAL_READ_KWARGS_PARQUET_PROPERTY = "read_kwargs"
     _OPTIONAL_WRITE_KWARGS_PARQUET_PROPERTY = "write_kwargs"
+    _OPTIONAL_PARTITION_COLS_PARQUET_PROPERTY = "partition_cols"
+    # Npy
+    _OPTIONAL_DEFAULT_PATH_NPY_PROPERTY = "default_path"
+    _OPTIONAL_MMAP_MODE_NPY_PROPERTY = "mmap_mode"
+    # Arrow IPC
+    _OPTIONAL_DEFAULT_PATH_ARROW_IPC_PROPERTY = "default_path"
+    _OPTIONAL_EXPOSED_TYPE_ARROW_IPC_PROPERTY = "exposed_type"
     # S3object
     _REQUIRED_AWS_ACCESS_KEY_ID_PROPERTY = "aws_access_key"
     _REQUIRED_AWS_SECRET_ACCESS_KEY_PROPERTY = "aws_secret_access_key"
@@ -170,6 +221,8 @@ class DataNodeConfig(Section):
         _STORAGE_TYPE_VALUE_GENERIC: [],
         _STORAGE_TYPE_VALUE_JSON: [],
         _STORAGE_TYPE_VALUE_PARQUET: [],
+        _STORAGE_TYPE_VALUE_NPY: [],
+        _STORAGE_TYPE_VALUE_ARROW_IPC: [],
         _STORAGE_TYPE_VALUE_S3_OBJECT: [
             _REQUIRED_AWS_ACCESS_KEY_ID_PROPERTY,
             _REQUIRED_AWS_SECRET_ACCESS_KEY_PROPERTY,
@@ -195,6 +248,8 @@ class DataNodeConfig(Section):
             _OPTIONAL_DEFAULT_PATH_EXCEL_PROPERTY: None,
             _OPTIONAL_HAS_HEADER_EXCEL_PROPERTY: True,
             _OPTIONAL_SHEET_NAME_EXCEL_PROPERTY: None,
+            _OPTIONAL_ENGINE_EXCEL_PROPERTY: "openpyxl",
+            _OPTIONAL_LAZY_SHEETS_EXCEL_PROPERTY: False,
             _OPTIONAL_EXPOSED_TYPE_EXCEL_PROPERTY: _DEFAULT_EXPOSED_TYPE,
         },
         _STORAGE_TYPE_VALUE_IN_MEMORY: {_OPTIONAL_DEFAULT_DATA_IN_MEMORY_PROPERTY: None},
@@ -208,6 +263,9 @@ class DataNodeConfig(Section):
             _OPTIONAL_FILE_EXTENSION_SQLITE_PROPERTY: ".db",
             _OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY: None,
             _OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY: _DEFAULT_EXPOSED_TYPE,
+            _OPTIONAL_INSERT_BATCH_SIZE_SQL_TABLE_PROPERTY: None,
+            _OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY: None,
+            _OPTIONAL_DB_MAX_OVERFLOW_SQL_PROPERTY: None,
         },
         _STORAGE_TYPE_VALUE_SQL: {
             _OPTIONAL_DB_USERNAME_SQL_PROPERTY: None,
@@ -220,6 +278,8 @@ class DataNodeConfig(Section):
             _OPTIONAL_FILE_EXTENSION_SQLITE_PROPERTY: ".db",
             _OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY: None,
             _OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY: _DEFAULT_EXPOSED_TYPE,
+            _OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY: None,
+            _OPTIONAL_DB_MAX_OVERFLOW_SQL_PROPERTY: None,
         },
         _STORAGE_TYPE_VALUE_MONGO_COLLECTION: {
             _OPTIONAL_CUSTOM_DOCUMENT_MONGO_PROPERTY: MongoDefaultDocument,
@@ -229,16 +289,26 @@ class DataNodeConfig(Section):
             _OPTIONAL_PORT_MONGO_PROPERTY: 27017,
             _OPTIONAL_DRIVER_MONGO_PROPERTY: "",
             _OPTIONAL_DB_EXTRA_ARGS_MONGO_PROPERTY: None,
+            _OPTIONAL_BATCH_SIZE_MONGO_PROPERTY: None,
+            _OPTIONAL_ID_FIELD_MONGO_PROPERTY: None,
+            _OPTIONAL_PROJECTION_MONGO_PROPERTY: None,
+            _OPTIONAL_INDEXES_MONGO_PROPERTY: None,
         },
         _STORAGE_TYPE_VALUE_PICKLE: {
             _OPTIONAL_DEFAULT_PATH_PICKLE_PROPERTY: None,
             _OPTIONAL_DEFAULT_DATA_PICKLE_PROPERTY: None,
+            _OPTIONAL_COMPRESSION_PICKLE_PROPERTY: None,
+            _OPTIONAL_COMPRESSION_LEVEL_PICKLE_PROPERTY: None,
+            _OPTIONAL_OUT_OF_BAND_PICKLE_PROPERTY: None,
         },
         _STORAGE_TYPE_VALUE_JSON: {
             _OPTIONAL_DEFAULT_PATH_PICKLE_PROPERTY: None,
             _OPTIONAL_ENCODING_PROPERTY: _DEFAULT_ENCODING_VALUE,
             _OPTIONAL_ENCODER_JSON_PROPERTY: None,
             _OPTIONAL_DECODER_JSON_PROPERTY: None,
+            _OPTIONAL_FORMAT_JSON_PROPERTY: None,
+            _OPTIONAL_COMPRESSION_JSON_PROPERTY: None,
+            _OPTIONAL_COMPRESSION_LEVEL_JSON_PROPERTY: None,
         },
         _STORAGE_TYPE_VALUE_PARQUET: {
             _OPTIONAL_DEFAULT_PATH_PARQUET_PROPERTY: None,
@@ -246,8 +316,17 @@ class DataNodeConfig(Section):
             _OPTIONAL_COMPRESSION_PARQUET_PROPERTY: "snappy",
             _OPTIONAL_READ_KWARGS_PARQUET_PROPERTY: None,
             _OPTIONAL_WRITE_KWARGS_PARQUET_PROPERTY: None,
+            _OPTIONAL_PARTITION_COLS_PARQUET_PROPERTY: None,
             _OPTIONAL_EXPOSED_TYPE_PARQUET_PROPERTY: _DEFAULT_EXPOSED_TYPE,
         },
+        _STORAGE_TYPE_VALUE_NPY: {
+            _OPTIONAL_DEFAULT_PATH_NPY_PROPERTY: None,
+            _OPTIONAL_MMAP_MODE_NPY_PROPERTY: "r",
+        },
+        _STORAGE_TYPE_VALUE_ARROW_IPC: {
+            _OPTIONAL_DEFAULT_PATH_ARROW_IPC_PROPERTY: None,
+            _OPTIONAL_EXPOSED_TYPE_ARROW_IPC_PROPERTY: _EXPOSED_TYPE_ARROW,
+        },
         _STORAGE_TYPE_VALUE_S3_OBJECT: {
             _OPTIONAL_AWS_REGION_PROPERTY: None,
             _OPTIONAL_AWS_S3_OBJECT_PARAMETERS_PROPERTY: None,
@@ -293,7 +372,7 @@ class DataNodeConfig(Section):
         """Storage type of the data nodes created from the data node config.
 
         The possible values are : "csv", "excel", "pickle", "sql_table", "sql",
-        "mongo_collection", "generic", "json", "parquet", "in_memory and "s3_object".
+        "mongo_collection", "generic", "json", "parquet", "npy", "arrow_ipc", "in_memory and "s3_object".
 
         The default value is "pickle".
 
@@ -410,8 +489,8 @@ class DataNodeConfig(Section):
         Parameters:
             storage_type (str): The default storage type for all data node configurations.
                 The possible values are *"pickle"* (the default value), *"csv"*, *"excel"*,
-                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"generic"*,
-                or *"s3_object"*.
+                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"npy"*,
+                *"arrow_ipc"*, *"generic"*, or *"s3_object"*.
             scope (Optional[Scope^]): The default scope for all data node configurations.<br/>
                 The default value is `Scope.SCENARIO`.
             validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
@@ -470,8 +549,8 @@ class DataNodeConfig(Section):
                 are None (which is the default value of *"pickle"*, unless it has been overloaded by the
                 *storage_type* value set in the default data node configuration
                 (see `(Config.)set_default_data_node_configuration()^`)), *"pickle"*, *"csv"*, *"excel"*,
-                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"mongo_collection"*, *"in_memory"*, or
-                *"generic"*.
+                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"npy"*, *"arrow_ipc"*, *"mongo_collection"*,
+                *"in_memory"*, or *"generic"*.
             scope (Optional[Scope^]): The scope of the data node configuration.<br/>
                 The default value is `Scope.SCENARIO` (or the one specified in
                 `(Config.)set_default_data_node_configuration()^`).
@@ -481,7 +560,16 @@ class DataNodeConfig(Section):
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
-            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.<br/>
+                The *shared_memory* property (bool) can be set to True so that the data is read once
+                and mapped by all the worker processes reading it in *"standalone"* mode (see the
+                *shared_memory_budget* parameter of `(Config.)configure_job_executions()^`). Only
+                NumPy arrays and pandas dataframes are shared, and only the arrays and the numeric
+                dataframe columns without missing values are mapped without copy.
+                The *read_cache* property (bool) can be set to True so that the data read is kept in
+                memory until it is edited (see the *read_cache_budget* and *read_cache_mode* parameters of
+                `(Config.)configure_core()^`). The *read_cache_mode* property (str) overrides the
+                *read_cache_mode* of the core configuration for this data node.
 
         Returns:
             The new data node configuration.
@@ -497,6 +585,8 @@ class DataNodeConfig(Section):
             cls._STORAGE_TYPE_VALUE_GENERIC: cls._configure_generic,
             cls._STORAGE_TYPE_VALUE_JSON: cls._configure_json,
             cls._STORAGE_TYPE_VALUE_PARQUET: cls._configure_parquet,
+            cls._STORAGE_TYPE_VALUE_NPY: cls._configure_npy,
+            cls._STORAGE_TYPE_VALUE_ARROW_IPC: cls._configure_arrow_ipc,
             cls._STORAGE_TYPE_VALUE_S3_OBJECT: cls._configure_s3_object,
         }
 
@@ -524,7 +614,8 @@ class DataNodeConfig(Section):
             default_path (Optional[str]): The default path of the CSV file.
             encoding (Optional[str]): The encoding of the CSV file.
             has_header (Optional[bool]): If True, indicates that the CSV file has a header.
-            exposed_type (Optional[str]): The exposed type of the data read from CSV file.<br/>
+            exposed_type (Optional[str]): The exposed type of the data read from CSV file. Possible values
+                are *"pandas"*, *"numpy"*, *"arrow"* (`pyarrow.Table`), *"polars"*, or a custom class.<br/>
                 The default value is `pandas`.
             scope (Optional[Scope^]): The scope of the CSV data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
@@ -560,6 +651,9 @@ class DataNodeConfig(Section):
         decoder: Optional[json.JSONDecoder] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        format: Optional[str] = None,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new JSON data node configuration.
@@ -578,6 +672,15 @@ class DataNodeConfig(Section):
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            format (Optional[str]): The format of the file: *"json"* for a single JSON document, or
+                *"jsonl"* for JSON Lines (one JSON value per line).<br/>
+                The default value is *"json"*. Appending to a JSON Lines file only writes the new lines.
+            compression (Optional[str]): The algorithm used to compress the file: *"zstd"*, *"lz4"*,
+                *"gzip"*, or None for an uncompressed file.<br/>
+                The default value is None. The *"zstd"* and *"lz4"* algorithms require the `zstandard` and
+                `lz4` packages.
+            compression_level (Optional[int]): The compression level. If None, the default level of the
+                algorithm is used.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -591,6 +694,12 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_ENCODER_JSON_PROPERTY] = encoder
         if decoder is not None:
             properties[cls._OPTIONAL_DECODER_JSON_PROPERTY] = decoder
+        if format is not None:
+            properties[cls._OPTIONAL_FORMAT_JSON_PROPERTY] = format
+        if compression is not None:
+            properties[cls._OPTIONAL_COMPRESSION_JSON_PROPERTY] = compression
+        if compression_level is not None:
+            properties[cls._OPTIONAL_COMPRESSION_LEVEL_JSON_PROPERTY] = compression_level
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_JSON, scope, validity_period, **properties)
 
@@ -606,6 +715,7 @@ class DataNodeConfig(Section):
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        partition_cols: Optional[List[str]] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new Parquet data node configuration.
@@ -624,7 +734,8 @@ class DataNodeConfig(Section):
                 `pandas.DataFrame.write_parquet()` function.<br/>
                 The parameters in *read_kwargs* and *write_kwargs* have a **higher precedence** than the
                 top-level parameters which are also passed to Pandas.
-            exposed_type (Optional[str]): The exposed type of the data read from Parquet file.<br/>
+            exposed_type (Optional[str]): The exposed type of the data read from Parquet file. Possible values
+                are *"pandas"*, *"numpy"*, *"arrow"* (`pyarrow.Table`), *"polars"*, or a custom class.<br/>
                 The default value is `pandas`.
             scope (Optional[Scope^]): The scope of the Parquet data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
@@ -634,6 +745,11 @@ class DataNodeConfig(Section):
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            partition_cols (Optional[List[str]]): The columns used to partition the data in a directory
+                per value (Hive layout).<br/>
+                With the *"pyarrow"* engine, appending data writes new files in the matching partitions
+                without rewriting the existing ones, and filters on the partition columns only read the
+                matching directories. *default_path* is then the root directory of the dataset.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -651,9 +767,94 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_WRITE_KWARGS_PARQUET_PROPERTY] = write_kwargs
         if exposed_type is not None:
             properties[cls._OPTIONAL_EXPOSED_TYPE_PARQUET_PROPERTY] = exposed_type
+        if partition_cols is not None:
+            properties[cls._OPTIONAL_PARTITION_COLS_PARQUET_PROPERTY] = partition_cols
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_PARQUET, scope, validity_period, **properties)
 
+    @classmethod
+    def _configure_npy(
+        cls,
+        id: str,
+        default_path: Optional[str] = None,
+        mmap_mode: Optional[str] = None,
+        scope: Optional[Scope] = None,
+        validity_period: Optional[timedelta] = None,
+        **properties,
+    ) -> "DataNodeConfig":
+        """Configure a new NumPy `.npy` data node configuration.
+
+        The arrays read from the data nodes are memory-mapped from their file.
+
+        Parameters:
+            id (str): The unique identifier of the new `.npy` data node configuration.
+            default_path (Optional[str]): The default path of the `.npy` file.
+            mmap_mode (Optional[str]): The mode used to memory-map the file when reading it. Possible
+                values are *"r"* (read-only) or *"c"* (copy-on-write).<br/>
+                The default value is *"r"*. On Windows, where a memory-mapped file cannot be replaced until
+                the arrays read from it are released, the array is loaded in memory by default.
+            scope (Optional[Scope^]): The scope of the `.npy` data node configuration.<br/>
+                The default value is `Scope.SCENARIO`.
+            validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
+                considered up-to-date. Once the validity period has passed, the data node is considered stale and
+                relevant tasks will run even if they are skippable (see the Task configuration
+                [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
+                for more details).
+                If *validity_period* is set to None, the data node is always up-to-date.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+
+        Returns:
+            The new `.npy` data node configuration.
+        """  # noqa: E501
+        if default_path is not None:
+            properties[cls._OPTIONAL_DEFAULT_PATH_NPY_PROPERTY] = default_path
+        if mmap_mode is not None:
+            properties[cls._OPTIONAL_MMAP_MODE_NPY_PROPERTY] = mmap_mode
+
+        return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_NPY, scope, validity_period, **properties)
+
+    @classmethod
+    def _configure_arrow_ipc(
+        cls,
+        id: str,
+        default_path: Optional[str] = None,
+        exposed_type: Optional[str] = None,
+        scope: Optional[Scope] = None,
+        validity_period: Optional[timedelta] = None,
+        **properties,
+    ) -> "DataNodeConfig":
+        """Configure a new Arrow IPC data node configuration.
+
+        The files of the data nodes are memory-mapped when they are read, except on Windows where a
+        memory-mapped file cannot be replaced.
+
+        Parameters:
+            id (str): The unique identifier of the new Arrow IPC data node configuration.
+            default_path (Optional[str]): The default path of the Arrow IPC file.
+            exposed_type (Optional[str]): The exposed type of the data read from the Arrow IPC file. Possible
+                values are *"arrow"* (`pyarrow.Table`), *"polars"*, *"pandas"*, *"numpy"*, or a custom
+                class.<br/>
+                The default value is *"arrow"*. The *"arrow"* and *"polars"* exposed types do not copy the data.
+            scope (Optional[Scope^]): The scope of the Arrow IPC data node configuration.<br/>
+                The default value is `Scope.SCENARIO`.
+            validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
+                considered up-to-date. Once the validity period has passed, the data node is considered stale and
+                relevant tasks will run even if they are skippable (see the Task configuration
+                [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
+                for more details).
+                If *validity_period* is set to None, the data node is always up-to-date.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+
+        Returns:
+            The new Arrow IPC data node configuration.
+        """  # noqa: E501
+        if default_path is not None:
+            properties[cls._OPTIONAL_DEFAULT_PATH_ARROW_IPC_PROPERTY] = default_path
+        if exposed_type is not None:
+            properties[cls._OPTIONAL_EXPOSED_TYPE_ARROW_IPC_PROPERTY] = exposed_type
+
+        return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_ARROW_IPC, scope, validity_period, **properties)
+
     @classmethod
     def _configure_excel(
         cls,
@@ -664,6 +865,8 @@ class DataNodeConfig(Section):
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        engine: Optional[str] = None,
+        lazy_sheets: Optional[bool] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new Excel data node configuration.
@@ -684,6 +887,13 @@ class DataNodeConfig(Section):
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            engine (Optional[str]): The library used to read the Excel file. Possible values are
+                *"openpyxl"* or *"calamine"*.<br/>
+                The default value is *"openpyxl"*. The *"calamine"* engine parses large workbooks much
+                faster. It requires the *python-calamine* package and pandas 2.2 or higher.
+            lazy_sheets (Optional[bool]): If True, reading several sheets returns a read-only mapping
+                where each sheet is only parsed when it is first accessed.<br/>
+                The default value is False.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -697,6 +907,10 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_SHEET_NAME_EXCEL_PROPERTY] = sheet_name
         if exposed_type is not None:
             properties[cls._OPTIONAL_EXPOSED_TYPE_EXCEL_PROPERTY] = exposed_type
+        if engine is not None:
+            properties[cls._OPTIONAL_ENGINE_EXCEL_PROPERTY] = engine
+        if lazy_sheets is not None:
+            properties[cls._OPTIONAL_LAZY_SHEETS_EXCEL_PROPERTY] = lazy_sheets
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_EXCEL, scope, validity_period, **properties)
 
@@ -790,6 +1004,9 @@ class DataNodeConfig(Section):
         default_data: Optional[Any] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        out_of_band: bool = False,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new pickle data node configuration.
@@ -809,6 +1026,16 @@ class DataNodeConfig(Section):
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            compression (Optional[str]): The algorithm used to compress the file: *"zstd"*, *"lz4"*,
+                *"gzip"*, or None for an uncompressed file.<br/>
+                The default value is None. The *"zstd"* and *"lz4"* algorithms require the `zstandard` and
+                `lz4` packages.
+            compression_level (Optional[int]): The compression level. If None, the default level of the
+                algorithm is used.
+            out_of_band (bool): If True, the contiguous buffers of NumPy arrays and pandas objects are written
+                out-of-band, directly from the memory of the objects to the file.<br/>
+                The default value is False. The files that are compressed or written with out-of-band buffers
+                can only be read by a pickle data node.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -818,6 +1045,12 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_DEFAULT_PATH_PICKLE_PROPERTY] = default_path
         if default_data is not None:
             properties[cls._OPTIONAL_DEFAULT_DATA_PICKLE_PROPERTY] = default_data
+        if compression is not None:
+            properties[cls._OPTIONAL_COMPRESSION_PICKLE_PROPERTY] = compression
+        if compression_level is not None:
+            properties[cls._OPTIONAL_COMPRESSION_LEVEL_PICKLE_PROPERTY] = compression_level
+        if out_of_band:
+            properties[cls._OPTIONAL_OUT_OF_BAND_PICKLE_PROPERTY] = out_of_band
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_PICKLE, scope, validity_period, **properties)
 
@@ -839,6 +1072,9 @@ class DataNodeConfig(Section):
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        insert_batch_size: Optional[int] = None,
+        db_pool_size: Optional[int] = None,
+        db_max_overflow: Optional[int] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new SQL table data node configuration.
@@ -864,7 +1100,8 @@ class DataNodeConfig(Section):
                 The default value is ".db".
             db_extra_args (Optional[dict[str, any]]): A dictionary of additional arguments to be passed
                 into database connection string.
-            exposed_type (Optional[str]): The exposed type of the data read from SQL table.<br/>
+            exposed_type (Optional[str]): The exposed type of the data read from SQL table. Possible values
+                are *"pandas"*, *"numpy"*, *"arrow"* (`pyarrow.Table`), *"polars"*, or a custom class.<br/>
                 The default value is "pandas".
             scope (Optional[Scope^]): The scope of the SQL data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
@@ -874,6 +1111,15 @@ class DataNodeConfig(Section):
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            insert_batch_size (Optional[int]): The maximum number of rows sent to the database in a single
+                insert statement when writing or appending data.<br/>
+                The default value is 10000.
+            db_pool_size (Optional[int]): The number of connections kept open in the connection pool shared
+                by the data nodes of the same database.<br/>
+                The default value is the SQLAlchemy default of the database engine.
+            db_max_overflow (Optional[int]): The number of connections that can be opened beyond *db_pool_size*
+                when all the pooled connections are in use.<br/>
+                The default value is the SQLAlchemy default of the database engine.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -905,6 +1151,12 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY] = db_extra_args
         if exposed_type is not None:
             properties[cls._OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY] = exposed_type
+        if insert_batch_size is not None:
+            properties[cls._OPTIONAL_INSERT_BATCH_SIZE_SQL_TABLE_PROPERTY] = insert_batch_size
+        if db_pool_size is not None:
+            properties[cls._OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY] = db_pool_size
+        if db_max_overflow is not None:
+            properties[cls._OPTIONAL_DB_MAX_OVERFLOW_SQL_PROPERTY] = db_max_overflow
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_SQL_TABLE, scope, validity_period, **properties)
 
@@ -928,6 +1180,8 @@ class DataNodeConfig(Section):
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        db_pool_size: Optional[int] = None,
+        db_max_overflow: Optional[int] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new SQL data node configuration.
@@ -938,6 +1192,9 @@ class DataNodeConfig(Section):
             db_engine (str): The database engine. Possible values are *"sqlite"*, *"mssql"*, *"mysql"*,
                 or *"postgresql"*.
             read_query (str): The SQL query string used to read the data from the database.
+                The query is selected from to filter, sort, and page the rows on the database server. With
+                the *"mssql"* engine, a query with an ORDER BY clause but no TOP, OFFSET, or FOR XML clause
+                cannot be selected from, so its rows are filtered, sorted, and paged in memory.
             write_query_builder (Callable): A callback function that takes the data as an input parameter
                 and returns a list of SQL queries to be executed when writing data to the data node.
             append_query_builder (Optional[Callable]): A callback function that takes the data as an input parameter
@@ -957,7 +1214,8 @@ class DataNodeConfig(Section):
                 The default value is ".db".
             db_extra_args (Optional[dict[str, any]]): A dictionary of additional arguments to be passed
                 into database connection string.
-            exposed_type (Optional[str]): The exposed type of the data read from SQL query.<br/>
+            exposed_type (Optional[str]): The exposed type of the data read from SQL query. Possible values
+                are *"pandas"*, *"numpy"*, *"arrow"* (`pyarrow.Table`), *"polars"*, or a custom class.<br/>
                 The default value is "pandas".
             scope (Optional[Scope^]): The scope of the SQL data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
@@ -967,6 +1225,12 @@ class DataNodeConfig(Section):
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            db_pool_size (Optional[int]): The number of connections kept open in the connection pool shared
+                by the data nodes of the same database.<br/>
+                The default value is the SQLAlchemy default of the database engine.
+            db_max_overflow (Optional[int]): The number of connections that can be opened beyond *db_pool_size*
+                when all the pooled connections are in use.<br/>
+                The default value is the SQLAlchemy default of the database engine.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -1001,6 +1265,10 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY] = db_extra_args
         if exposed_type is not None:
             properties[cls._OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY] = exposed_type
+        if db_pool_size is not None:
+            properties[cls._OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY] = db_pool_size
+        if db_max_overflow is not None:
+            properties[cls._OPTIONAL_DB_MAX_OVERFLOW_SQL_PROPERTY] = db_max_overflow
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_SQL, scope, validity_period, **properties)
 
@@ -1019,6 +1287,10 @@ class DataNodeConfig(Section):
         db_extra_args: Optional[Dict[str, Any]] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        batch_size: Optional[int] = None,
+        id_field: Optional[str] = None,
+        projection: Optional[List[str]] = None,
+        indexes: Optional[List[Union[str, List, Dict[str, Any]]]] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new Mongo collection data node configuration.
@@ -1049,6 +1321,18 @@ class DataNodeConfig(Section):
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            batch_size (Optional[int]): The number of documents fetched per round trip when reading, and
+                sent per request when writing.<br/>
+                If not provided, the default batch size of the driver is used for reading and the documents
+                are written in a single request.
+            id_field (Optional[str]): The document field that identifies the documents. If provided, the
+                documents are upserted on this field, and writing the data node deletes the documents
+                that are not written again instead of dropping the collection.
+            projection (Optional[list[str]]): The fields of the documents that are read.<br/>
+                If not provided, all the fields are read.
+            indexes (Optional[list]): The indexes created on the collection before writing to it. Each
+                index is a field name, a list of (field name, direction) pairs, or a dictionary with the
+                *keys* of the index and the pymongo index options (*unique*, *name*, ...).
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -1075,6 +1359,14 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_DRIVER_MONGO_PROPERTY] = db_driver
         if db_extra_args is not None:
             properties[cls._OPTIONAL_DB_EXTRA_ARGS_MONGO_PROPERTY] = db_extra_args
+        if batch_size is not None:
+            properties[cls._OPTIONAL_BATCH_SIZE_MONGO_PROPERTY] = batch_size
+        if id_field is not None:
+            properties[cls._OPTIONAL_ID_FIELD_MONGO_PROPERTY] = id_field
+        if projection is not None:
+            properties[cls._OPTIONAL_PROJECTION_MONGO_PROPERTY] = projection
+        if indexes is not None:
+            properties[cls._OPTIONAL_INDEXES_MONGO_PROPERTY] = indexes
 
         return cls.__configure(
             id, DataNodeConfig._STORAGE_TYPE_VALUE_MONGO_COLLECTION, scope, validity_period, **properties
@@ -29,6 +29,7 @@ class JobConfig(UniqueSection):
     _DEFAULT_MODE = _DEVELOPMENT_MODE
     _DEFAULT_MAX_NB_OF_WORKERS = 2
     _MODES = [_DEVELOPMENT_MODE, _STANDALONE_MODE]
+    _TASK_FUSION_KEY = "task_fusion"
 
     mode: Optional[str]
     """The task orchestration mode.
@@ -61,6 +62,12 @@ class JobConfig(UniqueSection):
         """True if the config is set to development mode"""
         return self.mode == self._DEVELOPMENT_MODE
 
+    @property
+    def is_task_fusion_enabled(self) -> bool:
+        """True if linear chains of tasks are executed as a single job dispatch."""
+        task_fusion = self._properties.get(self._TASK_FUSION_KEY, False) if self._properties else False
+        return bool(_tpl._replace_templates(task_fusion, type=bool, required=False, default=False))
+
     @classmethod
     def default_config(cls) -> "JobConfig":
         """Return a default configuration for the job execution.
@@ -97,7 +104,11 @@ class JobConfig(UniqueSection):
 
     @staticmethod
     def _configure(
-        mode: Optional[str] = None, max_nb_of_workers: Optional[Union[int, str]] = None, **properties
+        mode: Optional[str] = None,
+        max_nb_of_workers: Optional[Union[int, str]] = None,
+        task_fusion: Optional[Union[bool, str]] = None,
+        shared_memory_budget: Optional[Union[int, str]] = None,
+        **properties,
     ) -> "JobConfig":
         """Configure job execution.
 
@@ -110,6 +121,19 @@ class JobConfig(UniqueSection):
                 A string can be provided to dynamically set the value using an environment
                 variable. The string must follow the pattern: `ENV[&lt;env_var&gt;]` where
                 `&lt;env_var&gt;` is the name of an environment variable.
+            task_fusion (Optional[bool, str]): If True, the chains of tasks whose intermediate data nodes are
+                not read by any other task of the submission are executed one after the other by a single
+                worker. The intermediate data are handed over in memory instead of being read back from
+                the storage. Each task still gets its own job.<br/>
+                The default value is False.
+            shared_memory_budget (Optional[int, str]): Parameter used only in *"standalone"* mode.
+                The maximum number of bytes of shared memory used to broadcast the inputs of the jobs to
+                the worker processes. The data nodes configured with the `shared_memory` property set to
+                True are read once, and their data (a NumPy array or a pandas DataFrame) is mapped
+                by all the workers reading the same data node version. The arrays and the numeric
+                dataframe columns without missing values are mapped without copy; the other dataframe
+                columns and the index are copied by each worker.<br/>
+                The default value is None, which disables the shared memory cache.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -117,6 +141,10 @@ class JobConfig(UniqueSection):
         """
         if max_nb_of_workers:
             properties["max_nb_of_workers"] = max_nb_of_workers
+        if task_fusion is not None:
+            properties[JobConfig._TASK_FUSION_KEY] = task_fusion
+        if shared_memory_budget:
+            properties["shared_memory_budget"] = shared_memory_budget
         section = JobConfig(mode=mode, **properties)
         Config._register(section)
         return Config.unique_sections[JobConfig.name]
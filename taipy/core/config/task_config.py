@@ -37,6 +37,12 @@ class TaskConfig(Section):
     #         exposed types (*exposed_type* field) of the input data nodes and returning results
     #         compatible with the exposed types (*exposed_type* field) of the outputs list.<br/>
     #         The default value is None.
+    #     input_columns (Dict[str, List]): The columns read from each input data node, indexed by the
+    #         input data node configuration id.<br/>
+    #         The default value is {}.
+    #     incremental (bool): If True, the function receives the data appended to the inputs since the
+    #         last successful execution of the task, followed by the data of its outputs.<br/>
+    #         The default value is False.
 
     name = "TASK"
 
@@ -44,6 +50,8 @@ class TaskConfig(Section):
     _FUNCTION = "function"
     _OUTPUT_KEY = "outputs"
     _IS_SKIPPABLE_KEY = "skippable"
+    _INPUT_COLUMNS_KEY = "input_columns"
+    _INCREMENTAL_KEY = "incremental"
 
     function: Optional[Callable]
     """User function taking as inputs some parameters compatible with the data type
@@ -104,6 +112,16 @@ class TaskConfig(Section):
         """Indicates if the task can be skipped if no change has been made on inputs."""
         return _tpl._replace_templates(self._skippable)
 
+    @property
+    def input_columns(self) -> Dict[str, List]:
+        """The columns read from each input data node, indexed by the input data node configuration id."""
+        return _tpl._replace_templates(self._properties.get(self._INPUT_COLUMNS_KEY)) or {}
+
+    @property
+    def incremental(self) -> bool:
+        """Indicates if the function only receives the data appended to the inputs since its last execution."""
+        return _tpl._replace_templates(self._properties.get(self._INCREMENTAL_KEY, False), type=bool)
+
     @classmethod
     def default_config(cls) -> "TaskConfig":
         """Get the default task configuration.
@@ -168,6 +186,8 @@ class TaskConfig(Section):
         input: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         output: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         skippable: bool = False,
+        input_columns: Optional[Dict[str, List]] = None,
+        incremental: Optional[bool] = None,
         **properties,
     ) -> "TaskConfig":
         """Configure a new task configuration.
@@ -184,11 +204,29 @@ class TaskConfig(Section):
             skippable (bool): If True, indicates that the task can be skipped if no change has
                 been made on inputs.<br/>
                 The default value is False.
+            input_columns (Optional[Dict[str, List]]): The columns the function reads from its
+                input data nodes, indexed by the input data node configuration id. Only these
+                columns are loaded from the storage of the corresponding data nodes.<br/>
+                The default value is None, meaning all the columns are read.
+            incremental (Optional[bool]): If True, the task is incremental: instead of the full data of
+                its inputs, the function receives the rows appended to each input since the last
+                successful execution of the task, followed by the data of its outputs as written by
+                that execution. The function returns the new data of the outputs, computed from the
+                previous one and the appended rows.<br/>
+                The inputs are read in full, and the function receives None for its outputs, on the
+                first execution, or when an input or an output was edited otherwise than by appending
+                rows (with `DataNode.append()^`) since the last execution. The inputs that are not made
+                of rows, such as parameters, are always read in full.<br/>
+                The default value is None, meaning the task is not incremental.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
             The new task configuration.
         """
+        if input_columns is not None:
+            properties[TaskConfig._INPUT_COLUMNS_KEY] = input_columns
+        if incremental is not None:
+            properties[TaskConfig._INCREMENTAL_KEY] = incremental
         section = TaskConfig(id, function, input, output, skippable, **properties)
         Config._register(section)
         return Config.sections[TaskConfig.name][id]
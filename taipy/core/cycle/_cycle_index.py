@@ -0,0 +1,126 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+from taipy.common.config.common.frequency import Frequency
+
+from .cycle import Cycle
+
+if TYPE_CHECKING:
+    from ..scenario.scenario import Scenario
+
+
+class _CycleIndex:
+    """In-process index of the cycles and of the scenarios they hold.
+
+    The cycles are indexed by frequency and start date, and the identifiers of the scenarios and of the
+    primary scenario are kept for each cycle. The cycle and scenario managers fill the index from their
+    repository on a miss and keep it up to date on creation, update, and deletion.
+
+    Other processes may create or delete scenarios. The identifiers of the scenarios of a cycle are
+    therefore only returned while the change marker of the scenario repository is the one they were loaded
+    with. The cycle identifiers and the primary scenario identifiers are checked against the repository
+    by the managers.
+    """
+
+    __cycle_ids: Optional[Dict[Tuple[Frequency, datetime], str]] = None
+    __scenario_ids: Dict[str, Set[str]] = {}
+    __scenario_markers: Dict[str, Any] = {}
+    __primary_ids: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def _get_cycle_id(cls, frequency: Frequency, start_date: datetime) -> Optional[str]:
+        if cls.__cycle_ids is None:
+            return None
+        return cls.__cycle_ids.get((frequency, start_date))
+
+    @classmethod
+    def _load_cycles(cls, cycles: Iterable[Cycle]) -> None:
+        cls.__cycle_ids = {}
+        for cycle in cycles:
+            cls.__cycle_ids.setdefault((cycle._frequency, cycle._start_date), cycle.id)
+
+    @classmethod
+    def _add_cycle(cls, cycle: Cycle) -> None:
+        if cls.__cycle_ids is not None:
+            cls.__cycle_ids.setdefault((cycle._frequency, cycle._start_date), cycle.id)
+
+    @classmethod
+    def _remove_cycles(cls, cycle_ids: Iterable[str]) -> None:
+        cycle_ids = set(cycle_ids)
+        if cls.__cycle_ids is not None:
+            cls.__cycle_ids = {key: value for key, value in cls.__cycle_ids.items() if value not in cycle_ids}
+        for cycle_id in cycle_ids:
+            cls.__scenario_ids.pop(cycle_id, None)
+            cls.__scenario_markers.pop(cycle_id, None)
+            cls.__primary_ids.pop(cycle_id, None)
+
+    @classmethod
+    def _get_scenario_ids(cls, cycle_id: str, marker: Optional[Any]) -> Optional[FrozenSet[str]]:
+        """Return the identifiers of the scenarios of a cycle, or None if they are not indexed.
+
+        Parameters:
+            cycle_id (str): The identifier of the cycle.
+            marker (Optional[Any]): The current change marker of the scenario repository. None is returned if
+                it is None or differs from the marker the identifiers were loaded with.
+        """
+        if marker is None or cls.__scenario_markers.get(cycle_id) != marker:
+            return None
+        if (scenario_ids := cls.__scenario_ids.get(cycle_id)) is None:
+            return None
+        return frozenset(scenario_ids)
+
+    @classmethod
+    def _get_primary_id(cls, cycle_id: str) -> Optional[str]:
+        return cls.__primary_ids.get(cycle_id)
+
+    @classmethod
+    def _load_scenarios(cls, cycle_id: str, scenarios: Iterable["Scenario"], marker: Optional[Any]) -> None:
+        """Index the scenarios of a cycle, loaded after the change marker of the scenario repository was read."""
+        cls.__scenario_ids[cycle_id] = set()
+        cls.__scenario_markers[cycle_id] = marker
+        cls.__primary_ids[cycle_id] = None
+        for scenario in scenarios:
+            cls._update_scenario(scenario)
+
+    @classmethod
+    def _update_scenario(cls, scenario: "Scenario") -> None:
+        if not scenario._cycle:
+            return
+        cycle_id = scenario._cycle.id
+        if (scenario_ids := cls.__scenario_ids.get(cycle_id)) is None:
+            return
+        scenario_ids.add(scenario.id)
+        if scenario._primary_scenario:
+            cls.__primary_ids[cycle_id] = scenario.id
+        elif cls.__primary_ids.get(cycle_id) == scenario.id:
+            cls.__primary_ids[cycle_id] = None
+
+    @classmethod
+    def _remove_scenarios(cls, scenario_ids: Iterable[str]) -> None:
+        scenario_ids = set(scenario_ids)
+        for cycle_id, cycle_scenario_ids in cls.__scenario_ids.items():
+            cycle_scenario_ids.difference_update(scenario_ids)
+            if cls.__primary_ids.get(cycle_id) in scenario_ids:
+                cls.__primary_ids[cycle_id] = None
+
+    @classmethod
+    def _clear_scenarios(cls) -> None:
+        cls.__scenario_ids.clear()
+        cls.__scenario_markers.clear()
+        cls.__primary_ids.clear()
+
+    @classmethod
+    def _clear(cls) -> None:
+        cls.__cycle_ids = None
+        cls._clear_scenarios()
@@ -11,7 +11,7 @@
 
 import calendar
 from datetime import datetime, time, timedelta
-from typing import Callable, List, Optional
+from typing import Callable, Iterable, List, Optional
 
 from taipy.common.config.common.frequency import Frequency
 
@@ -21,6 +21,7 @@ from .._repository._abstract_repository import _AbstractRepository
 from ..job._job_manager_factory import _JobManagerFactory
 from ..notification import EventEntityType, EventOperation, _publish_event
 from ..submission._submission_manager_factory import _SubmissionManagerFactory
+from ._cycle_index import _CycleIndex
 from .cycle import Cycle
 from .cycle_id import CycleId
 
@@ -54,8 +55,14 @@ class _CycleManager(_Manager[Cycle]):
     ) -> Cycle:
         creation_date = creation_date if creation_date else datetime.now()
         start_date = _CycleManager._get_start_date_of_cycle(frequency, creation_date)
+        if (cycle_id := _CycleIndex._get_cycle_id(frequency, start_date)) and (cycle := cls._get(cycle_id)):
+            return cycle
+
+        # The index misses new cycles, which may have been created by another process.
+        all_cycles = cls._get_all()
+        _CycleIndex._load_cycles(all_cycles)
         cycles = cls._get_cycles_by_frequency_and_start_date(
-            frequency=frequency, start_date=start_date, cycles=cls._get_all()
+            frequency=frequency, start_date=start_date, cycles=all_cycles
         )
         if len(cycles) > 0:
             return cycles[0]
@@ -90,6 +97,32 @@ class _CycleManager(_Manager[Cycle]):
             end_date = end_date.replace(month=12, day=31) + timedelta(days=1)
         return end_date - timedelta(microseconds=1)
 
+    @classmethod
+    def _set(cls, cycle: Cycle) -> None:
+        super()._set(cycle)
+        _CycleIndex._add_cycle(cycle)
+
+    @classmethod
+    def _delete(cls, cycle_id: CycleId) -> None:
+        _CycleIndex._remove_cycles([cycle_id])
+        super()._delete(cycle_id)
+
+    @classmethod
+    def _delete_many(cls, cycle_ids: Iterable[CycleId]) -> None:
+        cycle_ids = list(cycle_ids)
+        _CycleIndex._remove_cycles(cycle_ids)
+        super()._delete_many(cycle_ids)
+
+    @classmethod
+    def _delete_all(cls) -> None:
+        _CycleIndex._clear()
+        super()._delete_all()
+
+    @classmethod
+    def _delete_by_version(cls, version_number: str) -> None:
+        _CycleIndex._clear()
+        super()._delete_by_version(version_number)
+
     @classmethod
     def _hard_delete(cls, cycle_id: CycleId):
         cycle = cls._get(cycle_id)
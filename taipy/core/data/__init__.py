@@ -10,6 +10,7 @@
 # specific language governing permissions and limitations under the License.
 """Classes related to data nodes."""
 
+from .arrow_ipc import ArrowIPCDataNode
 from .aws_s3 import S3ObjectDataNode
 from .csv import CSVDataNode
 from .data_node import DataNode
@@ -18,6 +19,7 @@ from .generic import GenericDataNode
 from .in_memory import InMemoryDataNode
 from .json import JSONDataNode
 from .mongo import MongoCollectionDataNode
+from .npy import NpyDataNode
 from .operator import JoinOperator, Operator
 from .parquet import ParquetDataNode
 from .pickle import PickleDataNode
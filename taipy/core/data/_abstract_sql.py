@@ -14,17 +14,21 @@ import re
 import urllib.parse
 from abc import abstractmethod
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine, text
+import pyarrow as pa
+from sqlalchemy import ColumnElement, TextClause, and_, column, func, literal_column, or_, select, text
+from sqlalchemy.sql.expression import Executable
 
 from taipy.common.config.common.scope import Scope
 
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..data.operator import JoinOperator, Operator
-from ..exceptions.exceptions import MissingRequiredProperty, UnknownDatabaseEngine
+from ..exceptions.exceptions import MissingRequiredProperty, NoData, UnknownDatabaseEngine
+from ._filter import _FilterDataNode
+from ._sql_engine_registry import _SQLEngineRegistry
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
@@ -42,8 +46,17 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
     __DB_ENGINE_KEY = "db_engine"
     __DB_DRIVER_KEY = "db_driver"
     __DB_EXTRA_ARGS_KEY = "db_extra_args"
+    __DB_POOL_SIZE_KEY = "db_pool_size"
+    __DB_MAX_OVERFLOW_KEY = "db_max_overflow"
     __SQLITE_FOLDER_PATH = "sqlite_folder_path"
     __SQLITE_FILE_EXTENSION = "sqlite_file_extension"
+    # SQL Server refuses an ORDER BY in a derived table, unless TOP, OFFSET, or FOR XML is also specified.
+    __ORDER_BY_PATTERN = re.compile(r"\border\s+by\b", re.IGNORECASE)
+    __DERIVED_ORDER_BY_PATTERN = re.compile(r"\b(top|offset|for\s+xml)\b", re.IGNORECASE)
+    _VALID_STRING_EXPOSED_TYPES = [
+        *_TabularDataNodeMixin._VALID_STRING_EXPOSED_TYPES,
+        *_TabularDataNodeMixin._ARROW_EXPOSED_TYPES,
+    ]
 
     __ENGINE_PROPERTIES: List[str] = [
         __DB_NAME_KEY,
@@ -53,6 +66,8 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
         __DB_PORT_KEY,
         __DB_DRIVER_KEY,
         __DB_EXTRA_ARGS_KEY,
+        __DB_POOL_SIZE_KEY,
+        __DB_MAX_OVERFLOW_KEY,
         __SQLITE_FOLDER_PATH,
         __SQLITE_FILE_EXTENSION,
     ]
@@ -129,6 +144,8 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
                 self.__DB_ENGINE_KEY,
                 self.__DB_DRIVER_KEY,
                 self.__DB_EXTRA_ARGS_KEY,
+                self.__DB_POOL_SIZE_KEY,
+                self.__DB_MAX_OVERFLOW_KEY,
                 self.__SQLITE_FOLDER_PATH,
                 self.__SQLITE_FILE_EXTENSION,
                 self._EXPOSED_TYPE_PROPERTY,
@@ -141,12 +158,98 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
         return super().__setattr__(key, value)
 
     def filter(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
-        properties = self.properties
-        if properties[self._EXPOSED_TYPE_PROPERTY] == self._EXPOSED_TYPE_PANDAS:
-            return self._read_as_pandas_dataframe(operators=operators, join_operator=join_operator)
-        if properties[self._EXPOSED_TYPE_PROPERTY] == self._EXPOSED_TYPE_NUMPY:
-            return self._read_as_numpy(operators=operators, join_operator=join_operator)
-        return self._read_as(operators=operators, join_operator=join_operator)
+        # The operators are compiled into the WHERE clause of the query, with bound parameters.
+        return self.__read_query(operators=operators, join_operator=join_operator)
+
+    def read_or_raise(
+        self,
+        columns: Optional[List] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[Union[str, Tuple[str, bool], List[Union[str, Tuple[str, bool]]]]] = None,
+    ) -> Any:
+        """Read the data referenced by this data node.
+
+        The rows can be sorted and paged by the database server, so that a large table can be read
+        one page at a time.
+
+        Parameters:
+            columns (Optional[List]): The columns to read. If None, all the columns are read.
+            limit (Optional[int]): The maximum number of rows to read. If None, all the rows are read.
+            offset (Optional[int]): The number of rows to skip before reading. Some database engines,
+                like *mssql*, require *order_by* to be set when *offset* is used.
+            order_by (Optional[Union[str, Tuple[str, bool], List]]): The column, or list of columns, used
+                to sort the rows. A column can be given as a (column, ascending) tuple to sort it in
+                descending order.
+
+        Returns:
+            The data referenced by this data node.
+
+        Raises:
+            NoData^: If the data has not been written yet.
+        """
+        if limit is None and offset is None and order_by is None:
+            return super().read_or_raise(columns)
+        if not self.last_edit_date:
+            raise NoData(f"Data node {self.id} from config {self.config_id} has not been written yet.")
+        if columns is not None and not all(isinstance(column, str) for column in columns):
+            data = self.__read_query(limit=limit, offset=offset, order_by=order_by)
+            return _FilterDataNode._select_columns(data, list(columns))
+        return self.__read_query(
+            columns=list(columns) if columns is not None else None, limit=limit, offset=offset, order_by=order_by
+        )
+
+    def read(
+        self,
+        columns: Optional[List] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[Union[str, Tuple[str, bool], List[Union[str, Tuple[str, bool]]]]] = None,
+    ) -> Any:
+        """Read the data referenced by this data node.
+
+        The rows can be sorted and paged by the database server, so that a large table can be read
+        one page at a time.
+
+        Parameters:
+            columns (Optional[List]): The columns to read. If None, all the columns are read.
+            limit (Optional[int]): The maximum number of rows to read. If None, all the rows are read.
+            offset (Optional[int]): The number of rows to skip before reading. Some database engines,
+                like *mssql*, require *order_by* to be set when *offset* is used.
+            order_by (Optional[Union[str, Tuple[str, bool], List]]): The column, or list of columns, used
+                to sort the rows. A column can be given as a (column, ascending) tuple to sort it in
+                descending order.
+
+        Returns:
+            The data referenced by this data node. None if the data has not been written yet.
+        """
+        try:
+            return self.read_or_raise(columns, limit, offset, order_by)
+        except NoData:
+            self._logger.warning(
+                f"Data node {self.id} from config {self.config_id} is being read but has never been written."
+            )
+            return None
+
+    def count(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND) -> int:
+        """Count the rows of the data node on the database server.
+
+        Parameters:
+            operators (Optional[Union[List[Tuple], Tuple]]): A 3-element tuple or a list of 3-element
+                tuples, each is in the form of (key, value, `Operator^`), used to count only the
+                matching rows.
+            join_operator (JoinOperator^): The operator used to join the multiple filter 3-tuples.
+
+        Returns:
+            The number of rows, matching the operators if any.
+        """
+        if not self._can_wrap_base_read_query():
+            return len(self.__read_in_memory(operators=operators, join_operator=join_operator))
+        query = select(func.count()).select_from(self._get_base_read_from_clause())
+        if operators:
+            query = query.where(self.__build_where_clause(operators, join_operator))
+        with self._get_engine().connect() as connection:
+            return connection.execute(query).scalar_one()
 
     def _check_required_properties(self, properties: Dict):
         db_engine = properties.get(self.__DB_ENGINE_KEY)
@@ -163,9 +266,17 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
 
     def _get_engine(self):
         if self._engine is None:
-            self._engine = create_engine(self._conn_string())
+            self._engine = _SQLEngineRegistry._get_engine(self._conn_string(), **self.__get_pool_options())
         return self._engine
 
+    def __get_pool_options(self) -> Dict[str, Any]:
+        options = {}
+        if (pool_size := self.properties.get(self.__DB_POOL_SIZE_KEY)) is not None:
+            options["pool_size"] = pool_size
+        if (max_overflow := self.properties.get(self.__DB_MAX_OVERFLOW_KEY)) is not None:
+            options["max_overflow"] = max_overflow
+        return options
+
     def _conn_string(self) -> str:
         properties = self.properties
         engine = properties.get(self.__DB_ENGINE_KEY)
@@ -206,73 +317,220 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
         raise UnknownDatabaseEngine(f"Unknown engine: {engine}")
 
     def _read(self):
-        properties = self.properties
-        if properties[self._EXPOSED_TYPE_PROPERTY] == self._EXPOSED_TYPE_PANDAS:
-            return self._read_as_pandas_dataframe()
-        if properties[self._EXPOSED_TYPE_PROPERTY] == self._EXPOSED_TYPE_NUMPY:
-            return self._read_as_numpy()
-        return self._read_as()
-
-    def _read_as(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
+        return self.__read_query()
+
+    def __read_query(self, **query_options) -> Any:
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        if exposed_type == self._EXPOSED_TYPE_PANDAS:
+            return self._read_as_pandas_dataframe(**query_options)
+        if exposed_type == self._EXPOSED_TYPE_NUMPY:
+            return self._read_as_numpy(**query_options)
+        if exposed_type in self._ARROW_EXPOSED_TYPES:
+            return self._read_as_arrow(**query_options)
+        return self._read_as(**query_options)
+
+    def _read_as(
+        self,
+        columns: Optional[List[str]] = None,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        **query_options,
+    ):
         custom_class = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        if self.__needs_in_memory_read(columns, operators, **query_options):
+            df = self.__read_in_memory(columns, operators, join_operator, **query_options)
+            return [custom_class(**row) for row in df.to_dict(orient="records")]
         with self._get_engine().connect() as connection:
-            query_result = connection.execute(text(self._get_read_query(operators, join_operator)))
+            query_result = connection.execute(self._get_read_query(operators, join_operator, columns, **query_options))
         return [custom_class(**row) for row in query_result]
 
     def _read_as_numpy(
-        self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND
+        self,
+        columns: Optional[List[str]] = None,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        **query_options,
     ) -> np.ndarray:
-        return self._read_as_pandas_dataframe(operators=operators, join_operator=join_operator).to_numpy()
+        return self._read_as_pandas_dataframe(columns, operators, join_operator, **query_options).to_numpy()
+
+    def _read_as_arrow(
+        self,
+        columns: Optional[List[str]] = None,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        **query_options,
+    ) -> Any:
+        df = self._read_as_pandas_dataframe(columns, operators, join_operator, **query_options)
+        return self.__convert_dataframe_to_arrow(df)
+
+    def __convert_dataframe_to_arrow(self, df: pd.DataFrame) -> Any:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        return self._convert_arrow_to_exposed_type(self.properties[self._EXPOSED_TYPE_PROPERTY], table)
 
     def _read_as_pandas_dataframe(
         self,
         columns: Optional[List[str]] = None,
         operators: Optional[Union[List, Tuple]] = None,
         join_operator=JoinOperator.AND,
+        **query_options,
     ):
+        if self.__needs_in_memory_read(columns, operators, **query_options):
+            return self.__read_in_memory(columns, operators, join_operator, **query_options)
         with self._get_engine().connect() as conn:
-            result = conn.execute(text(self._get_read_query(operators, join_operator)))
+            result = conn.execute(self._get_read_query(operators, join_operator, columns, **query_options))
 
             # On pandas 1.3.5 there's a bug that makes that the dataframe from sqlalchemy query is
             # created without headers
             keys = list(result.keys())
-            if columns:
-                return pd.DataFrame(result, columns=keys)[columns]
             return pd.DataFrame(result, columns=keys)
 
-    @abstractmethod
-    def _get_read_query(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
-        query = self._get_base_read_query()
+    def __needs_in_memory_read(
+        self, columns: Optional[List[str]], operators: Optional[Union[List, Tuple]], **query_options
+    ) -> bool:
+        if not columns and not operators and all(option is None for option in query_options.values()):
+            return False
+        return not self._can_wrap_base_read_query()
 
-        if not operators:
-            return query
+    def __read_in_memory(
+        self,
+        columns: Optional[List[str]] = None,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[Union[str, Tuple[str, bool], List[Union[str, Tuple[str, bool]]]]] = None,
+    ) -> pd.DataFrame:
+        """Read all the rows of the base query, then filter, sort, page, and select them like the database would."""
+        df = self._read_as_pandas_dataframe()
+        if operators:
+            df = _FilterDataNode._filter(df, operators, join_operator)
+        if order_by is not None:
+            keys = [key if isinstance(key, tuple) else (key, True) for key in self.__as_list(order_by)]
+            df = df.sort_values([key for key, _ in keys], ascending=[ascending for _, ascending in keys], kind="stable")
+        offset = offset or 0
+        df = df.iloc[offset : None if limit is None else offset + limit]
+        if columns:
+            df = df[columns]
+        return df.reset_index(drop=True)
+
+    @staticmethod
+    def __as_list(order_by: Union[str, Tuple[str, bool], List[Union[str, Tuple[str, bool]]]]) -> List:
+        return order_by if isinstance(order_by, List) else [order_by]
+
+    def _read_columns(self, columns: List) -> Any:
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        if all(isinstance(column, str) for column in columns):
+            if exposed_type == self._EXPOSED_TYPE_PANDAS:
+                return self._read_as_pandas_dataframe(columns=columns)
+            if exposed_type == self._EXPOSED_TYPE_NUMPY:
+                return self._read_as_pandas_dataframe(columns=columns).to_numpy()
+            if exposed_type in self._ARROW_EXPOSED_TYPES:
+                return self._read_as_arrow(columns=columns)
+        return super()._read_columns(columns)
+
+    def _read_chunks(
+        self, chunksize: int, columns: Optional[List], operators: List, join_operator: JoinOperator
+    ) -> Iterator[Any]:
+        if columns is not None and not all(isinstance(column, str) for column in columns):
+            return super()._read_chunks(chunksize, columns, operators, join_operator)
+        if (columns or operators) and not self._can_wrap_base_read_query():
+            return super()._read_chunks(chunksize, columns, operators, join_operator)
+        return self.__read_partitions(chunksize, self._get_read_query(operators, join_operator, columns))
+
+    def __read_partitions(self, chunksize: int, query: Executable) -> Iterator[Any]:
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        with self._get_engine().connect() as connection:
+            # The rows are fetched from a server-side cursor, at most chunksize rows at a time.
+            result = connection.execution_options(yield_per=chunksize).execute(query)
+            keys = list(result.keys())
+            for partition in result.partitions():
+                if exposed_type == self._EXPOSED_TYPE_PANDAS:
+                    yield pd.DataFrame(partition, columns=keys)
+                elif exposed_type == self._EXPOSED_TYPE_NUMPY:
+                    yield pd.DataFrame(partition, columns=keys).to_numpy()
+                elif exposed_type in self._ARROW_EXPOSED_TYPES:
+                    yield self.__convert_dataframe_to_arrow(pd.DataFrame(partition, columns=keys))
+                else:
+                    yield [exposed_type(**row._mapping) for row in partition]
 
+    @abstractmethod
+    def _get_read_query(
+        self,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[Union[str, Tuple[str, bool], List[Union[str, Tuple[str, bool]]]]] = None,
+    ) -> Executable:
+        if not operators and not columns and limit is None and offset is None and order_by is None:
+            return text(self._get_base_read_query())
+
+        query = select(*[column(name) for name in columns] if columns else [literal_column("*")]).select_from(
+            self._get_base_read_from_clause()
+        )
+        if operators:
+            query = query.where(self.__build_where_clause(operators, join_operator))
+        if order_by is not None:
+            query = query.order_by(*self.__build_order_by_clauses(order_by))
+        if limit is not None:
+            query = query.limit(limit)
+        if offset is not None:
+            query = query.offset(offset)
+        return query
+
+    @classmethod
+    def __build_where_clause(cls, operators: Union[List, Tuple], join_operator: JoinOperator) -> ColumnElement:
         if not isinstance(operators, List):
             operators = [operators]
-
-        conditions = []
-        for key, value, operator in operators:
-            if operator == Operator.EQUAL:
-                conditions.append(f"{key} = '{value}'")
-            elif operator == Operator.NOT_EQUAL:
-                conditions.append(f"{key} <> '{value}'")
-            elif operator == Operator.GREATER_THAN:
-                conditions.append(f"{key} > '{value}'")
-            elif operator == Operator.GREATER_OR_EQUAL:
-                conditions.append(f"{key} >= '{value}'")
-            elif operator == Operator.LESS_THAN:
-                conditions.append(f"{key} < '{value}'")
-            elif operator == Operator.LESS_OR_EQUAL:
-                conditions.append(f"{key} <= '{value}'")
-
+        conditions = [cls.__build_condition(key, value, operator) for key, value, operator in operators]
         if join_operator == JoinOperator.AND:
-            query += f" WHERE {' AND '.join(conditions)}"
-        elif join_operator == JoinOperator.OR:
-            query += f" WHERE {' OR '.join(conditions)}"
-        else:
-            raise NotImplementedError(f"Join operator {join_operator} not implemented.")
+            return and_(*conditions)
+        if join_operator == JoinOperator.OR:
+            return or_(*conditions)
+        raise NotImplementedError(f"Join operator {join_operator} not implemented.")
+
+    @staticmethod
+    def __build_condition(key: str, value: Any, operator: Operator) -> ColumnElement:
+        # NumPy scalars are not supported by the database drivers.
+        value = value.item() if isinstance(value, np.generic) else value
+        if operator == Operator.EQUAL:
+            return column(key) == value
+        if operator == Operator.NOT_EQUAL:
+            return column(key) != value
+        if operator == Operator.GREATER_THAN:
+            return column(key) > value
+        if operator == Operator.GREATER_OR_EQUAL:
+            return column(key) >= value
+        if operator == Operator.LESS_THAN:
+            return column(key) < value
+        if operator == Operator.LESS_OR_EQUAL:
+            return column(key) <= value
+        raise NotImplementedError(f"Operator {operator} not implemented.")
+
+    @staticmethod
+    def __build_order_by_clauses(
+        order_by: Union[str, Tuple[str, bool], List[Union[str, Tuple[str, bool]]]],
+    ) -> List[ColumnElement]:
+        clauses: List[ColumnElement] = []
+        for key in _AbstractSQLDataNode.__as_list(order_by):
+            if isinstance(key, tuple):
+                key, ascending = key
+                clauses.append(column(key).asc() if ascending else column(key).desc())
+            else:
+                clauses.append(column(key).asc())
+        return clauses
+
+    def _can_wrap_base_read_query(self) -> bool:
+        """Return False if the base query cannot be selected from, so its rows are filtered in memory."""
+        if self.properties.get(self.__DB_ENGINE_KEY) != self.__ENGINE_MSSQL:
+            return True
+        query = self._get_base_read_query()
+        return not self.__ORDER_BY_PATTERN.search(query) or bool(self.__DERIVED_ORDER_BY_PATTERN.search(query))
 
-        return query
+    def _get_base_read_from_clause(self) -> TextClause:
+        # The base query is selected from so that it can be filtered, sorted, and paged whatever its content.
+        return text(f"({self._get_base_read_query().strip().rstrip(';')}) AS taipy_query")
 
     @abstractmethod
     def _get_base_read_query(self) -> str:
@@ -307,7 +565,21 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
                 else:
                     transaction.commit()
 
+    def _write_chunks(self, first_chunk: Any, other_chunks: Iterator) -> None:
+        # All the chunks are written in a single transaction.
+        engine = self._get_engine()
+        with engine.connect() as connection:
+            with connection.begin() as transaction:
+                try:
+                    self._do_write(first_chunk, engine, connection)
+                    for chunk in other_chunks:
+                        self._do_append(chunk, engine, connection)
+                except Exception as e:
+                    transaction.rollback()
+                    raise e
+                else:
+                    transaction.commit()
+
     @abstractmethod
     def _do_write(self, data, engine, connection) -> None:
         raise NotImplementedError
-
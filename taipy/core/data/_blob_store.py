@@ -0,0 +1,160 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import hashlib
+import os
+import shutil
+import uuid
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from taipy.common.config import Config
+from taipy.common.logger._taipy_logger import _TaipyLogger
+
+from ._file_datanode_mixin import _FileDataNodeMixin
+
+if TYPE_CHECKING:
+    from .data_node import DataNode
+
+
+class _BlobStore:
+    """Content-addressed store of the files generated by the file-based data nodes.
+
+    When the `deduplicate_files` setting of the core configuration is True, a file written by a data node
+    is hashed and stored once, under its SHA-256 digest, in the "blobs" folder of the storage folder. The
+    file of the data node becomes a hard link to the blob: the data nodes holding byte-identical files use
+    the disk space of a single file, and their readers share the pages cached by the operating system.
+
+    The number of links of a blob counts its references. Before a data node is edited or deleted, its file
+    is detached from the blob, so that the other data nodes are never modified, and the blob is removed
+    once no data node references it anymore.
+    """
+
+    __FOLDER = "blobs"
+    __HASH_BLOCK_SIZE = 1 << 20
+
+    __logger = _TaipyLogger._get_logger()
+
+    @classmethod
+    def _store(cls, data_node: "DataNode") -> None:
+        """Deduplicate the file of the data node after it is written, if the deduplication is enabled."""
+        if not Config.core.deduplicate_files or not isinstance(data_node, _FileDataNodeMixin):
+            return
+        path = data_node._path
+        # The files provided by the user are left untouched since they can be modified outside of Taipy.
+        if not data_node._is_generated or not os.path.isfile(path):
+            return
+
+        digest = cls.__hash(path)
+        try:
+            cls.__link(path, cls.__blob_path(digest))
+        except OSError as e:
+            cls.__logger.warning(f"The file of data node {data_node.id} could not be deduplicated: {e}")
+            return
+        data_node._properties.data[_FileDataNodeMixin._CONTENT_DIGEST_KEY] = digest
+
+    @classmethod
+    @contextmanager
+    def _edit(cls, data_node: "DataNode", keep_content: bool = False) -> Iterator[None]:
+        """Detach the file of the data node from its blob while it is written, then deduplicate it again.
+
+        If the write fails, the file of the data node is restored as a link to its blob, so that the data
+        node keeps its last content.
+
+        Parameters:
+            data_node (DataNode): The data node written within this context.
+            keep_content (bool): If True, the content of the file is kept, so that data can be appended to it.
+        """
+        digest = cls.__get_digest(data_node)
+        path = data_node._path  # type: ignore[attr-defined]
+        if digest and not keep_content and os.path.isfile(path):
+            # The file is moved aside instead of removed, so that it can be restored.
+            directory, file_name = os.path.split(path)
+            backup_path = os.path.join(directory, f".{file_name}.{uuid.uuid4().hex}.bak")
+            os.replace(path, backup_path)
+            try:
+                yield
+            except BaseException:
+                os.replace(backup_path, path)
+                data_node._properties.data[_FileDataNodeMixin._CONTENT_DIGEST_KEY] = digest
+                raise
+            os.remove(backup_path)
+            cls.__release(digest)
+        else:
+            cls._detach(data_node, keep_content)
+            yield
+        # The properties reloaded while the file was written may still hold the digest of the detached blob.
+        data_node._properties.data.pop(_FileDataNodeMixin._CONTENT_DIGEST_KEY, None)
+        cls._store(data_node)
+
+    @classmethod
+    def _detach(cls, data_node: "DataNode", keep_content: bool = False) -> None:
+        """Unlink the file of the data node from its blob before it is modified.
+
+        Parameters:
+            data_node (DataNode): The data node about to be modified.
+            keep_content (bool): If True, the file is replaced by a private copy of the blob, so that
+                data can be appended to it. Otherwise, the file is removed.
+        """
+        if not (digest := cls.__get_digest(data_node)):
+            return
+        path = data_node._path  # type: ignore[attr-defined]
+        if os.path.isfile(path):
+            if keep_content:
+                data_node._replace_file(lambda tmp_path: shutil.copyfile(path, tmp_path))  # type: ignore[attr-defined]
+            else:
+                os.remove(path)
+        data_node._properties.data.pop(_FileDataNodeMixin._CONTENT_DIGEST_KEY, None)
+        cls.__release(digest)
+
+    @classmethod
+    def __get_digest(cls, data_node: "DataNode") -> Optional[str]:
+        return data_node._properties.data.get(_FileDataNodeMixin._CONTENT_DIGEST_KEY)
+
+    @classmethod
+    def __blob_path(cls, digest: str) -> str:
+        return os.path.join(Config.core.storage_folder, cls.__FOLDER, digest[:2], digest)
+
+    @classmethod
+    def __hash(cls, path: str) -> str:
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as f:
+            while block := f.read(cls.__HASH_BLOCK_SIZE):
+                sha256.update(block)
+        return sha256.hexdigest()
+
+    @staticmethod
+    def __link(path: str, blob_path: str) -> None:
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        try:
+            # The first file with this content becomes the blob.
+            os.link(path, blob_path)
+            return
+        except FileExistsError:
+            pass
+
+        # The file is atomically replaced by a link to the existing blob.
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.link(blob_path, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @classmethod
+    def __release(cls, digest: str) -> None:
+        blob_path = cls.__blob_path(digest)
+        try:
+            if os.stat(blob_path).st_nlink == 1:
+                os.remove(blob_path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,73 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+import gzip
+import io
+from importlib import util
+from typing import Any, Optional
+
+from ..common._check_dependencies import _check_dependency_is_installed
+from ..exceptions.exceptions import UnknownCompressionAlgorithm
+
+if util.find_spec("zstandard"):
+    import zstandard
+
+if util.find_spec("lz4"):
+    import lz4.frame
+
+
+class _Compression:
+    """Stream compression of the files of the file-based data nodes."""
+
+    _ZSTD = "zstd"
+    _LZ4 = "lz4"
+    _GZIP = "gzip"
+    _VALID_ALGORITHMS = [_ZSTD, _LZ4, _GZIP]
+
+    __PACKAGES = {_ZSTD: "zstandard", _LZ4: "lz4"}
+
+    @classmethod
+    def _check_algorithm(cls, algorithm: Optional[str], module_name: str):
+        if algorithm is None:
+            return
+        if algorithm not in cls._VALID_ALGORITHMS:
+            raise UnknownCompressionAlgorithm(
+                f"Invalid compression algorithm: {algorithm}. "
+                f"Supported algorithms are {', '.join(cls._VALID_ALGORITHMS)}"
+            )
+        if package := cls.__PACKAGES.get(algorithm):
+            _check_dependency_is_installed(module_name, package)
+
+    @classmethod
+    def _open(cls, path: str, mode: str, algorithm: Optional[str], level: Optional[int] = None) -> Any:
+        """Open a binary file that is compressed or decompressed as a stream while it is written or read.
+
+        Parameters:
+            path (str): The path of the file.
+            mode (str): *"rb"*, *"wb"*, or *"ab"*.
+            algorithm (Optional[str]): The compression algorithm, or None for an uncompressed file.
+            level (Optional[int]): The compression level. If None, the default level of the algorithm is used.
+
+        Returns:
+            A binary file object: a built-in file, a `GzipFile`, an `LZ4FrameFile`, or a zstandard stream.
+        """
+        if algorithm is None:
+            return open(path, mode)
+        if algorithm == cls._GZIP:
+            # The default level of zlib, gzip uses the much slower level 9 otherwise.
+            return gzip.open(path, mode, compresslevel=6 if level is None else level)
+        if algorithm == cls._LZ4:
+            return lz4.frame.open(path, mode, compression_level=level or 0)
+        if "r" in mode:
+            # Appending to a file adds a frame, so the frames are read one after the other.
+            reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True)
+            return io.BufferedReader(reader)  # type: ignore[arg-type]
+        compressor = zstandard.ZstdCompressor() if level is None else zstandard.ZstdCompressor(level=level)
+        return compressor.stream_writer(open(path, mode))
@@ -10,6 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 import os
+import shutil
 from typing import Dict, Iterable, List, Optional, Set, Union
 
 from taipy.common.config import Config
@@ -25,8 +26,10 @@ from ..notification import Event, EventEntityType, EventOperation, Notifier, _ma
 from ..reason import NotGlobalScope, ReasonCollection, WrongConfigType
 from ..scenario.scenario_id import ScenarioId
 from ..sequence.sequence_id import SequenceId
+from ._blob_store import _BlobStore
 from ._data_fs_repository import _DataFSRepository
 from ._file_datanode_mixin import _FileDataNodeMixin
+from ._read_cache import _ReadCache
 from .data_node import DataNode
 from .data_node_id import DataNodeId
 
@@ -88,12 +91,23 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
         Notifier.publish(_make_event(data_node, EventOperation.CREATION))
         return data_node
 
+    @classmethod
+    def _bulk_build(
+        cls, data_node_configs: Iterable[DataNodeConfig], owner_id: Optional[str], version: str
+    ) -> Dict[DataNodeConfig, DataNode]:
+        """Create data nodes in memory, without saving them nor publishing their creation events."""
+        return {dn_config: cls.__create(dn_config, owner_id, None, version) for dn_config in data_node_configs}
+
     @classmethod
     def __create(
-        cls, data_node_config: DataNodeConfig, owner_id: Optional[str], parent_ids: Optional[Set[str]]
+        cls,
+        data_node_config: DataNodeConfig,
+        owner_id: Optional[str],
+        parent_ids: Optional[Set[str]],
+        version: Optional[str] = None,
     ) -> DataNode:
         try:
-            version = cls._get_latest_version()
+            version = version or cls._get_latest_version()
             props = data_node_config._properties.copy()
 
             if data_node_config.storage_type:
@@ -125,7 +139,13 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
     def _clean_generated_file(cls, data_node: DataNode) -> None:
         if not isinstance(data_node, _FileDataNodeMixin):
             return
-        if data_node.is_generated and os.path.exists(data_node.path):
+        _BlobStore._detach(data_node)
+        if not data_node.is_generated:
+            return
+        if os.path.isdir(data_node.path):
+            # The partitioned datasets are directories.
+            shutil.rmtree(data_node.path)
+        elif os.path.exists(data_node.path):
             os.remove(data_node.path)
 
     @classmethod
@@ -137,6 +157,7 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
     def _delete(cls, data_node_id: DataNodeId) -> None:
         if data_node := cls._get(data_node_id, None):
             cls._clean_generated_file(data_node)
+        _ReadCache._invalidate(data_node_id)
         super()._delete(data_node_id)
 
     @classmethod
@@ -146,18 +167,23 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
             if data_node := cls._get(data_node_id):
                 data_nodes.append(data_node)
         cls._clean_generated_files(data_nodes)
+        for data_node_id in data_node_ids:
+            _ReadCache._invalidate(data_node_id)
         super()._delete_many(data_node_ids)
 
     @classmethod
     def _delete_all(cls) -> None:
         data_nodes = cls._get_all()
         cls._clean_generated_files(data_nodes)
+        _ReadCache._clear()
         super()._delete_all()
 
     @classmethod
     def _delete_by_version(cls, version_number: str) -> None:
         data_nodes = cls._get_all(version_number)
         cls._clean_generated_files(data_nodes)
+        for data_node in data_nodes:
+            _ReadCache._invalidate(data_node.id)
         cls._repository._delete_by(attribute="version", value=version_number)
         Notifier.publish(
             Event(EventEntityType.DATA_NODE, EventOperation.DELETION, metadata={"delete_by_version": version_number})
@@ -12,9 +12,11 @@
 import os
 import pathlib
 import shutil
+import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from os.path import isfile
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional
 
 from taipy.common.config import Config
 from taipy.common.logger._taipy_logger import _TaipyLogger
@@ -28,12 +30,23 @@ from .data_node_id import Edit
 class _FileDataNodeMixin(object):
     """Mixin class designed to handle file-based data nodes."""
 
-    __EXTENSION_MAP = {"csv": "csv", "excel": "xlsx", "parquet": "parquet", "pickle": "p", "json": "json"}
+    __EXTENSION_MAP = {
+        "csv": "csv",
+        "excel": "xlsx",
+        "parquet": "parquet",
+        "pickle": "p",
+        "json": "json",
+        "npy": "npy",
+        "arrow_ipc": "arrow",
+    }
 
     _DEFAULT_DATA_KEY = "default_data"
     _PATH_KEY = "path"
     _DEFAULT_PATH_KEY = "default_path"
     _IS_GENERATED_KEY = "is_generated"
+    _CONTENT_DIGEST_KEY = "content_digest"
+    # On Windows, a file cannot be replaced while it is memory-mapped.
+    _CAN_REPLACE_MAPPED_FILES = os.name != "nt"
 
     __logger = _TaipyLogger._get_logger()
 
@@ -140,7 +153,8 @@ class _FileDataNodeMixin(object):
                 reason_collection._add_reason(self.id, InvalidUploadFile(upload_path.name, self.id))  # type: ignore[attr-defined]
                 return reason_collection
 
-        shutil.copy(upload_path, self.path)
+        with self._edit_file():
+            shutil.copy(upload_path, self.path)
 
         self.track_edit(timestamp=datetime.now())  # type: ignore[attr-defined]
         self.unlock_edit()  # type: ignore[attr-defined]
@@ -153,7 +167,8 @@ class _FileDataNodeMixin(object):
 
     def _write_default_data(self, default_value: Any):
         if default_value is not None and not os.path.exists(self._path):
-            self._write(default_value)  # type: ignore[attr-defined]
+            with self._edit_file():
+                self._write(default_value)  # type: ignore[attr-defined]
             self._last_edit_date = DataNode._get_last_modified_datetime(self._path) or datetime.now()
             self._edits.append(  # type: ignore[attr-defined]
                 Edit(
@@ -168,6 +183,38 @@ class _FileDataNodeMixin(object):
         if not self._last_edit_date and isfile(self._path):
             self._last_edit_date = datetime.now()
 
+    @contextmanager
+    def _edit_file(self, keep_content: bool = False) -> Iterator[None]:
+        """Write the file of the data node within this context.
+
+        Every write goes through this context, so that the file is detached from the blob shared with other
+        data nodes before it is modified, and deduplicated again once it is written (see `_BlobStore`). If
+        the write fails, the file shared with other data nodes is restored.
+
+        Parameters:
+            keep_content (bool): If True, the content of the file is kept, so that data can be appended to it.
+        """
+        from ._blob_store import _BlobStore
+
+        with _BlobStore._edit(self, keep_content):  # type: ignore[arg-type]
+            yield
+
+    def _replace_file(self, write_fct: Callable[[str], None]):
+        """Write a new file with *write_fct* next to the file of the data node, then replace it.
+
+        The file is never partially written. On POSIX systems, the processes that memory-mapped the
+        previous file keep reading its content. On Windows, the file cannot be replaced while it is
+        memory-mapped, so *write_fct* must release the memory maps of the file it opens.
+        """
+        directory, file_name = os.path.split(self._path)
+        tmp_path = os.path.join(directory, f".{file_name}.{uuid.uuid4().hex}.tmp")
+        try:
+            write_fct(tmp_path)
+            os.replace(tmp_path, self._path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     def _build_path(self, storage_type) -> str:
         folder = f"{storage_type}s"
         dir_path = pathlib.Path(Config.core.storage_folder) / folder
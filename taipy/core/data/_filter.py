@@ -9,16 +9,20 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import sys
 from collections.abc import Hashable
 from functools import reduce
-from itertools import chain
+from itertools import compress
 from operator import and_, or_
-from typing import Dict, Iterable, List, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pandas.core.common import is_bool_indexer
 
+from ._lazy_sheets import _LazySheets
 from .operator import JoinOperator, Operator
 
 
@@ -27,8 +31,20 @@ class _FilterDataNode:
     def __is_pandas_object(data) -> bool:
         return isinstance(data, (pd.DataFrame, pd.Series))
 
+    @staticmethod
+    def _is_polars_dataframe(data) -> bool:
+        # Polars is an optional dependency: there is no Polars data if the package was never imported.
+        polars = sys.modules.get("polars")
+        return polars is not None and isinstance(data, polars.DataFrame)
+
+    @staticmethod
+    def __is_arrow_object(data) -> bool:
+        return isinstance(data, pa.Table) or _FilterDataNode._is_polars_dataframe(data)
+
     @staticmethod
     def __is_multi_sheet_excel(data) -> bool:
+        if isinstance(data, _LazySheets):
+            return True
         if isinstance(data, Dict):
             has_df_children = all(isinstance(e, pd.DataFrame) for e in data.values())
             has_list_children = all(isinstance(e, List) for e in data.values())
@@ -54,7 +70,7 @@ class _FilterDataNode:
         if isinstance(key, pd.DataFrame):
             return _FilterDataNode.__getitem_dataframe(data, key)
 
-        if is_bool_indexer(key):
+        if is_bool_indexer(key) or _FilterDataNode.__is_arrow_bool_indexer(key):
             return _FilterDataNode.__getitem_bool_indexer(data, key)
 
         if isinstance(key, Iterable):
@@ -70,6 +86,10 @@ class _FilterDataNode:
     def __getitem_hashable(data, key):
         if _FilterDataNode.__is_pandas_object(data) or _FilterDataNode.__is_multi_sheet_excel(data):
             return data.get(key)
+        if isinstance(data, pa.Table):
+            return data.column(key) if key in data.column_names else None
+        if _FilterDataNode._is_polars_dataframe(data):
+            return data.get_column(key) if key in data.columns else None
         return [getattr(entry, key, None) for entry in data]
 
     @staticmethod
@@ -94,155 +114,249 @@ class _FilterDataNode:
     def __getitem_bool_indexer(data, key):
         if _FilterDataNode.__is_pandas_object(data):
             return data[key]
+        if _FilterDataNode.__is_arrow_object(data):
+            return data.filter(key if _FilterDataNode.__is_arrow_bool_indexer(key) else np.asarray(key, dtype=bool))
         return [e for i, e in enumerate(data) if key[i]]
 
+    @staticmethod
+    def __is_arrow_bool_indexer(key) -> bool:
+        return isinstance(key, (pa.Array, pa.ChunkedArray)) and pa.types.is_boolean(key.type)
+
     @staticmethod
     def __getitem_iterable(data, keys):
         if _FilterDataNode.__is_pandas_object(data):
             return data[keys]
+        if _FilterDataNode.__is_arrow_object(data):
+            return data.select(list(keys))
 
         return [{k: getattr(entry, k) for k in keys if hasattr(entry, k)} for entry in data]
 
+    @staticmethod
+    def _select_columns(data, columns: List):
+        if data is None:
+            return None
+        if _FilterDataNode.__is_pandas_object(data):
+            return data[columns]
+        if isinstance(data, np.ndarray):
+            return data[:, [int(column) for column in columns]]
+        if _FilterDataNode.__is_arrow_object(data):
+            return data.select(columns)
+        if _FilterDataNode.__is_multi_sheet_excel(data):
+            return {k: _FilterDataNode._select_columns(v, columns) for k, v in data.items()}
+        if isinstance(data, List):
+            return [
+                {k: row[k] for k in columns if k in row}
+                if isinstance(row, Dict)
+                else {k: getattr(row, k) for k in columns if hasattr(row, k)}
+                for row in data
+            ]
+        raise NotImplementedError
+
+    @staticmethod
+    def _split_chunks(data, chunksize: int) -> Iterator:
+        if data is None:
+            return
+        if _FilterDataNode.__is_pandas_object(data):
+            for start in range(0, len(data), chunksize):
+                yield data.iloc[start : start + chunksize]
+        elif isinstance(data, (list, tuple, np.ndarray)):
+            for start in range(0, len(data), chunksize):
+                yield data[start : start + chunksize]
+        elif _FilterDataNode.__is_arrow_object(data):
+            # Slices of Arrow tables and Polars dataframes are zero-copy.
+            for start in range(0, len(data), chunksize):
+                yield data.slice(start, chunksize)
+        else:
+            # Data that cannot be sliced by rows, such as multi-sheet Excel data, is a single chunk.
+            yield data
+
+    @staticmethod
+    def _count_rows(data) -> Optional[int]:
+        """Return the number of rows of tabular data, or None if the data is not made of rows."""
+        if _FilterDataNode.__is_pandas_object(data) or _FilterDataNode.__is_arrow_object(data):
+            return len(data)
+        if isinstance(data, (list, tuple, np.ndarray)):
+            return len(data)
+        return None
+
+    @staticmethod
+    def _slice_rows(data, start: int, stop: Optional[int] = None):
+        if _FilterDataNode.__is_pandas_object(data):
+            return data.iloc[start:stop]
+        if _FilterDataNode.__is_arrow_object(data):
+            return data.slice(start, None if stop is None else max(stop - start, 0))
+        return data[start:stop]
+
+    @staticmethod
+    def _concat_chunks(chunks: List):
+        if not chunks:
+            return []
+        if all(_FilterDataNode.__is_pandas_object(chunk) for chunk in chunks):
+            return pd.concat(chunks)
+        if all(isinstance(chunk, np.ndarray) for chunk in chunks):
+            return np.concatenate(chunks)
+        if all(isinstance(chunk, pa.Table) for chunk in chunks):
+            return pa.concat_tables(chunks)
+        if all(_FilterDataNode._is_polars_dataframe(chunk) for chunk in chunks):
+            return sys.modules["polars"].concat(chunks)
+        if all(isinstance(chunk, (list, tuple)) for chunk in chunks):
+            return [row for chunk in chunks for row in chunk]
+        if len(chunks) == 1:
+            return chunks[0]
+        raise NotImplementedError
+
     @staticmethod
     def _filter(data, operators: Union[List, Tuple], join_operator=JoinOperator.AND):
         if len(operators) == 0:
             return data
 
-        if isinstance(data, Dict):
+        if isinstance(data, (Dict, _LazySheets)):
             return {k: _FilterDataNode._filter(v, operators, join_operator) for k, v in data.items()}
 
         if not isinstance(operators[0], (list, tuple)):
-            if isinstance(data, pd.DataFrame):
-                return _FilterDataNode.__filter_dataframe_per_key_value(data, operators[0], operators[1], operators[2])
-            if isinstance(data, np.ndarray):
-                list_operators = [operators]
-                return _FilterDataNode.__filter_numpy_array(data, list_operators)
-            if isinstance(data, List):
-                return _FilterDataNode.__filter_list_per_key_value(data, operators[0], operators[1], operators[2])
-        else:
-            if isinstance(data, pd.DataFrame):
-                return _FilterDataNode.__filter_dataframe(data, operators, join_operator=join_operator)
-            if isinstance(data, np.ndarray):
-                return _FilterDataNode.__filter_numpy_array(data, operators, join_operator=join_operator)
-            if isinstance(data, List):
-                return _FilterDataNode.__filter_list(data, operators, join_operator=join_operator)
+            operators = [operators]
+
+        if isinstance(data, pd.DataFrame):
+            return data[_FilterDataNode.__join_masks([data[key] for key, _, _ in operators], operators, join_operator)]
+        if isinstance(data, np.ndarray):
+            columns = [data[:, int(key)] for key, _, _ in operators]
+            return data[_FilterDataNode.__join_masks(columns, operators, join_operator)]
+        if isinstance(data, List):
+            return _FilterDataNode.__filter_list(data, operators, join_operator)
+        if isinstance(data, pa.Table):
+            if (expression := _FilterDataNode._build_arrow_expression(operators, join_operator)) is None:
+                raise NotImplementedError
+            return data.filter(expression)
+        if _FilterDataNode._is_polars_dataframe(data):
+            return data.filter(_FilterDataNode.__build_polars_expression(operators, join_operator))
         raise NotImplementedError
 
     @staticmethod
-    def __filter_dataframe(df_data: pd.DataFrame, operators: Union[List, Tuple], join_operator=JoinOperator.AND):
-        if join_operator == JoinOperator.AND:
-            how = "inner"
-        elif join_operator == JoinOperator.OR:
-            how = "outer"
-        else:
-            raise NotImplementedError
-
-        filtered_df_data = [
-            _FilterDataNode.__filter_dataframe_per_key_value(df_data, key, value, operator)
-            for key, value, operator in operators
-        ]
+    def _build_arrow_expression(
+        operators: Union[List, Tuple], join_operator=JoinOperator.AND, column_names: Optional[List[str]] = None
+    ) -> Optional[pc.Expression]:
+        """Build the Arrow expression of the filter, or None if it cannot be expressed with Arrow.
+
+        The keys are positions in *column_names* if provided, column names otherwise.
+        """
+        conditions = []
+        for key, value, operator in operators:
+            field = pc.field(column_names[int(key)] if column_names is not None else key)
+            if value is None:
+                if operator == Operator.EQUAL:
+                    conditions.append(field.is_null(nan_is_null=True))
+                elif operator == Operator.NOT_EQUAL:
+                    conditions.append(~field.is_null(nan_is_null=True))
+                else:
+                    return None
+            elif operator == Operator.EQUAL:
+                conditions.append(field == value)
+            elif operator == Operator.NOT_EQUAL:
+                # Keep the pandas semantics where missing values are different from any value.
+                conditions.append((field != value) | field.is_null())
+            elif operator == Operator.LESS_THAN:
+                conditions.append(field < value)
+            elif operator == Operator.LESS_OR_EQUAL:
+                conditions.append(field <= value)
+            elif operator == Operator.GREATER_THAN:
+                conditions.append(field > value)
+            elif operator == Operator.GREATER_OR_EQUAL:
+                conditions.append(field >= value)
+            else:
+                return None
+        return _FilterDataNode.__join(conditions, join_operator)
 
-        return _FilterDataNode.__dataframe_merge(filtered_df_data, how) if filtered_df_data else pd.DataFrame()
+    @staticmethod
+    def __build_polars_expression(operators: Union[List, Tuple], join_operator=JoinOperator.AND) -> Any:
+        polars = sys.modules["polars"]
+        conditions = []
+        for key, value, operator in operators:
+            column = polars.col(key)
+            if value is None and operator == Operator.EQUAL:
+                conditions.append(column.is_null())
+            elif value is None and operator == Operator.NOT_EQUAL:
+                conditions.append(column.is_not_null())
+            elif operator == Operator.EQUAL:
+                conditions.append(column == value)
+            elif operator == Operator.NOT_EQUAL:
+                conditions.append((column != value) | column.is_null())
+            elif operator == Operator.LESS_THAN:
+                conditions.append(column < value)
+            elif operator == Operator.LESS_OR_EQUAL:
+                conditions.append(column <= value)
+            elif operator == Operator.GREATER_THAN:
+                conditions.append(column > value)
+            elif operator == Operator.GREATER_OR_EQUAL:
+                conditions.append(column >= value)
+            else:
+                raise NotImplementedError
+        return _FilterDataNode.__join(conditions, join_operator)
 
     @staticmethod
-    def __filter_dataframe_per_key_value(df_data: pd.DataFrame, key: str, value, operator: Operator):
-        df_by_col = df_data[key]
-        if operator == Operator.EQUAL:
-            df_by_col = df_by_col == value
-        if operator == Operator.NOT_EQUAL:
-            df_by_col = df_by_col != value
-        if operator == Operator.LESS_THAN:
-            df_by_col = df_by_col < value
-        if operator == Operator.LESS_OR_EQUAL:
-            df_by_col = df_by_col <= value
-        if operator == Operator.GREATER_THAN:
-            df_by_col = df_by_col > value
-        if operator == Operator.GREATER_OR_EQUAL:
-            df_by_col = df_by_col >= value
-        return df_data[df_by_col]
+    def __join(conditions: List, join_operator=JoinOperator.AND):
+        if join_operator == JoinOperator.AND:
+            return reduce(and_, conditions)
+        if join_operator == JoinOperator.OR:
+            return reduce(or_, conditions)
+        raise NotImplementedError
 
     @staticmethod
-    def __dataframe_merge(df_list: List, how="inner"):
-        return reduce(lambda df1, df2: pd.merge(df1, df2, how=how), df_list)
+    def __filter_list(list_data: List, operators: Union[List, Tuple], join_operator=JoinOperator.AND):
+        # Convert the rows to a columnar form once per key so that the conditions are evaluated vectorized.
+        columns: Dict[Hashable, pd.Series] = {}
+        for key, _, _ in operators:
+            if key not in columns:
+                columns[key] = pd.Series(
+                    [row.get(key) if isinstance(row, Dict) else getattr(row, key, None) for row in list_data],
+                    dtype=object,
+                )
+        mask = _FilterDataNode.__join_masks(
+            [columns[key] for key, _, _ in operators], operators, join_operator, _FilterDataNode.__is_none
+        )
+        return list(compress(list_data, mask))
 
     @staticmethod
-    def __filter_numpy_array(data: np.ndarray, operators: Union[List, Tuple], join_operator=JoinOperator.AND):
-        conditions = [
-            _FilterDataNode.__get_filter_condition_per_key_value(data, key, value, operator)
-            for key, value, operator in operators
-        ]
+    def __is_none(column: pd.Series) -> np.ndarray:
+        # A None value only matches the None values of a list, as NaN == None is False.
+        return np.fromiter((value is None for value in column), dtype=bool, count=len(column))
 
+    @staticmethod
+    def __join_masks(
+        columns: List, operators: Union[List, Tuple], join_operator=JoinOperator.AND, is_missing=pd.isna
+    ) -> np.ndarray:
         if join_operator == JoinOperator.AND:
-            join_conditions = reduce(and_, conditions)
+            join = and_
         elif join_operator == JoinOperator.OR:
-            join_conditions = reduce(or_, conditions)
+            join = or_
         else:
             raise NotImplementedError
-
-        return data[join_conditions]
+        masks = (
+            _FilterDataNode.__get_mask(column, value, operator, is_missing)
+            for column, (_, value, operator) in zip(columns, operators)
+        )
+        mask = reduce(join, masks)
+        if isinstance(mask, pd.Series):
+            # Nullable dtypes produce missing values in the mask, which never match.
+            return mask.fillna(False).to_numpy(dtype=bool)
+        return np.asarray(mask, dtype=bool)
 
     @staticmethod
-    def __get_filter_condition_per_key_value(array_data: np.ndarray, key, value, operator: Operator):
-        if not isinstance(key, int):
-            key = int(key)
-
+    def __get_mask(column, value, operator: Operator, is_missing=pd.isna):
+        if value is None:
+            if operator == Operator.EQUAL:
+                return is_missing(column)
+            if operator == Operator.NOT_EQUAL:
+                return ~is_missing(column)
         if operator == Operator.EQUAL:
-            return array_data[:, key] == value
+            return column == value
         if operator == Operator.NOT_EQUAL:
-            return array_data[:, key] != value
+            return column != value
         if operator == Operator.LESS_THAN:
-            return array_data[:, key] < value
+            return column < value
         if operator == Operator.LESS_OR_EQUAL:
-            return array_data[:, key] <= value
+            return column <= value
         if operator == Operator.GREATER_THAN:
-            return array_data[:, key] > value
+            return column > value
         if operator == Operator.GREATER_OR_EQUAL:
-            return array_data[:, key] >= value
-
+            return column >= value
         raise NotImplementedError
-
-    @staticmethod
-    def __filter_list(list_data: List, operators: Union[List, Tuple], join_operator=JoinOperator.AND):
-        filtered_list_data = [
-            _FilterDataNode.__filter_list_per_key_value(list_data, key, value, operator)
-            for key, value, operator in operators
-        ]
-        if not filtered_list_data:
-            return filtered_list_data
-
-        if join_operator == JoinOperator.AND:
-            return _FilterDataNode.__list_intersect(filtered_list_data)
-        elif join_operator == JoinOperator.OR:
-            merged_list = list(chain.from_iterable(filtered_list_data))
-            if all(isinstance(e, Dict) for e in merged_list):
-                return list({frozenset(item.items()) for item in merged_list})
-            return list(set(merged_list))
-        else:
-            raise NotImplementedError
-
-    @staticmethod
-    def __filter_list_per_key_value(list_data: List, key: str, value, operator: Operator):
-        filtered_list = []
-        for row in list_data:
-            if isinstance(row, Dict):
-                row_value = row.get(key, None)
-            else:
-                row_value = getattr(row, key, None)
-
-            if operator == Operator.EQUAL and row_value == value:
-                filtered_list.append(row)
-            if operator == Operator.NOT_EQUAL and row_value != value:
-                filtered_list.append(row)
-            if operator == Operator.LESS_THAN and row_value < value:
-                filtered_list.append(row)
-            if operator == Operator.LESS_OR_EQUAL and row_value <= value:
-                filtered_list.append(row)
-            if operator == Operator.GREATER_THAN and row_value > value:
-                filtered_list.append(row)
-            if operator == Operator.GREATER_OR_EQUAL and row_value >= value:
-                filtered_list.append(row)
-        return filtered_list
-
-    @staticmethod
-    def __list_intersect(list_data):
-        return list(set(list_data.pop()).intersection(*map(set, list_data)))
@@ -0,0 +1,47 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List
+
+
+class _LazySheets(Mapping):
+    """Read-only mapping from sheet names to sheet data, each sheet being read when it is first accessed.
+
+    The sheets already read are kept, so that a sheet is read at most once.
+    """
+
+    def __init__(self, sheet_names: List[str], read_sheet: Callable[[str], Any]):
+        self.__sheet_names = list(sheet_names)
+        self.__read_sheet = read_sheet
+        self.__sheets: Dict[str, Any] = {}
+
+    def __getitem__(self, sheet_name: str) -> Any:
+        if sheet_name not in self.__sheets:
+            if sheet_name not in self.__sheet_names:
+                raise KeyError(sheet_name)
+            self.__sheets[sheet_name] = self.__read_sheet(sheet_name)
+        return self.__sheets[sheet_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__sheet_names)
+
+    def __len__(self) -> int:
+        return len(self.__sheet_names)
+
+    def __contains__(self, sheet_name: object) -> bool:
+        return sheet_name in self.__sheet_names
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.__sheet_names}, read={list(self.__sheets)})"
+
+    def _is_read(self, sheet_name: str) -> bool:
+        return sheet_name in self.__sheets
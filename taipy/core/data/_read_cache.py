@@ -0,0 +1,107 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from collections import OrderedDict
+from datetime import datetime
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from taipy.common.config import Config
+
+if TYPE_CHECKING:
+    from .data_node import DataNode
+
+
+class _ReadCache:
+    """In-process cache of the data read from the data nodes opted in, under a least recently used policy.
+
+    An entry is keyed on the data node id, its last edit date, and the columns read, so that a new edit
+    of the data never serves stale data. The cache is bounded by the `read_cache_budget` (in bytes) of
+    the core configuration. Only pandas objects and NumPy arrays are cached since their memory usage is
+    measured.
+    """
+
+    _READ_CACHE_KEY = "read_cache"
+    _READ_CACHE_MODE_KEY = "read_cache_mode"
+    _COPY_MODE = "copy"
+    _VIEW_MODE = "view"
+
+    __entries: OrderedDict[Tuple[str, datetime, Optional[Tuple]], Tuple[Any, int]] = OrderedDict()
+    __size = 0
+    __lock = Lock()
+
+    @classmethod
+    def _read(cls, data_node: "DataNode", last_edit_date: datetime, columns: Optional[List], read: Callable) -> Any:
+        """Return the data from the cache if the data node is opted in, reading and caching it if missing."""
+        budget = Config.core.read_cache_budget
+        properties = data_node.properties
+        if not budget or not properties.get(cls._READ_CACHE_KEY):
+            return read()
+
+        mode = properties.get(cls._READ_CACHE_MODE_KEY) or Config.core.read_cache_mode
+        key = (data_node.id, last_edit_date, tuple(columns) if columns is not None else None)
+        with cls.__lock:
+            if key in cls.__entries:
+                cls.__entries.move_to_end(key)
+                return cls.__expose(cls.__entries[key][0], mode)
+
+        data = read()
+        if (size := cls.__memory_usage(data)) is None or size > budget:
+            return data
+        if isinstance(data, np.ndarray):
+            data.flags.writeable = False
+        with cls.__lock:
+            for stale_key in [k for k in cls.__entries if k[0] == data_node.id and k[1] != last_edit_date]:
+                cls.__evict(stale_key)
+            if key not in cls.__entries:
+                while cls.__size + size > budget and cls.__entries:
+                    cls.__evict(next(iter(cls.__entries)))
+                cls.__entries[key] = (data, size)
+                cls.__size += size
+        return cls.__expose(data, mode)
+
+    @staticmethod
+    def __memory_usage(data: Any) -> Optional[int]:
+        if isinstance(data, pd.DataFrame):
+            return int(data.memory_usage(deep=True).sum())
+        if isinstance(data, pd.Series):
+            return int(data.memory_usage(deep=True))
+        if isinstance(data, np.ndarray) and not data.dtype.hasobject:
+            return int(data.nbytes)
+        return None
+
+    @classmethod
+    def __expose(cls, data: Any, mode: str) -> Any:
+        if mode == cls._VIEW_MODE:
+            # NumPy views are read-only. Pandas shallow copies share the cached data and must not be modified
+            # in place, unless the pandas copy-on-write mode is enabled.
+            return data.view() if isinstance(data, np.ndarray) else data.copy(deep=False)
+        return data.copy()
+
+    @classmethod
+    def __evict(cls, key: Tuple[str, datetime, Optional[Tuple]]):
+        _, size = cls.__entries.pop(key)
+        cls.__size -= size
+
+    @classmethod
+    def _invalidate(cls, data_node_id: str):
+        with cls.__lock:
+            for key in [k for k in cls.__entries if k[0] == data_node_id]:
+                cls.__evict(key)
+
+    @classmethod
+    def _clear(cls):
+        with cls.__lock:
+            cls.__entries.clear()
+            cls.__size = 0
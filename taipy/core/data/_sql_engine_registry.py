@@ -0,0 +1,77 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+from threading import Lock
+from typing import Any, Dict, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+
+class _SQLEngineRegistry:
+    """Process-wide registry of the SQLAlchemy engines used by the SQL data nodes.
+
+    Data node entities are rebuilt from the repositories on most accesses, so an engine owned by an entity
+    would open a new connection pool each time. The engines are shared by all the data nodes with the same
+    connection string and engine options instead. In a child process created by `fork`, the engines get new
+    connection pools since the connections of the parent process must not be used.
+    """
+
+    __POOL_STATISTICS = {"size": "size", "checked_in": "checkedin", "checked_out": "checkedout", "overflow": "overflow"}
+
+    __engines: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Engine] = {}
+    __lock = Lock()
+
+    @classmethod
+    def _get_engine(cls, conn_string: str, **options) -> Engine:
+        """Return the engine of the connection string and options, creating it on the first call."""
+        key = (conn_string, tuple(sorted(options.items())))
+        with cls.__lock:
+            if (engine := cls.__engines.get(key)) is None:
+                engine = create_engine(conn_string, **options)
+                cls.__engines[key] = engine
+        return engine
+
+    @classmethod
+    def _get_statistics(cls) -> Dict[str, Dict[str, int]]:
+        """Return the state of the connection pools, by database URL without the password.
+
+        The statistics available depend on the pool class. The pools of the engines created with different
+        options for the same database are summed up.
+        """
+        statistics: Dict[str, Dict[str, int]] = {}
+        with cls.__lock:
+            engines = list(cls.__engines.values())
+        for engine in engines:
+            engine_statistics = statistics.setdefault(engine.url.render_as_string(hide_password=True), {})
+            for name, method in cls.__POOL_STATISTICS.items():
+                if callable(pool_method := getattr(engine.pool, method, None)):
+                    engine_statistics[name] = engine_statistics.get(name, 0) + pool_method()
+        return statistics
+
+    @classmethod
+    def _reset_after_fork(cls):
+        cls.__lock = Lock()
+        for engine in cls.__engines.values():
+            # The connections inherited from the parent process are left open for the parent to use.
+            engine.dispose(close=False)
+
+    @classmethod
+    def _clear(cls):
+        with cls.__lock:
+            for engine in cls.__engines.values():
+                engine.dispose()
+            cls.__engines.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_SQLEngineRegistry._reset_after_fork)
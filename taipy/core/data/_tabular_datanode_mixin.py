@@ -13,8 +13,11 @@ from typing import Any, Callable, Dict, List, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 
+from ..common._check_dependencies import _check_dependency_is_installed
 from ..exceptions.exceptions import InvalidExposedType
+from ._filter import _FilterDataNode
 
 
 class _TabularDataNodeMixin(object):
@@ -24,8 +27,11 @@ class _TabularDataNodeMixin(object):
     _EXPOSED_TYPE_PROPERTY = "exposed_type"
     _EXPOSED_TYPE_NUMPY = "numpy"
     _EXPOSED_TYPE_PANDAS = "pandas"
+    _EXPOSED_TYPE_ARROW = "arrow"
+    _EXPOSED_TYPE_POLARS = "polars"
     _EXPOSED_TYPE_MODIN = "modin"  # Deprecated in favor of pandas since 3.1.0
     _VALID_STRING_EXPOSED_TYPES = [_EXPOSED_TYPE_PANDAS, _EXPOSED_TYPE_NUMPY]
+    _ARROW_EXPOSED_TYPES = [_EXPOSED_TYPE_ARROW, _EXPOSED_TYPE_POLARS]
 
     def __init__(self, **kwargs) -> None:
         self._decoder: Union[Callable, Any]
@@ -44,6 +50,13 @@ class _TabularDataNodeMixin(object):
         if callable(custom_encoder):
             self._encoder = custom_encoder
 
+    @staticmethod
+    def _order_columns(df: pd.DataFrame, columns: List) -> pd.DataFrame:
+        """Reorder the columns loaded by a reader (in file order) as requested, by label or by position."""
+        if all(column in df.columns for column in columns):
+            return df[columns]
+        positions = sorted(columns)
+        return df.iloc[:, [positions.index(column) for column in columns]]
 
     def _convert_data_to_dataframe(self, exposed_type: Any, data: Any) -> Union[pd.DataFrame, pd.Series]:
         if exposed_type == self._EXPOSED_TYPE_PANDAS and isinstance(data, (pd.DataFrame, pd.Series)):
@@ -52,8 +65,30 @@ class _TabularDataNodeMixin(object):
             return pd.DataFrame(data)
         elif isinstance(data, list) and not isinstance(exposed_type, str):
             return pd.DataFrame.from_records([self._encoder(row) for row in data])
+        elif isinstance(data, pa.Table) or _FilterDataNode._is_polars_dataframe(data):
+            return data.to_pandas()
         return pd.DataFrame(data)
 
+    def _convert_data_to_arrow(self, exposed_type: Any, data: Any) -> pa.Table:
+        """Convert the data to an Arrow table, without copy for Arrow tables and Polars dataframes."""
+        if isinstance(data, pa.Table):
+            return data
+        if _FilterDataNode._is_polars_dataframe(data):
+            return data.to_arrow()
+        df = self._convert_data_to_dataframe(exposed_type, data)
+        if isinstance(df, pd.Series):
+            df = pd.DataFrame(df)
+        df.columns = df.columns.astype(str)
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+    def _convert_arrow_to_exposed_type(self, exposed_type: str, table: pa.Table) -> Any:
+        """Convert an Arrow table read to the *"arrow"* or *"polars"* exposed type."""
+        if exposed_type == self._EXPOSED_TYPE_POLARS:
+            import polars as pl
+
+            return pl.from_arrow(table)
+        return table
+
     @classmethod
     def _get_valid_exposed_type(cls, properties: Dict):
         if (
@@ -73,6 +108,8 @@ class _TabularDataNodeMixin(object):
                 f"Invalid string exposed type {exposed_type}. Supported values are "
                 f"{', '.join(valid_string_exposed_types)}"
             )
+        if exposed_type == cls._EXPOSED_TYPE_POLARS:
+            _check_dependency_is_installed("Polars exposed type", "polars")
 
     def _default_decoder_with_header(self, document: Dict) -> Any:
         if self.custom_document:
@@ -0,0 +1,184 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from datetime import datetime, timedelta
+from os.path import isfile
+from typing import Any, Dict, List, Optional, Set
+
+import pyarrow as pa
+
+from taipy.common.config.common.scope import Scope
+
+from .._entity._reload import _Reloader
+from .._version._version_manager_factory import _VersionManagerFactory
+from ._file_datanode_mixin import _FileDataNodeMixin
+from ._tabular_datanode_mixin import _TabularDataNodeMixin
+from .data_node import DataNode
+from .data_node_id import DataNodeId, Edit
+
+
+class ArrowIPCDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
+    """Data Node stored as an Arrow IPC file (also known as Feather V2).
+
+    On POSIX systems, the file is memory-mapped when it is read. With the *"arrow"* and *"polars"*
+    exposed types, the data read is not copied: the columns are loaded lazily from the file, and the
+    processes reading the same data node share the pages of the file cached by the operating system.
+    Writing the data node replaces the file, so that the tables already read keep their content. On
+    Windows, a memory-mapped file cannot be replaced, so the file is read in memory.
+
+    The *properties* attribute can contain the following optional entries:
+
+    - *default_path* (`str`): The default path of the Arrow IPC file used at the instantiation of
+        the data node.
+    - *default_data* (`Any`): The default data of the data node. It is used at the data node
+        instantiation to write the data to the Arrow IPC file.
+    - *exposed_type* (`str`): The exposed type of the data read from the Arrow IPC file. Possible
+        values are *"arrow"* (`pyarrow.Table`), *"polars"*, *"pandas"*, *"numpy"*, or a custom
+        class.<br/> The default value is *"arrow"*.
+    """
+
+    __STORAGE_TYPE = "arrow_ipc"
+    _VALID_STRING_EXPOSED_TYPES = [
+        *_TabularDataNodeMixin._VALID_STRING_EXPOSED_TYPES,
+        *_TabularDataNodeMixin._ARROW_EXPOSED_TYPES,
+    ]
+
+    _REQUIRED_PROPERTIES: List[str] = []
+
+    def __init__(
+        self,
+        config_id: str,
+        scope: Scope,
+        id: Optional[DataNodeId] = None,
+        owner_id: Optional[str] = None,
+        parent_ids: Optional[Set[str]] = None,
+        last_edit_date: Optional[datetime] = None,
+        edits: Optional[List[Edit]] = None,
+        version: Optional[str] = None,
+        validity_period: Optional[timedelta] = None,
+        edit_in_progress: bool = False,
+        editor_id: Optional[str] = None,
+        editor_expiration_date: Optional[datetime] = None,
+        properties: Optional[Dict] = None,
+    ) -> None:
+        self.id = id or self._new_id(config_id)
+
+        if properties is None:
+            properties = {}
+
+        if self._EXPOSED_TYPE_PROPERTY not in properties.keys():
+            properties[self._EXPOSED_TYPE_PROPERTY] = self._EXPOSED_TYPE_ARROW
+        properties[self._EXPOSED_TYPE_PROPERTY] = _TabularDataNodeMixin._get_valid_exposed_type(properties)
+        self._check_exposed_type(properties[self._EXPOSED_TYPE_PROPERTY])
+
+        default_value = properties.pop(self._DEFAULT_DATA_KEY, None)
+        _FileDataNodeMixin.__init__(self, properties)
+        _TabularDataNodeMixin.__init__(self, **properties)
+
+        DataNode.__init__(
+            self,
+            config_id,
+            scope,
+            self.id,
+            owner_id,
+            parent_ids,
+            last_edit_date,
+            edits,
+            version or _VersionManagerFactory._build_manager()._get_latest_version(),
+            validity_period,
+            edit_in_progress,
+            editor_id,
+            editor_expiration_date,
+            **properties,
+        )
+
+        with _Reloader():
+            self._write_default_data(default_value)
+
+        self._TAIPY_PROPERTIES.update(
+            {
+                self._EXPOSED_TYPE_PROPERTY,
+                self._PATH_KEY,
+                self._DEFAULT_PATH_KEY,
+                self._DEFAULT_DATA_KEY,
+                self._IS_GENERATED_KEY,
+                self._CONTENT_DIGEST_KEY,
+            }
+        )
+
+    @classmethod
+    def storage_type(cls) -> str:
+        """Return the storage type of the data node: "arrow_ipc"."""
+        return cls.__STORAGE_TYPE
+
+    def _read(self):
+        return self._read_from_path()
+
+    def _read_from_path(self, path: Optional[str] = None, **read_kwargs) -> Any:
+        if path is None:
+            path = self._path
+
+        table = self._read_as_arrow_table(path)
+        if columns := read_kwargs.get("columns"):
+            table = table.select(columns)
+        return self.__convert_table_to_exposed_type(table)
+
+    @classmethod
+    def _read_as_arrow_table(cls, path: str) -> pa.Table:
+        if not cls._CAN_REPLACE_MAPPED_FILES:
+            with pa.OSFile(path, "rb") as source:
+                return pa.ipc.open_file(source).read_all()
+        # The buffers of the table reference the memory map, which stays open as long as they are used.
+        return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+    def __convert_table_to_exposed_type(self, table: pa.Table) -> Any:
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        if exposed_type in self._ARROW_EXPOSED_TYPES:
+            return self._convert_arrow_to_exposed_type(exposed_type, table)
+        if exposed_type == self._EXPOSED_TYPE_PANDAS:
+            return table.to_pandas()
+        if exposed_type == self._EXPOSED_TYPE_NUMPY:
+            return table.to_pandas().to_numpy()
+        return [exposed_type(**row) for row in table.to_pylist()]
+
+    def _read_columns(self, columns: List) -> Any:
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        if exposed_type == self._EXPOSED_TYPE_NUMPY:
+            column_names = self._read_as_arrow_table(self._path).column_names
+            return self._read_from_path(columns=[column_names[int(column)] for column in columns])
+        if exposed_type == self._EXPOSED_TYPE_PANDAS or exposed_type in self._ARROW_EXPOSED_TYPES:
+            return self._read_from_path(columns=columns)
+        return super()._read_columns(columns)
+
+    def _write(self, data: Any):
+        table = self._convert_data_to_arrow(self.properties[self._EXPOSED_TYPE_PROPERTY], data)
+        self._replace_file(lambda path: self.__write_tables(path, table.schema, [table]))
+
+    def _append(self, data: Any):
+        if not isfile(self._path):
+            return self._write(data)
+
+        appended_table = self._convert_data_to_arrow(self.properties[self._EXPOSED_TYPE_PROPERTY], data)
+
+        def write_concatenation(path: str):
+            # The existing record batches are copied from the memory map to the new file. The memory map is
+            # local so that it is released before the file is replaced.
+            existing_table = self._read_as_arrow_table(self._path)
+            table = appended_table.select(existing_table.column_names).cast(existing_table.schema)
+            self.__write_tables(path, existing_table.schema, [existing_table, table])
+
+        self._replace_file(write_concatenation)
+
+    @staticmethod
+    def __write_tables(path: str, schema: pa.Schema, tables: List[pa.Table]):
+        with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+            for table in tables:
+                writer.write_table(table)
@@ -9,12 +9,16 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import codecs
 import csv
+import os
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 from taipy.common.config.common.scope import Scope
 
@@ -22,9 +26,12 @@ from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..job.job_id import JobId
 from ._file_datanode_mixin import _FileDataNodeMixin
+from ._filter import _FilterDataNode
+from ._read_cache import _ReadCache
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
+from .operator import JoinOperator
 
 
 class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
@@ -38,11 +45,17 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     - *default_data*: The default data of the data node. It is used at the data node instantiation
         to write the data to the CSV file.
     - *has_header* (`bool`): If True, indicates that the CSV file has a header.
-    - *exposed_type*: The exposed type of the data read from CSV file. The default value is `pandas`.
+    - *exposed_type*: The exposed type of the data read from CSV file. Possible values are *"pandas"*,
+        *"numpy"*, *"arrow"* (`pyarrow.Table`), *"polars"*, or a custom class. The default value is `pandas`.
     """
 
     __STORAGE_TYPE = "csv"
     __ENCODING_KEY = "encoding"
+    __FILTER_CHUNK_SIZE = 100_000
+    _VALID_STRING_EXPOSED_TYPES = [
+        *_TabularDataNodeMixin._VALID_STRING_EXPOSED_TYPES,
+        *_TabularDataNodeMixin._ARROW_EXPOSED_TYPES,
+    ]
 
     _REQUIRED_PROPERTIES: List[str] = []
 
@@ -106,6 +119,7 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
                 self._DEFAULT_PATH_KEY,
                 self._DEFAULT_DATA_KEY,
                 self._IS_GENERATED_KEY,
+                self._CONTENT_DIGEST_KEY,
                 self._HAS_HEADER_PROPERTY,
                 self._EXPOSED_TYPE_PROPERTY,
                 self.__ENCODING_KEY,
@@ -124,12 +138,88 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
             columns (Optional[List[str]]): The list of column names to write.
             job_id (JobId): An optional identifier of the writer.
         """
-        self._write(data, columns)
+        from ._data_manager_factory import _DataManagerFactory
+
+        with self._edit_file():
+            self._write(data, columns)
+        _ReadCache._invalidate(self.id)
         self.track_edit(timestamp=datetime.now(), job_id=job_id)
+        _DataManagerFactory._build_manager()._set(self)
 
     def _read(self):
         return self._read_from_path()
 
+    def filter(self, operators: Union[List, Tuple], join_operator=JoinOperator.AND) -> Any:
+        """Read and filter the data referenced by this data node.
+
+        When the exposed type is *"pandas"* or *"numpy"*, the CSV file is scanned by chunks and
+        only the matching rows of each chunk are kept in memory.
+
+        Parameters:
+            operators (Union[List[Tuple], Tuple]): A 3-element tuple or a list of 3-element tuples,
+                each is in the form of (key, value, `Operator^`).
+            join_operator (JoinOperator^): The operator used to join the multiple filter
+                3-tuples.
+
+        Returns:
+            The filtered data.
+        """
+        properties = self.properties
+        exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
+        if not operators or exposed_type not in [self._EXPOSED_TYPE_PANDAS, self._EXPOSED_TYPE_NUMPY]:
+            return super().filter(operators, join_operator)
+
+        try:
+            filtered_chunks = [
+                _FilterDataNode._filter(chunk, operators, join_operator)
+                for chunk in self.__read_pandas_chunks(self.__FILTER_CHUNK_SIZE, None, exposed_type, True)
+            ]
+        except (ValueError, TypeError):
+            # A chunk cannot be parsed with the types of the first one, which a single read would not keep.
+            return super().filter(operators, join_operator)
+        if not filtered_chunks:
+            return super().filter(operators, join_operator)
+        filtered_chunks = [chunk for chunk in filtered_chunks if len(chunk)] or filtered_chunks[:1]
+        if exposed_type == self._EXPOSED_TYPE_NUMPY:
+            return np.concatenate(filtered_chunks)
+        return pd.concat(filtered_chunks)
+
+    def _read_chunks(
+        self, chunksize: int, columns: Optional[List], operators: List, join_operator: JoinOperator
+    ) -> Iterator[Any]:
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        if exposed_type not in [self._EXPOSED_TYPE_PANDAS, self._EXPOSED_TYPE_NUMPY]:
+            return super()._read_chunks(chunksize, columns, operators, join_operator)
+        chunks = self.__read_pandas_chunks(chunksize, None if operators else columns, exposed_type)
+        return self._filter_chunks(chunks, columns, operators, join_operator)
+
+    def __read_pandas_chunks(
+        self, chunksize: int, usecols: Optional[List], exposed_type: str, same_dtypes: bool = False
+    ) -> Iterator[Any]:
+        """Read the file by chunks.
+
+        If *same_dtypes* is True, every chunk is parsed with the column types inferred from the first
+        chunk, so that the chunks can be concatenated as if the file was read at once. A chunk that
+        cannot be parsed with these types raises a ValueError.
+        """
+        properties = self.properties
+        kwargs: Dict[str, Any] = {"encoding": properties[self.__ENCODING_KEY]}
+        if not properties[self._HAS_HEADER_PROPERTY]:
+            kwargs["header"] = None
+        if usecols is not None:
+            kwargs["usecols"] = usecols
+        try:
+            if same_dtypes:
+                kwargs["dtype"] = pd.read_csv(self._path, nrows=chunksize, **kwargs).dtypes.to_dict()
+            kwargs["chunksize"] = chunksize
+            with pd.read_csv(self._path, **kwargs) as reader:
+                for chunk in reader:
+                    if usecols is not None:
+                        chunk = self._order_columns(chunk, usecols)
+                    yield chunk.to_numpy() if exposed_type == self._EXPOSED_TYPE_NUMPY else chunk
+        except pd.errors.EmptyDataError:
+            return
+
     def _read_from_path(self, path: Optional[str] = None, **read_kwargs) -> Any:
         if path is None:
             path = self._path
@@ -139,6 +229,9 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
             return self._read_as_pandas_dataframe(path=path)
         if properties[self._EXPOSED_TYPE_PROPERTY] == self._EXPOSED_TYPE_NUMPY:
             return self._read_as_numpy(path=path)
+        if properties[self._EXPOSED_TYPE_PROPERTY] in self._ARROW_EXPOSED_TYPES:
+            table = self._read_as_arrow_table(path=path)
+            return self._convert_arrow_to_exposed_type(properties[self._EXPOSED_TYPE_PROPERTY], table)
         return self._read_as(path=path)
 
     def _read_as(self, path: str):
@@ -162,26 +255,96 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     ) -> pd.DataFrame:
         try:
             properties = self.properties
-            if properties[self._HAS_HEADER_PROPERTY]:
-                if column_names:
-                    return pd.read_csv(path, encoding=properties[self.__ENCODING_KEY])[column_names]
-                return pd.read_csv(path, encoding=properties[self.__ENCODING_KEY])
-            else:
-                if usecols:
-                    return pd.read_csv(path, encoding=properties[self.__ENCODING_KEY], header=None, usecols=usecols)
-                return pd.read_csv(path, encoding=properties[self.__ENCODING_KEY], header=None)
+            kwargs: Dict[str, Any] = {"encoding": properties[self.__ENCODING_KEY]}
+            if not properties[self._HAS_HEADER_PROPERTY]:
+                kwargs["header"] = None
+            if columns := column_names or usecols:
+                return self._order_columns(pd.read_csv(path, usecols=columns, **kwargs), columns)
+            return pd.read_csv(path, **kwargs)
         except pd.errors.EmptyDataError:
             return pd.DataFrame()
 
+    def _read_as_arrow_table(self, path: str, columns: Optional[List] = None) -> pa.Table:
+        properties = self.properties
+        if os.path.getsize(path) == 0:
+            return pa.table({})
+        has_header = properties[self._HAS_HEADER_PROPERTY]
+        read_options = pacsv.ReadOptions(
+            encoding=properties[self.__ENCODING_KEY], autogenerate_column_names=not has_header
+        )
+        convert_options = pacsv.ConvertOptions()
+        if has_header and columns is not None and all(isinstance(column, str) for column in columns):
+            # Only the selected columns are parsed.
+            convert_options.include_columns = columns
+        table = pacsv.read_csv(path, read_options=read_options, convert_options=convert_options)
+        if not has_header:
+            table = table.rename_columns([str(i) for i in range(table.num_columns)])
+        if columns is not None and not convert_options.include_columns:
+            table = table.select(columns)
+        return table
+
+    def _get_end_position(self) -> Optional[int]:
+        return os.path.getsize(self._path) if os.path.isfile(self._path) else None
+
+    def _read_rows(self, start: int, stop: int, columns: Optional[List] = None, position: Optional[int] = None) -> Any:
+        properties = self.properties
+        exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
+        if position is None or exposed_type not in [self._EXPOSED_TYPE_PANDAS, self._EXPOSED_TYPE_NUMPY]:
+            return super()._read_rows(start, stop, columns, position)
+
+        # The file is read from the position of the first row, without reading the previous ones.
+        encoding = properties[self.__ENCODING_KEY]
+        kwargs: Dict[str, Any] = {"encoding": encoding, "header": None, "nrows": stop - start}
+        if properties[self._HAS_HEADER_PROPERTY]:
+            kwargs["names"] = pd.read_csv(self._path, encoding=encoding, nrows=0).columns
+        if columns is not None:
+            kwargs["usecols"] = columns
+        with open(self._path, "rb") as f:
+            f.seek(position)
+            try:
+                data = pd.read_csv(f, **kwargs)
+            except pd.errors.EmptyDataError:
+                data = pd.DataFrame(columns=kwargs.get("names"))
+        if columns is not None:
+            data = self._order_columns(data, columns)
+        return data.to_numpy() if exposed_type == self._EXPOSED_TYPE_NUMPY else data
+
+    def _read_columns(self, columns: List) -> Any:
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        if exposed_type == self._EXPOSED_TYPE_PANDAS:
+            return self._read_as_pandas_dataframe(self._path, usecols=columns)
+        if exposed_type == self._EXPOSED_TYPE_NUMPY:
+            return self._read_as_pandas_dataframe(self._path, usecols=columns).to_numpy()
+        if exposed_type in self._ARROW_EXPOSED_TYPES:
+            return self._convert_arrow_to_exposed_type(exposed_type, self._read_as_arrow_table(self._path, columns))
+        return super()._read_columns(columns)
+
     def _append(self, data: Any):
         properties = self.properties
         exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
+        if self.__is_arrow_writable(data):
+            with open(self._path, "ab") as csv_file:
+                table = self._convert_data_to_arrow(exposed_type, data)
+                pacsv.write_csv(table, csv_file, pacsv.WriteOptions(include_header=False))
+            return
         data = self._convert_data_to_dataframe(exposed_type, data)
         data.to_csv(self._path, mode="a", index=False, encoding=properties[self.__ENCODING_KEY], header=False)
 
+    def _write_chunks(self, first_chunk: Any, other_chunks: Iterator) -> None:
+        self._write(first_chunk)
+        for chunk in other_chunks:
+            self._append(chunk)
+
     def _write(self, data: Any, columns: Optional[List[str]] = None):
         properties = self.properties
         exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
+        if self.__is_arrow_writable(data):
+            table = self._convert_data_to_arrow(exposed_type, data)
+            if columns:
+                table = table.rename_columns(columns)
+            write_options = pacsv.WriteOptions(include_header=bool(properties[self._HAS_HEADER_PROPERTY]))
+            pacsv.write_csv(table, self._path, write_options)
+            return
         data = self._convert_data_to_dataframe(exposed_type, data)
 
         if columns and isinstance(data, pd.DataFrame):
@@ -193,3 +356,9 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
             encoding=properties[self.__ENCODING_KEY],
             header=properties[self._HAS_HEADER_PROPERTY],
         )
+
+    def __is_arrow_writable(self, data: Any) -> bool:
+        # Arrow data is written without conversion to pandas, but the Arrow CSV writer only supports UTF-8.
+        if not isinstance(data, pa.Table) and not _FilterDataNode._is_polars_dataframe(data):
+            return False
+        return codecs.lookup(self.properties[self.__ENCODING_KEY]).name == "utf-8"
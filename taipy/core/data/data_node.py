@@ -13,8 +13,9 @@ import functools
 import os
 import uuid
 from abc import abstractmethod
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import networkx as nx
 
@@ -33,6 +34,7 @@ from ..job.job_id import JobId
 from ..notification.event import Event, EventEntityType, EventOperation, _make_event
 from ..reason import DataNodeEditInProgress, DataNodeIsNotWritten
 from ._filter import _FilterDataNode
+from ._read_cache import _ReadCache
 from .data_node_id import DataNodeId, Edit
 from .operator import JoinOperator
 
@@ -108,6 +110,12 @@ class DataNode(_Entity, _Labeled):
     _MANAGER_NAME: str = "data"
     _PATH_KEY = "path"
     __EDIT_TIMEOUT = 30
+    __NO_CHUNK = object()
+    __ROWS_CHUNK_SIZE = 100_000
+
+    _EDIT_OFFSET_KEY = "offset"
+    _EDIT_ROWS_KEY = "rows"
+    _EDIT_POSITION_KEY = "position"
 
     _TAIPY_PROPERTIES: Set[str] = set()
 
@@ -205,7 +213,7 @@ class DataNode(_Entity, _Labeled):
     def last_edit_date(self) -> Optional[datetime]:
         """The date and time of the last modification."""
         last_modified_datetime = self._get_last_modified_datetime(self._properties.get(self._PATH_KEY, None))
-        if last_modified_datetime and last_modified_datetime > self._last_edit_date: # type: ignore
+        if last_modified_datetime and last_modified_datetime > self._last_edit_date:  # type: ignore
             return last_modified_datetime
         else:
             return self._last_edit_date
@@ -388,33 +396,111 @@ class DataNode(_Entity, _Labeled):
         """
         raise NotImplementedError
 
-    def read_or_raise(self) -> Any:
+    def read_or_raise(self, columns: Optional[List] = None) -> Any:
         """Read the data referenced by this data node.
 
+        Parameters:
+            columns (Optional[List]): The columns (or keys) to read. Tabular data nodes only load
+                these columns from the storage. If None, all the columns are read.
+
         Returns:
             The data referenced by this data node.
 
         Raises:
             NoData^: If the data has not been written yet.
         """
-        if not self.last_edit_date:
+        if not (last_edit_date := self.last_edit_date):
             raise NoData(f"Data node {self.id} from config {self.config_id} has not been written yet.")
-        return self._read()
+        if columns is not None:
+            columns = list(columns)
+            return _ReadCache._read(self, last_edit_date, columns, lambda: self._read_columns(columns))
+        return _ReadCache._read(self, last_edit_date, None, self._read)
 
-    def read(self) -> Any:
+    def read(self, columns: Optional[List] = None) -> Any:
         """Read the data referenced by this data node.
 
+        Parameters:
+            columns (Optional[List]): The columns (or keys) to read. Tabular data nodes only load
+                these columns from the storage. If None, all the columns are read.
+
         Returns:
             The data referenced by this data node. None if the data has not been written yet.
         """
         try:
-            return self.read_or_raise()
+            return self.read_or_raise(columns)
         except NoData:
             self._logger.warning(
                 f"Data node {self.id} from config {self.config_id} is being read but has never been written."
             )
             return None
 
+    def read_chunks(
+        self,
+        chunksize: int = 100_000,
+        columns: Optional[List] = None,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+    ) -> Iterator[Any]:
+        """Read the data referenced by this data node by chunks.
+
+        Data nodes backed by a CSV file, a Parquet file, a SQL database, or a Mongo collection stream
+        the chunks from the storage so that the whole data is never loaded in memory. The other data
+        nodes read the data entirely and then split it.
+
+        Parameters:
+            chunksize (int): The maximum number of rows (or items) of each chunk.
+            columns (Optional[List]): The columns (or keys) to read. If None, all the columns are read.
+            operators (Optional[Union[List[Tuple], Tuple]]): A 3-element tuple or a list of 3-element
+                tuples, each is in the form of (key, value, `Operator^`), used to filter the rows of
+                each chunk. The keys refer to the columns of the data node, even if they are not read.
+            join_operator (JoinOperator^): The operator used to join the multiple filter 3-tuples.
+
+        Returns:
+            An iterator over the chunks of data, in the exposed type of the data node.
+
+        Raises:
+            NoData^: If the data has not been written yet.
+            ValueError: If *chunksize* is not a positive integer.
+        """
+        if not self.last_edit_date:
+            raise NoData(f"Data node {self.id} from config {self.config_id} has not been written yet.")
+        if not isinstance(chunksize, int) or chunksize <= 0:
+            raise ValueError(f"The chunk size must be a positive integer, got {chunksize}.")
+        if operators and not isinstance(operators[0], (list, tuple)):
+            operators = [operators]
+        return self._read_chunks(
+            chunksize, list(columns) if columns is not None else None, list(operators or []), join_operator
+        )
+
+    def write_chunks(self, chunks: Iterable, job_id: Optional[JobId] = None, **kwargs: Dict[str, Any]):
+        """Write some data to this data node by chunks.
+
+        Data nodes backed by a CSV file, a Parquet file, a SQL database, or a Mongo collection write
+        each chunk to the storage as soon as it is produced. The other data nodes concatenate the
+        chunks before writing them. If *chunks* is empty, the data node is left unchanged.
+
+        Parameters:
+            chunks (Iterable): The chunks of data to write, in the exposed type of the data node.
+            job_id (JobId): An optional identifier of the writer.
+            **kwargs (dict[str, any]): Extra information to attach to the edit document
+                corresponding to this write.
+        """
+        from ._data_manager_factory import _DataManagerFactory
+
+        chunks = iter(chunks)
+        first_chunk = next(chunks, self.__NO_CHUNK)
+        if first_chunk is self.__NO_CHUNK:
+            return
+        row_counts = [_FilterDataNode._count_rows(first_chunk)]
+        with self.__edit_storage():
+            self._write_chunks(first_chunk, self.__count_rows(chunks, row_counts))
+        _ReadCache._invalidate(self.id)
+        known_row_counts = [count for count in row_counts if count is not None]
+        rows = sum(known_row_counts) if len(known_row_counts) == len(row_counts) else None
+        self.track_edit(job_id=job_id, **{**self.__get_rows_edit(0, rows), **kwargs})
+        self.unlock_edit()
+        _DataManagerFactory._build_manager()._set(self)
+
     def append(self, data, job_id: Optional[JobId] = None, **kwargs: Dict[str, Any]):
         """Append some data to this data node.
 
@@ -426,8 +512,14 @@ class DataNode(_Entity, _Labeled):
         """
         from ._data_manager_factory import _DataManagerFactory
 
-        self._append(data)
-        self.track_edit(job_id=job_id, **kwargs)
+        offset = self._get_row_count()
+        rows_edit = self.__get_rows_edit(offset, _FilterDataNode._count_rows(data))
+        if rows_edit and (position := self._get_end_position()) is not None:
+            rows_edit[self._EDIT_POSITION_KEY] = position
+        with self.__edit_storage(keep_content=True):
+            self._append(data)
+        _ReadCache._invalidate(self.id)
+        self.track_edit(job_id=job_id, **{**rows_edit, **kwargs})
         self.unlock_edit()
         _DataManagerFactory._build_manager()._set(self)
 
@@ -442,11 +534,20 @@ class DataNode(_Entity, _Labeled):
         """
         from ._data_manager_factory import _DataManagerFactory
 
-        self._write(data)
-        self.track_edit(job_id=job_id, **kwargs)
+        with self.__edit_storage():
+            self._write(data)
+        _ReadCache._invalidate(self.id)
+        self.track_edit(job_id=job_id, **{**self.__get_rows_edit(0, _FilterDataNode._count_rows(data)), **kwargs})
         self.unlock_edit()
         _DataManagerFactory._build_manager()._set(self)
 
+    def __edit_storage(self, keep_content: bool = False) -> ContextManager:
+        from ._file_datanode_mixin import _FileDataNodeMixin
+
+        if isinstance(self, _FileDataNodeMixin):
+            return self._edit_file(keep_content)
+        return nullcontext()
+
     def track_edit(self, **options):
         """Creates and adds a new entry in the edits attribute without writing the data.
 
@@ -571,6 +672,89 @@ class DataNode(_Entity, _Labeled):
     def _read(self):
         raise NotImplementedError
 
+    def _read_columns(self, columns: List) -> Any:
+        # Data nodes that can project the columns at the storage level override this method.
+        return _FilterDataNode._select_columns(self._read(), columns)
+
+    def _read_chunks(
+        self, chunksize: int, columns: Optional[List], operators: List, join_operator: JoinOperator
+    ) -> Iterator[Any]:
+        # Data nodes that can stream the data from the storage override this method.
+        data = self._read_columns(columns) if columns is not None and not operators else self._read()
+        return self._filter_chunks(_FilterDataNode._split_chunks(data, chunksize), columns, operators, join_operator)
+
+    @staticmethod
+    def _filter_chunks(
+        chunks: Iterable, columns: Optional[List], operators: List, join_operator: JoinOperator
+    ) -> Iterator[Any]:
+        # The chunks to filter contain all the columns since the operators may refer to columns that are not read.
+        for chunk in chunks:
+            if operators:
+                chunk = _FilterDataNode._filter(chunk, operators, join_operator)
+                if not len(chunk):
+                    continue
+                if columns is not None:
+                    chunk = _FilterDataNode._select_columns(chunk, columns)
+            yield chunk
+
+    def _read_rows(self, start: int, stop: int, columns: Optional[List] = None, position: Optional[int] = None) -> Any:
+        """Read the rows of the data from *start* (included) to *stop* (excluded).
+
+        The rows are read by chunks, so that only the requested rows are kept in memory. The *position* of
+        the row *start* in the storage, if known, lets the data nodes that support it read from there.
+        """
+        rows = []
+        chunk_start = 0
+        empty = None
+        for chunk in self._read_chunks(self.__ROWS_CHUNK_SIZE, columns, [], JoinOperator.AND):
+            length = len(chunk)
+            if chunk_start + length > start:
+                rows.append(_FilterDataNode._slice_rows(chunk, max(start - chunk_start, 0), stop - chunk_start))
+            elif empty is None:
+                empty = _FilterDataNode._slice_rows(chunk, 0, 0)
+            chunk_start += length
+            if chunk_start >= stop:
+                break
+        if not rows and empty is not None:
+            return empty
+        return _FilterDataNode._concat_chunks(rows)
+
+    def _get_row_count(self) -> Optional[int]:
+        """Return the number of rows of the data according to the edits, or None if it is unknown.
+
+        The number of rows is known when the last edit was made through `write()`, `write_chunks()`,
+        or `append()` with tabular data, and the previous edits since the last `write()` as well.
+        """
+        if not self._edits:
+            return 0
+        last_edit = self._edits[-1]
+        offset, rows = last_edit.get(self._EDIT_OFFSET_KEY), last_edit.get(self._EDIT_ROWS_KEY)
+        if offset is None or rows is None:
+            return None
+        return offset + rows
+
+    def _get_end_position(self) -> Optional[int]:
+        # Data nodes that can read the data from a position in the storage, such as an offset in a file,
+        # override this method so that the rows appended can be read without reading the previous ones.
+        return None
+
+    @classmethod
+    def __get_rows_edit(cls, offset: Optional[int], rows: Optional[int]) -> Dict[str, int]:
+        # The edit records the range of rows it wrote, so that the data appended since an edit can be read.
+        if offset is None or rows is None:
+            return {}
+        return {cls._EDIT_OFFSET_KEY: offset, cls._EDIT_ROWS_KEY: rows}
+
+    @staticmethod
+    def __count_rows(chunks: Iterator, row_counts: List[Optional[int]]) -> Iterator:
+        for chunk in chunks:
+            row_counts.append(_FilterDataNode._count_rows(chunk))
+            yield chunk
+
+    def _write_chunks(self, first_chunk: Any, other_chunks: Iterator) -> None:
+        # Data nodes that can stream the data to the storage override this method.
+        self._write(_FilterDataNode._concat_chunks([first_chunk, *other_chunks]))
+
     def _append(self, data):
         raise NotImplementedError
 
@@ -596,10 +780,10 @@ class DataNode(_Entity, _Labeled):
 
         last_modified_datetime = None
         if path and os.path.isdir(path):
-            for filename in os.listdir(path):
-                filepath = os.path.join(path, filename)
-                if os.path.isfile(filepath):
-                    file_mtime = datetime.fromtimestamp(os.path.getmtime(filepath))
+            # The files of partitioned datasets are stored in sub-directories.
+            for dirpath, _, filenames in os.walk(path):
+                for filename in filenames:
+                    file_mtime = datetime.fromtimestamp(os.path.getmtime(os.path.join(dirpath, filename)))
 
                     if last_modified_datetime is None or file_mtime > last_modified_datetime:
                         last_modified_datetime = file_mtime
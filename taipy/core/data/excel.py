@@ -9,8 +9,9 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -20,9 +21,19 @@ from taipy.common.config.common.scope import Scope
 
 from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
-from ..exceptions.exceptions import ExposedTypeLengthMismatch, NonExistingExcelSheet, SheetNameLengthMismatch
+from ..common._check_dependencies import _check_dependency_is_installed
+from ..exceptions.exceptions import (
+    ExposedTypeLengthMismatch,
+    NoData,
+    NonExistingExcelSheet,
+    SheetNameLengthMismatch,
+    UnknownExcelEngine,
+)
 from ..job.job_id import JobId
 from ._file_datanode_mixin import _FileDataNodeMixin
+from ._filter import _FilterDataNode
+from ._lazy_sheets import _LazySheets
+from ._read_cache import _ReadCache
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
@@ -43,10 +54,22 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     - *has_header* (`bool`): If True, indicates that the Excel file has a header.
     - *exposed_type* (`str`): The exposed type of the data read from Excel file. The default value
         is `pandas`.
+    - *engine* (`str`): The library used to read the Excel file. Possible values are *"openpyxl"*
+        (the default) or *"calamine"*. The *"calamine"* engine parses the workbook much faster. It
+        requires the *python-calamine* package and pandas 2.2 or higher. The file is always written
+        with *openpyxl*.
+    - *lazy_sheets* (`bool`): If True, reading several sheets returns a read-only mapping from the
+        sheet names to the sheet data, where each sheet is only parsed when it is first accessed.
+        The default value is False.
     """
 
     __STORAGE_TYPE = "excel"
     __SHEET_NAME_PROPERTY = "sheet_name"
+    __ENGINE_PROPERTY = "engine"
+    __LAZY_SHEETS_PROPERTY = "lazy_sheets"
+    __OPENPYXL_ENGINE = "openpyxl"
+    __CALAMINE_ENGINE = "calamine"
+    __VALID_EXCEL_ENGINES = [__OPENPYXL_ENGINE, __CALAMINE_ENGINE]
 
     _REQUIRED_PROPERTIES: List[str] = []
 
@@ -75,6 +98,17 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
             properties[self.__SHEET_NAME_PROPERTY] = None
         if self._HAS_HEADER_PROPERTY not in properties.keys():
             properties[self._HAS_HEADER_PROPERTY] = True
+        if self.__ENGINE_PROPERTY not in properties.keys():
+            properties[self.__ENGINE_PROPERTY] = self.__OPENPYXL_ENGINE
+        if properties[self.__ENGINE_PROPERTY] not in self.__VALID_EXCEL_ENGINES:
+            raise UnknownExcelEngine(
+                f"Invalid Excel engine: {properties[self.__ENGINE_PROPERTY]}. "
+                f"Supported engines are {', '.join(self.__VALID_EXCEL_ENGINES)}"
+            )
+        if properties[self.__ENGINE_PROPERTY] == self.__CALAMINE_ENGINE:
+            _check_dependency_is_installed("Excel data node with the calamine engine", "python_calamine")
+        if self.__LAZY_SHEETS_PROPERTY not in properties.keys():
+            properties[self.__LAZY_SHEETS_PROPERTY] = False
         properties[self._EXPOSED_TYPE_PROPERTY] = _TabularDataNodeMixin._get_valid_exposed_type(properties)
         self._check_exposed_type(properties[self._EXPOSED_TYPE_PROPERTY])
 
@@ -108,9 +142,12 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
                 self._DEFAULT_PATH_KEY,
                 self._DEFAULT_DATA_KEY,
                 self._IS_GENERATED_KEY,
+                self._CONTENT_DIGEST_KEY,
                 self._HAS_HEADER_PROPERTY,
                 self._EXPOSED_TYPE_PROPERTY,
                 self.__SHEET_NAME_PROPERTY,
+                self.__ENGINE_PROPERTY,
+                self.__LAZY_SHEETS_PROPERTY,
             }
         )
 
@@ -119,6 +156,47 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         """Return the storage type of the data node: "excel"."""
         return cls.__STORAGE_TYPE
 
+    def read_or_raise(self, columns: Optional[List] = None, sheet_names: Optional[List[str]] = None) -> Any:
+        """Read the data referenced by this data node.
+
+        Parameters:
+            columns (Optional[List]): The columns to read. If None, all the columns are read.
+            sheet_names (Optional[List[str]]): The names of the sheets to read. Only these sheets are
+                parsed, and the data is returned as a mapping from the sheet names to the sheet data.
+                If None, the sheets of the *sheet_name* property are read.
+
+        Returns:
+            The data referenced by this data node.
+
+        Raises:
+            NoData^: If the data has not been written yet.
+        """
+        if sheet_names is None:
+            return super().read_or_raise(columns)
+        if not self.last_edit_date:
+            raise NoData(f"Data node {self.id} from config {self.config_id} has not been written yet.")
+        return self._read_sheets(self._path, list(sheet_names), list(columns) if columns is not None else None)
+
+    def read(self, columns: Optional[List] = None, sheet_names: Optional[List[str]] = None) -> Any:
+        """Read the data referenced by this data node.
+
+        Parameters:
+            columns (Optional[List]): The columns to read. If None, all the columns are read.
+            sheet_names (Optional[List[str]]): The names of the sheets to read. Only these sheets are
+                parsed, and the data is returned as a mapping from the sheet names to the sheet data.
+                If None, the sheets of the *sheet_name* property are read.
+
+        Returns:
+            The data referenced by this data node. None if the data has not been written yet.
+        """
+        try:
+            return self.read_or_raise(columns, sheet_names)
+        except NoData:
+            self._logger.warning(
+                f"Data node {self.id} from config {self.config_id} is being read but has never been written."
+            )
+            return None
+
     def write_with_column_names(self, data: Any, columns: List[str] = None, job_id: Optional[JobId] = None) -> None:
         """Write a set of columns.
 
@@ -127,14 +205,19 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
             columns (List[str]): The list of column names to write.
             job_id (Optional[JobId]): An optional identifier of the writer.
         """
-        if isinstance(data, Dict) and all(isinstance(x, (pd.DataFrame, np.ndarray)) for x in data.values()):
-            self._write_excel_with_multiple_sheets(data, columns=columns)
-        else:
-            df = pd.DataFrame(data)
-            if columns:
-                df = self._set_column_if_dataframe(df, columns)
-            self._write_excel_with_single_sheet(df.to_excel, self.path, index=False)
+        from ._data_manager_factory import _DataManagerFactory
+
+        with self._edit_file():
+            if isinstance(data, Dict) and all(isinstance(x, (pd.DataFrame, np.ndarray)) for x in data.values()):
+                self._write_excel_with_multiple_sheets(data, columns=columns)
+            else:
+                df = pd.DataFrame(data)
+                if columns:
+                    df = self._set_column_if_dataframe(df, columns)
+                self._write_excel_with_single_sheet(df.to_excel, self.path, index=False)
+        _ReadCache._invalidate(self.id)
         self.track_edit(timestamp=datetime.now(), job_id=job_id)
+        _DataManagerFactory._build_manager()._set(self)
 
     @staticmethod
     def _check_exposed_type(exposed_type):
@@ -154,6 +237,9 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         if path is None:
             path = self._path
 
+        if self.__reads_lazy_sheets():
+            return self._read_sheets(path, self.__get_sheet_name_list())
+
         exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
         if exposed_type == self._EXPOSED_TYPE_PANDAS:
             return self._read_as_pandas_dataframe(path=path)
@@ -170,39 +256,121 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
             return self._read_as_pandas_dataframe(path, sheet_name)  # type: ignore
         return None
 
-    def _read_as(self, path: str):
+    def _read_sheets(
+        self, path: str, sheet_names: Optional[List[str]] = None, usecols: Optional[List] = None
+    ) -> Mapping[str, Any]:
+        # All the sheets of the workbook are read if sheet_names is None.
+        if not self.properties[self.__LAZY_SHEETS_PROPERTY]:
+            return self.__read_sheets(path, sheet_names, usecols)
+
+        workbook_sheet_names = self.__get_workbook_sheet_names(path)
+        if sheet_names is None:
+            sheet_names = workbook_sheet_names
+        for sheet_name in sheet_names:
+            if sheet_name not in workbook_sheet_names:
+                raise NonExistingExcelSheet(sheet_name, path)
+        return _LazySheets(sheet_names, lambda sheet_name: self.__read_sheets(path, [sheet_name], usecols)[sheet_name])
+
+    def __read_sheets(self, path: str, sheet_names: Optional[List[str]], usecols: Optional[List]) -> Dict[str, Any]:
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        if exposed_type == self._EXPOSED_TYPE_PANDAS:
+            return self._read_as_pandas_dataframe(path, sheet_names, usecols)  # type: ignore
+        if exposed_type == self._EXPOSED_TYPE_NUMPY:
+            return self._read_as_numpy(path, sheet_names, usecols)
+        sheets = self._read_as(path, sheet_names)
+        return sheets if usecols is None else _FilterDataNode._select_columns(sheets, usecols)
+
+    def __reads_lazy_sheets(self) -> bool:
+        properties = self.properties
+        if not properties[self.__LAZY_SHEETS_PROPERTY]:
+            return False
+        sheet_name = properties[self.__SHEET_NAME_PROPERTY]
+        return sheet_name is None or (isinstance(sheet_name, (list, set, tuple)) and len(sheet_name) > 1)
+
+    def __get_sheet_name_list(self) -> Optional[List[str]]:
+        sheet_name = self.properties[self.__SHEET_NAME_PROPERTY]
+        return list(sheet_name) if sheet_name is not None else None
+
+    def __get_workbook_sheet_names(self, path: str) -> List[str]:
+        with self.__open_workbook(path) as (workbook_sheet_names, _):
+            return workbook_sheet_names
+
+    @contextmanager
+    def __open_workbook(self, path: str) -> Iterator[Tuple[List[str], Callable[[str], List[List]]]]:
+        """Open the workbook, yielding its sheet names and a function reading the cell values of a sheet."""
+        if self.properties[self.__ENGINE_PROPERTY] == self.__CALAMINE_ENGINE:
+            from python_calamine import CalamineWorkbook
+
+            calamine_workbook = CalamineWorkbook.from_path(path)
+
+            def read_calamine_rows(sheet_name: str) -> List[List]:
+                sheet = calamine_workbook.get_sheet_by_name(sheet_name)
+                return [
+                    [self.__convert_calamine_value(v) for v in row] for row in sheet.to_python(skip_empty_area=False)
+                ]
+
+            try:
+                yield calamine_workbook.sheet_names, read_calamine_rows
+            finally:
+                calamine_workbook.close()
+            return
+
+        workbook = load_workbook(path, read_only=True)
+
+        def read_openpyxl_rows(sheet_name: str) -> List[List]:
+            return [[cell.value for cell in row] for row in workbook[sheet_name].rows]
+
         try:
-            properties = self.properties
-            excel_file = load_workbook(path, read_only=True)
-            exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
-            work_books = {}
-            sheet_names = excel_file.sheetnames
+            yield workbook.sheetnames, read_openpyxl_rows
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def __convert_calamine_value(value: Any) -> Any:
+        # Calamine reads empty cells as empty strings and all the numbers as floats, where openpyxl reads
+        # None and integers.
+        if value == "":
+            return None
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    def _read_as(self, path: str, sheet_names: Optional[List[str]] = None):
+        # The sheets of the sheet_name property are read if sheet_names is None.
+        properties = self.properties
+        exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
+        work_books = {}
 
-            user_provided_sheet_names = properties.get(self.__SHEET_NAME_PROPERTY) or []
-            if not isinstance(user_provided_sheet_names, (list, set, tuple)):
-                user_provided_sheet_names = [user_provided_sheet_names]
+        user_provided_sheet_names = properties.get(self.__SHEET_NAME_PROPERTY) or []
+        if not isinstance(user_provided_sheet_names, (list, set, tuple)):
+            user_provided_sheet_names = [user_provided_sheet_names]
 
-            provided_sheet_names = user_provided_sheet_names or sheet_names
+        with self.__open_workbook(path) as (workbook_sheet_names, read_rows):
+            provided_sheet_names = list(user_provided_sheet_names or workbook_sheet_names)
+            sheet_names_to_read = provided_sheet_names if sheet_names is None else sheet_names
 
-            for sheet_name in provided_sheet_names:
-                if sheet_name not in sheet_names:
+            for sheet_name in [*provided_sheet_names, *sheet_names_to_read]:
+                if sheet_name not in workbook_sheet_names:
                     raise NonExistingExcelSheet(sheet_name, path)
 
             if isinstance(exposed_type, List):
                 if len(provided_sheet_names) != len(exposed_type):
                     raise ExposedTypeLengthMismatch(
-                        f"Expected {len(provided_sheet_names)} exposed types, got " f"{len(exposed_type)}"
+                        f"Expected {len(provided_sheet_names)} exposed types, got {len(exposed_type)}"
                     )
 
-            for i, sheet_name in enumerate(provided_sheet_names):
-                work_sheet = excel_file[sheet_name]
+            for sheet_name in sheet_names_to_read:
                 sheet_exposed_type = exposed_type
 
                 if not isinstance(sheet_exposed_type, str):
                     if isinstance(exposed_type, dict):
                         sheet_exposed_type = exposed_type.get(sheet_name, self._EXPOSED_TYPE_PANDAS)
                     elif isinstance(exposed_type, List):
-                        sheet_exposed_type = exposed_type[i]
+                        sheet_exposed_type = (
+                            exposed_type[provided_sheet_names.index(sheet_name)]
+                            if sheet_name in provided_sheet_names
+                            else self._EXPOSED_TYPE_PANDAS
+                        )
 
                     if isinstance(sheet_exposed_type, str):
                         sheet_data = self._read_sheet_with_exposed_type(path, sheet_exposed_type, sheet_name)
@@ -210,7 +378,7 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
                             work_books[sheet_name] = sheet_data
                         continue
 
-                res = [[col.value for col in row] for row in work_sheet.rows]
+                res = read_rows(sheet_name)
                 if properties[self._HAS_HEADER_PROPERTY] and res:
                     header = res.pop(0)
                     for i, row in enumerate(res):
@@ -219,16 +387,14 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
                     for i, row in enumerate(res):
                         res[i] = sheet_exposed_type(*row)
                 work_books[sheet_name] = res  # type: ignore
-        finally:
-            excel_file.close()
 
-        if len(user_provided_sheet_names) == 1:
+        if sheet_names is None and len(user_provided_sheet_names) == 1:
             return work_books[user_provided_sheet_names[0]]
 
         return work_books
 
-    def _read_as_numpy(self, path: str, sheet_names=None):
-        sheets = self._read_as_pandas_dataframe(path=path, sheet_names=sheet_names)
+    def _read_as_numpy(self, path: str, sheet_names=None, usecols: Optional[List] = None):
+        sheets = self._read_as_pandas_dataframe(path=path, sheet_names=sheet_names, usecols=usecols)
         if isinstance(sheets, dict):
             return {sheet_name: df.to_numpy() for sheet_name, df in sheets.items()}
         return sheets.to_numpy()
@@ -245,16 +411,36 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
             sheet_names = properties[self.__SHEET_NAME_PROPERTY]
         if not properties[self._HAS_HEADER_PROPERTY]:
             kwargs["header"] = None
+        if properties[self.__ENGINE_PROPERTY] == self.__CALAMINE_ENGINE:
+            # Pandas picks the engine from the file extension otherwise.
+            kwargs["engine"] = self.__CALAMINE_ENGINE
         return sheet_names, kwargs
 
     def _read_as_pandas_dataframe(
-        self, path: str, sheet_names=None
+        self, path: str, sheet_names=None, usecols: Optional[List] = None
     ) -> Union[Dict[Union[int, str], pd.DataFrame], pd.DataFrame]:
         sheet_names, kwargs = self.__get_sheet_names_and_header(sheet_names)
+        if usecols:
+            kwargs["usecols"] = usecols
         try:
-            return self._do_read_excel(path, sheet_names, kwargs)
+            sheets = self._do_read_excel(path, sheet_names, kwargs)
         except pd.errors.EmptyDataError:
             return pd.DataFrame()
+        if not usecols:
+            return sheets
+        if isinstance(sheets, dict):
+            return {sheet_name: self._order_columns(df, usecols) for sheet_name, df in sheets.items()}
+        return self._order_columns(sheets, usecols)
+
+    def _read_columns(self, columns: List) -> Any:
+        if self.__reads_lazy_sheets():
+            return self._read_sheets(self._path, self.__get_sheet_name_list(), columns)
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        if exposed_type == self._EXPOSED_TYPE_PANDAS:
+            return self._read_as_pandas_dataframe(self._path, usecols=columns)
+        if exposed_type == self._EXPOSED_TYPE_NUMPY:
+            return self._read_as_numpy(self._path, usecols=columns)
+        return super()._read_columns(columns)
 
     def _append_excel_with_single_sheet(self, append_excel_fct, *args, **kwargs):
         sheet_name = self.properties.get(self.__SHEET_NAME_PROPERTY)
@@ -10,19 +10,26 @@
 # specific language governing permissions and limitations under the License.
 
 import dataclasses
+import io
 import json
+import os
 from datetime import date, datetime, timedelta
 from enum import Enum
+from itertools import chain, islice
 from pydoc import locate
-from typing import Any, Dict, List, Optional, Set
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from taipy.common.config.common.scope import Scope
 
 from .._entity._reload import _Reloader, _self_reload
 from .._version._version_manager_factory import _VersionManagerFactory
+from ..exceptions.exceptions import UnknownJSONFormat
+from ._compression import _Compression
 from ._file_datanode_mixin import _FileDataNodeMixin
+from ._filter import _FilterDataNode
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
+from .operator import JoinOperator
 
 
 class JSONDataNode(DataNode, _FileDataNodeMixin):
@@ -34,11 +41,28 @@ class JSONDataNode(DataNode, _FileDataNodeMixin):
         the data node.
     - *default_data* (`Any`): The default data of the data node. It is used at the data node
         instantiation to write the data to the JSON file.
-    - *encoding* (`str`): The encoding of the JSON file. The default value is `utf-8`.\n
+    - *encoding* (`str`): The encoding of the JSON file. The default value is `utf-8`.
+    - *format* (`str`): The format of the file. Possible values are *"json"* (a single JSON
+        document) or *"jsonl"* (JSON Lines: one JSON value per line).<br/>
+        The default value is *"json"*. A JSON Lines file is read as a list of values. Appending
+        to it only writes the new lines, and the file is streamed line by line by `read_chunks()`
+        and `filter()`.
+    - *compression* (`Optional[str]`): The algorithm used to compress the file: *"zstd"*, *"lz4"*,
+        *"gzip"*, or None for an uncompressed file.<br/>
+        The default value is None. The data is compressed as a stream while it is written.
+    - *compression_level* (`Optional[int]`): The compression level. If None, the default level of the
+        algorithm is used.\n
     """
 
     __STORAGE_TYPE = "json"
     __ENCODING_KEY = "encoding"
+    __FORMAT_KEY = "format"
+    __COMPRESSION_KEY = "compression"
+    __COMPRESSION_LEVEL_KEY = "compression_level"
+    __FORMAT_JSON = "json"
+    __FORMAT_JSONL = "jsonl"
+    __VALID_FORMATS = [__FORMAT_JSON, __FORMAT_JSONL]
+    __FILTER_CHUNK_SIZE = 100_000
     _ENCODER_KEY = "encoder"
     _DECODER_KEY = "decoder"
     _REQUIRED_PROPERTIES: List[str] = []
@@ -66,6 +90,15 @@ class JSONDataNode(DataNode, _FileDataNodeMixin):
 
         if self.__ENCODING_KEY not in properties.keys():
             properties[self.__ENCODING_KEY] = "utf-8"
+        if self.__FORMAT_KEY not in properties.keys():
+            properties[self.__FORMAT_KEY] = self.__FORMAT_JSON
+        if properties[self.__FORMAT_KEY] not in self.__VALID_FORMATS:
+            raise UnknownJSONFormat(
+                f"Invalid format: {properties[self.__FORMAT_KEY]}. "
+                f"Supported formats are {', '.join(self.__VALID_FORMATS)}"
+            )
+        self._is_json_lines = properties[self.__FORMAT_KEY] == self.__FORMAT_JSONL
+        _Compression._check_algorithm(properties.get(self.__COMPRESSION_KEY), "compressed JSON Data Node")
 
         default_value = properties.pop(self._DEFAULT_DATA_KEY, None)
         _FileDataNodeMixin.__init__(self, properties)
@@ -99,7 +132,11 @@ class JSONDataNode(DataNode, _FileDataNodeMixin):
                 self._DEFAULT_PATH_KEY,
                 self._DEFAULT_DATA_KEY,
                 self._IS_GENERATED_KEY,
+                self._CONTENT_DIGEST_KEY,
                 self.__ENCODING_KEY,
+                self.__FORMAT_KEY,
+                self.__COMPRESSION_KEY,
+                self.__COMPRESSION_LEVEL_KEY,
                 self._ENCODER_KEY,
                 self._DECODER_KEY,
             }
@@ -130,6 +167,10 @@ class JSONDataNode(DataNode, _FileDataNodeMixin):
     def decoder(self, decoder: json.JSONDecoder) -> None:
         self.properties[self._DECODER_KEY] = decoder
 
+    def _build_path(self, storage_type) -> str:
+        path = super()._build_path(storage_type)
+        return f"{os.path.splitext(path)[0]}.jsonl" if self._is_json_lines else path
+
     def _read(self):
         return self._read_from_path()
 
@@ -137,25 +178,96 @@ class JSONDataNode(DataNode, _FileDataNodeMixin):
         if path is None:
             path = self._path
 
-        with open(path, "r", encoding=self.properties[self.__ENCODING_KEY]) as f:
+        if self._is_json_lines:
+            return list(self.__read_lines(path))
+        with self.__open(path, "r") as f:
             return json.load(f, cls=self._decoder)
 
+    def __open(self, path: str, mode: str) -> IO[str]:
+        properties = self.properties
+        encoding = properties[self.__ENCODING_KEY]
+        if not (compression := properties.get(self.__COMPRESSION_KEY)):
+            return open(path, mode, encoding=encoding)
+        # The text is encoded and compressed as a stream, without building the whole document in memory.
+        level = properties.get(self.__COMPRESSION_LEVEL_KEY)
+        compressed_file = _Compression._open(path, f"{mode}b", compression, level)
+        return io.TextIOWrapper(compressed_file, encoding=encoding)
+
+    def __read_lines(self, path: str) -> Iterator[Any]:
+        decoder = self._decoder()
+        with self.__open(path, "r") as f:
+            for line in f:
+                if line.strip():
+                    yield decoder.decode(line)
+
+    def __write_lines(self, mode: str, rows: Iterable):
+        with self.__open(self._path, mode) as f:
+            f.writelines(f"{json.dumps(row, cls=self._encoder)}\n" for row in rows)
+
+    @staticmethod
+    def __as_rows(data: Any) -> Iterable:
+        return data if isinstance(data, (list, tuple)) else [data]
+
+    def filter(self, operators: Union[List, Tuple], join_operator=JoinOperator.AND) -> Any:
+        """Read and filter the data referenced by this data node.
+
+        When the format is *"jsonl"*, the file is scanned line by line and only the matching
+        values are kept in memory.
+
+        Parameters:
+            operators (Union[List[Tuple], Tuple]): A 3-element tuple or a list of 3-element tuples,
+                each is in the form of (key, value, `Operator^`).
+            join_operator (JoinOperator^): The operator used to join the multiple filter
+                3-tuples.
+
+        Returns:
+            The filtered data.
+        """
+        if not operators or not self._is_json_lines:
+            return super().filter(operators, join_operator)
+        chunks = self.__read_line_chunks(self.__FILTER_CHUNK_SIZE)
+        return [row for chunk in chunks for row in _FilterDataNode._filter(chunk, operators, join_operator)]
+
+    def _read_chunks(
+        self, chunksize: int, columns: Optional[List], operators: List, join_operator: JoinOperator
+    ) -> Iterator[Any]:
+        if not self._is_json_lines:
+            return super()._read_chunks(chunksize, columns, operators, join_operator)
+        chunks = self.__read_line_chunks(chunksize)
+        if columns is not None and not operators:
+            chunks = (_FilterDataNode._select_columns(chunk, columns) for chunk in chunks)
+        return self._filter_chunks(chunks, columns, operators, join_operator)
+
+    def __read_line_chunks(self, chunksize: int) -> Iterator[List]:
+        lines = self.__read_lines(self._path)
+        while chunk := list(islice(lines, chunksize)):
+            yield chunk
+
+    def _write_chunks(self, first_chunk: Any, other_chunks: Iterator) -> None:
+        if not self._is_json_lines:
+            return super()._write_chunks(first_chunk, other_chunks)
+        chunks = chain([first_chunk], other_chunks)
+        self.__write_lines("w", (row for chunk in chunks for row in self.__as_rows(chunk)))
+
     def _append(self, data: Any):
-        with open(self._path, "r+", encoding=self.properties[self.__ENCODING_KEY]) as f:
-            file_data = json.load(f, cls=self._decoder)
-            if isinstance(file_data, List):
-                if isinstance(data, List):
-                    file_data.extend(data)
-                else:
-                    file_data.append(data)
-            elif isinstance(data, Dict):
-                file_data.update(data)
-
-            f.seek(0)
-            json.dump(file_data, f, indent=4, cls=self._encoder)
+        if self._is_json_lines:
+            # Only the new lines are written, the existing content of the file is never read.
+            return self.__write_lines("a", self.__as_rows(data))
+
+        file_data = self._read_from_path()
+        if isinstance(file_data, List):
+            if isinstance(data, List):
+                file_data.extend(data)
+            else:
+                file_data.append(data)
+        elif isinstance(data, Dict):
+            file_data.update(data)
+        self._write(file_data)
 
     def _write(self, data: Any):
-        with open(self._path, "w", encoding=self.properties[self.__ENCODING_KEY]) as f:  # type: ignore
+        if self._is_json_lines:
+            return self.__write_lines("w", self.__as_rows(data))
+        with self.__open(self._path, "w") as f:
             json.dump(data, f, indent=4, cls=self._encoder)
 
 
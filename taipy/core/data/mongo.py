@@ -12,14 +12,18 @@
 from datetime import datetime, timedelta
 from importlib import util
 from inspect import isclass
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from taipy.common.config.common.scope import Scope
 
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..common._check_dependencies import _check_dependency_is_installed
+from ..common.mongo_default_document import MongoDefaultDocument
 
 if util.find_spec("pymongo"):
+    from pymongo import ASCENDING, IndexModel, InsertOne, ReplaceOne
+
     from ..common._mongo_connector import _connect_mongodb
 
 from ..data.operator import JoinOperator, Operator
@@ -47,6 +51,19 @@ class MongoCollectionDataNode(DataNode):
     - *db_driver* (`str`): The database driver.
     - *db_extra_args* (`Dict[str, Any]`): A dictionary of additional arguments to be passed into
         database connection string.
+    - *batch_size* (`int`): The number of documents fetched from the database per round trip when
+        reading, and sent to the database per request when writing. If not provided, the documents
+        are read with the default batch size of the driver and written in a single request.
+    - *id_field* (`str`): The document field that identifies the documents. If provided, the written
+        documents replace the stored documents with the same identifier (or are inserted if there
+        is none), and writing the data node only deletes the documents that are not written again
+        instead of dropping the collection. A unique index is created on this field.
+    - *projection* (`List[str]`): The fields of the documents that are read. If not provided, all the
+        fields are read.
+    - *indexes* (`List`): The indexes to create on the collection before writing to it. Each index is
+        a field name, a list of (field name, direction) pairs for a compound index, or a dictionary with
+        the *keys* of the index (field name or list of pairs) and the index options of pymongo (*unique*,
+        *name*, *expireAfterSeconds*, ...).
     """
 
     __STORAGE_TYPE = "mongo_collection"
@@ -59,6 +76,10 @@ class MongoCollectionDataNode(DataNode):
     __DB_PORT_KEY = "db_port"
     __DB_EXTRA_ARGS_KEY = "db_extra_args"
     __DB_DRIVER_KEY = "db_driver"
+    __BATCH_SIZE_KEY = "batch_size"
+    __ID_FIELD_KEY = "id_field"
+    __PROJECTION_KEY = "projection"
+    __INDEXES_KEY = "indexes"
 
     __DB_HOST_DEFAULT = "localhost"
     __DB_PORT_DEFAULT = 27017
@@ -150,6 +171,10 @@ class MongoCollectionDataNode(DataNode):
                 self.__DB_PORT_KEY,
                 self.__DB_DRIVER_KEY,
                 self.__DB_EXTRA_ARGS_KEY,
+                self.__BATCH_SIZE_KEY,
+                self.__ID_FIELD_KEY,
+                self.__PROJECTION_KEY,
+                self.__INDEXES_KEY,
             }
         )
 
@@ -162,15 +187,61 @@ class MongoCollectionDataNode(DataNode):
         cursor = self._read_by_query(operators, join_operator)
         return [self._decoder(row) for row in cursor]
 
+    def __find(self, query: Dict, projection: Optional[Dict] = None, batch_size: Optional[int] = None):
+        if projection is None and (fields := self.properties.get(self.__PROJECTION_KEY)):
+            projection = self.__build_projection(fields)
+        if batch_size is None:
+            batch_size = self.properties.get(self.__BATCH_SIZE_KEY)
+        if batch_size:
+            return self.collection.find(query, projection, batch_size=batch_size)
+        return self.collection.find(query, projection)
+
+    def __getitem__(self, item) -> Any:
+        if self.custom_document is not MongoDefaultDocument or self._decoder != self._default_decoder:
+            return super().__getitem__(item)
+
+        # Default documents expose the fields as attributes, so the selected fields can be projected by Mongo.
+        if isinstance(item, str):
+            return [document.get(item) for document in self.__find({}, {item: 1, "_id": 0})]
+        if isinstance(item, list) and item and all(isinstance(key, str) for key in item):
+            return [dict(document) for document in self.__find({}, self.__build_projection(item))]
+        return super().__getitem__(item)
+
     def _read(self):
         cursor = self._read_by_query()
         return [self._decoder(row) for row in cursor]
 
+    def _read_columns(self, columns: List) -> List:
+        """Read the documents projected on the selected fields, which must be accepted by the custom document."""
+        return [self._decoder(row) for row in self.__find({}, self.__build_projection(columns))]
+
+    @staticmethod
+    def __build_projection(fields: List[str]) -> Dict[str, int]:
+        projection = dict.fromkeys(fields, 1)
+        if "_id" not in projection:
+            projection["_id"] = 0
+        return projection
+
     def _read_by_query(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
         """Query from a Mongo collection, exclude the _id field"""
         if not operators:
-            return self.collection.find()
-
+            return self.__find({})
+        return self.__find(self.__build_query(operators, join_operator))
+
+    def _read_chunks(
+        self, chunksize: int, columns: Optional[List], operators: List, join_operator: JoinOperator
+    ) -> Iterator[List]:
+        query = self.__build_query(operators, join_operator) if operators else {}
+        projection = self.__build_projection(columns) if columns is not None else None
+        cursor = self.__find(query, projection, batch_size=chunksize)
+        return self.__read_batches(cursor, chunksize)
+
+    def __read_batches(self, cursor, chunksize: int) -> Iterator[List]:
+        while documents := list(islice(cursor, chunksize)):
+            yield [self._decoder(row) for row in documents]
+
+    @staticmethod
+    def __build_query(operators: Union[List, Tuple], join_operator=JoinOperator.AND) -> Dict:
         if not isinstance(operators, List):
             operators = [operators]
 
@@ -189,15 +260,11 @@ class MongoCollectionDataNode(DataNode):
             elif operator == Operator.LESS_OR_EQUAL:
                 conditions.append({key: {"$lte": value}})
 
-        query = {}
         if join_operator == JoinOperator.AND:
-            query = {"$and": conditions}
-        elif join_operator == JoinOperator.OR:
-            query = {"$or": conditions}
-        else:
-            raise NotImplementedError(f"Join operator {join_operator} is not supported.")
-
-        return self.collection.find(query)
+            return {"$and": conditions}
+        if join_operator == JoinOperator.OR:
+            return {"$or": conditions}
+        raise NotImplementedError(f"Join operator {join_operator} is not supported.")
 
     def _append(self, data) -> None:
         """Append data to a Mongo collection."""
@@ -223,6 +290,7 @@ class MongoCollectionDataNode(DataNode):
 
         if len(data) == 0:
             self.collection.drop()
+            self.__create_indexes()
             return
 
         if isinstance(data[0], dict):
@@ -230,18 +298,73 @@ class MongoCollectionDataNode(DataNode):
         else:
             self._insert_dicts([self._encoder(row) for row in data], drop=True)
 
+    def _write_chunks(self, first_chunk: Any, other_chunks: Iterator) -> None:
+        self._write(first_chunk)
+        for chunk in other_chunks:
+            self._append(chunk)
+
     def _insert_dicts(self, data: List[Dict], drop=False) -> None:
         """
         This method will insert data contained in a list of dictionaries into a collection.
 
+        If an *id_field* is configured, the documents are upserted on this field.
+
         Parameters:
             data (List[Dict]): a list of dictionaries
             drop (bool): drop the collection before inserting the data to overwrite the data in the collection.
+                If an *id_field* is configured, only the documents that are not in *data* are deleted.
         """
-        if drop:
+        id_field = self.properties.get(self.__ID_FIELD_KEY)
+        if drop and not id_field:
             self.collection.drop()
+        self.__create_indexes()
+
+        # The batches are unordered so that the server can process their documents in parallel.
+        if id_field:
+            if drop:
+                self.__delete_documents_not_in(id_field, {doc[id_field] for doc in data if id_field in doc})
+            for batch in self.__batches(data):
+                self.collection.bulk_write([self.__upsert_operation(id_field, doc) for doc in batch], ordered=False)
+        else:
+            for batch in self.__batches(data):
+                self.collection.insert_many(batch, ordered=False)
 
-        self.collection.insert_many(data)
+    def __batches(self, data: List) -> Iterator[List]:
+        if not data:
+            return
+        batch_size = self.properties.get(self.__BATCH_SIZE_KEY) or len(data)
+        for start in range(0, len(data), batch_size):
+            yield data[start : start + batch_size]
+
+    @staticmethod
+    def __upsert_operation(id_field: str, document: Dict):
+        if id_field not in document:
+            return InsertOne(document)
+        return ReplaceOne({id_field: document[id_field]}, document, upsert=True)
+
+    def __delete_documents_not_in(self, id_field: str, ids: Set):
+        # The documents are selected by the server, including the documents without the field.
+        self.collection.delete_many({id_field: {"$nin": list(ids)}})
+
+    def __create_indexes(self):
+        """Create the configured indexes. Creating an index that already exists does nothing."""
+        indexes = [self.__build_index_model(index) for index in self.properties.get(self.__INDEXES_KEY) or []]
+        if id_field := self.properties.get(self.__ID_FIELD_KEY):
+            if all(index.document["key"] != {id_field: ASCENDING} for index in indexes):
+                indexes.append(IndexModel([(id_field, ASCENDING)], unique=True))
+        if indexes:
+            self.collection.create_indexes(indexes)
+
+    @staticmethod
+    def __build_index_model(index: Union[str, List, Dict]) -> "IndexModel":
+        if isinstance(index, dict):
+            options = dict(index)
+            keys = options.pop("keys")
+        else:
+            keys, options = index, {}
+        if isinstance(keys, str):
+            keys = [(keys, ASCENDING)]
+        return IndexModel([tuple(key) for key in keys], **options)
 
     def _check_custom_document(self, custom_document):
         if not isclass(custom_document):
@@ -270,4 +393,3 @@ class MongoCollectionDataNode(DataNode):
             The document dictionary.
         """
         return document_object.__dict__
-
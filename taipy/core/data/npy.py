@@ -0,0 +1,170 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from datetime import datetime, timedelta
+from os.path import isfile
+from typing import Any, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+from taipy.common.config.common.scope import Scope
+
+from .._entity._reload import _Reloader
+from .._version._version_manager_factory import _VersionManagerFactory
+from ..exceptions.exceptions import InvalidMmapMode
+from ._file_datanode_mixin import _FileDataNodeMixin
+from .data_node import DataNode
+from .data_node_id import DataNodeId, Edit
+
+
+class NpyDataNode(DataNode, _FileDataNodeMixin):
+    """Data Node stored as a NumPy `.npy` file.
+
+    The array is memory-mapped when it is read: the data is loaded lazily from the file, and the
+    processes reading the same data node share the pages of the file cached by the operating system.
+    Writing the data node replaces the file. On POSIX systems, the arrays already read keep their
+    content. On Windows, a memory-mapped file cannot be replaced until the arrays read from it are
+    released, so the array is loaded in memory by default.
+
+    The *properties* attribute can contain the following optional entries:
+
+    - *default_path* (`str`): The default path of the `.npy` file used at the instantiation of the
+        data node.
+    - *default_data*: The default data of the data node. It is used at the data node instantiation
+        to write the data to the `.npy` file.
+    - *mmap_mode* (`Optional[str]`): The mode used to memory-map the file when reading it. Possible
+        values are *"r"* (read-only), *"c"* (copy-on-write: the array can be modified without
+        modifying the file), or None to load the array in memory.<br/>
+        The default value is *"r"*, or None on Windows.
+    """
+
+    __STORAGE_TYPE = "npy"
+    __MMAP_MODE_PROPERTY = "mmap_mode"
+    __VALID_MMAP_MODES = ["r", "c", None]
+
+    _REQUIRED_PROPERTIES: List[str] = []
+
+    def __init__(
+        self,
+        config_id: str,
+        scope: Scope,
+        id: Optional[DataNodeId] = None,
+        owner_id: Optional[str] = None,
+        parent_ids: Optional[Set[str]] = None,
+        last_edit_date: Optional[datetime] = None,
+        edits: Optional[List[Edit]] = None,
+        version: Optional[str] = None,
+        validity_period: Optional[timedelta] = None,
+        edit_in_progress: bool = False,
+        editor_id: Optional[str] = None,
+        editor_expiration_date: Optional[datetime] = None,
+        properties=None,
+    ) -> None:
+        self.id = id or self._new_id(config_id)
+
+        if properties is None:
+            properties = {}
+
+        if self.__MMAP_MODE_PROPERTY not in properties.keys():
+            properties[self.__MMAP_MODE_PROPERTY] = "r" if self._CAN_REPLACE_MAPPED_FILES else None
+        if properties[self.__MMAP_MODE_PROPERTY] not in self.__VALID_MMAP_MODES:
+            raise InvalidMmapMode(
+                f"Invalid mmap_mode: {properties[self.__MMAP_MODE_PROPERTY]}. "
+                f"Supported modes are {', '.join(str(mode) for mode in self.__VALID_MMAP_MODES)}"
+            )
+
+        default_value = properties.pop(self._DEFAULT_DATA_KEY, None)
+        _FileDataNodeMixin.__init__(self, properties)
+
+        DataNode.__init__(
+            self,
+            config_id,
+            scope,
+            self.id,
+            owner_id,
+            parent_ids,
+            last_edit_date,
+            edits,
+            version or _VersionManagerFactory._build_manager()._get_latest_version(),
+            validity_period,
+            edit_in_progress,
+            editor_id,
+            editor_expiration_date,
+            **properties,
+        )
+
+        with _Reloader():
+            self._write_default_data(default_value)
+
+        self._TAIPY_PROPERTIES.update(
+            {
+                self._PATH_KEY,
+                self._DEFAULT_PATH_KEY,
+                self._DEFAULT_DATA_KEY,
+                self._IS_GENERATED_KEY,
+                self._CONTENT_DIGEST_KEY,
+                self.__MMAP_MODE_PROPERTY,
+            }
+        )
+
+    @classmethod
+    def storage_type(cls) -> str:
+        """Return the storage type of the data node: "npy"."""
+        return cls.__STORAGE_TYPE
+
+    def _read(self):
+        return self._read_from_path()
+
+    def _read_from_path(self, path: Optional[str] = None, **read_kwargs) -> Any:
+        if path is None:
+            path = self._path
+
+        # Pickled objects cannot be memory-mapped, and loading them could execute arbitrary code.
+        return np.load(path, mmap_mode=self.properties[self.__MMAP_MODE_PROPERTY], allow_pickle=False)
+
+    @staticmethod
+    def __to_array(data: Any) -> np.ndarray:
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            return data.to_numpy()
+        return np.asarray(data)
+
+    def _write(self, data: Any):
+        array = self.__to_array(data)
+
+        def write_array(path: str):
+            with open(path, "wb") as f:
+                np.save(f, array, allow_pickle=False)
+
+        self._replace_file(write_array)
+
+    def _append(self, data: Any):
+        if not isfile(self._path):
+            return self._write(data)
+
+        appended_data = self.__to_array(data)
+
+        def write_concatenation(path: str):
+            # The new file is filled through a memory map, without loading the existing array in memory. The
+            # memory maps are local so that they are released before the file is replaced.
+            existing = np.load(self._path, mmap_mode="r", allow_pickle=False)
+            appended = appended_data.astype(existing.dtype, copy=False)
+            if appended.ndim != existing.ndim:
+                appended = appended.reshape(-1, *existing.shape[1:])
+            array = np.lib.format.open_memmap(
+                path, mode="w+", dtype=existing.dtype, shape=(len(existing) + len(appended), *existing.shape[1:])
+            )
+            array[: len(existing)] = existing
+            array[len(existing) :] = appended
+            array.flush()
+            del array, existing
+
+        self._replace_file(write_concatenation)
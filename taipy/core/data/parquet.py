@@ -9,12 +9,19 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import os
+import shutil
+import uuid
 from datetime import datetime, timedelta
 from os.path import isdir, isfile
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
 from taipy.common.config.common.scope import Scope
 
@@ -23,9 +30,11 @@ from .._version._version_manager_factory import _VersionManagerFactory
 from ..exceptions.exceptions import UnknownCompressionAlgorithm, UnknownParquetEngine
 from ..job.job_id import JobId
 from ._file_datanode_mixin import _FileDataNodeMixin
+from ._filter import _FilterDataNode
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
+from .operator import JoinOperator
 
 
 class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
@@ -39,7 +48,8 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         instantiation to write the data to the Parquet file.
     - *has_header* (`bool`): If True, indicates that the Parquet file has a header.
     - *exposed_type* (`str`): The exposed type of the data read from Parquet
-        file.<br/> The default value is `pandas`.
+        file. Possible values are *"pandas"*, *"numpy"*, *"arrow"* (`pyarrow.Table`), *"polars"*,
+        or a custom class.<br/> The default value is `pandas`.
     - *engine* (`Optional[str]`): Parquet library to use. Possible values are
         *"fastparquet"* or *"pyarrow"*.<br/> The default value is *"pyarrow"*.
     - *compression* (`Optional[str]`): Name of the compression to use. Possible values
@@ -53,6 +63,10 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         *pandas.DataFrame.write_parquet()* function when writing the data. <br/>
         The parameters in *"write_kwargs"* have a **higher precedence** than the
         top-level parameters which are also passed to Pandas.
+    - *partition_cols* (`Optional[List[str]]`): The columns used to partition the data in a
+        directory per value (Hive layout). With the *"pyarrow"* engine, appending data writes new
+        files in the matching partitions without rewriting the existing ones, and the filters on
+        the partition columns only read the matching directories.
     """
 
     __STORAGE_TYPE = "parquet"
@@ -62,6 +76,12 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     __VALID_COMPRESSION_ALGORITHMS = ["snappy", "gzip", "brotli", "none"]
     __READ_KWARGS_PROPERTY = "read_kwargs"
     __WRITE_KWARGS_PROPERTY = "write_kwargs"
+    __PARTITION_COLS_PROPERTY = "partition_cols"
+    __POSITION_COLUMN = "__taipy_position__"
+    _VALID_STRING_EXPOSED_TYPES = [
+        *_TabularDataNodeMixin._VALID_STRING_EXPOSED_TYPES,
+        *_TabularDataNodeMixin._ARROW_EXPOSED_TYPES,
+    ]
     _REQUIRED_PROPERTIES: List[str] = []
 
     def __init__(
@@ -151,10 +171,12 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
                 self._DEFAULT_PATH_KEY,
                 self._DEFAULT_DATA_KEY,
                 self._IS_GENERATED_KEY,
+                self._CONTENT_DIGEST_KEY,
                 self.__ENGINE_PROPERTY,
                 self.__COMPRESSION_PROPERTY,
                 self.__READ_KWARGS_PROPERTY,
                 self.__WRITE_KWARGS_PROPERTY,
+                self.__PARTITION_COLS_PROPERTY,
             }
         )
 
@@ -179,18 +201,39 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
             self.__ENGINE_PROPERTY: properties[self.__ENGINE_PROPERTY],
             self.__COMPRESSION_PROPERTY: properties[self.__COMPRESSION_PROPERTY],
         }
+        if partition_cols := properties.get(self.__PARTITION_COLS_PROPERTY):
+            kwargs[self.__PARTITION_COLS_PROPERTY] = partition_cols
         kwargs.update(properties[self.__WRITE_KWARGS_PROPERTY])
         kwargs.update(write_kwargs)
 
+        if kwargs[self.__ENGINE_PROPERTY] == "pyarrow" and (
+            isinstance(data, pa.Table) or _FilterDataNode._is_polars_dataframe(data)
+        ):
+            self.__write_arrow_table(self._convert_data_to_arrow(properties[self._EXPOSED_TYPE_PROPERTY], data), kwargs)
+            self.track_edit(timestamp=datetime.now(), job_id=job_id)
+            return
+
         df = self._convert_data_to_dataframe(properties[self._EXPOSED_TYPE_PROPERTY], data)
         if isinstance(df, pd.Series):
             df = pd.DataFrame(df)
 
         # Ensure that the columns are strings, otherwise writing will fail with pandas 1.3.5
         df.columns = df.columns.astype(str)
+        if kwargs.get(self.__PARTITION_COLS_PROPERTY) and not kwargs.get("append"):
+            # Partitioned datasets are written as new files next to the existing ones, which must be removed first.
+            self.__remove_data()
         df.to_parquet(self._path, **kwargs)
         self.track_edit(timestamp=datetime.now(), job_id=job_id)
 
+    def __write_arrow_table(self, table: pa.Table, kwargs: Dict):
+        # Arrow data is written as is, without the round trip through pandas of `pandas.DataFrame.to_parquet()`.
+        kwargs = {k: v for k, v in kwargs.items() if k not in [self.__ENGINE_PROPERTY, "index"]}
+        if partition_cols := kwargs.pop(self.__PARTITION_COLS_PROPERTY, None):
+            self.__remove_data()
+            pq.write_to_dataset(table, self._path, partition_cols=partition_cols, **kwargs)
+        else:
+            pq.write_table(table, self._path, **kwargs)
+
     def read_with_kwargs(self, **read_kwargs):
         """Read data from this data node.
 
@@ -205,6 +248,140 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     def _read(self):
         return self._read_from_path()
 
+    def filter(self, operators: Union[List, Tuple], join_operator=JoinOperator.AND) -> Any:
+        """Read and filter the data referenced by this data node.
+
+        With the *"pyarrow"* engine, the filter is pushed down to the Parquet reader so that row
+        groups whose statistics do not match the filter are skipped and only the matching rows are
+        loaded in memory. Otherwise, the data is read entirely and filtered in memory.
+
+        Parameters:
+            operators (Union[List[Tuple], Tuple]): A 3-element tuple or a list of 3-element tuples,
+                each is in the form of (key, value, `Operator^`).
+            join_operator (JoinOperator^): The operator used to join the multiple filter
+                3-tuples.
+
+        Returns:
+            The filtered data.
+        """
+        properties = self.properties
+        if properties[self.__ENGINE_PROPERTY] != "pyarrow" or not operators or not self.last_edit_date:
+            return super().filter(operators, join_operator)
+        if not isinstance(operators[0], (list, tuple)):
+            operators = [operators]
+        exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
+
+        kwargs = {**properties[self.__READ_KWARGS_PROPERTY], self.__ENGINE_PROPERTY: "pyarrow"}
+        try:
+            expression = self.__build_filter_expression(operators, join_operator, exposed_type)
+            if expression is None:
+                return super().filter(operators, join_operator)
+            if user_filters := kwargs.get("filters"):
+                if not isinstance(user_filters, pc.Expression):
+                    user_filters = pq.filters_to_expression(user_filters)
+                kwargs["filters"] = user_filters & expression
+            else:
+                kwargs["filters"] = expression
+            data = self._do_read_from_path(self._path, exposed_type, kwargs)
+            if isinstance(data, pd.DataFrame) and isfile(self._path):
+                self.__restore_filtered_index(data, operators, user_filters, expression)
+            return data
+        except pa.ArrowException:
+            # The filter cannot be evaluated by Arrow (e.g. a value type that does not match the column type).
+            return super().filter(operators, join_operator)
+
+    def __restore_filtered_index(
+        self, data: pd.DataFrame, operators: Union[List, Tuple], user_filters: Any, expression: pc.Expression
+    ) -> None:
+        """Label the rows read with a pushed down filter the way the in-memory filter would.
+
+        A range index is not stored as a column of the file, so the reader numbers the rows read from zero.
+        The labels of the matching rows are recovered from their positions in the file, which are computed
+        by reading the filtered columns only.
+        """
+        index_columns = (pq.read_schema(self._path).pandas_metadata or {}).get("index_columns", [])
+        if any(not isinstance(column, dict) or column.get("kind") != "range" for column in index_columns):
+            # The index is stored as columns of the file and read back as is.
+            return
+        columns = list(dict.fromkeys(key for key, _, _ in operators))
+        table = pq.read_table(self._path, columns=columns, filters=user_filters or None)
+        index = pd.RangeIndex(table.num_rows)
+        if index_columns:
+            stored = index_columns[0]
+            stored_index = pd.RangeIndex(stored["start"], stored["stop"], stored["step"], name=stored.get("name"))
+            if len(stored_index) == table.num_rows:
+                index = stored_index
+        table = table.append_column(self.__POSITION_COLUMN, pa.array(np.arange(table.num_rows)))
+        positions = table.filter(expression).column(self.__POSITION_COLUMN).to_numpy()
+        if len(positions) == len(data):
+            data.index = index[positions]
+
+    def __build_filter_expression(
+        self, operators: Union[List, Tuple], join_operator: JoinOperator, exposed_type: Any
+    ) -> Optional[pc.Expression]:
+        # Numpy filters reference the columns by position.
+        column_names = self.__get_column_names() if exposed_type == self._EXPOSED_TYPE_NUMPY else None
+        return _FilterDataNode._build_arrow_expression(operators, join_operator, column_names)
+
+    def __get_column_names(self) -> List[str]:
+        # The serialized index columns are not part of the data read.
+        schema = pq.ParquetDataset(self._path).schema
+        index_columns = (schema.pandas_metadata or {}).get("index_columns", [])
+        return [name for name in schema.names if name not in index_columns]
+
+    def _read_columns(self, columns: List) -> Any:
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        if exposed_type == self._EXPOSED_TYPE_PANDAS or exposed_type in self._ARROW_EXPOSED_TYPES:
+            return self._read_from_path(columns=columns)
+        if exposed_type == self._EXPOSED_TYPE_NUMPY:
+            column_names = self.__get_column_names()
+            return self._read_from_path(columns=[column_names[int(column)] for column in columns])
+        return super()._read_columns(columns)
+
+    def _read_chunks(
+        self, chunksize: int, columns: Optional[List], operators: List, join_operator: JoinOperator
+    ) -> Iterator[Any]:
+        properties = self.properties
+        exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
+        read_kwargs = properties[self.__READ_KWARGS_PROPERTY]
+        if (
+            properties[self.__ENGINE_PROPERTY] != "pyarrow"
+            or exposed_type not in [self._EXPOSED_TYPE_PANDAS, self._EXPOSED_TYPE_NUMPY, *self._ARROW_EXPOSED_TYPES]
+            or not (isfile(self._path) or isdir(self._path))
+            or set(read_kwargs) - {"columns", "filters"}
+        ):
+            return super()._read_chunks(chunksize, columns, operators, join_operator)
+
+        try:
+            expression = self.__build_filter_expression(operators, join_operator, exposed_type) if operators else None
+            if operators and expression is None:
+                return super()._read_chunks(chunksize, columns, operators, join_operator)
+            if user_filters := read_kwargs.get("filters"):
+                if not isinstance(user_filters, pc.Expression):
+                    user_filters = pq.filters_to_expression(user_filters)
+                expression = user_filters & expression if expression is not None else user_filters
+            if columns is None:
+                columns = read_kwargs.get("columns")
+            elif exposed_type == self._EXPOSED_TYPE_NUMPY:
+                column_names = self.__get_column_names()
+                columns = [column_names[int(column)] for column in columns]
+            scanner = ds.dataset(self._path, format="parquet", partitioning="hive").scanner(
+                columns=columns, filter=expression, batch_size=chunksize
+            )
+        except pa.ArrowException:
+            # The filter cannot be evaluated by Arrow (e.g. a value type that does not match the column type).
+            return super()._read_chunks(chunksize, columns, operators, join_operator)
+        return self.__read_batches(scanner, exposed_type)
+
+    def __read_batches(self, scanner: ds.Scanner, exposed_type: str) -> Iterator[Any]:
+        for batch in scanner.to_batches():
+            if batch.num_rows and exposed_type in self._ARROW_EXPOSED_TYPES:
+                table = self.__drop_index_columns(pa.Table.from_batches([batch]))
+                yield self._convert_arrow_to_exposed_type(exposed_type, table)
+            elif batch.num_rows:
+                df = batch.to_pandas()
+                yield df.to_numpy() if exposed_type == self._EXPOSED_TYPE_NUMPY else df
+
     def _read_from_path(self, path: Optional[str] = None, **read_kwargs) -> Any:
         if path is None:
             path = self._path
@@ -218,7 +395,7 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
 
         properties = self.properties
 
-        kwargs = properties[self.__READ_KWARGS_PROPERTY]
+        kwargs = dict(properties[self.__READ_KWARGS_PROPERTY])
         kwargs.update(
             {
                 self.__ENGINE_PROPERTY: properties[self.__ENGINE_PROPERTY],
@@ -232,6 +409,8 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
             return self._read_as_pandas_dataframe(path, kwargs)
         if exposed_type == self._EXPOSED_TYPE_NUMPY:
             return self._read_as_numpy(path, kwargs)
+        if exposed_type in self._ARROW_EXPOSED_TYPES:
+            return self._convert_arrow_to_exposed_type(exposed_type, self._read_as_arrow_table(path, kwargs))
         return self._read_as(path, kwargs)
 
     def _read_as(self, path: str, read_kwargs: Dict):
@@ -245,9 +424,124 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     def _read_as_pandas_dataframe(self, path: str, read_kwargs: Dict) -> pd.DataFrame:
         return pd.read_parquet(path, **read_kwargs)
 
+    def _read_as_arrow_table(self, path: str, read_kwargs: Dict) -> pa.Table:
+        kwargs = dict(read_kwargs)
+        if (engine := kwargs.pop(self.__ENGINE_PROPERTY, "pyarrow")) != "pyarrow":
+            return pa.Table.from_pandas(pd.read_parquet(path, engine=engine, **kwargs), preserve_index=False)
+        return self.__drop_index_columns(pq.read_table(path, **kwargs))
+
+    @staticmethod
+    def __drop_index_columns(table: pa.Table) -> pa.Table:
+        # The index of the pandas dataframes written is not part of the data.
+        index_columns = (table.schema.pandas_metadata or {}).get("index_columns", [])
+        return table.drop_columns([c for c in index_columns if isinstance(c, str) and c in table.column_names])
+
+    def _write_chunks(self, first_chunk: Any, other_chunks: Iterator) -> None:
+        properties = self.properties
+        if properties[self.__ENGINE_PROPERTY] == "pyarrow" and self.__get_partition_cols():
+            # Each chunk is written as soon as it is produced, as new files of its partitions.
+            self._write(first_chunk)
+            for chunk in other_chunks:
+                self.__write_part_files(chunk)
+            return
+        if (
+            properties[self.__ENGINE_PROPERTY] != "pyarrow"
+            or properties[self.__WRITE_KWARGS_PROPERTY]
+            or isdir(self._path)
+        ):
+            return super()._write_chunks(first_chunk, other_chunks)
+
+        # Each chunk is written as soon as it is produced, as one or more row groups of the same file. A chunk with
+        # new columns or wider types evolves the schema of the file, so the row groups already written are rewritten.
+        table = self.__convert_data_to_table(first_chunk)
+        schema = table.schema
+        writer = pq.ParquetWriter(self._path, schema, compression=properties[self.__COMPRESSION_PROPERTY])
+        try:
+            writer.write_table(table)
+            for chunk in other_chunks:
+                table = self.__convert_data_to_table(chunk)
+                if not table.schema.equals(schema, check_metadata=False):
+                    evolved_schema = self.__evolve_schema(schema, table.schema)
+                    if not evolved_schema.equals(schema, check_metadata=False):
+                        writer = self.__rewrite_file(writer, evolved_schema)
+                        schema = evolved_schema
+                    table = self.__conform_table(table, schema)
+                writer.write_table(table)
+        finally:
+            writer.close()
+
+    def __evolve_schema(self, schema: pa.Schema, chunk_schema: pa.Schema) -> pa.Schema:
+        """Return the schema of the file once a chunk is written, with the columns and wider types of the chunk."""
+        try:
+            evolved_schema = pa.unify_schemas([schema, chunk_schema], promote_options="permissive")
+        except pa.ArrowException as e:
+            raise ValueError(
+                f"A chunk cannot be written to the Parquet file of data node {self.id}: its schema is not compatible"
+                f" with the schema of the previous chunks.\n{chunk_schema}\n{schema}"
+            ) from e
+        return (
+            evolved_schema if evolved_schema.equals(schema, check_metadata=False) else evolved_schema.remove_metadata()
+        )
+
+    def __rewrite_file(self, writer: pq.ParquetWriter, schema: pa.Schema) -> pq.ParquetWriter:
+        """Rewrite the row groups already written with a new schema, and return the writer of the new file."""
+        writer.close()
+        previous_path = f"{self._path}.{uuid.uuid4().hex}"
+        os.replace(self._path, previous_path)
+        writer = pq.ParquetWriter(self._path, schema, compression=self.properties[self.__COMPRESSION_PROPERTY])
+        with pq.ParquetFile(previous_path) as previous_file:
+            for i in range(previous_file.num_row_groups):
+                writer.write_table(self.__conform_table(previous_file.read_row_group(i), schema))
+        os.remove(previous_path)
+        return writer
+
+    @staticmethod
+    def __conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+        columns = [
+            table.column(field.name).cast(field.type)
+            if field.name in table.column_names
+            else pa.nulls(table.num_rows, field.type)
+            for field in schema
+        ]
+        return pa.Table.from_arrays(columns, schema=schema)
+
+    def __convert_data_to_table(self, data: Any) -> pa.Table:
+        if isinstance(data, pa.Table) or _FilterDataNode._is_polars_dataframe(data):
+            return self._convert_data_to_arrow(self.properties[self._EXPOSED_TYPE_PROPERTY], data)
+        df = self._convert_data_to_dataframe(self.properties[self._EXPOSED_TYPE_PROPERTY], data)
+        if isinstance(df, pd.Series):
+            df = pd.DataFrame(df)
+        df.columns = df.columns.astype(str)
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+    def __get_partition_cols(self) -> Optional[List[str]]:
+        properties = self.properties
+        return properties[self.__WRITE_KWARGS_PROPERTY].get(self.__PARTITION_COLS_PROPERTY) or properties.get(
+            self.__PARTITION_COLS_PROPERTY
+        )
+
+    def __write_part_files(self, data: Any):
+        # The new files have a unique name so that the files previously written are neither rewritten nor replaced.
+        pq.write_to_dataset(
+            self.__convert_data_to_table(data),
+            self._path,
+            partition_cols=self.__get_partition_cols(),
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+            compression=self.properties[self.__COMPRESSION_PROPERTY],
+        )
+
+    def __remove_data(self):
+        if isdir(self._path):
+            shutil.rmtree(self._path)
+        elif isfile(self._path):
+            os.remove(self._path)
+
     def _append(self, data: Any):
+        if self.properties[self.__ENGINE_PROPERTY] == "pyarrow" and (self.__get_partition_cols() or isdir(self._path)):
+            self.__write_part_files(data)
+            return
         self._write_with_kwargs(data, engine="fastparquet", append=True)
 
     def _write(self, data: Any):
         self._write_with_kwargs(data)
-
@@ -9,14 +9,17 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import io
 import pickle
+import struct
 from datetime import datetime, timedelta
-from typing import Any, List, Optional, Set
+from typing import IO, Any, List, Optional, Set
 
 from taipy.common.config.common.scope import Scope
 
 from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
+from ._compression import _Compression
 from ._file_datanode_mixin import _FileDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
@@ -31,9 +34,27 @@ class PickleDataNode(DataNode, _FileDataNodeMixin):
         data node.
     - *default_data*: The default data of the data node. It is used at the data node instantiation
         to write the data to the Pickle file.
+    - *compression* (`Optional[str]`): The algorithm used to compress the file: *"zstd"*, *"lz4"*,
+        *"gzip"*, or None for an uncompressed file.<br/>
+        The default value is None. The data is compressed as a stream while it is written.
+    - *compression_level* (`Optional[int]`): The compression level. If None, the default level of the
+        algorithm is used.
+    - *out_of_band* (`bool`): If True, the contiguous buffers of NumPy arrays and pandas objects are
+        written out-of-band, directly from the memory of the objects to the file.<br/>
+        The default value is False.
+
+    The data is pickled with protocol 5. By default, the file is a standard pickle file that can be
+    loaded with `pickle.load()`. If the file is compressed or if *out_of_band* is True, the file has a
+    Taipy specific format that contains the pickle stream followed by its out-of-band buffers.
     """
 
     __STORAGE_TYPE = "pickle"
+    __COMPRESSION_KEY = "compression"
+    __COMPRESSION_LEVEL_KEY = "compression_level"
+    __OUT_OF_BAND_KEY = "out_of_band"
+    # Files starting with this header contain a protocol 5 pickle stream followed by its out-of-band buffers.
+    __OUT_OF_BAND_HEADER = b"\x00taipy-pickle-5\x00"
+    __SIZE = struct.Struct("<Q")
 
     _REQUIRED_PROPERTIES: List[str] = []
 
@@ -46,7 +67,7 @@ class PickleDataNode(DataNode, _FileDataNodeMixin):
         parent_ids: Optional[Set[str]] = None,
         last_edit_date: Optional[datetime] = None,
         edits: Optional[List[Edit]] = None,
-        version: str = None,
+        version: Optional[str] = None,
         validity_period: Optional[timedelta] = None,
         edit_in_progress: bool = False,
         editor_id: Optional[str] = None,
@@ -58,6 +79,8 @@ class PickleDataNode(DataNode, _FileDataNodeMixin):
         if properties is None:
             properties = {}
 
+        _Compression._check_algorithm(properties.get(self.__COMPRESSION_KEY), "compressed Pickle Data Node")
+
         default_value = properties.pop(self._DEFAULT_DATA_KEY, None)
         _FileDataNodeMixin.__init__(self, properties)
 
@@ -87,6 +110,10 @@ class PickleDataNode(DataNode, _FileDataNodeMixin):
                 self._DEFAULT_PATH_KEY,
                 self._DEFAULT_DATA_KEY,
                 self._IS_GENERATED_KEY,
+                self._CONTENT_DIGEST_KEY,
+                self.__COMPRESSION_KEY,
+                self.__COMPRESSION_LEVEL_KEY,
+                self.__OUT_OF_BAND_KEY,
             }
         )
 
@@ -102,9 +129,69 @@ class PickleDataNode(DataNode, _FileDataNodeMixin):
         if path is None:
             path = self._path
 
-        with open(path, "rb") as pf:
+        with self.__open(path, "rb") as pf:
+            if pf.read(len(self.__OUT_OF_BAND_HEADER)) == self.__OUT_OF_BAND_HEADER:
+                return self.__load_out_of_band(pf)
+        # The files written without out-of-band buffers contain a plain pickle stream.
+        with self.__open(path, "rb") as pf:
             return pickle.load(pf)
 
     def _write(self, data):
-        with open(self._path, "wb") as pf:
-            pickle.dump(data, pf)
+        properties = self.properties
+        if properties.get(self.__COMPRESSION_KEY) is None and not properties.get(self.__OUT_OF_BAND_KEY):
+            with open(self._path, "wb") as pf:
+                pickle.dump(data, pf, protocol=5)
+            return
+        buffers: List[pickle.PickleBuffer] = []
+        with self.__open(self._path, "wb") as pf:
+            pf.write(self.__OUT_OF_BAND_HEADER)
+            # The pickle stream is split into sized records so that it can be read before its buffers.
+            pickle.dump(data, _SizedRecordWriter(pf), protocol=5, buffer_callback=buffers.append)
+            pf.write(self.__SIZE.pack(0))
+            for buffer in buffers:
+                raw = buffer.raw()
+                pf.write(self.__SIZE.pack(raw.nbytes))
+                pf.write(raw)
+
+    def __open(self, path: str, mode: str) -> Any:
+        properties = self.properties
+        return _Compression._open(
+            path, mode, properties.get(self.__COMPRESSION_KEY), properties.get(self.__COMPRESSION_LEVEL_KEY)
+        )
+
+    def __load_out_of_band(self, pf: IO[bytes]) -> Any:
+        stream = io.BytesIO()
+        while record_size := self.__read_size(pf):
+            stream.write(pf.read(record_size))
+        buffers = []
+        while (buffer_size := self.__read_size(pf)) is not None:
+            # The buffers are writable, so are the arrays loaded from them.
+            buffer = bytearray(buffer_size)
+            view = memoryview(buffer)
+            while view:
+                if not (read_size := pf.readinto(view)):  # type: ignore[attr-defined]
+                    raise pickle.UnpicklingError("The pickle file is truncated.")
+                view = view[read_size:]
+            buffers.append(buffer)
+        return pickle.loads(stream.getbuffer(), buffers=buffers)
+
+    def __read_size(self, pf: IO[bytes]) -> Optional[int]:
+        if not (size := pf.read(self.__SIZE.size)):
+            return None
+        return self.__SIZE.unpack(size)[0]
+
+
+class _SizedRecordWriter:
+    """File-like object writing each chunk of data to the underlying file as a record prefixed by its size."""
+
+    __SIZE = struct.Struct("<Q")
+
+    def __init__(self, file: IO[bytes]):
+        self.__file = file
+
+    def write(self, data) -> int:
+        size = memoryview(data).nbytes
+        if size:
+            self.__file.write(self.__SIZE.pack(size))
+            self.__file.write(data)
+        return size
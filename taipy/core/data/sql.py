@@ -28,11 +28,16 @@ class SQLDataNode(_AbstractSQLDataNode):
     The *properties* attribute must contain the following mandatory entries:
 
     - *has_header* (`bool`): If True, indicates that the SQL query has a header.
-    - *exposed_type* (`str`): The exposed type of the data read from SQL query. The default value is `pandas`.
+    - *exposed_type* (`str`): The exposed type of the data read from SQL query. Possible values are
+        *"pandas"*, *"numpy"*, *"arrow"* (`pyarrow.Table`), *"polars"*, or a custom class. The default value
+        is `pandas`.
     - *db_name* (`str`): The database name, or the name of the SQLite database file.
     - *db_engine* (`str`): The database engine. Possible values are *sqlite*, *mssql*,
         *mysql*, or *postgresql*.
     - *read_query* (`str`): The SQL query string used to read the data from the database.
+        The query is selected from to filter, sort, and page the rows on the database server. With
+        the *"mssql"* engine, a query with an ORDER BY clause but no TOP, OFFSET, or FOR XML clause
+        cannot be selected from, so its rows are filtered, sorted, and paged in memory.
     - *write_query_builder* `(Callable)`: A callback function that takes the data as an input
         parameter and returns a list of SQL queries to be executed when writing data to the data
         node.
@@ -52,6 +57,11 @@ class SQLDataNode(_AbstractSQLDataNode):
     - *sqlite_file_extension* (str): The filename extension of the SQLite file. The default value is ".db".
     - *db_extra_args* (`Dict[str, Any]`): A dictionary of additional arguments to be passed into database
         connection string.
+    - *db_pool_size* (`int`): The number of connections kept open in the connection pool shared by the
+        data nodes of the same database. The default value is the SQLAlchemy default of the database engine.
+    - *db_max_overflow* (`int`): The number of connections that can be opened beyond *db_pool_size* when
+        all the pooled connections are in use. The default value is the SQLAlchemy default of the database
+        engine.
     """
 
     __STORAGE_TYPE = "sql"
@@ -9,17 +9,22 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import io
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import pandas as pd
-from sqlalchemy import MetaData, Table
+import pyarrow as pa
+from sqlalchemy import LargeBinary, MetaData, Table, TextClause, text
+from sqlalchemy.exc import SQLAlchemyError
 
 from taipy.common.config.common.scope import Scope
 
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..exceptions.exceptions import MissingRequiredProperty
 from ._abstract_sql import _AbstractSQLDataNode
+from ._filter import _FilterDataNode
 from .data_node_id import DataNodeId, Edit
 
 
@@ -28,7 +33,9 @@ class SQLTableDataNode(_AbstractSQLDataNode):
     The *properties* attribute must contain the following mandatory entries:
 
     - *has_header* (`bool`): If True, indicates that the SQL query has a header.
-    - *exposed_type* (`str`): The exposed type of the data read from SQL query. The default value is `pandas`.
+    - *exposed_type* (`str`): The exposed type of the data read from SQL query. Possible values are
+        *"pandas"*, *"numpy"*, *"arrow"* (`pyarrow.Table`), *"polars"*, or a custom class. The default value
+        is `pandas`.
     - *db_name* (`str`): The database name, or the name of the SQLite database file.
     - *db_engine* (`str`): The database engine. Possible values are *sqlite*, *mssql*,
         *mysql*, or *postgresql*.
@@ -46,10 +53,27 @@ class SQLTableDataNode(_AbstractSQLDataNode):
     - *sqlite_file_extension* (str): The filename extension of the SQLite file. The default value is ".db".
     - *db_extra_args* (`Dict[str, Any]`): A dictionary of additional arguments to be passed into database
         connection string.
+    - *db_pool_size* (`int`): The number of connections kept open in the connection pool shared by the
+        data nodes of the same database. The default value is the SQLAlchemy default of the database engine.
+    - *db_max_overflow* (`int`): The number of connections that can be opened beyond *db_pool_size* when
+        all the pooled connections are in use. The default value is the SQLAlchemy default of the database
+        engine.
+    - *insert_batch_size* (`int`): The maximum number of rows sent to the database in a single insert statement.
+        The default value is 10000.
     """
 
     __STORAGE_TYPE = "sql_table"
     __TABLE_KEY = "table_name"
+    __INSERT_BATCH_SIZE_KEY = "insert_batch_size"
+    __INSERT_BATCH_SIZE_DEFAULT = 10_000
+
+    # Overwriting a table with TRUNCATE is transactional on these engines, unlike on MySQL.
+    __TRUNCATE_DIALECTS = {"postgresql", "mssql"}
+
+    # The tables reflected from the databases with their reflection time, by connection string and table name.
+    # They are reflected again once expired, since the tables may have been altered by other processes.
+    __reflected_tables: Dict[Tuple[str, str], Tuple[Table, float]] = {}
+    __REFLECTED_TABLE_TTL = 60.0
 
     def __init__(
         self,
@@ -86,7 +110,7 @@ class SQLTableDataNode(_AbstractSQLDataNode):
             editor_expiration_date=editor_expiration_date,
             properties=properties,
         )
-        self._TAIPY_PROPERTIES.update({self.__TABLE_KEY})
+        self._TAIPY_PROPERTIES.update({self.__TABLE_KEY, self.__INSERT_BATCH_SIZE_KEY})
 
     @classmethod
     def storage_type(cls) -> str:
@@ -96,6 +120,9 @@ class SQLTableDataNode(_AbstractSQLDataNode):
     def _get_base_read_query(self) -> str:
         return f"SELECT * FROM {self.properties[self.__TABLE_KEY]}"
 
+    def _get_base_read_from_clause(self) -> TextClause:
+        return text(self.properties[self.__TABLE_KEY])
+
     def _do_append(self, data, engine, connection) -> None:
         self.__insert_data(data, engine, connection)
 
@@ -103,41 +130,171 @@ class SQLTableDataNode(_AbstractSQLDataNode):
         self.__insert_data(data, engine, connection, delete_table=True)
 
     def __insert_data(self, data, engine, connection, delete_table: bool = False) -> None:
+        if isinstance(data, pa.Table) or _FilterDataNode._is_polars_dataframe(data):
+            # The rows of Arrow data are inserted without conversion to pandas.
+            data = data if isinstance(data, pa.Table) else data.to_arrow()
+            columns = data.column_names
+        else:
+            data = self._convert_data_to_dataframe(self.properties[self._EXPOSED_TYPE_PROPERTY], data)
+            columns = list(data.index if isinstance(data, pd.Series) else data.columns)
         table = self._create_table(engine)
-        self._insert_dataframe(
-            self._convert_data_to_dataframe(self.properties[self._EXPOSED_TYPE_PROPERTY], data),
-            table,
-            connection,
-            delete_table,
-        )
+        if any(isinstance(column, str) and column not in table.c for column in columns):
+            # The table may have been altered since it was reflected.
+            self._invalidate_reflected_table()
+            table = self._create_table(engine)
+
+        batch_size = self.properties.get(self.__INSERT_BATCH_SIZE_KEY) or self.__INSERT_BATCH_SIZE_DEFAULT
+        try:
+            if isinstance(data, pa.Table):
+                self._insert_arrow_table(data, table, connection, delete_table, batch_size)
+            else:
+                self._insert_dataframe(data, table, connection, delete_table, batch_size)
+        except Exception:
+            self._invalidate_reflected_table()
+            raise
 
     def _create_table(self, engine) -> Table:
-        return Table(
-            self.properties[self.__TABLE_KEY],
-            MetaData(),
-            autoload_with=engine,
-        )
+        key = self.__get_table_key()
+        now = time.monotonic()
+        if (reflected := self.__reflected_tables.get(key)) is not None and now - reflected[
+            1
+        ] < self.__REFLECTED_TABLE_TTL:
+            return reflected[0]
+        table = Table(self.properties[self.__TABLE_KEY], MetaData(), autoload_with=engine)
+        self.__reflected_tables[key] = (table, now)
+        return table
+
+    def _invalidate_reflected_table(self) -> None:
+        """Reflect the table again on the next write, e.g. after it has been altered."""
+        self.__reflected_tables.pop(self.__get_table_key(), None)
+
+    def __get_table_key(self) -> Tuple[str, str]:
+        return self._conn_string(), self.properties[self.__TABLE_KEY]
 
     @classmethod
-    def _insert_dicts(cls, data: List[Dict], table: Any, connection: Any, delete_table: bool) -> None:
+    def _insert_dicts(
+        cls, data: List[Dict], table: Any, connection: Any, delete_table: bool, batch_size: Optional[int] = None
+    ) -> None:
         """
         This method will insert the data contained in a list of dictionaries into a table. The query itself is handled
         by SQLAlchemy, so it's only needed to pass the correct data type.
         """
         cls.__delete_all_rows(table, connection, delete_table)
-        connection.execute(table.insert(), data)
+        batch_size = batch_size or cls.__INSERT_BATCH_SIZE_DEFAULT
+        for start in range(0, len(data), batch_size):
+            connection.execute(table.insert(), data[start : start + batch_size])
 
     @classmethod
     def _insert_dataframe(
-        cls, df: Union[pd.DataFrame, pd.Series], table: Any, connection: Any, delete_table: bool
+        cls,
+        df: Union[pd.DataFrame, pd.Series],
+        table: Any,
+        connection: Any,
+        delete_table: bool,
+        batch_size: Optional[int] = None,
     ) -> None:
         if isinstance(df, pd.Series):
-            data = [df.to_dict()]
-        elif isinstance(df, pd.DataFrame):
-            data = df.to_dict(orient="records")
-        cls._insert_dicts(data, table, connection, delete_table)
+            cls._insert_dicts([df.to_dict()], table, connection, delete_table)
+            return
+        cls.__delete_all_rows(table, connection, delete_table)
+        batch_size = batch_size or cls.__INSERT_BATCH_SIZE_DEFAULT
+        # The batches are converted column by column to the Python objects returned by DataFrame.to_dict().
+        batches = (
+            [batch.iloc[:, i].tolist() for i in range(batch.shape[1])]
+            for batch in (df.iloc[start : start + batch_size] for start in range(0, len(df), batch_size))
+        )
+        cls.__insert_rows(list(df.columns), batches, table, connection)
+
+    @classmethod
+    def _insert_arrow_table(
+        cls, data: pa.Table, table: Any, connection: Any, delete_table: bool, batch_size: Optional[int] = None
+    ) -> None:
+        cls.__delete_all_rows(table, connection, delete_table)
+        batches = (
+            [column.to_pylist() for column in batch.columns]
+            for batch in data.to_batches(batch_size or cls.__INSERT_BATCH_SIZE_DEFAULT)
+        )
+        cls.__insert_rows(data.column_names, batches, table, connection)
+
+    @classmethod
+    def __insert_rows(cls, columns: List, batches: Iterable[List[List]], table: Any, connection: Any) -> None:
+        """Insert batches of rows, given as the list of the values of each column."""
+        dialect = connection.dialect
+        if not all(isinstance(column, str) and column in table.c for column in columns):
+            # SQLAlchemy reports the columns that do not exist in the table.
+            insert_rows = cls.__execute
+        elif dialect.name == "postgresql" and dialect.driver == "psycopg2":
+            insert_rows = cls.__copy_rows
+        elif dialect.name == "sqlite":
+            insert_rows = cls.__execute_many
+        else:
+            insert_rows = cls.__execute
+        for values in batches:
+            insert_rows(columns, values, table, connection)
+
+    @staticmethod
+    def __execute(columns: List, values: List[List], table: Any, connection: Any) -> None:
+        connection.execute(table.insert(), [dict(zip(columns, row)) for row in zip(*values)])
+
+    @staticmethod
+    def __process_values(
+        columns: List[str], values: List[List], table: Any, connection: Any, raw_types: Tuple = ()
+    ) -> List[Tuple]:
+        # The values sent to the driver directly are processed like SQLAlchemy does for the column types.
+        dialect = connection.dialect
+        for i, column in enumerate(columns):
+            if isinstance(table.c[column].type, raw_types):
+                continue
+            if processor := table.c[column].type.dialect_impl(dialect).bind_processor(dialect):
+                values[i] = list(map(processor, values[i]))
+        return list(zip(*values))
+
+    @classmethod
+    def __execute_many(cls, columns: List[str], values: List[List], table: Any, connection: Any) -> None:
+        # A single prepared statement executed for all the rows, inside the write transaction.
+        rows = cls.__process_values(columns, values, table, connection)
+        preparer = connection.dialect.identifier_preparer
+        statement = (
+            f"INSERT INTO {preparer.format_table(table)} ({', '.join(preparer.quote(column) for column in columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+        connection.exec_driver_sql(statement, rows)
+
+    @classmethod
+    def __copy_rows(cls, columns: List[str], values: List[List], table: Any, connection: Any) -> None:
+        # The binary values are encoded by COPY rather than wrapped by the driver.
+        rows = cls.__process_values(columns, values, table, connection, raw_types=(LargeBinary,))
+        preparer = connection.dialect.identifier_preparer
+        buffer = io.StringIO()
+        buffer.writelines("\t".join(cls.__format_copy_value(value) for value in row) + "\n" for row in rows)
+        buffer.seek(0)
+        statement = (
+            f"COPY {preparer.format_table(table)} ({', '.join(preparer.quote(column) for column in columns)}) "
+            "FROM STDIN"
+        )
+        with connection.connection.dbapi_connection.cursor() as cursor:
+            cursor.copy_expert(statement, buffer)
+
+    @staticmethod
+    def __format_copy_value(value: Any) -> str:
+        # The values are written in the text format of COPY, where \N is NULL and binary values are hexadecimal.
+        if value is None or value is pd.NaT or value is pd.NA:
+            return "\\N"
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return "\\\\x" + bytes(value).hex()
+        return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
 
     @classmethod
     def __delete_all_rows(cls, table: Any, connection: Any, delete_table: bool) -> None:
-        if delete_table:
-            connection.execute(table.delete())
+        if not delete_table:
+            return
+        if connection.dialect.name in cls.__TRUNCATE_DIALECTS:
+            try:
+                with connection.begin_nested():
+                    preparer = connection.dialect.identifier_preparer
+                    connection.execute(text(f"TRUNCATE TABLE {preparer.format_table(table)}"))
+                return
+            except SQLAlchemyError:
+                # TRUNCATE is refused on tables referenced by foreign keys or without the privilege.
+                pass
+        connection.execute(table.delete())
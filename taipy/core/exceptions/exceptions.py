@@ -72,8 +72,20 @@ class UnknownParquetEngine(Exception):
     """Raised if the parquet engine is not known or not supported when create a ParquetDataNode."""
 
 
+class UnknownExcelEngine(Exception):
+    """Raised if the engine used to read the Excel file of an ExcelDataNode is not supported."""
+
+
+class UnknownJSONFormat(Exception):
+    """Raised if the format of the file of a JSONDataNode is not supported."""
+
+
+class InvalidMmapMode(Exception):
+    """Raised if the memory-map mode of an NpyDataNode is not supported."""
+
+
 class UnknownCompressionAlgorithm(Exception):
-    """Raised if the compression algorithm is not supported by ParquetDataNode."""
+    """Raised if the compression algorithm of a ParquetDataNode, PickleDataNode, or JSONDataNode is not supported."""
 
 
 class NonExistingDataNode(Exception):
@@ -12,6 +12,7 @@
 import uuid
 from typing import Callable, Iterable, List, Optional, Union
 
+from .._entity._latest_index import _LatestIndex
 from .._manager._manager import _Manager
 from .._repository._abstract_repository import _AbstractRepository
 from .._version._version_manager_factory import _VersionManagerFactory
@@ -29,6 +30,7 @@ class _JobManager(_Manager[Job], _VersionMixin):
     _ID_PREFIX = "JOB_"
     _repository: _AbstractRepository
     _EVENT_ENTITY_TYPE = EventEntityType.JOB
+    __latest_jobs = _LatestIndex(lambda job: job._task.id)
 
     @classmethod
     def _get_all(cls, version_number: Optional[str] = None) -> List[Job]:
@@ -38,6 +40,11 @@ class _JobManager(_Manager[Job], _VersionMixin):
         filters = cls._build_filters_with_version(version_number)
         return cls._repository._load_all(filters)
 
+    @classmethod
+    def _set(cls, job: Job) -> None:
+        super()._set(job)
+        cls.__latest_jobs._update(job)
+
     @classmethod
     def _create(
         cls, task: Task, callbacks: Iterable[Callable], submit_id: str, submit_entity_id: str, force=False
@@ -64,11 +71,28 @@ class _JobManager(_Manager[Job], _VersionMixin):
             job = cls._get(job)
         if cls._is_deletable(job) or force:
             super()._delete(job.id)
+            cls.__latest_jobs._remove([job.id])
         else:
             err = JobNotDeletedException(job.id)
             cls._logger.error(err)
             raise err
 
+    @classmethod
+    def _delete_many(cls, job_ids: Iterable[JobId]) -> None:
+        job_ids = list(job_ids)
+        super()._delete_many(job_ids)
+        cls.__latest_jobs._remove(job_ids)
+
+    @classmethod
+    def _delete_all(cls) -> None:
+        super()._delete_all()
+        cls.__latest_jobs._clear()
+
+    @classmethod
+    def _delete_by_version(cls, version_number: str) -> None:
+        super()._delete_by_version(version_number)
+        cls.__latest_jobs._clear()
+
     @classmethod
     def _cancel(cls, job: Union[str, Job]) -> None:
         job = cls._get(job) if isinstance(job, str) else job
@@ -79,13 +103,7 @@ class _JobManager(_Manager[Job], _VersionMixin):
 
     @classmethod
     def _get_latest(cls, task: Task) -> Optional[Job]:
-        jobs_of_task = list(filter(lambda job: task in job, cls._get_all()))
-        if len(jobs_of_task) == 0:
-            return None
-        if len(jobs_of_task) == 1:
-            return jobs_of_task[0]
-        else:
-            return max(jobs_of_task)
+        return cls.__latest_jobs._get_latest(task.id, cls._repository._get_change_marker(), cls._get_all, cls._get)
 
     @classmethod
     def _is_deletable(cls, job: Union[Job, JobId]) -> ReasonCollection:
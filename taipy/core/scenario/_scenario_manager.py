@@ -11,25 +11,30 @@
 
 from datetime import datetime
 from functools import partial
-from typing import Any, Callable, Dict, List, Literal, Optional, Union
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Literal, Optional, Union
 
 from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
 
 from .._entity._entity_ids import _EntityIds
 from .._manager._manager import _Manager
 from .._repository._abstract_repository import _AbstractRepository
 from .._version._version_mixin import _VersionMixin
 from ..common.warn_if_inputs_not_ready import _warn_if_inputs_not_ready
+from ..config.data_node_config import DataNodeConfig
 from ..config.scenario_config import ScenarioConfig
+from ..cycle._cycle_index import _CycleIndex
 from ..cycle._cycle_manager_factory import _CycleManagerFactory
 from ..cycle.cycle import Cycle
 from ..data._data_manager_factory import _DataManagerFactory
+from ..data.data_node import DataNode
 from ..exceptions.exceptions import (
     DeletingPrimaryScenario,
     DifferentScenarioConfigs,
     DoesNotBelongToACycle,
     InsufficientScenarioToCompare,
     InvalidScenario,
+    InvalidSequence,
     NonExistingComparator,
     NonExistingScenario,
     NonExistingScenarioConfig,
@@ -38,7 +43,7 @@ from ..exceptions.exceptions import (
 )
 from ..job._job_manager_factory import _JobManagerFactory
 from ..job.job import Job
-from ..notification import EventEntityType, EventOperation, Notifier, _make_event
+from ..notification import Event, EventEntityType, EventOperation, Notifier, _make_event
 from ..reason import (
     EntityDoesNotExist,
     EntityIsNotAScenario,
@@ -51,6 +56,8 @@ from ..reason import (
 from ..submission._submission_manager_factory import _SubmissionManagerFactory
 from ..submission.submission import Submission
 from ..task._task_manager_factory import _TaskManagerFactory
+from ..task.task import Task
+from ._scenario_model import _ScenarioModel
 from .scenario import Scenario
 from .scenario_id import ScenarioId
 
@@ -62,6 +69,26 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
 
     _repository: _AbstractRepository
 
+    __MODEL_SORT_KEYS: Dict[str, Callable[[_ScenarioModel], Any]] = {
+        "name": lambda model: (model.properties.get("name"), model.id),
+        "id": lambda model: model.id,
+        "config_id": lambda model: (model.config_id, model.id),
+        "creation_date": lambda model: (datetime.fromisoformat(model.creation_date), model.id),
+        "tags": lambda model: (tuple(sorted(model.tags)), model.id),
+    }
+
+    @classmethod
+    def _set(cls, scenario: Scenario) -> None:
+        super()._set(scenario)
+        _CycleIndex._update_scenario(scenario)
+
+    @classmethod
+    def _set_many(cls, scenarios: Iterable[Scenario]) -> None:
+        scenarios = list(scenarios)
+        super()._set_many(scenarios)
+        for scenario in scenarios:
+            _CycleIndex._update_scenario(scenario)
+
     @classmethod
     def _get_all(cls, version_number: Optional[str] = None) -> List[Scenario]:
         """
@@ -150,23 +177,9 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
             else {}
         )
 
-        sequences = {}
-        tasks_and_config_id_maps = {task.config_id: task for task in tasks}
-        for sequence_name, sequence_task_configs in config.sequences.items():
-            sequence_tasks = []
-            non_existing_sequence_task_config_in_scenario_config = set()
-            for sequence_task_config in sequence_task_configs:
-                if task := tasks_and_config_id_maps.get(sequence_task_config.id):
-                    sequence_tasks.append(task)
-                else:
-                    non_existing_sequence_task_config_in_scenario_config.add(sequence_task_config.id)
-            if non_existing_sequence_task_config_in_scenario_config:
-                raise SequenceTaskConfigDoesNotExistInSameScenarioConfig(
-                    list(non_existing_sequence_task_config_in_scenario_config), sequence_name, str(config.id)
-                )
-            sequences[sequence_name] = {Scenario._SEQUENCE_TASKS_KEY: sequence_tasks}
+        sequences = cls.__build_sequences(config, tasks)
 
-        is_primary_scenario = len(cls._get_all_by_cycle(cycle)) == 0 if cycle else False
+        is_primary_scenario = len(cls.__get_scenario_ids_of_cycle(cycle)) == 0 if cycle else False
         props = config._properties.copy()
         if name:
             props["name"] = name
@@ -207,6 +220,142 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
         Notifier.publish(_make_event(scenario, EventOperation.CREATION))
         return scenario
 
+    @classmethod
+    def _bulk_create(
+        cls,
+        config: ScenarioConfig,
+        names: List[Optional[str]],
+        creation_date: Optional[datetime] = None,
+    ) -> List[Scenario]:
+        from ..sequence._sequence_manager_factory import _SequenceManagerFactory
+
+        _task_manager = _TaskManagerFactory._build_manager()
+        _data_manager = _DataManagerFactory._build_manager()
+        _sequence_manager = _SequenceManagerFactory._build_manager()
+
+        cycle = (
+            _CycleManagerFactory._build_manager()._get_or_create(config.frequency, creation_date)
+            if config.frequency
+            else None
+        )
+        cycle_id = cycle.id if cycle else None
+        has_primary_scenario = len(cls.__get_scenario_ids_of_cycle(cycle)) > 0 if cycle else True
+        version = cls._get_latest_version()
+
+        # The GLOBAL and CYCLE scoped entities are shared by all the scenarios, so they are resolved once.
+        task_configs = config.task_configs or []
+        additional_data_node_configs = [Config.data_nodes[dnc.id] for dnc in config.additional_data_node_configs]
+        data_node_configs = {
+            Config.data_nodes[dnc.id] for tc in task_configs for dnc in tc.input_configs + tc.output_configs
+        }
+        data_node_configs.update(additional_data_node_configs)
+        scenario_data_node_configs = [dnc for dnc in data_node_configs if cls.__is_scenario_scoped(dnc)]
+        shared_data_nodes = _data_manager._bulk_get_or_create(
+            [dnc for dnc in data_node_configs if not cls.__is_scenario_scoped(dnc)], cycle_id
+        )
+        scenario_task_configs = [
+            tc
+            for tc in task_configs
+            if any(cls.__is_scenario_scoped(Config.data_nodes[dnc.id]) for dnc in tc.input_configs + tc.output_configs)
+        ]
+        shared_task_configs = [tc for tc in task_configs if tc not in scenario_task_configs]
+        shared_tasks = (
+            _task_manager._bulk_get_or_create(shared_task_configs, cycle_id, data_nodes=shared_data_nodes)
+            if shared_task_configs
+            else []
+        )
+
+        # The scenarios and their own entities are created in memory, then saved all at once.
+        scenarios: List[Scenario] = []
+        data_nodes_to_save: List[DataNode] = []
+        tasks_to_save: List[Task] = []
+        events: List[Event] = []
+        for name in names:
+            scenario_id = Scenario._new_id(str(config.id))
+            scenario_data_nodes = _data_manager._bulk_build(scenario_data_node_configs, scenario_id, version)
+            data_nodes = {**shared_data_nodes, **scenario_data_nodes}
+            scenario_tasks = _task_manager._bulk_build(scenario_task_configs, data_nodes, scenario_id, version)
+            tasks = shared_tasks + scenario_tasks
+            additional_data_nodes = {dnc: data_nodes[dnc] for dnc in additional_data_node_configs}
+
+            props = config._properties.copy()
+            if name:
+                props["name"] = name
+            scenario = Scenario(
+                config_id=str(config.id),
+                tasks=set(tasks),
+                properties=props,
+                additional_data_nodes=set(additional_data_nodes.values()),
+                scenario_id=scenario_id,
+                creation_date=creation_date,
+                is_primary=not has_primary_scenario and not scenarios,
+                cycle=cycle,
+                version=version,
+                sequences=cls.__build_sequences(config, tasks),
+            )
+            for task in tasks:
+                task._parent_ids.add(scenario_id)
+            for dn in additional_data_nodes.values():
+                dn._parent_ids.add(scenario_id)
+
+            # The entities are checked before any of them is saved, with the tasks built in memory.
+            if not scenario._is_consistent(tasks):
+                raise InvalidScenario(scenario.id)
+            sequences = []
+            for sequence_name, sequence_data in scenario._sequences.items():
+                sequence_tasks = sequence_data[Scenario._SEQUENCE_TASKS_KEY]
+                sequence = _sequence_manager._build_sequence(
+                    sequence_name, sequence_tasks, [], {}, scenario_id, version
+                )
+                if not sequence._is_consistent(sequence_tasks):
+                    raise InvalidSequence(sequence.id)
+                for task in sequence_tasks:
+                    task._parent_ids.add(sequence.id)
+                sequences.append(sequence)
+
+            scenarios.append(scenario)
+            data_nodes_to_save.extend(scenario_data_nodes.values())
+            tasks_to_save.extend(scenario_tasks)
+            events.extend(_make_event(entity, EventOperation.CREATION) for entity in scenario_data_nodes.values())
+            events.extend(_make_event(task, EventOperation.CREATION) for task in scenario_tasks)
+            events.extend(_make_event(sequence, EventOperation.CREATION) for sequence in sequences)
+            events.append(_make_event(scenario, EventOperation.CREATION))
+
+        _data_manager._set_many([*shared_data_nodes.values(), *data_nodes_to_save])
+        _task_manager._set_many([*shared_tasks, *tasks_to_save])
+        cls._set_many(scenarios)
+
+        if scenarios:
+            # The scenarios are built from the same configuration, so their inputs are in the same state.
+            _warn_if_inputs_not_ready(scenarios[0].get_inputs())
+
+        for event in events:
+            Notifier.publish(event)
+        return scenarios
+
+    @staticmethod
+    def __is_scenario_scoped(data_node_config: DataNodeConfig) -> bool:
+        return (data_node_config.scope or DataNodeConfig._DEFAULT_SCOPE) == Scope.SCENARIO
+
+    @staticmethod
+    def __build_sequences(config: ScenarioConfig, tasks: List[Task]) -> Dict[str, Dict]:
+        sequences = {}
+        tasks_and_config_id_maps = {task.config_id: task for task in tasks}
+        for sequence_name, sequence_task_configs in config.sequences.items():
+            sequence_tasks = []
+            non_existing_sequence_task_config_in_scenario_config = set()
+            for sequence_task_config in sequence_task_configs:
+                if task := tasks_and_config_id_maps.get(sequence_task_config.id):
+                    sequence_tasks.append(task)
+                else:
+                    non_existing_sequence_task_config_in_scenario_config.add(sequence_task_config.id)
+            if non_existing_sequence_task_config_in_scenario_config:
+                raise SequenceTaskConfigDoesNotExistInSameScenarioConfig(
+                    list(non_existing_sequence_task_config_in_scenario_config), sequence_name, str(config.id)
+                )
+            sequences[sequence_name] = {Scenario._SEQUENCE_TASKS_KEY: sequence_tasks}
+        return sequences
+
     @classmethod
     def _is_submittable(cls, scenario: Union[Scenario, ScenarioId]) -> ReasonCollection:
         reason_collector = ReasonCollection()
@@ -267,6 +416,14 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
 
     @classmethod
     def _get_primary(cls, cycle: Cycle) -> Optional[Scenario]:
+        if primary_id := _CycleIndex._get_primary_id(cycle.id):
+            scenario = cls._get(primary_id)
+            if scenario and scenario._primary_scenario and scenario._cycle and scenario._cycle.id == cycle.id:
+                return scenario
+        elif _CycleIndex._get_scenario_ids(cycle.id, cls._repository._get_change_marker()) == frozenset():
+            return None
+
+        # The index is missing or out of date: the scenarios of the cycle are scanned.
         scenarios = cls._get_all_by_cycle(cycle)
         for scenario in scenarios:
             if scenario.is_primary:
@@ -290,7 +447,17 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
             filters = [{}]
         for fil in filters:
             fil.update({"cycle": cycle.id})
-        return cls._get_all_by(filters)
+        # The marker is read first, so that the scenarios saved meanwhile by other processes are loaded later.
+        marker = cls._repository._get_change_marker()
+        scenarios = cls._get_all_by(filters)
+        _CycleIndex._load_scenarios(cycle.id, scenarios, marker)
+        return scenarios
+
+    @classmethod
+    def __get_scenario_ids_of_cycle(cls, cycle: Cycle) -> FrozenSet[str]:
+        if (scenario_ids := _CycleIndex._get_scenario_ids(cycle.id, cls._repository._get_change_marker())) is None:
+            scenario_ids = frozenset(scenario.id for scenario in cls._get_all_by_cycle(cycle))
+        return scenario_ids
 
     @classmethod
     def _get_primary_scenarios(cls) -> List[Scenario]:
@@ -340,6 +507,62 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
 
         return [scenario for scenario in scenarios if created_start_time <= scenario.creation_date < created_end_time]
 
+    @classmethod
+    def _get_all_by_criteria(
+        cls,
+        cycle: Optional[Cycle] = None,
+        tag: Optional[str] = None,
+        is_sorted: bool = False,
+        descending: bool = False,
+        created_start_time: Optional[datetime] = None,
+        created_end_time: Optional[datetime] = None,
+        sort_key: Literal["name", "id", "config_id", "creation_date", "tags"] = "name",
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Scenario]:
+        """
+        Filter, sort and paginate the scenarios in the repository.
+
+        Only the scenarios of the requested page are built. When a page is requested without sorting, the
+        scenarios are ordered by id so that consecutive pages do not overlap.
+
+        Raises:
+            ValueError: If *offset* or *limit* is negative.
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError(f"The offset and the limit must be non-negative integers, got {offset} and {limit}.")
+        if cycle:
+            filters = cls._build_filters_with_version("all") or [{}]
+            for fil in filters:
+                fil.update({"cycle": cycle.id})
+        else:
+            filters = cls._build_filters_with_version(None)
+
+        def predicate(model: _ScenarioModel) -> bool:
+            if tag and tag not in model.tags:
+                return False
+            if created_start_time or created_end_time:
+                creation_date = datetime.fromisoformat(model.creation_date)
+                if created_start_time and creation_date < created_start_time:
+                    return False
+                if created_end_time and creation_date >= created_end_time:
+                    return False
+            return True
+
+        model_sort_key = None
+        if is_sorted:
+            model_sort_key = cls.__MODEL_SORT_KEYS.get(sort_key, cls.__MODEL_SORT_KEYS["name"])
+        elif offset or limit is not None:
+            model_sort_key = cls.__MODEL_SORT_KEYS["id"]
+        return cls._repository._load_page(
+            filters,
+            predicate if tag or created_start_time or created_end_time else None,
+            model_sort_key,
+            descending and is_sorted,
+            offset,
+            limit,
+        )
+
     @classmethod
     def _is_promotable_to_primary(cls, scenario: Union[Scenario, ScenarioId]) -> ReasonCollection:
         reason_collection = ReasonCollection()
@@ -440,7 +663,7 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
         if not isinstance(scenario, Scenario):
             reason_collection._add_reason(str(scenario), EntityIsNotAScenario(str(scenario)))
         elif scenario.is_primary:
-            if len(cls._get_all_by_cycle(scenario.cycle)) > 1:
+            if len(cls.__get_scenario_ids_of_cycle(scenario.cycle)) > 1:
                 reason_collection._add_reason(scenario.id, ScenarioIsThePrimaryScenario(scenario.id, scenario.cycle.id))
 
         return reason_collection
@@ -455,8 +678,20 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
             )
         if scenario.is_primary:
             _CycleManagerFactory._build_manager()._delete(scenario.cycle.id)
+        _CycleIndex._remove_scenarios([scenario_id])
         super()._delete(scenario_id)
 
+    @classmethod
+    def _delete_many(cls, scenario_ids: Iterable[ScenarioId]) -> None:
+        scenario_ids = list(scenario_ids)
+        _CycleIndex._remove_scenarios(scenario_ids)
+        super()._delete_many(scenario_ids)
+
+    @classmethod
+    def _delete_all(cls) -> None:
+        _CycleIndex._clear_scenarios()
+        super()._delete_all()
+
     @classmethod
     def _hard_delete(cls, scenario_id: ScenarioId) -> None:
         scenario = cls._get(scenario_id)
@@ -480,8 +715,9 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
         Check if the cycle is only attached to this scenario, then delete it.
         """
         for scenario in cls._repository._search("version", version_number):
-            if scenario.cycle and len(cls._get_all_by_cycle(scenario.cycle)) == 1:
+            if scenario.cycle and len(cls.__get_scenario_ids_of_cycle(scenario.cycle)) == 1:
                 _CycleManagerFactory._build_manager()._delete(scenario.cycle.id)
+            _CycleIndex._remove_scenarios([scenario.id])
             super()._delete(scenario.id)
 
     @classmethod
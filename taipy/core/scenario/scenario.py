@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
 
 import networkx as nx
 
@@ -605,9 +605,12 @@ class Scenario(_Entity, Submittable, _Labeled):
         """Generate a unique scenario identifier."""
         return ScenarioId(Scenario.__SEPARATOR.join([Scenario._ID_PREFIX, _validate_id(config_id), str(uuid.uuid4())]))
 
-    def _is_consistent(self) -> bool:
-        """Check if the scenario is consistent."""
-        dag = self._build_dag()
+    def _is_consistent(self, tasks: Optional[Iterable[Task]] = None) -> bool:
+        """Check if the scenario is consistent.
+
+        The *tasks* of a scenario that is not saved yet can be provided, so that they are not loaded.
+        """
+        dag = self._build_dag(tasks)
         if dag.number_of_nodes() == 0:
             return True
         if not nx.is_directed_acyclic_graph(dag):
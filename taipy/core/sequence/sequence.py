@@ -11,7 +11,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
 
 import networkx as nx
 
@@ -338,8 +338,8 @@ class Sequence(_Entity, Submittable, _Labeled):
         seq_id = sequence_name.replace(" ", "TPSPACE")
         return SequenceId(Sequence._SEPARATOR.join([Sequence._ID_PREFIX, _validate_id(seq_id), scenario_id]))
 
-    def _is_consistent(self) -> bool:
-        dag = self._build_dag()
+    def _is_consistent(self, tasks: Optional[Iterable[Task]] = None) -> bool:
+        dag = self._build_dag(tasks)
         if dag.number_of_nodes() == 0:
             return True
         if not nx.is_directed_acyclic_graph(dag):
@@ -46,6 +46,10 @@ extras_require = {
     "parquet": ["fastparquet==2022.11.0", "pyarrow>=17.0.0,<18.0"],
     "s3": ["boto3==1.29.1"],
     "mongo": ["pymongo[srv]>=4.2.0,<5.0"],
+    "polars": ["polars>=1.0,<2.0"],
+    "calamine": ["python-calamine>=0.2,<1.0"],
+    "zstd": ["zstandard>=0.22,<1.0"],
+    "lz4": ["lz4>=4.3,<5.0"],
 }
 
 setup(
@@ -10,11 +10,12 @@
 # specific language governing permissions and limitations under the License.
 
 from threading import Lock
-from typing import List, Optional, Union
+from typing import Iterable, List, Optional, Union
 
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
 from .._entity._entity_ids import _EntityIds
+from .._entity._latest_index import _LatestIndex
 from .._manager._manager import _Manager
 from .._repository._abstract_repository import _AbstractRepository
 from .._version._version_mixin import _VersionMixin
@@ -34,6 +35,7 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
     _EVENT_ENTITY_TYPE = EventEntityType.SUBMISSION
     __lock = Lock()
     __logger = _TaipyLogger._get_logger()
+    __latest_submissions = _LatestIndex(lambda submission: submission.entity_id)
 
     @classmethod
     def _get_all(cls, version_number: Optional[str] = None) -> List[Submission]:
@@ -43,6 +45,11 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
         filters = cls._build_filters_with_version(version_number)
         return cls._repository._load_all(filters)
 
+    @classmethod
+    def _set(cls, submission: Submission) -> None:
+        super()._set(submission)
+        cls.__latest_submissions._update(submission)
+
     @classmethod
     def _create(cls, entity_id: str, entity_type: str, entity_config: Optional[str], **properties) -> Submission:
         submission = Submission(
@@ -138,13 +145,9 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
     @classmethod
     def _get_latest(cls, entity: Union[Scenario, Sequence, Task]) -> Optional[Submission]:
         entity_id = entity.id if not isinstance(entity, str) else entity
-        submissions_of_task = list(filter(lambda submission: submission.entity_id == entity_id, cls._get_all()))
-        if len(submissions_of_task) == 0:
-            return None
-        if len(submissions_of_task) == 1:
-            return submissions_of_task[0]
-        else:
-            return max(submissions_of_task)
+        return cls.__latest_submissions._get_latest(
+            entity_id, cls._repository._get_change_marker(), cls._get_all, cls._get
+        )
 
     @classmethod
     def _delete(cls, submission: Union[Submission, SubmissionId]) -> None:
@@ -152,11 +155,28 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
             submission = cls._get(submission)
         if cls._is_deletable(submission):
             super()._delete(submission.id)
+            cls.__latest_submissions._remove([submission.id])
         else:
             err = SubmissionNotDeletedException(submission.id)
             cls._logger.error(err)
             raise err
 
+    @classmethod
+    def _delete_many(cls, submission_ids: Iterable[SubmissionId]) -> None:
+        submission_ids = list(submission_ids)
+        super()._delete_many(submission_ids)
+        cls.__latest_submissions._remove(submission_ids)
+
+    @classmethod
+    def _delete_all(cls) -> None:
+        super()._delete_all()
+        cls.__latest_submissions._clear()
+
+    @classmethod
+    def _delete_by_version(cls, version_number: str) -> None:
+        super()._delete_by_version(version_number)
+        cls.__latest_submissions._clear()
+
     @classmethod
     def _hard_delete(cls, submission_id: SubmissionId) -> None:
         submission = cls._get(submission_id)
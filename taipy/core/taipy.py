@@ -498,6 +498,8 @@ def get_scenarios(
     created_start_time: Optional[datetime] = None,
     created_end_time: Optional[datetime] = None,
     sort_key: Literal["name", "id", "config_id", "creation_date", "tags"] = "name",
+    offset: int = 0,
+    limit: Optional[int] = None,
 ) -> List[Scenario]:
     """Retrieve a list of existing scenarios filtered by cycle or tag.
 
@@ -520,27 +522,22 @@ def get_scenarios(
             dates, in alphabetical order for name and id, and in lexicographical order for tags.
             The default value is "name".<br/>
             If an incorrect sorting key is provided, the scenarios are sorted by name.
+        offset (int): The number of filtered scenarios to skip before the returned ones.
+            The default value is 0.
+        limit (Optional[int]): The maximum number of scenarios to return. If None, all the
+            filtered scenarios after *offset* are returned. The default value is None.<br/>
+            If *offset* or *limit* is provided and *is_sorted* is False, the scenarios are
+            ordered by id so that consecutive pages do not overlap.
 
     Returns:
         The list of scenarios filtered by cycle or tag.
-    """
-    scenario_manager = _ScenarioManagerFactory._build_manager()
-    if not cycle and not tag:
-        scenarios = scenario_manager._get_all()
-    elif cycle and not tag:
-        scenarios = scenario_manager._get_all_by_cycle(cycle)
-    elif not cycle and tag:
-        scenarios = scenario_manager._get_all_by_tag(tag)
-    elif cycle and tag:
-        scenarios = scenario_manager._get_all_by_cycle_tag(cycle, tag)
-    else:
-        scenarios = []
 
-    if created_start_time or created_end_time:
-        scenarios = scenario_manager._filter_by_creation_time(scenarios, created_start_time, created_end_time)
-    if is_sorted:
-        scenario_manager._sort_scenarios(scenarios, descending, sort_key)
-    return scenarios
+    Raises:
+        ValueError: If *offset* or *limit* is negative.
+    """
+    return _ScenarioManagerFactory._build_manager()._get_all_by_criteria(
+        cycle, tag, is_sorted, descending, created_start_time, created_end_time, sort_key, offset, limit
+    )
 
 
 def get_primary(cycle: Cycle) -> Optional[Scenario]:
@@ -909,6 +906,38 @@ def create_scenario(
     return _ScenarioManagerFactory._build_manager()._create(config, creation_date, name)
 
 
+def create_scenarios(
+    config: ScenarioConfig,
+    count_or_names: Union[int, List[str]],
+    creation_date: Optional[datetime] = None,
+) -> List[Scenario]:
+    """Create and return several new scenarios based on a scenario configuration.
+
+    This function is equivalent to calling `create_scenario()^` once per scenario, but the
+    cycle, the version, and the shared (GLOBAL or CYCLE scope) entities are resolved once,
+    and all the new entities are saved at once.
+
+    Parameters:
+        config (ScenarioConfig^): The scenario configuration used to create the new scenarios.
+        count_or_names (Union[int, List[str]]): The number of scenarios to create, or the list of
+            their displayable names.
+        creation_date (Optional[datetime.datetime]): The creation date of the scenarios.
+            If None, the current date time is used.
+
+    Returns:
+        The list of new scenarios.
+
+    Raises:
+        SystemExit: If the configuration check returns some errors.
+    """
+    Orchestrator._manage_version_and_block_config()
+
+    names: List[Optional[str]] = (
+        [None] * count_or_names if isinstance(count_or_names, int) else list(count_or_names)  # type: ignore
+    )
+    return _ScenarioManagerFactory._build_manager()._bulk_create(config, names, creation_date)
+
+
 def create_global_data_node(config: DataNodeConfig) -> DataNode:
     """Create and return a new GLOBAL data node from a data node configuration.
 
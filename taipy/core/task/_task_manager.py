@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Callable, List, Optional, Type, Union, cast
+from typing import Callable, Dict, List, Optional, Type, Union, cast
 
 from taipy.common.config import Config
 from taipy.common.config.common.scope import Scope
@@ -21,9 +21,11 @@ from .._repository._abstract_repository import _AbstractRepository
 from .._version._version_manager_factory import _VersionManagerFactory
 from .._version._version_mixin import _VersionMixin
 from ..common.warn_if_inputs_not_ready import _warn_if_inputs_not_ready
+from ..config.data_node_config import DataNodeConfig
 from ..config.task_config import TaskConfig
 from ..cycle.cycle_id import CycleId
 from ..data._data_manager_factory import _DataManagerFactory
+from ..data.data_node import DataNode
 from ..exceptions.exceptions import NonExistingTask
 from ..notification import EventEntityType, EventOperation, Notifier, _make_event
 from ..reason import (
@@ -63,15 +65,17 @@ class _TaskManager(_Manager[Task], _VersionMixin):
         task_configs: List[TaskConfig],
         cycle_id: Optional[CycleId] = None,
         scenario_id: Optional[ScenarioId] = None,
+        data_nodes: Optional[Dict[DataNodeConfig, DataNode]] = None,
     ) -> List[Task]:
-        data_node_configs = set()
-        for task_config in task_configs:
-            data_node_configs.update([Config.data_nodes[dnc.id] for dnc in task_config.input_configs])
-            data_node_configs.update([Config.data_nodes[dnc.id] for dnc in task_config.output_configs])
-
-        data_nodes = _DataManagerFactory._build_manager()._bulk_get_or_create(
-            list(data_node_configs), cycle_id, scenario_id
-        )
+        if data_nodes is None:
+            data_node_configs = set()
+            for task_config in task_configs:
+                data_node_configs.update([Config.data_nodes[dnc.id] for dnc in task_config.input_configs])
+                data_node_configs.update([Config.data_nodes[dnc.id] for dnc in task_config.output_configs])
+
+            data_nodes = _DataManagerFactory._build_manager()._bulk_get_or_create(
+                list(data_node_configs), cycle_id, scenario_id
+            )
         tasks_configs_and_owner_id = []
         for task_config in task_configs:
             task_dn_configs = [Config.data_nodes[dnc.id] for dnc in task_config.output_configs] + [
@@ -99,34 +103,51 @@ class _TaskManager(_Manager[Task], _VersionMixin):
                 tasks.append(task)
             else:
                 version = _VersionManagerFactory._build_manager()._get_latest_version()
-                inputs = [
-                    data_nodes[input_config]
-                    for input_config in [Config.data_nodes[dnc.id] for dnc in task_config.input_configs]
-                ]
-                outputs = [
-                    data_nodes[output_config]
-                    for output_config in [Config.data_nodes[dnc.id] for dnc in task_config.output_configs]
-                ]
-                skippable = task_config.skippable
-
-                task = Task(
-                    str(task_config.id),
-                    dict(**task_config._properties),
-                    cast(Callable, task_config.function),
-                    inputs,
-                    outputs,
-                    owner_id=owner_id,
-                    parent_ids=set(),
-                    version=version,
-                    skippable=skippable,
-                )
-                for dn in set(inputs + outputs):
-                    dn._parent_ids.update([task.id])
+                task = cls.__build(task_config, data_nodes, owner_id, version)
                 cls._set(task)
                 Notifier.publish(_make_event(task, EventOperation.CREATION))
                 tasks.append(task)
         return tasks
 
+    @classmethod
+    def _bulk_build(
+        cls,
+        task_configs: List[TaskConfig],
+        data_nodes: Dict[DataNodeConfig, DataNode],
+        owner_id: Optional[str],
+        version: str,
+    ) -> List[Task]:
+        """Create tasks in memory, without saving them nor publishing their creation events.
+
+        The identifiers of the tasks are added to the parent identifiers of their data nodes.
+        """
+        return [cls.__build(task_config, data_nodes, owner_id, version) for task_config in task_configs]
+
+    @classmethod
+    def __build(
+        cls,
+        task_config: TaskConfig,
+        data_nodes: Dict[DataNodeConfig, DataNode],
+        owner_id: Optional[str],
+        version: str,
+    ) -> Task:
+        inputs = [data_nodes[Config.data_nodes[dnc.id]] for dnc in task_config.input_configs]
+        outputs = [data_nodes[Config.data_nodes[dnc.id]] for dnc in task_config.output_configs]
+        task = Task(
+            str(task_config.id),
+            dict(**task_config._properties),
+            cast(Callable, task_config.function),
+            inputs,
+            outputs,
+            owner_id=owner_id,
+            parent_ids=set(),
+            version=version,
+            skippable=task_config.skippable,
+        )
+        for dn in set(inputs + outputs):
+            dn._parent_ids.update([task.id])
+        return task
+
     @classmethod
     def _get_all(cls, version_number: Optional[str] = None) -> List[Task]:
         """
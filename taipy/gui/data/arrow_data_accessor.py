@@ -0,0 +1,75 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import typing as t
+
+import pandas as pd
+import pyarrow as pa
+
+from .data_format import _DataFormat
+from .pandas_data_accessor import _PandasDataAccessor
+
+
+class _ArrowDataAccessor(_PandasDataAccessor):
+    __types = (pa.Table,)
+
+    # Payload entries that require all the rows of the data.
+    __WHOLE_DATA_KEYS = ["filters", "aggregates", "orderby", "compare", "reverse"]
+
+    @staticmethod
+    def get_supported_classes() -> t.List[t.Type]:
+        return list(_ArrowDataAccessor.__types)
+
+    def to_arrow(self, value: t.Any) -> pa.Table:
+        return value
+
+    def to_pandas(self, value: t.Any) -> pd.DataFrame:
+        return self.to_arrow(value).to_pandas()
+
+    def _from_pandas(self, value: pd.DataFrame, data_type: t.Type):
+        if data_type is pa.Table:
+            return pa.Table.from_pandas(value, preserve_index=False)
+        return super()._from_pandas(value, data_type)
+
+    def get_col_types(self, var_name: str, value: t.Any) -> t.Union[None, t.Dict[str, str]]:  # type: ignore
+        # Only the schema is converted to get the pandas types of the columns.
+        return super().get_col_types(var_name, self.to_arrow(value).schema.empty_table().to_pandas())
+
+    def get_data(
+        self, var_name: str, value: t.Any, payload: t.Dict[str, t.Any], data_format: _DataFormat
+    ) -> t.Dict[str, t.Any]:
+        table = self.to_arrow(value)
+        if (page := self.__get_page(table, payload)) is None:
+            return super().get_data(var_name, table.to_pandas(), payload, data_format)
+
+        # Only the rows of the requested page are converted to pandas.
+        start, end = page
+        df = table.slice(start, end - start + 1).to_pandas()
+        df.index = pd.RangeIndex(start, start + len(df))
+        ret_payload = super().get_data(var_name, df, {**payload, "start": 0, "end": -1}, data_format)
+        ret_value = ret_payload["value"]
+        ret_value["start"] = start
+        ret_value["rowcount"] = table.num_rows
+        ret_value.pop("fullrowcount", None)
+        return ret_payload
+
+    def __get_page(self, table: pa.Table, payload: t.Dict[str, t.Any]) -> t.Optional[t.Tuple[int, int]]:
+        if payload.get("alldata", False) or any(payload.get(key) for key in self.__WHOLE_DATA_KEYS):
+            return None
+        start, end = payload.get("start", 0), payload.get("end", -1)
+        if not isinstance(start, int) or not isinstance(end, int):
+            return None
+        rowcount = table.num_rows
+        if start < 0 or start >= rowcount:
+            start = 0
+        if end < 0 or end >= rowcount:
+            end = rowcount - 1
+        return start, end
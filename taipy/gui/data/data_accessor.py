@@ -12,6 +12,7 @@
 import inspect
 import typing as t
 from abc import ABC, abstractmethod
+from importlib import util
 
 from .._warnings import _warn
 from ..utils import _TaipyData
@@ -108,6 +109,14 @@ class _DataAccessors(object):
         self._register(_PandasDataAccessor)
         self._register(_ArrayDictDataAccessor)
         self._register(_NumpyDataAccessor)
+        if util.find_spec("pyarrow"):
+            from .arrow_data_accessor import _ArrowDataAccessor
+
+            self._register(_ArrowDataAccessor)
+            if util.find_spec("polars"):
+                from .polars_data_accessor import _PolarsDataAccessor
+
+                self._register(_PolarsDataAccessor)
 
     def _register(self, cls: t.Type[_DataAccessor]) -> None:
         if not inspect.isclass(cls):
@@ -0,0 +1,34 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import typing as t
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+from .arrow_data_accessor import _ArrowDataAccessor
+
+
+class _PolarsDataAccessor(_ArrowDataAccessor):
+    __types = (pl.DataFrame,)
+
+    @staticmethod
+    def get_supported_classes() -> t.List[t.Type]:
+        return list(_PolarsDataAccessor.__types)
+
+    def to_arrow(self, value: t.Any) -> pa.Table:
+        return value.to_arrow()
+
+    def _from_pandas(self, value: pd.DataFrame, data_type: t.Type):
+        if data_type is pl.DataFrame:
+            return pl.from_pandas(value)
+        return super()._from_pandas(value, data_type)
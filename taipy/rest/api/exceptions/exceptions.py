@@ -23,3 +23,8 @@ class ScenarioIdMissingException(Exception):
 class SequenceNameMissingException(Exception):
     def __init__(self) -> None:
         self.message = "Sequence name is missing."
+
+
+class InvalidPaginationException(Exception):
+    def __init__(self) -> None:
+        self.message = "The offset and the limit must be non-negative integers."
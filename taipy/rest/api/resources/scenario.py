@@ -18,7 +18,7 @@ from taipy.core.exceptions.exceptions import NonExistingScenario, NonExistingSce
 from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
 
 from ...commons.to_from_model import _to_model
-from ..exceptions.exceptions import ConfigIdMissingException
+from ..exceptions.exceptions import ConfigIdMissingException, InvalidPaginationException
 from ..middlewares._middleware import _middleware
 from ..schemas import ScenarioResponseSchema
 
@@ -311,6 +311,19 @@ class ScenarioList(Resource):
             When the authorization feature is activated (available in Taipy Enterprise edition only), this endpoint
             requires the `TAIPY_READER` role.
 
+      parameters:
+        - in: query
+          name: offset
+          schema:
+            type: integer
+            minimum: 0
+          description: The number of scenarios to skip. The scenarios are ordered by identifier.
+        - in: query
+          name: limit
+          schema:
+            type: integer
+            minimum: 0
+          description: The maximum number of scenarios to return.
       responses:
         200:
           content:
@@ -323,6 +336,8 @@ class ScenarioList(Resource):
                         type: array
                         items:
                           $ref: '#/components/schemas/ScenarioSchema'
+        400:
+          description: The *offset* or the *limit* is negative.
     post:
       tags:
         - api
@@ -425,8 +440,15 @@ class ScenarioList(Resource):
     def get(self):
         schema = ScenarioResponseSchema(many=True)
         manager = _ScenarioManagerFactory._build_manager()
-        scenarios = [_to_model(REPOSITORY, scenario) for scenario in manager._get_all()]
-        return schema.dump(scenarios)
+        offset = request.args.get("offset", 0, type=int)
+        limit = request.args.get("limit", type=int)
+        if offset < 0 or (limit is not None and limit < 0):
+            raise InvalidPaginationException
+        if offset or limit is not None:
+            scenarios = manager._get_all_by_criteria(offset=offset, limit=limit)
+        else:
+            scenarios = manager._get_all()
+        return schema.dump([_to_model(REPOSITORY, scenario) for scenario in scenarios])
 
     @_middleware
     def post(self):
@@ -0,0 +1,66 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from taipy.common.config.common.scope import Scope
+from taipy.core import DataNode, Sequence, SequenceId, Task, TaskId
+from taipy.core._entity._topology import _Topology
+
+
+def build_sequence(suffix: str) -> Sequence:
+    data_node_1 = DataNode("foo", Scope.SCENARIO, f"s1_{suffix}")
+    data_node_2 = DataNode("bar", Scope.SCENARIO, f"s2_{suffix}")
+    data_node_3 = DataNode("baz", Scope.SCENARIO, f"s3_{suffix}")
+    data_node_4 = DataNode("qux", Scope.SCENARIO, f"s4_{suffix}")
+    task_1 = Task("grault", {}, print, [data_node_1], [data_node_2], TaskId(f"t1_{suffix}"))
+    task_2 = Task("garply", {}, print, [data_node_2], [data_node_3], TaskId(f"t2_{suffix}"))
+    task_3 = Task("waldo", {}, print, [data_node_2, data_node_3], [data_node_4], TaskId(f"t3_{suffix}"))
+    return Sequence({}, [task_3, task_1, task_2], SequenceId(f"p_{suffix}"))
+
+
+def ids(entities):
+    return {entity.id for entity in entities}
+
+
+def test_topology_is_shared_by_submittables_with_the_same_configuration():
+    _Topology._clear()
+    sequence_1 = build_sequence("1")
+    sequence_2 = build_sequence("2")
+
+    topology_1, entities_1 = sequence_1._get_topology()
+    topology_2, entities_2 = sequence_2._get_topology()
+
+    assert topology_1 is topology_2
+    assert ids(entities_1.values()) == {"s1_1", "s2_1", "s3_1", "s4_1", "t1_1", "t2_1", "t3_1"}
+    assert ids(entities_2.values()) == {"s1_2", "s2_2", "s3_2", "s4_2", "t1_2", "t2_2", "t3_2"}
+
+
+def test_topology_is_mapped_onto_the_entities():
+    sequence = build_sequence("1")
+
+    assert ids(sequence.get_inputs()) == {"s1_1"}
+    assert ids(sequence.get_outputs()) == {"s4_1"}
+    assert ids(sequence.get_intermediate()) == {"s2_1", "s3_1"}
+    assert [ids(tasks) for tasks in sequence._get_sorted_tasks()] == [{"t1_1"}, {"t2_1"}, {"t3_1"}]
+
+
+def test_topology_of_data_nodes_sharing_a_configuration_is_not_cached():
+    _Topology._clear()
+    data_node_1 = DataNode("foo", Scope.SCENARIO, "s1")
+    data_node_2 = DataNode("foo", Scope.SCENARIO, "s2")
+    data_node_3 = DataNode("bar", Scope.SCENARIO, "s3")
+    task_1 = Task("grault", {}, print, [data_node_1], [data_node_2], TaskId("t1"))
+    task_2 = Task("garply", {}, print, [data_node_2], [data_node_3], TaskId("t2"))
+    sequence = Sequence({}, [task_1, task_2], SequenceId("p1"))
+
+    assert ids(sequence.get_inputs()) == {"s1"}
+    assert ids(sequence.get_intermediate()) == {"s2"}
+    assert [ids(tasks) for tasks in sequence._get_sorted_tasks()] == [{"t1"}, {"t2"}]
+    assert sequence._get_topology()[0] is not sequence._get_topology()[0]
@@ -0,0 +1,131 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from datetime import datetime, timedelta
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
+from taipy.core._orchestrator._dispatcher._shared_memory_cache import (
+    _attached_blocks,
+    _read_shared_block,
+    _release_shared_blocks,
+    _SharedMemoryCache,
+)
+from taipy.core._orchestrator._dispatcher._task_function_wrapper import _TaskFunctionWrapper
+from taipy.core.data._data_manager import _DataManager
+from taipy.core.data.pickle import PickleDataNode
+from taipy.core.task.task import Task
+
+
+@pytest.fixture
+def cache():
+    cache = _SharedMemoryCache(budget=10_000)
+    yield cache
+    cache._clear()
+
+
+def test_share_ndarray(cache):
+    array = np.arange(100, dtype=np.int64)
+    block = cache._get_or_create("dn_id", datetime.now(), lambda: array)
+
+    assert block.size == array.nbytes
+    shared_array = _read_shared_block(block)
+    np.testing.assert_array_equal(shared_array, array)
+    assert not shared_array.flags.writeable
+    del shared_array
+    _release_shared_blocks([block.name])
+
+
+def test_share_dataframe(cache):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    block = cache._get_or_create("dn_id", datetime.now(), lambda: df)
+
+    pd.testing.assert_frame_equal(_read_shared_block(block), df)
+    _release_shared_blocks([block.name])
+
+
+def test_share_dataframe_numeric_columns_without_copy(cache):
+    df = pd.DataFrame(
+        {"a": [1.0, 2.0, 3.0], "b": [1, 2, 3], "c": [1.0, None, 3.0], "d": ["x", "y", "z"]},
+        index=pd.Index(["i", "j", "k"], name="key"),
+    )
+    block = cache._get_or_create("dn_id", datetime.now(), lambda: df)
+    shared_df = _read_shared_block(block)
+
+    pd.testing.assert_frame_equal(shared_df, df)
+    buffer = np.frombuffer(_attached_blocks[block.name].buf, dtype=np.uint8)
+    assert np.shares_memory(shared_df["a"].to_numpy(), buffer)
+    assert np.shares_memory(shared_df["b"].to_numpy(), buffer)
+    assert not np.shares_memory(shared_df["c"].to_numpy(), buffer)
+    del shared_df, buffer
+    _release_shared_blocks([block.name])
+
+
+def test_unsupported_data_is_not_shared(cache):
+    assert cache._get_or_create("dn_id", datetime.now(), lambda: [1, 2, 3]) is None
+    assert cache._get_or_create("dn_id", datetime.now(), lambda: np.array([{}, []], dtype=object)) is None
+    assert cache._size == 0
+
+
+def test_data_is_read_once_per_last_edit_date(cache):
+    now = datetime.now()
+    read = mock.Mock(return_value=np.zeros(10))
+
+    block_1 = cache._get_or_create("dn_id", now, read)
+    block_2 = cache._get_or_create("dn_id", now, read)
+    assert block_1 == block_2
+    assert read.call_count == 1
+
+    block_3 = cache._get_or_create("dn_id", now + timedelta(seconds=1), read)
+    assert block_3 != block_1
+    assert read.call_count == 2
+    assert len(cache._blocks) == 1  # The stale version has been evicted
+    with pytest.raises(FileNotFoundError):
+        _read_shared_block(block_1)
+
+
+def test_eviction_respects_budget(cache):
+    now = datetime.now()
+    block_1 = cache._get_or_create("dn_1", now, lambda: np.zeros(600, dtype=np.int64))  # 4800 bytes
+    block_2 = cache._get_or_create("dn_2", now, lambda: np.zeros(600, dtype=np.int64))  # 4800 bytes
+    cache._get_or_create("dn_1", now, lambda: None)  # dn_1 becomes the most recently used
+
+    cache._get_or_create("dn_3", now, lambda: np.zeros(600, dtype=np.int64))
+
+    assert cache._size == 9600
+    assert [key[0] for key in cache._blocks] == ["dn_1", "dn_3"]
+    with pytest.raises(FileNotFoundError):
+        _read_shared_block(block_2)
+    assert cache._get_or_create("dn_4", now, lambda: np.zeros(2000, dtype=np.int64)) is None  # Larger than budget
+    assert _read_shared_block(block_1).sum() == 0
+
+
+def test_prepare_only_shares_opted_in_data_nodes(cache):
+    shared_cfg = Config.configure_pickle_data_node("shared", scope=Scope.GLOBAL, shared_memory=True)
+    not_shared_cfg = Config.configure_pickle_data_node("not_shared", scope=Scope.GLOBAL)
+    dns = _DataManager._bulk_get_or_create([shared_cfg, not_shared_cfg])
+    dns[shared_cfg].write(np.ones(10))
+    dns[not_shared_cfg].write(np.ones(10))
+    task = Task("task", {}, print, [dns[shared_cfg], dns[not_shared_cfg]], [])
+
+    shared_inputs = cache._prepare([task])
+
+    assert list(shared_inputs.keys()) == [dns[shared_cfg].id]
+
+    with mock.patch.object(PickleDataNode, "_read") as mck_read:
+        arguments = _TaskFunctionWrapper("job_id", task, shared_inputs)._read_inputs(list(task.input.values()))
+        mck_read.assert_called_once()  # Only the data node not shared is read from the storage
+    np.testing.assert_array_equal(arguments[0], np.ones(10))
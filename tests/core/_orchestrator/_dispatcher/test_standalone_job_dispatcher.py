@@ -77,6 +77,28 @@ def test_dispatch_job():
     assert dispatcher.update_job_status_from_future_calls[0][1] == dispatcher._executor.f[0]
 
 
+def test_dispatch_fused_jobs():
+    task_1 = create_task()
+    task_2 = create_task()
+    job_1 = Job(JobId("job1"), task_1, "s_id", task_1.id)
+    job_2 = Job(JobId("job2"), task_2, "s_id", task_2.id)
+    _JobManagerFactory._build_manager()._set(job_1)
+    _JobManagerFactory._build_manager()._set(job_2)
+    dispatcher = MockStandaloneDispatcher(_OrchestratorFactory._build_orchestrator())
+
+    dispatcher._dispatch_fused([job_1, job_2])
+
+    # test that the whole chain is submitted to the executor at once
+    submit_last_call = dispatcher._executor.submit_called[-1]
+    assert submit_last_call[0].job_ids == [job_1.id, job_2.id]
+    assert submit_last_call[0].tasks == [task_1, task_2]
+    assert dispatcher._nb_available_workers == 1
+
+    # test that each job gets its own status
+    assert job_1.is_completed()
+    assert job_2.is_completed()
+
+
 def test_can_execute():
     dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
     assert dispatcher._nb_available_workers == 2
@@ -12,6 +12,8 @@
 import random
 import string
 
+import pandas as pd
+
 from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
 from taipy.common.config.common.scope import Scope
@@ -128,3 +130,91 @@ def test_can_execute_task_with_a_modified_config():
     res = _TaskFunctionWrapper("job_id", task_asserting_cfg_is_correct).execute(config_as_string=cfg_as_str)
 
     assert len(res) == 0  # no exception raised so the asserts in the fct passed
+
+
+def test_execute_task_reads_only_input_columns():
+    input_cfg = Config.configure_pickle_data_node("input")
+    output_cfg = Config.configure_pickle_data_node("output")
+    dns = _DataManager._bulk_get_or_create([input_cfg, output_cfg])
+    dns[input_cfg].write(pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]}))
+    task = Task(
+        "task",
+        {"input_columns": {"input": ["c", "a"]}},
+        lambda df: list(df.columns),
+        [dns[input_cfg]],
+        [dns[output_cfg]],
+    )
+
+    _TaskFunctionWrapper("job_id", task).execute()
+
+    assert dns[output_cfg].read() == ["c", "a"]
+
+
+def rollup(logs, previous_total):
+    total = logs["value"].sum()
+    return total if previous_total is None else previous_total + total
+
+
+def _create_incremental_task(tmpdir_factory, function=rollup):
+    path = str(tmpdir_factory.mktemp("data").join("logs.csv"))
+    input_cfg = Config.configure_csv_data_node("logs", default_path=path)
+    output_cfg = Config.configure_pickle_data_node("total")
+    dns = _DataManager._bulk_get_or_create([input_cfg, output_cfg])
+    task = Task("task", {"incremental": True}, function, [dns[input_cfg]], [dns[output_cfg]])
+    return task, dns[input_cfg], dns[output_cfg]
+
+
+def test_execute_incremental_task_reads_only_appended_rows(tmpdir_factory):
+    calls = []
+
+    def spy_rollup(logs, previous_total):
+        calls.append((logs["value"].tolist(), previous_total))
+        return rollup(logs, previous_total)
+
+    task, logs, total = _create_incremental_task(tmpdir_factory, spy_rollup)
+    logs.write(pd.DataFrame({"value": [1, 2, 3]}))
+
+    _TaskFunctionWrapper("job_1", task).execute()
+    assert total.read() == 6
+
+    logs.append(pd.DataFrame({"value": [4]}))
+    logs.append(pd.DataFrame({"value": [5, 6]}))
+    _TaskFunctionWrapper("job_2", task).execute()
+    assert total.read() == 21
+
+    _TaskFunctionWrapper("job_3", task).execute()
+    assert total.read() == 21
+
+    assert calls == [([1, 2, 3], None), ([4, 5, 6], 6), ([], 21)]
+    assert _DataManager._get(total.id).get_last_edit()["incremental_inputs"] == {logs.id: [3, 6]}
+
+
+def test_execute_incremental_task_processes_full_inputs_after_a_write(tmpdir_factory):
+    task, logs, total = _create_incremental_task(tmpdir_factory)
+    logs.write(pd.DataFrame({"value": [1, 2, 3]}))
+    _TaskFunctionWrapper("job_1", task).execute()
+
+    logs.write(pd.DataFrame({"value": [10]}))
+    _TaskFunctionWrapper("job_2", task).execute()
+    assert total.read() == 10
+
+    # The output edited by another writer does not match the inputs anymore.
+    logs.append(pd.DataFrame({"value": [5]}))
+    total.write(0)
+    _TaskFunctionWrapper("job_3", task).execute()
+    assert total.read() == 15
+
+
+def test_execute_incremental_task_with_data_edited_outside_taipy(tmpdir_factory):
+    task, logs, total = _create_incremental_task(tmpdir_factory)
+    logs.write(pd.DataFrame({"value": [1, 2, 3]}))
+    pd.DataFrame({"value": [1, 2, 3, 4]}).to_csv(logs.path, index=False)
+
+    _TaskFunctionWrapper("job_1", task).execute()
+    assert total.read() == 10
+    assert _DataManager._get(total.id).get_last_edit()["incremental_inputs"] == {logs.id: [1, None]}
+
+    logs.append(pd.DataFrame({"value": [5]}))
+    _TaskFunctionWrapper("job_2", task).execute()
+    assert total.read() == 15
+    assert _DataManager._get(total.id).get_last_edit()["incremental_inputs"] == {logs.id: [2, None]}
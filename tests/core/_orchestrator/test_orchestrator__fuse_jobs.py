@@ -0,0 +1,178 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from unittest import mock
+
+from taipy.common.config import Config
+from taipy.core import taipy
+from taipy.core._orchestrator._dispatcher import _JobDispatcher
+from taipy.core._orchestrator._dispatcher._task_function_wrapper import _FusedTaskFunctionWrapper
+from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core.data.pickle import PickleDataNode
+
+
+def plus_one(x):
+    return x + 1
+
+
+def fail(x):
+    raise ValueError("fail")
+
+
+def create_scenario(t2_function=plus_one):
+    # dn_0 --> t_1 --> dn_1 --> t_2 --> dn_2 --> t_3 --> dn_3
+    #                   \
+    #                    \--> t_2bis --> dn_2bis
+    dn_0_cfg = Config.configure_pickle_data_node("dn_0", default_data=0)
+    dn_1_cfg = Config.configure_pickle_data_node("dn_1")
+    dn_2_cfg = Config.configure_pickle_data_node("dn_2")
+    dn_2bis_cfg = Config.configure_pickle_data_node("dn_2bis")
+    dn_3_cfg = Config.configure_pickle_data_node("dn_3")
+    t1_cfg = Config.configure_task("t_1", plus_one, [dn_0_cfg], [dn_1_cfg])
+    t2_cfg = Config.configure_task("t_2", t2_function, [dn_1_cfg], [dn_2_cfg])
+    t2_bis_cfg = Config.configure_task("t_2bis", plus_one, [dn_1_cfg], [dn_2bis_cfg])
+    t3_cfg = Config.configure_task("t_3", plus_one, [dn_2_cfg], [dn_3_cfg])
+    sc_conf = Config.configure_scenario("scenario_cfg", [t1_cfg, t2_cfg, t2_bis_cfg, t3_cfg])
+    return taipy.create_scenario(sc_conf)
+
+
+def test_fuse_jobs():
+    scenario = create_scenario()
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    jobs = [
+        orchestrator._lock_dn_output_and_create_job(task, "submit_id", scenario.id)
+        for task in [scenario.t_1, scenario.t_2, scenario.t_2bis, scenario.t_3]
+    ]
+    job_1, job_2, job_2bis, job_3 = jobs
+
+    jobs_to_orchestrate = orchestrator._fuse_jobs(jobs)
+
+    # dn_1 is read by both t_2 and t_2bis so t_1 cannot be fused. t_3 is fused behind t_2.
+    assert jobs_to_orchestrate == [job_1, job_2, job_2bis]
+    assert orchestrator.fused_jobs == {job_2.id: [job_3]}
+    assert job_3.is_blocked()
+
+
+def test_fuse_jobs_with_multiple_predecessors():
+    dn_0_cfg = Config.configure_pickle_data_node("dn_0", default_data=0)
+    dn_1_cfg = Config.configure_pickle_data_node("dn_1", default_data=0)
+    dn_2_cfg = Config.configure_pickle_data_node("dn_2")
+    dn_3_cfg = Config.configure_pickle_data_node("dn_3")
+    dn_4_cfg = Config.configure_pickle_data_node("dn_4")
+    t1_cfg = Config.configure_task("t_1", plus_one, [dn_0_cfg], [dn_2_cfg])
+    t2_cfg = Config.configure_task("t_2", plus_one, [dn_1_cfg], [dn_3_cfg])
+    t3_cfg = Config.configure_task("t_3", max, [dn_2_cfg, dn_3_cfg], [dn_4_cfg])
+    scenario = taipy.create_scenario(Config.configure_scenario("scenario_cfg", [t1_cfg, t2_cfg, t3_cfg]))
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    jobs = [
+        orchestrator._lock_dn_output_and_create_job(task, "submit_id", scenario.id)
+        for task in [scenario.t_1, scenario.t_2, scenario.t_3]
+    ]
+
+    assert orchestrator._fuse_jobs(jobs) == jobs
+    assert orchestrator.fused_jobs == {}
+
+
+def test_submit_with_task_fusion_development_mode():
+    Config.configure_job_executions(task_fusion=True)
+    scenario = create_scenario()
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    _OrchestratorFactory._build_dispatcher()
+
+    with mock.patch.object(PickleDataNode, "_read", autospec=True, side_effect=PickleDataNode._read) as mck_read:
+        submission = orchestrator.submit(scenario)
+        read_dn_ids = [call.args[0].id for call in mck_read.call_args_list]
+
+    assert all(job.is_completed() for job in submission.jobs)
+    assert submission.submission_status.name == "COMPLETED"
+    assert scenario.dn_2.read() == 2
+    assert scenario.dn_3.read() == 3
+    assert scenario.dn_2bis.read() == 2
+    assert not scenario.dn_2.edit_in_progress
+    assert not scenario.dn_3.edit_in_progress
+    # dn_2 is handed over in memory from t_2 to t_3 and never read back from the storage
+    assert scenario.dn_2.id not in read_dn_ids
+    assert orchestrator.fused_jobs == {}
+
+
+def test_submit_with_task_fusion_failure_abandons_following_jobs():
+    Config.configure_job_executions(task_fusion=True)
+    scenario = create_scenario(t2_function=fail)
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    _OrchestratorFactory._build_dispatcher()
+
+    submission = orchestrator.submit(scenario)
+    jobs = {job.task.config_id: job for job in submission.jobs}
+
+    assert jobs["t_1"].is_completed()
+    assert jobs["t_2bis"].is_completed()
+    assert jobs["t_2"].is_failed()
+    assert jobs["t_3"].is_abandoned()
+    assert not scenario.dn_2.edit_in_progress
+    assert not scenario.dn_3.edit_in_progress
+    assert orchestrator.fused_jobs == {}
+
+
+def test_submit_with_task_fusion_skips_following_jobs_that_do_not_need_to_run():
+    Config.configure_job_executions(task_fusion=True)
+    scenario = create_scenario()
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    _OrchestratorFactory._build_dispatcher()
+
+    with mock.patch.object(_JobDispatcher, "_needs_to_run", side_effect=lambda task: task.config_id != "t_3"):
+        submission = orchestrator.submit(scenario)
+    jobs = {job.task.config_id: job for job in submission.jobs}
+
+    assert jobs["t_2"].is_completed()
+    assert jobs["t_3"].is_skipped()
+    assert scenario.dn_2.read() == 2
+    assert scenario.dn_3.read() is None
+    assert not scenario.dn_3.edit_in_progress
+    assert orchestrator.fused_jobs == {}
+
+
+def test_fused_task_function_wrapper_does_not_skip_forced_jobs():
+    scenario = create_scenario()
+
+    with mock.patch.object(_JobDispatcher, "_needs_to_run", return_value=False):
+        results = _FusedTaskFunctionWrapper(["job_1", "job_2"], [scenario.t_1, scenario.t_2], force=True).execute()
+
+    assert results == [[], []]
+    assert scenario.dn_2.read() == 2
+
+
+def test_cancel_head_of_fused_chain():
+    scenario = create_scenario()
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    job_2 = orchestrator._lock_dn_output_and_create_job(scenario.t_2, "submit_id", scenario.id)
+    job_3 = orchestrator._lock_dn_output_and_create_job(scenario.t_3, "submit_id", scenario.id)
+    orchestrator._orchestrate_job_to_run_or_block(orchestrator._fuse_jobs([job_2, job_3]))
+
+    orchestrator.cancel_job(job_2)
+
+    assert job_2.is_canceled()
+    assert job_3.is_abandoned()
+    assert orchestrator.fused_jobs == {}
+    assert not scenario.dn_3.edit_in_progress
+
+
+def test_fused_task_function_wrapper_stops_at_first_failure():
+    scenario = create_scenario(t2_function=fail)
+
+    results = _FusedTaskFunctionWrapper(
+        ["job_1", "job_2", "job_3"], [scenario.t_1, scenario.t_2, scenario.t_3]
+    ).execute()
+
+    assert results[0] == []
+    assert len(results[1]) == 1
+    assert isinstance(results[1][0], ValueError)
+    assert results[2] is None
+    assert scenario.dn_1.read() == 1
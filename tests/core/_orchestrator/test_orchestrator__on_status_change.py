@@ -107,6 +107,27 @@ def test_on_status_change_on_completed_job():
         assert orchestrator.jobs_to_run.get() == job_2_to_be_unblocked
 
 
+def test_on_status_change_unblocks_consecutive_blocked_jobs():
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    job_1_to_be_unblocked = create_job("1_to_be_unblocked", Status.BLOCKED)
+    job_2_to_be_unblocked = create_job("2_to_be_unblocked", Status.BLOCKED)
+    job_3_blocked = create_job("3_blocked", Status.BLOCKED)
+    job_4_completed = create_job("completed_job", Status.COMPLETED)
+    orchestrator.blocked_jobs.append(job_1_to_be_unblocked)
+    orchestrator.blocked_jobs.append(job_2_to_be_unblocked)
+    orchestrator.blocked_jobs.append(job_3_blocked)
+
+    with mock.patch("taipy.core._orchestrator._orchestrator._Orchestrator._is_blocked") as mck:
+        mck.side_effect = lambda job: job.id == "3_blocked"
+        orchestrator._on_status_change(job_4_completed)
+
+        # Removing a job from the blocked jobs must not prevent the next one from being unblocked.
+        assert job_1_to_be_unblocked.is_pending()
+        assert job_2_to_be_unblocked.is_pending()
+        assert orchestrator.blocked_jobs == [job_3_blocked]
+        assert orchestrator.jobs_to_run.qsize() == 2
+
+
 def test_on_status_change_on_skipped_job():
     orchestrator = _OrchestratorFactory._build_orchestrator()
     job_1_blocked = create_job("1_blocked", Status.BLOCKED)
@@ -9,6 +9,8 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import pytest
+
 from taipy.common.config import Config
 from taipy.common.config.checker.issue_collector import IssueCollector
 from taipy.core.config.checkers._core_section_checker import _CoreSectionChecker
@@ -51,3 +53,17 @@ class TestCoreSectionChecker:
         assert len(Config._collector.warnings) == 1
         assert Config._collector.warnings[0].field == CoreSection._REPOSITORY_TYPE_KEY
         assert Config._collector.warnings[0].value == 1
+
+    def test_check_read_cache_mode(self):
+        Config.configure_core(read_cache_mode="view")
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+        Config.configure_core(read_cache_mode="any")
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert Config._collector.errors[0].field == CoreSection._READ_CACHE_MODE_KEY
+        assert Config._collector.errors[0].value == "any"
@@ -665,7 +665,7 @@ class TestDataNodeConfigChecker:
         assert len(Config._collector.errors) == 1
         expected_error_message = (
             'The `exposed_type` of DataNodeConfig `default` must be either "pandas"'
-            ', "numpy", or a custom type. Current value of property `exposed_type` is "foo".'
+            ', "numpy", "arrow", "polars", or a custom type. Current value of property `exposed_type` is "foo".'
         )
         assert expected_error_message in caplog.text
 
@@ -688,3 +688,19 @@ class TestDataNodeConfigChecker:
         config._sections[DataNodeConfig.name]["default"].properties = {"exposed_type": MyCustomClass}
         Config.check()
         assert len(Config._collector.errors) == 0
+
+        config._sections[DataNodeConfig.name]["default"].properties = {"exposed_type": "arrow"}
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+        config._sections[DataNodeConfig.name]["default"].storage_type = "excel"
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        expected_error_message = (
+            'The `exposed_type` of DataNodeConfig `default` can only be "arrow" for the csv, parquet, arrow_ipc, sql,'
+            ' sql_table storage types. Current value of property `exposed_type` is "arrow".'
+        )
+        assert expected_error_message in caplog.text
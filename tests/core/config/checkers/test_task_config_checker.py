@@ -311,3 +311,24 @@ class TestTaskConfigChecker:
         Config.check()
         assert len(Config._collector.errors) == 0
         assert len(Config._collector.warnings) == 2
+
+    def test_check_input_columns(self, caplog):
+        input_config = Config.configure_csv_data_node("sales")
+        Config.configure_task("new", print, input_config, [], input_columns={"sales": ["a"]})
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+        Config.configure_task("new", print, input_config, [], input_columns={"unknown": ["a"]})
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "refers to `unknown` which is not an input of the task." in caplog.text
+
+        Config.configure_task("new", print, input_config, [], input_columns={"sales": "a"})
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "must be populated with a list of columns for input `sales`." in caplog.text
@@ -157,6 +157,7 @@ def test_set_default_json_data_node_configuration():
     assert dn1.default_path == "default.json"
     assert dn1.encoder == MyCustomEncoder
     assert dn1.decoder is None
+    assert dn1.format is None
     assert dn1.scope == Scope.GLOBAL
     assert dn1.validity_period == timedelta(2)
 
@@ -186,6 +187,11 @@ def test_set_default_json_data_node_configuration():
     assert dn3.scope == Scope.GLOBAL
     assert dn3.validity_period == timedelta(1)
 
+    dn4 = Config.configure_json_data_node(id="dn4", default_path="dn4.jsonl", format="jsonl")
+    assert dn4.storage_type == "json"
+    assert dn4.format == "jsonl"
+    assert dn4.encoder == MyCustomEncoder
+
 
 def test_set_default_parquet_data_node_configuration():
     Config.set_default_data_node_configuration(
@@ -206,6 +212,7 @@ def test_set_default_parquet_data_node_configuration():
     assert dn1.compression == "gzip"
     assert dn1.read_kwargs is None
     assert dn1.write_kwargs is None
+    assert dn1.partition_cols is None
     assert dn1.exposed_type == "numpy"
     assert dn1.scope == Scope.GLOBAL
     assert dn1.validity_period == timedelta(2)
@@ -234,6 +241,7 @@ def test_set_default_parquet_data_node_configuration():
         storage_type="parquet",
         default_path="dn3.parquet",
         read_kwargs={"filter": "foo"},
+        partition_cols=["day"],
         scope=Scope.SCENARIO,
         validity_period=timedelta(1),
     )
@@ -243,11 +251,59 @@ def test_set_default_parquet_data_node_configuration():
     assert dn3.compression == "gzip"
     assert dn3.read_kwargs == {"filter": "foo"}
     assert dn3.write_kwargs is None
+    assert dn3.partition_cols == ["day"]
     assert dn3.exposed_type == "numpy"
     assert dn3.scope == Scope.SCENARIO
     assert dn3.validity_period == timedelta(1)
 
 
+def test_set_default_npy_data_node_configuration():
+    Config.set_default_data_node_configuration(
+        storage_type="npy",
+        default_path="default.npy",
+        mmap_mode="c",
+        scope=Scope.GLOBAL,
+        validity_period=timedelta(2),
+    )
+
+    dn1 = Config.configure_data_node(id="dn1")
+    assert dn1.storage_type == "npy"
+    assert dn1.default_path == "default.npy"
+    assert dn1.mmap_mode == "c"
+    assert dn1.scope == Scope.GLOBAL
+    assert dn1.validity_period == timedelta(2)
+
+    dn2 = Config.configure_npy_data_node(id="dn2", default_path="dn2.npy", scope=Scope.SCENARIO)
+    assert dn2.storage_type == "npy"
+    assert dn2.default_path == "dn2.npy"
+    assert dn2.mmap_mode == "c"
+    assert dn2.scope == Scope.SCENARIO
+    assert dn2.validity_period == timedelta(2)
+
+
+def test_set_default_arrow_ipc_data_node_configuration():
+    Config.set_default_data_node_configuration(
+        storage_type="arrow_ipc",
+        default_path="default.arrow",
+        scope=Scope.GLOBAL,
+        validity_period=timedelta(2),
+    )
+
+    dn1 = Config.configure_data_node(id="dn1")
+    assert dn1.storage_type == "arrow_ipc"
+    assert dn1.default_path == "default.arrow"
+    assert dn1.exposed_type == "arrow"
+    assert dn1.scope == Scope.GLOBAL
+    assert dn1.validity_period == timedelta(2)
+
+    dn2 = Config.configure_arrow_ipc_data_node(id="dn2", default_path="dn2.arrow", exposed_type="pandas")
+    assert dn2.storage_type == "arrow_ipc"
+    assert dn2.default_path == "dn2.arrow"
+    assert dn2.exposed_type == "pandas"
+    assert dn2.scope == Scope.GLOBAL
+    assert dn2.validity_period == timedelta(2)
+
+
 def test_set_default_excel_data_node_configuration():
     Config.set_default_data_node_configuration(
         storage_type="excel",
@@ -267,6 +323,8 @@ def test_set_default_excel_data_node_configuration():
     assert dn1.has_header is False
     assert dn1.sheet_name is None
     assert dn1.exposed_type == "numpy"
+    assert dn1.engine == "openpyxl"
+    assert dn1.lazy_sheets is False
     assert dn1.validity_period == timedelta(2)
 
     # Config with generic config_data_node without storage_type
@@ -286,6 +344,8 @@ def test_set_default_excel_data_node_configuration():
         id="dn3",
         storage_type="excel",
         default_path="dn3.xlsx",
+        engine="calamine",
+        lazy_sheets=True,
         scope=Scope.SCENARIO,
         validity_period=timedelta(1),
     )
@@ -294,6 +354,8 @@ def test_set_default_excel_data_node_configuration():
     assert dn3.has_header is False
     assert dn3.sheet_name is None
     assert dn3.exposed_type == "numpy"
+    assert dn3.engine == "calamine"
+    assert dn3.lazy_sheets is True
     assert dn3.scope == Scope.SCENARIO
     assert dn3.validity_period == timedelta(1)
 
@@ -303,6 +365,7 @@ def test_set_default_pickle_data_node_configuration():
         storage_type="pickle",
         default_data=1,
         exposed_type="numpy",
+        compression="zstd",
         scope=Scope.GLOBAL,
         validity_period=timedelta(2),
     )
@@ -315,12 +378,16 @@ def test_set_default_pickle_data_node_configuration():
     assert dn1.default_path is None
     assert dn1.default_data == 1
     assert dn1.exposed_type == "numpy"
+    assert dn1.compression == "zstd"
+    assert dn1.compression_level is None
     assert dn1.validity_period == timedelta(2)
 
     # Config with generic config_data_node without storage_type
     # with custom properties
-    dn2 = Config.configure_data_node(id="dn2", default_path="dn2.pkl", default_data=2)
+    dn2 = Config.configure_data_node(id="dn2", default_path="dn2.pkl", default_data=2, compression_level=19)
     assert dn2.storage_type == "pickle"
+    assert dn2.compression == "zstd"
+    assert dn2.compression_level == 19
     assert dn2.default_path == "dn2.pkl"
     assert dn2.default_data == 2
     assert dn2.exposed_type == "numpy"
@@ -373,6 +440,7 @@ def test_set_default_sql_table_data_node_configuration():
     assert dn1.db_host == "default_host"
     assert dn1.db_driver == "default server"
     assert dn1.db_extra_args == {"default": "default"}
+    assert dn1.insert_batch_size is None
     assert dn1.scope == Scope.GLOBAL
     assert dn1.validity_period == timedelta(2)
 
@@ -408,6 +476,8 @@ def test_set_default_sql_table_data_node_configuration():
         db_engine="postgresql",
         table_name="table_3",
         validity_period=timedelta(1),
+        insert_batch_size=500,
+        db_pool_size=4,
     )
     assert dn3.storage_type == "sql_table"
     assert dn3.db_username == "user_3"
@@ -419,6 +489,9 @@ def test_set_default_sql_table_data_node_configuration():
     assert dn3.db_host == "default_host"
     assert dn3.db_driver == "default server"
     assert dn3.db_extra_args == {"default": "default"}
+    assert dn3.insert_batch_size == 500
+    assert dn3.db_pool_size == 4
+    assert dn3.db_max_overflow is None
     assert dn3.scope == Scope.GLOBAL
     assert dn3.validity_period == timedelta(1)
 
@@ -519,6 +592,7 @@ def test_set_default_mongo_collection_data_node_configuration():
         db_host="default_host",
         db_driver="default server",
         db_extra_args={"default": "default"},
+        batch_size=500,
         scope=Scope.GLOBAL,
         validity_period=timedelta(2),
     )
@@ -536,6 +610,10 @@ def test_set_default_mongo_collection_data_node_configuration():
     assert dn1.db_port == 1010
     assert dn1.db_driver == "default server"
     assert dn1.db_extra_args == {"default": "default"}
+    assert dn1.batch_size == 500
+    assert dn1.id_field is None
+    assert dn1.projection is None
+    assert dn1.indexes is None
     assert dn1.scope == Scope.GLOBAL
     assert dn1.validity_period == timedelta(2)
 
@@ -570,6 +648,8 @@ def test_set_default_mongo_collection_data_node_configuration():
         db_username="user_3",
         db_password="pwd_3",
         validity_period=timedelta(1),
+        id_field="key",
+        indexes=["foo"],
     )
     assert dn3.storage_type == "mongo_collection"
     assert dn3.db_username == "user_3"
@@ -580,6 +660,9 @@ def test_set_default_mongo_collection_data_node_configuration():
     assert dn3.db_port == 1010
     assert dn3.db_host == "default_host"
     assert dn3.db_driver == "default server"
+    assert dn3.batch_size == 500
+    assert dn3.id_field == "key"
+    assert dn3.indexes == ["foo"]
     assert dn3.db_extra_args == {"default": "default"}
     assert dn3.scope == Scope.GLOBAL
     assert dn3.validity_period == timedelta(1)
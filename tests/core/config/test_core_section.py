@@ -102,3 +102,27 @@ def test_clean_config():
 
     assert core_config.force is False
     assert core_config.properties == {}
+
+
+def test_read_cache_configuration():
+    assert Config.core.read_cache_budget is None
+    assert Config.core.read_cache_mode == "copy"
+
+    Config.configure_core(read_cache_budget=1000, read_cache_mode="view")
+    assert Config.core.read_cache_budget == 1000
+    assert Config.core.read_cache_mode == "view"
+
+    with patch.dict(os.environ, {"BUDGET": "2000"}):
+        Config.configure_core(read_cache_budget="ENV[BUDGET]")
+        assert Config.core.read_cache_budget == 2000
+
+
+def test_deduplicate_files_configuration():
+    assert Config.core.deduplicate_files is False
+
+    Config.configure_core(deduplicate_files=True)
+    assert Config.core.deduplicate_files is True
+
+    with patch.dict(os.environ, {"DEDUPLICATE": "False"}):
+        Config.configure_core(deduplicate_files="ENV[DEDUPLICATE]")
+        assert Config.core.deduplicate_files is False
@@ -9,6 +9,9 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import os
+from unittest import mock
+
 from taipy.common.config import Config
 
 
@@ -26,6 +29,18 @@ def test_job_config():
     assert Config.job_config.foo == "bar"
 
 
+def test_job_config_task_fusion():
+    assert not Config.job_config.is_task_fusion_enabled
+
+    Config.configure_job_executions(task_fusion=True)
+    assert Config.job_config.task_fusion
+    assert Config.job_config.is_task_fusion_enabled
+
+    with mock.patch.dict(os.environ, {"TASK_FUSION": "false"}):
+        Config.configure_job_executions(task_fusion="ENV[TASK_FUSION]")
+        assert not Config.job_config.is_task_fusion_enabled
+
+
 def test_clean_config():
     job_config = Config.configure_job_executions(mode="standalone", max_nb_of_workers=3, prop="foo")
 
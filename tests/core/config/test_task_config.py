@@ -180,3 +180,27 @@ def test_clean_config():
     assert task1_config.output_configs == task1_config.output_configs == []
     assert task1_config.skippable is task1_config.skippable is False
     assert task1_config.properties == task1_config.properties == {}
+
+
+def test_task_config_input_columns():
+    input_config = Config.configure_csv_data_node("input")
+    output_config = Config.configure_data_node("output")
+    task_config = Config.configure_task("task1", print, input_config, output_config)
+    assert task_config.input_columns == {}
+
+    task_config = Config.configure_task(
+        "task2", print, input_config, output_config, input_columns={"input": ["a", "b"]}
+    )
+    assert task_config.input_columns == {"input": ["a", "b"]}
+    assert Config.tasks["task2"].input_columns == {"input": ["a", "b"]}
+
+
+def test_task_config_incremental():
+    input_config = Config.configure_csv_data_node("input")
+    output_config = Config.configure_data_node("output")
+    task_config = Config.configure_task("task1", print, input_config, output_config)
+    assert task_config.incremental is False
+
+    task_config = Config.configure_task("task2", print, input_config, output_config, incremental=True)
+    assert task_config.incremental is True
+    assert Config.tasks["task2"].incremental is True
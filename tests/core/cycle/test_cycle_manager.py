@@ -10,6 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 from datetime import datetime
+from unittest import mock
 
 from taipy.common.config import Config
 from taipy.common.config.common.frequency import Frequency
@@ -284,3 +285,31 @@ def test_get_primary(tmpdir, cycle, current_datetime):
         )
         == 0
     )
+
+
+def test_get_or_create_looks_up_known_cycles_in_the_index():
+    creation_date = datetime(2024, 3, 5, 10)
+    cycle = _CycleManager._get_or_create(Frequency.DAILY, creation_date)
+
+    with mock.patch.object(_CycleManager, "_get_all", wraps=_CycleManager._get_all) as get_all:
+        assert _CycleManager._get_or_create(Frequency.DAILY, datetime(2024, 3, 5, 18)) == cycle
+        assert get_all.call_count == 0
+
+        other_cycle = _CycleManager._get_or_create(Frequency.DAILY, datetime(2024, 3, 6, 10))
+        assert other_cycle != cycle
+        assert get_all.call_count == 1
+
+        assert _CycleManager._get_or_create(Frequency.DAILY, datetime(2024, 3, 6, 12)) == other_cycle
+        assert get_all.call_count == 1
+
+
+def test_get_or_create_does_not_return_a_deleted_cycle():
+    creation_date = datetime(2024, 3, 5, 10)
+    cycle = _CycleManager._get_or_create(Frequency.DAILY, creation_date)
+
+    # The cycle is deleted behind the back of the manager, e.g. by another process.
+    _CycleManager._repository._delete(cycle.id)
+
+    new_cycle = _CycleManager._get_or_create(Frequency.DAILY, creation_date)
+    assert new_cycle != cycle
+    assert _CycleManager._get(new_cycle.id) == new_cycle
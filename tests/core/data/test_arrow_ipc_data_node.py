@@ -0,0 +1,133 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+import os
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from pandas.testing import assert_frame_equal
+
+from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data.arrow_ipc import ArrowIPCDataNode
+from taipy.core.exceptions.exceptions import InvalidExposedType
+
+
+class MyCustomObject:
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
+
+@pytest.fixture
+def arrow_file_path(tmp_path):
+    path = str(tmp_path / "example.arrow")
+    table = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return path
+
+
+class TestArrowIPCDataNode:
+    def test_create(self):
+        arrow_dn_config = Config.configure_arrow_ipc_data_node(id="foo_bar", default_path="data/node/path.arrow")
+        dn = _DataManagerFactory._build_manager()._create_and_set(arrow_dn_config, None, None)
+        assert isinstance(dn, ArrowIPCDataNode)
+        assert dn.storage_type() == "arrow_ipc"
+        assert dn.config_id == "foo_bar"
+        assert dn.path == "data/node/path.arrow"
+        assert dn.properties["exposed_type"] == "arrow"
+        assert not dn.is_ready_for_reading
+        assert dn._get_user_properties() == {}
+
+    def test_generated_path_has_arrow_extension(self):
+        dn = ArrowIPCDataNode("foo", Scope.SCENARIO, properties={"default_data": pd.DataFrame({"a": [1]})})
+        assert dn.path.endswith(".arrow")
+        assert dn.is_ready_for_reading
+        os.remove(dn.path)
+
+    def test_invalid_exposed_type(self):
+        with pytest.raises(InvalidExposedType):
+            ArrowIPCDataNode("foo", Scope.SCENARIO, properties={"exposed_type": "foo"})
+
+    def test_read_does_not_copy_the_data(self, arrow_file_path):
+        dn = ArrowIPCDataNode("foo", Scope.SCENARIO, properties={"path": arrow_file_path})
+        allocated_bytes = pa.total_allocated_bytes()
+        data = dn.read()
+        assert isinstance(data, pa.Table)
+        assert pa.total_allocated_bytes() == allocated_bytes
+        assert data.to_pydict() == {"a": [1, 2, 3], "b": ["x", "y", "z"]}
+
+    def test_read_with_exposed_types(self, arrow_file_path):
+        dn = ArrowIPCDataNode("foo", Scope.SCENARIO, properties={"path": arrow_file_path, "exposed_type": "pandas"})
+        assert_frame_equal(dn.read(), pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}))
+
+        dn = ArrowIPCDataNode("foo", Scope.SCENARIO, properties={"path": arrow_file_path, "exposed_type": "numpy"})
+        np.testing.assert_array_equal(dn.read(), np.array([[1, "x"], [2, "y"], [3, "z"]], dtype=object))
+
+        dn = ArrowIPCDataNode(
+            "foo", Scope.SCENARIO, properties={"path": arrow_file_path, "exposed_type": MyCustomObject}
+        )
+        data = dn.read()
+        assert all(isinstance(row, MyCustomObject) for row in data)
+        assert [row.a for row in data] == [1, 2, 3]
+
+    def test_read_columns(self, arrow_file_path):
+        dn = ArrowIPCDataNode("foo", Scope.SCENARIO, properties={"path": arrow_file_path})
+        assert dn["b"].to_pylist() == ["x", "y", "z"]
+
+        dn = ArrowIPCDataNode("foo", Scope.SCENARIO, properties={"path": arrow_file_path, "exposed_type": "pandas"})
+        assert_frame_equal(dn[["a"]], pd.DataFrame({"a": [1, 2, 3]}))
+
+    def test_write_and_append(self, tmp_path):
+        path = str(tmp_path / "data.arrow")
+        dn = ArrowIPCDataNode("foo", Scope.SCENARIO, properties={"path": path, "exposed_type": "pandas"})
+
+        dn.append(pd.DataFrame({"a": [1, 2], "b": [1.0, 2.0]}))
+        dn.append(pd.DataFrame({"b": [3, 4], "a": [3, 4]}))
+        assert_frame_equal(dn.read(), pd.DataFrame({"a": [1, 2, 3, 4], "b": [1.0, 2.0, 3.0, 4.0]}))
+
+        dn.write(pd.DataFrame({"c": ["foo"]}))
+        assert_frame_equal(dn.read(), pd.DataFrame({"c": ["foo"]}))
+        assert os.listdir(tmp_path) == ["data.arrow"]
+
+    @pytest.mark.skipif(not os.path.exists("/proc/self/maps"), reason="The memory maps cannot be listed")
+    def test_append_releases_the_memory_map_before_replacing_the_file(self, arrow_file_path):
+        dn = ArrowIPCDataNode("foo", Scope.SCENARIO, properties={"path": arrow_file_path})
+        os_replace = os.replace
+
+        def replace(src, dst):
+            with open("/proc/self/maps") as maps:
+                assert os.path.basename(arrow_file_path) not in maps.read()
+            os_replace(src, dst)
+
+        with mock.patch("os.replace", side_effect=replace) as mck_replace:
+            dn.append(pa.table({"a": [4], "b": ["w"]}))
+            assert mck_replace.call_count == 1
+        assert dn.read().column("a").to_pylist() == [1, 2, 3, 4]
+
+    def test_read_in_memory_where_mapped_files_cannot_be_replaced(self, arrow_file_path):
+        dn = ArrowIPCDataNode("foo", Scope.SCENARIO, properties={"path": arrow_file_path})
+        with mock.patch.object(ArrowIPCDataNode, "_CAN_REPLACE_MAPPED_FILES", False):
+            with mock.patch("pyarrow.memory_map") as mck_memory_map:
+                assert dn.read().column("a").to_pylist() == [1, 2, 3]
+                mck_memory_map.assert_not_called()
+
+    def test_write_keeps_previous_read_valid(self, arrow_file_path):
+        dn = ArrowIPCDataNode("foo", Scope.SCENARIO, properties={"path": arrow_file_path})
+        previous = dn.read()
+
+        dn.write(pa.table({"a": [42]}))
+        assert previous.to_pydict() == {"a": [1, 2, 3], "b": ["x", "y", "z"]}
+        assert dn.read().to_pydict() == {"a": [42]}
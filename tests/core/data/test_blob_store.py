@@ -0,0 +1,211 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import pathlib
+
+import pandas as pd
+import pytest
+
+from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
+from taipy.core.data._data_manager import _DataManager
+from taipy.core.data.csv import CSVDataNode
+from taipy.core.data.pickle import PickleDataNode
+
+
+@pytest.fixture
+def storage_folder(tmpdir_factory):
+    folder = str(tmpdir_factory.mktemp("storage"))
+    Config.configure_core(storage_folder=folder, deduplicate_files=True)
+    return folder
+
+
+def list_blobs(storage_folder):
+    return sorted(str(path) for path in pathlib.Path(storage_folder, "blobs").glob("*/*"))
+
+
+def create_data_nodes(dn_config, count):
+    return [_DataManager._create_and_set(dn_config, f"SCENARIO_{i}", None) for i in range(count)]
+
+
+def test_deduplication_is_disabled_by_default(tmpdir_factory):
+    folder = str(tmpdir_factory.mktemp("storage"))
+    Config.configure_core(storage_folder=folder)
+    dn_1, dn_2 = create_data_nodes(Config.configure_pickle_data_node("foo", scope=Scope.SCENARIO), 2)
+    dn_1.write({"a": 1})
+    dn_2.write({"a": 1})
+
+    assert list_blobs(folder) == []
+    assert os.stat(dn_1.path).st_nlink == 1
+    assert "content_digest" not in dn_1.properties
+
+
+def test_identical_files_share_a_blob(storage_folder):
+    dn_config = Config.configure_csv_data_node("foo", scope=Scope.SCENARIO)
+    dn_1, dn_2, dn_3 = create_data_nodes(dn_config, 3)
+    data = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    for dn in (dn_1, dn_2, dn_3):
+        dn.write(data)
+
+    blobs = list_blobs(storage_folder)
+    assert len(blobs) == 1
+    assert os.path.samefile(dn_1.path, blobs[0])
+    assert os.path.samefile(dn_2.path, blobs[0])
+    assert os.path.samefile(dn_3.path, blobs[0])
+    assert os.stat(blobs[0]).st_nlink == 4
+    assert os.path.basename(blobs[0]) == dn_1.properties["content_digest"]
+    assert "content_digest" not in dn_1._get_user_properties()
+    pd.testing.assert_frame_equal(dn_2.read(), data)
+
+    # The digest is persisted with the data node.
+    assert _DataManager._get(dn_1.id).properties["content_digest"] == dn_1.properties["content_digest"]
+
+
+def test_write_does_not_modify_the_other_data_nodes(storage_folder):
+    dn_1, dn_2 = create_data_nodes(Config.configure_csv_data_node("foo", scope=Scope.SCENARIO), 2)
+    data = pd.DataFrame({"a": [1, 2, 3]})
+    dn_1.write(data)
+    dn_2.write(data)
+    old_blob = list_blobs(storage_folder)[0]
+
+    new_data = pd.DataFrame({"a": [7, 8]})
+    dn_1.write(new_data)
+
+    pd.testing.assert_frame_equal(dn_1.read(), new_data)
+    pd.testing.assert_frame_equal(dn_2.read(), data)
+    assert len(list_blobs(storage_folder)) == 2
+    assert os.stat(old_blob).st_nlink == 2
+
+    # The blob is removed when its last data node is edited.
+    dn_2.write(new_data)
+    assert not os.path.exists(old_blob)
+    assert len(list_blobs(storage_folder)) == 1
+    assert os.path.samefile(dn_1.path, dn_2.path)
+
+
+def test_failed_write_keeps_the_shared_file(storage_folder):
+    dn_1, dn_2 = create_data_nodes(Config.configure_pickle_data_node("foo", scope=Scope.SCENARIO), 2)
+    dn_1.write({"a": 1})
+    dn_2.write({"a": 1})
+    blob = list_blobs(storage_folder)[0]
+    digest = dn_1.properties["content_digest"]
+
+    with pytest.raises(TypeError):
+        dn_1.write(i for i in range(3))
+
+    assert dn_1.read() == {"a": 1}
+    assert dn_2.read() == {"a": 1}
+    assert os.path.samefile(dn_1.path, blob)
+    assert os.stat(blob).st_nlink == 3
+    assert dn_1.properties["content_digest"] == digest
+    assert sorted(os.listdir(os.path.dirname(dn_1.path))) == sorted(os.path.basename(dn.path) for dn in (dn_1, dn_2))
+
+
+def test_append_and_write_chunks_detach_the_file(storage_folder):
+    dn_1, dn_2 = create_data_nodes(Config.configure_csv_data_node("foo", scope=Scope.SCENARIO), 2)
+    data = pd.DataFrame({"a": [1, 2, 3]})
+    dn_1.write(data)
+    dn_2.write(data)
+
+    dn_1.append(pd.DataFrame({"a": [4]}))
+    assert dn_1.read()["a"].tolist() == [1, 2, 3, 4]
+    assert dn_2.read()["a"].tolist() == [1, 2, 3]
+
+    dn_2.write_chunks([pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3, 4]})])
+    assert dn_2.read()["a"].tolist() == [1, 2, 3, 4]
+    assert os.path.samefile(dn_1.path, dn_2.path)
+    assert len(list_blobs(storage_folder)) == 1
+
+
+def test_default_data_is_deduplicated(storage_folder):
+    dn_config = Config.configure_pickle_data_node("foo", default_data={"a": [1, 2, 3]}, scope=Scope.SCENARIO)
+    dn_1, dn_2 = create_data_nodes(dn_config, 2)
+
+    assert len(list_blobs(storage_folder)) == 1
+    assert os.path.samefile(dn_1.path, dn_2.path)
+    assert dn_1.read() == dn_2.read() == {"a": [1, 2, 3]}
+
+
+def test_deleting_data_nodes_releases_the_blob(storage_folder):
+    dn_1, dn_2 = create_data_nodes(Config.configure_pickle_data_node("foo", scope=Scope.SCENARIO), 2)
+    dn_1.write([1, 2, 3])
+    dn_2.write([1, 2, 3])
+    blob = list_blobs(storage_folder)[0]
+
+    _DataManager._delete(dn_1.id)
+    assert not os.path.exists(dn_1.path)
+    assert os.path.exists(blob)
+    assert dn_2.read() == [1, 2, 3]
+
+    _DataManager._delete(dn_2.id)
+    assert not os.path.exists(dn_2.path)
+    assert not os.path.exists(blob)
+
+
+def test_user_files_are_not_deduplicated(storage_folder, tmpdir_factory):
+    path = str(tmpdir_factory.mktemp("data").join("data.p"))
+    dn = PickleDataNode("foo", Scope.SCENARIO, properties={"path": path})
+    dn.write([1, 2, 3])
+
+    assert list_blobs(storage_folder) == []
+    assert os.stat(path).st_nlink == 1
+
+
+def test_upload_detaches_the_file(storage_folder, tmpdir_factory):
+    dn_1, dn_2 = create_data_nodes(Config.configure_csv_data_node("foo", scope=Scope.SCENARIO), 2)
+    data = pd.DataFrame({"a": [1, 2, 3]})
+    dn_1.write(data)
+    dn_2.write(data)
+
+    upload_path = str(tmpdir_factory.mktemp("upload").join("upload.csv"))
+    pd.DataFrame({"a": [9]}).to_csv(upload_path, index=False)
+    assert CSVDataNode._upload(dn_1, upload_path)
+
+    assert dn_1.read()["a"].tolist() == [9]
+    assert dn_2.read()["a"].tolist() == [1, 2, 3]
+    assert len(list_blobs(storage_folder)) == 2
+
+
+@pytest.mark.parametrize("storage_type", ["csv", "excel"])
+def test_write_with_column_names_detaches_the_file(storage_folder, storage_type):
+    dn_config = Config.configure_data_node("foo", storage_type, scope=Scope.SCENARIO, sheet_name="Sheet1")
+    dn_1, dn_2 = create_data_nodes(dn_config, 2)
+    data = pd.DataFrame({"a": [1, 2, 3]})
+    dn_1.write(data)
+    dn_2.write(data)
+    assert os.path.samefile(dn_1.path, dn_2.path)
+
+    dn_1.write_with_column_names([[9], [9]], ["x"])
+
+    assert dn_1.read()["x"].tolist() == [9, 9]
+    assert dn_2.read()["a"].tolist() == [1, 2, 3]
+    assert len(list_blobs(storage_folder)) == 2
+
+
+def test_partitioned_writes_detach_the_file(storage_folder):
+    dn_1, dn_2 = create_data_nodes(Config.configure_parquet_data_node("foo", scope=Scope.SCENARIO), 2)
+    data = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "x"]})
+    dn_1.write(data)
+    dn_2.write(data)
+    blob = list_blobs(storage_folder)[0]
+
+    # The file is replaced by a partitioned dataset, which is a directory that is not deduplicated.
+    dn_1.properties["partition_cols"] = ["b"]
+    dn_1.write(data)
+    dn_1.append(pd.DataFrame({"a": [4], "b": ["z"]}))
+    dn_1.write_chunks([data, pd.DataFrame({"a": [5], "b": ["y"]})])
+
+    assert sorted(dn_1.read()["a"].tolist()) == [1, 2, 3, 5]
+    assert "content_digest" not in dn_1.properties
+    pd.testing.assert_frame_equal(dn_2.read(), data)
+    assert list_blobs(storage_folder) == [blob]
+    assert os.stat(blob).st_nlink == 2
@@ -12,6 +12,7 @@
 import os
 import pathlib
 
+import pandas as pd
 import pytest
 
 from taipy.common.config import Config
@@ -530,6 +531,15 @@ class TestDataManager:
         assert not file_exists(generated_dn_1.path)
         assert not file_exists(generated_dn_2.path)
 
+    def test_clean_generated_partitioned_parquet_dataset(self):
+        dn_config = Config.configure_parquet_data_node("d1", partition_cols=["b"])
+        dn = _DataManager._create_and_set(dn_config, None, None)
+        dn.write(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+        assert os.path.isdir(dn.path)
+
+        _DataManager._delete(dn.id)
+        assert not os.path.exists(dn.path)
+
     @pytest.mark.parametrize(
         "storage_type,path",
         [
@@ -14,6 +14,7 @@ from datetime import datetime, timedelta
 from time import sleep
 from unittest import mock
 
+import pandas as pd
 import pytest
 
 import taipy.core as tp
@@ -22,9 +23,12 @@ from taipy.common.config.common.scope import Scope
 from taipy.common.config.exceptions.exceptions import InvalidConfigurationId
 from taipy.core.data._data_manager import _DataManager
 from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data.csv import CSVDataNode
 from taipy.core.data.data_node import DataNode
 from taipy.core.data.data_node_id import DataNodeId
 from taipy.core.data.in_memory import InMemoryDataNode
+from taipy.core.data.json import JSONDataNode
+from taipy.core.data.operator import Operator
 from taipy.core.exceptions.exceptions import DataNodeIsBeingEdited, NoData
 from taipy.core.job.job_id import JobId
 from taipy.core.task.task import Task
@@ -161,6 +165,26 @@ class TestDataNode:
         assert dn.is_ready_for_reading
         assert dn.job_ids == [job_id]
 
+    def test_read_and_write_chunks(self):
+        dn = InMemoryDataNode("dn", Scope.SCENARIO)
+        with pytest.raises(NoData):
+            dn.read_chunks()
+
+        dn.write_chunks(iter([[{"a": 1, "b": 1}, {"a": 2, "b": 2}], [{"a": 3, "b": 3}]]))
+        assert dn.read() == [{"a": 1, "b": 1}, {"a": 2, "b": 2}, {"a": 3, "b": 3}]
+        assert len(dn.edits) == 1
+
+        assert list(dn.read_chunks(chunksize=2)) == [[{"a": 1, "b": 1}, {"a": 2, "b": 2}], [{"a": 3, "b": 3}]]
+        assert list(dn.read_chunks(chunksize=2, columns=["b"], operators=("a", 1, Operator.GREATER_THAN))) == [
+            [{"b": 2}],
+            [{"b": 3}],
+        ]
+        with pytest.raises(ValueError):
+            dn.read_chunks(chunksize=0)
+
+        dn.write_chunks([])
+        assert len(dn.edits) == 1
+
     def test_lock_initialization(self):
         dn = InMemoryDataNode("dn", Scope.SCENARIO)
         assert not dn.edit_in_progress
@@ -745,3 +769,38 @@ class TestDataNode:
         # This new syntax will be the only one allowed: https://github.com/Avaiga/taipy-core/issues/806
         dn.properties["name"] = "baz"
         assert dn.name == "baz"
+
+
+def test_edits_track_the_rows_written(tmpdir_factory):
+    path = str(tmpdir_factory.mktemp("data").join("data.csv"))
+    dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": path})
+    assert dn._get_row_count() == 0
+
+    dn.write(pd.DataFrame({"a": [1, 2, 3]}))
+    dn.append(pd.DataFrame({"a": [4, 5]}))
+    dn.write_chunks([pd.DataFrame({"a": [6]}), pd.DataFrame({"a": [7, 8]})])
+    dn.append(pd.DataFrame({"a": [9]}))
+
+    assert [(edit.get("offset"), edit.get("rows")) for edit in dn.edits] == [(0, 3), (3, 2), (0, 3), (3, 1)]
+    assert dn._get_row_count() == 4
+    assert dn._read_rows(1, 3)["a"].tolist() == [7, 8]
+    assert dn._read_rows(4, 4)["a"].tolist() == []
+
+    # The appends record the position of their first row in the file, from which the rows can be read.
+    position = dn.edits[-1]["position"]
+    assert dn.edits[1]["position"] == len("a\n1\n2\n3\n")
+    assert dn._read_rows(3, 4, position=position)["a"].tolist() == [9]
+    assert dn._read_rows(4, 4, position=dn._get_end_position())["a"].tolist() == []
+
+    dn.track_edit(comment="edited outside of Taipy")
+    assert dn._get_row_count() is None
+
+
+def test_read_rows_of_non_streamed_data(tmpdir_factory):
+    path = str(tmpdir_factory.mktemp("data").join("data.json"))
+    dn = JSONDataNode("foo", Scope.SCENARIO, properties={"path": path})
+    dn.write(list(range(10)))
+    dn.append([10, 11])
+
+    assert dn._get_row_count() == 12
+    assert dn._read_rows(8, 12) == [8, 9, 10, 11]
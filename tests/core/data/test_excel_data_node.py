@@ -32,6 +32,7 @@ from taipy.core.exceptions.exceptions import (
     ExposedTypeLengthMismatch,
     InvalidExposedType,
     NonExistingExcelSheet,
+    UnknownExcelEngine,
 )
 from taipy.core.reason import NoFileToDownload, NotAFile
 
@@ -375,6 +376,11 @@ class TestExcelDataNode:
                 },
             )
 
+    def test_invalid_engine(self):
+        path = os.path.join(pathlib.Path(__file__).parent.resolve(), "data_sample/example.xlsx")
+        with pytest.raises(UnknownExcelEngine):
+            ExcelDataNode("foo", Scope.SCENARIO, properties={"default_path": path, "engine": "xlrd"})
+
     def test_get_system_modified_date_instead_of_last_edit_date(self, tmpdir_factory):
         temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.xlsx"))
         pd.DataFrame([]).to_excel(temp_file_path)
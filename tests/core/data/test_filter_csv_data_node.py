@@ -11,6 +11,7 @@
 
 import os
 import pathlib
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -117,3 +118,36 @@ def test_filter_numpy_exposed_type(csv_file):
         np.array([[1, 1], [1, 2], [2, 1], [2, 2]]),
     )
     assert np.array_equal(dn[(dn[:, 1] == 1) | (dn[:, 1] == 2)], np.array([[1, 1], [1, 2], [2, 1], [2, 2]]))
+
+
+def test_filter_scans_file_by_chunks(csv_file):
+    dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": csv_file, "exposed_type": "pandas"})
+    dn.write(pd.DataFrame({"foo": [1, 1, 1, 2, None], "bar": [1, 2, None, 2, 2]}))
+
+    with mock.patch.object(CSVDataNode, "_CSVDataNode__FILTER_CHUNK_SIZE", 2):
+        with mock.patch.object(CSVDataNode, "_read") as mck_read:
+            filtered_data = dn.filter(("foo", 1, Operator.EQUAL))
+            mck_read.assert_not_called()
+        assert_frame_equal(filtered_data, pd.DataFrame({"foo": [1.0, 1.0, 1.0], "bar": [1.0, 2.0, None]}))
+
+        filtered_data = dn.filter([("foo", 1, Operator.EQUAL), ("bar", 2, Operator.EQUAL)])
+        assert_frame_equal(filtered_data, pd.DataFrame({"foo": [1.0], "bar": [2.0]}, index=[1]))
+
+        dn.properties["exposed_type"] = "numpy"
+        assert np.array_equal(dn.filter((1, 2, Operator.EQUAL)), np.array([[1, 2], [2, 2], [np.nan, 2]]), True)
+
+
+def test_filter_by_chunks_parses_every_chunk_with_the_types_of_the_first_one(csv_file):
+    dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": csv_file, "exposed_type": "pandas"})
+    dn.write(pd.DataFrame({"foo": ["a", "b", "1", "2"], "bar": [1, 2, 3, 4]}))
+
+    with mock.patch.object(CSVDataNode, "_CSVDataNode__FILTER_CHUNK_SIZE", 2):
+        # The second chunk alone would be parsed as integers, the full file is parsed as strings.
+        assert dn.filter(("foo", "1", Operator.EQUAL))["bar"].tolist() == [3]
+        assert dn.filter(("bar", 2, Operator.GREATER_OR_EQUAL))["foo"].tolist() == ["b", "1", "2"]
+
+    dn.write(pd.DataFrame({"foo": [1, 2, None, 3], "bar": [1, 2, 3, 4]}))
+    with mock.patch.object(CSVDataNode, "_CSVDataNode__FILTER_CHUNK_SIZE", 2):
+        # The missing value of the second chunk cannot be parsed as an integer like the first chunk.
+        filtered_data = dn.filter(("bar", 2, Operator.GREATER_OR_EQUAL))
+    assert_frame_equal(filtered_data, pd.DataFrame({"foo": [2.0, None, 3.0], "bar": [2, 3, 4]}, index=[1, 2, 3]))
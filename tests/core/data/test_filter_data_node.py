@@ -9,12 +9,17 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+from importlib import util
 from typing import Dict, List
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import pytest
 
+from taipy.common.config.common.scope import Scope
+from taipy.core.data.in_memory import InMemoryDataNode
 from taipy.core.data.operator import JoinOperator, Operator
 
 from .utils import (
@@ -203,6 +208,74 @@ def test_filter_numpy_exposed_type(default_data_frame):
     )
 
 
+def test_filter_keeps_rows_order_and_index():
+    df = pd.DataFrame({"a": [3, 1, 2, 1, 3], "b": [1, 1, 2, 2, 1]}, index=[10, 11, 12, 13, 14])
+    df_dn = FakeDataframeDataNode("fake_dataframe_dn", df)
+
+    filtered_df = df_dn.filter([("a", 3, Operator.EQUAL), ("b", 2, Operator.EQUAL)], JoinOperator.OR)
+    pd.testing.assert_frame_equal(filtered_df, df.loc[[10, 12, 13, 14]])
+
+    filtered_df = df_dn.filter([("a", 1, Operator.GREATER_THAN), ("b", 1, Operator.EQUAL)], JoinOperator.AND)
+    pd.testing.assert_frame_equal(filtered_df, df.loc[[10, 14]])
+
+    array_dn = FakeNumpyarrayDataNode("fake_array_dn", df.to_numpy())
+    filtered_array = array_dn.filter([(0, 3, Operator.EQUAL), (1, 2, Operator.EQUAL)], JoinOperator.OR)
+    assert np.array_equal(filtered_array, np.array([[3, 1], [2, 2], [1, 2], [3, 1]]))
+
+
+def test_filter_arrow_table():
+    table = pa.table({"a": [3, 1, 2, None, 3], "b": ["x", "y", "z", "y", "x"]})
+    arrow_dn = InMemoryDataNode("fake_arrow_dn", Scope.SCENARIO, properties={"default_data": table})
+
+    filtered = arrow_dn.filter([("a", 3, Operator.EQUAL), ("b", "z", Operator.EQUAL)], JoinOperator.OR)
+    assert filtered.to_pylist() == [table.slice(i, 1).to_pylist()[0] for i in [0, 2, 4]]
+    assert arrow_dn.filter(("a", 2, Operator.GREATER_OR_EQUAL)).column("a").to_pylist() == [3, 2, 3]
+    assert arrow_dn.filter(("a", 3, Operator.NOT_EQUAL)).column("a").to_pylist() == [1, 2, None]
+    assert arrow_dn.filter(("a", None, Operator.EQUAL)).column("b").to_pylist() == ["y"]
+
+    assert arrow_dn["a"].to_pylist() == [3, 1, 2, None, 3]
+    assert arrow_dn[["b"]].column_names == ["b"]
+    assert arrow_dn[pc.equal(arrow_dn["b"], "x")].column("a").to_pylist() == [3, 3]
+    assert arrow_dn["c"] is None
+
+
+@pytest.mark.skipif(not util.find_spec("polars"), reason="polars is not installed")
+def test_filter_polars_dataframe():
+    import polars as pl
+
+    df = pl.DataFrame({"a": [3, 1, 2, None, 3], "b": ["x", "y", "z", "y", "x"]})
+    polars_dn = InMemoryDataNode("fake_polars_dn", Scope.SCENARIO, properties={"default_data": df})
+
+    filtered = polars_dn.filter([("a", 3, Operator.EQUAL), ("b", "z", Operator.EQUAL)], JoinOperator.OR)
+    assert filtered["a"].to_list() == [3, 2, 3]
+    assert polars_dn.filter(("a", 3, Operator.NOT_EQUAL))["a"].to_list() == [1, 2, None]
+    assert polars_dn["b"].to_list() == ["x", "y", "z", "y", "x"]
+
+
+def test_filter_list_of_dicts():
+    rows = [{"a": 3, "b": 1}, {"a": 1}, {"a": 2, "b": 2}, {"b": 2}, {"a": 3, "b": 1}]
+    list_dn = InMemoryDataNode("fake_list_dn", Scope.SCENARIO, properties={"default_data": rows})
+
+    assert list_dn.filter([("a", 3, Operator.EQUAL), ("b", 2, Operator.EQUAL)], JoinOperator.OR) == [
+        rows[0],
+        rows[2],
+        rows[3],
+        rows[4],
+    ]
+    assert list_dn.filter([("a", 2, Operator.GREATER_OR_EQUAL), ("b", 1, Operator.EQUAL)]) == [rows[0], rows[4]]
+    # Missing values only match None and never match a comparison
+    assert list_dn.filter(("b", None, Operator.EQUAL)) == [rows[1]]
+    assert list_dn.filter(("a", 2, Operator.LESS_THAN)) == [rows[1]]
+
+
+def test_filter_list_with_none_keeps_equality_semantics():
+    rows = [{"a": None}, {"a": float("nan")}, {"a": 1}]
+    list_dn = InMemoryDataNode("fake_list_dn", Scope.SCENARIO, properties={"default_data": rows})
+
+    assert list_dn.filter(("a", None, Operator.EQUAL)) == [rows[0]]
+    assert list_dn.filter(("a", None, Operator.NOT_EQUAL)) == [rows[1], rows[2]]
+
+
 def test_filter_by_get_item(default_data_frame):
     # get item for DataFrame data_type
     default_data_frame[1] = [100, 100]
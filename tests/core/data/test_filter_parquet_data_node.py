@@ -12,6 +12,7 @@
 import os
 import pathlib
 from importlib import util
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -19,6 +20,7 @@ import pytest
 from pandas.testing import assert_frame_equal
 
 from taipy.common.config.common.scope import Scope
+from taipy.core.data._filter import _FilterDataNode
 from taipy.core.data.operator import JoinOperator, Operator
 from taipy.core.data.parquet import ParquetDataNode
 
@@ -137,3 +139,68 @@ class TestFilterParquetDataNode:
             np.array([[1, 1], [1, 2], [2, 1], [2, 2]]),
         )
         assert np.array_equal(dn[(dn[:, 1] == 1) | (dn[:, 1] == 2)], np.array([[1, 1], [1, 2], [2, 1], [2, 2]]))
+
+    def test_filter_is_pushed_down_with_pyarrow_engine(self, parquet_file_path):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path, "exposed_type": "pandas"})
+        dn._write_with_kwargs(pd.DataFrame({"foo": [1, 1, 1, 2, None], "bar": [1, 2, None, 2, 2]}), row_group_size=2)
+
+        with mock.patch.object(ParquetDataNode, "_read") as mck_read:
+            with mock.patch("pandas.read_parquet", wraps=pd.read_parquet) as mck_read_parquet:
+                filtered_data = dn.filter(("foo", 1, Operator.NOT_EQUAL))
+                assert "filters" in mck_read_parquet.call_args.kwargs
+            mck_read.assert_not_called()
+        # Missing values are kept as they are different from 1, like in pandas
+        assert_frame_equal(filtered_data, pd.DataFrame({"foo": [2.0, None], "bar": [2.0, 2.0]}, index=[3, 4]))
+
+        filtered_data = dn.filter([("foo", 1, Operator.EQUAL), ("bar", 2, Operator.GREATER_OR_EQUAL)])
+        assert_frame_equal(filtered_data, pd.DataFrame({"foo": [1.0], "bar": [2.0]}, index=[1]))
+
+        filtered_data = dn.filter([("foo", 2, Operator.EQUAL), ("bar", 1, Operator.LESS_THAN)], JoinOperator.OR)
+        assert_frame_equal(filtered_data, pd.DataFrame({"foo": [2.0], "bar": [2.0]}, index=[3]))
+
+    def test_pushed_down_filter_keeps_the_index_of_the_in_memory_filter(self, parquet_file_path):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path, "exposed_type": "pandas"})
+        operators = [("foo", 1, Operator.EQUAL), ("bar", 3, Operator.GREATER_OR_EQUAL)]
+        for data in [
+            pd.DataFrame({"foo": [1, 2, 1, 1], "bar": [3, 4, 5, 1]}, index=pd.RangeIndex(10, 18, 2, name="id")),
+            pd.DataFrame({"foo": [1, 2, 1, 1], "bar": [3, 4, 5, 1]}, index=["a", "b", "c", "d"]),
+        ]:
+            dn._write_with_kwargs(data, row_group_size=2)
+            assert_frame_equal(dn.filter(operators), _FilterDataNode._filter(dn.read(), operators, JoinOperator.AND))
+
+        dn.properties["read_kwargs"] = {"filters": [("bar", ">", 1)]}
+        assert_frame_equal(dn.filter(operators), _FilterDataNode._filter(dn.read(), operators, JoinOperator.AND))
+
+    def test_filter_numpy_exposed_type_is_pushed_down_by_column_position(self, parquet_file_path):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path, "exposed_type": "numpy"})
+        dn.write(pd.DataFrame({"a": [1, 1, 2], "b": [1, 2, 3]}, index=[10, 11, 12]))
+
+        with mock.patch.object(ParquetDataNode, "_read") as mck_read:
+            assert np.array_equal(dn.filter((1, 2, Operator.GREATER_OR_EQUAL)), np.array([[1, 2], [2, 3]]))
+            mck_read.assert_not_called()
+
+    def test_filter_falls_back_to_in_memory_filtering(self, parquet_file_path):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path, "exposed_type": "pandas"})
+        dn.write(pd.DataFrame({"foo": ["a", "b"], "bar": [1, 2]}))
+
+        # Arrow cannot compare a string column with an integer, pandas can.
+        assert dn.filter(("foo", 1, Operator.EQUAL)).empty
+        assert_frame_equal(
+            dn.filter(("foo", None, Operator.NOT_EQUAL)).reset_index(drop=True),
+            pd.DataFrame({"foo": ["a", "b"], "bar": [1, 2]}),
+        )
+
+    def test_filter_on_partition_columns_only_reads_matching_partitions(self, tmpdir_factory):
+        temp_dir_path = pathlib.Path(tmpdir_factory.mktemp("data").join("temp_dir"))
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": str(temp_dir_path), "partition_cols": ["day"]})
+        dn.write(pd.DataFrame({"day": ["d1", "d1", "d2"], "value": [1, 2, 3]}))
+        dn.append(pd.DataFrame({"day": ["d3"], "value": [4]}))
+
+        # The files of the other partitions are not valid Parquet files anymore, so they must not be read
+        for path in [*temp_dir_path.glob("day=d2/*"), *temp_dir_path.glob("day=d3/*")]:
+            path.write_bytes(b"corrupted")
+
+        filtered_data = dn.filter(("day", "d1", Operator.EQUAL))
+        assert filtered_data["value"].tolist() == [1, 2]
+        chunks = list(dn.read_chunks(chunksize=1, operators=[("day", "d1", Operator.EQUAL)]))
+        assert [chunk["value"].tolist() for chunk in chunks] == [[1], [2]]
@@ -16,6 +16,7 @@ import pathlib
 import uuid
 from dataclasses import dataclass
 from enum import Enum
+from importlib import util
 from time import sleep
 
 import freezegun
@@ -31,7 +32,7 @@ from taipy.core.data._data_manager_factory import _DataManagerFactory
 from taipy.core.data.data_node_id import DataNodeId
 from taipy.core.data.json import JSONDataNode
 from taipy.core.data.operator import JoinOperator, Operator
-from taipy.core.exceptions.exceptions import NoData
+from taipy.core.exceptions.exceptions import NoData, UnknownCompressionAlgorithm, UnknownJSONFormat
 from taipy.core.reason import NoFileToDownload, NotAFile
 
 
@@ -327,6 +328,98 @@ class TestJSONDataNode:
         assert json_dn[2] == {"foo": 1}
         assert json_dn[:2] == [{"foo": 1, "bar": 1}, {"foo": 1, "bar": 2}]
 
+    def test_invalid_format(self):
+        with pytest.raises(UnknownJSONFormat):
+            JSONDataNode("foo", Scope.SCENARIO, properties={"format": "ndjson"})
+
+    def test_json_lines_generated_path(self):
+        dn = JSONDataNode("foo", Scope.SCENARIO, DataNodeId(f"dn_id_{uuid.uuid4()}"), properties={"format": "jsonl"})
+        assert dn.path == os.path.join(Config.core.storage_folder.strip("/"), "jsons", dn.id + ".jsonl")
+        assert dn._get_user_properties() == {}
+
+    def test_read_write_append_json_lines(self, tmp_path):
+        path = str(tmp_path / "data.jsonl")
+        dn = JSONDataNode("foo", Scope.SCENARIO, properties={"default_path": path, "format": "jsonl"})
+
+        dn.write([{"a": 1}, {"a": 2, "date": datetime.datetime(2024, 1, 1)}])
+        assert dn.read() == [{"a": 1}, {"a": 2, "date": datetime.datetime(2024, 1, 1)}]
+
+        dn.append({"a": 3})
+        dn.append([{"a": 4}, {"a": 5}])
+        assert [row["a"] for row in dn.read()] == [1, 2, 3, 4, 5]
+        with open(path) as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 5
+        assert json.loads(lines[-1]) == {"a": 5}
+
+        dn.write({"b": MyEnum.A})
+        assert dn.read() == [{"b": MyEnum.A}]
+
+    def test_append_json_lines_does_not_read_the_file(self, tmp_path):
+        path = str(tmp_path / "data.jsonl")
+        with open(path, "w") as f:
+            f.write('{"a": 1}\nnot json\n')
+        dn = JSONDataNode("foo", Scope.SCENARIO, properties={"default_path": path, "format": "jsonl"})
+
+        dn.append({"a": 2})
+        with open(path) as f:
+            assert f.read().splitlines() == ['{"a": 1}', "not json", '{"a": 2}']
+
+    def test_read_chunks_and_filter_json_lines(self, tmp_path):
+        path = str(tmp_path / "data.jsonl")
+        dn = JSONDataNode("foo", Scope.SCENARIO, properties={"default_path": path, "format": "jsonl"})
+        dn.write_chunks([[{"foo": i, "bar": i % 2} for i in range(3)], [{"foo": 3, "bar": 1}, {"bar": 0}]])
+
+        assert [len(chunk) for chunk in dn.read_chunks(chunksize=2)] == [2, 2, 1]
+        assert list(dn.read_chunks(chunksize=2, columns=["foo"])) == [
+            [{"foo": 0}, {"foo": 1}],
+            [{"foo": 2}, {"foo": 3}],
+            [{}],
+        ]
+        assert list(dn.read_chunks(chunksize=2, columns=["foo"], operators=("bar", 1, Operator.EQUAL))) == [
+            [{"foo": 1}],
+            [{"foo": 3}],
+        ]
+
+        assert dn.filter(("bar", 1, Operator.EQUAL)) == [{"foo": 1, "bar": 1}, {"foo": 3, "bar": 1}]
+        assert dn.filter([("foo", 0, Operator.EQUAL), ("foo", None, Operator.EQUAL)], JoinOperator.OR) == [
+            {"foo": 0, "bar": 0},
+            {"bar": 0},
+        ]
+        assert dn.filter(("foo", 10, Operator.GREATER_THAN)) == []
+
+    @pytest.mark.parametrize(
+        "compression",
+        [
+            "gzip",
+            pytest.param("lz4", marks=pytest.mark.skipif(not util.find_spec("lz4"), reason="lz4 is not installed")),
+            pytest.param(
+                "zstd", marks=pytest.mark.skipif(not util.find_spec("zstandard"), reason="zstandard is not installed")
+            ),
+        ],
+    )
+    @pytest.mark.parametrize("json_format", ["json", "jsonl"])
+    def test_read_write_append_compressed(self, compression, json_format, tmp_path):
+        path = str(tmp_path / "data.json")
+        dn = JSONDataNode(
+            "foo",
+            Scope.SCENARIO,
+            properties={"path": path, "format": json_format, "compression": compression, "compression_level": 1},
+        )
+        rows = [{"a": i, "date": datetime.datetime(2024, 1, 1)} for i in range(1000)]
+        dn.write(rows)
+        assert dn.read() == rows
+        assert os.path.getsize(path) < len(json.dumps(rows, default=str)) / 5
+
+        dn.append([{"a": 1000}])
+        assert dn.read() == [*rows, {"a": 1000}]
+        if json_format == "jsonl":
+            assert list(dn.read_chunks(chunksize=600)) == [rows[:600], [*rows[600:], {"a": 1000}]]
+
+    def test_invalid_compression(self):
+        with pytest.raises(UnknownCompressionAlgorithm):
+            JSONDataNode("foo", Scope.SCENARIO, properties={"compression": "bz2"})
+
     @pytest.mark.parametrize(
         ["properties", "exists"],
         [
@@ -371,3 +371,125 @@ class TestMongoCollectionDataNode:
             mongo_dn.filter([("bar", 1, Operator.EQUAL), ("bar", 2, Operator.EQUAL)], JoinOperator.OR)
 
             assert read_mock["_read"].call_count == 0
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_getitem_projects_selected_fields(self, properties):
+        mock_client = pymongo.MongoClient("localhost")
+        mock_client[properties["db_name"]][properties["collection_name"]].insert_many(
+            [{"foo": 1, "bar": 1}, {"foo": 2}, {"bar": 2}]
+        )
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties=properties)
+
+        with patch.object(MongoCollectionDataNode, "_read") as read_mock:
+            assert mongo_dn["foo"] == [1, 2, None]
+            assert mongo_dn[["foo", "bar"]] == [{"foo": 1, "bar": 1}, {"foo": 2}, {"bar": 2}]
+            assert read_mock.call_count == 0
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_read_columns(self, properties):
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties=properties)
+        mongo_dn.write([{"foo": 1, "bar": 1}, {"foo": 2}])
+
+        data = mongo_dn.read(columns=["foo"])
+        assert [document.__dict__ for document in data] == [{"foo": 1}, {"foo": 2}]
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_read_and_write_chunks(self, properties):
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties=properties)
+        mongo_dn.write_chunks([[{"foo": 1, "bar": 1}, {"foo": 2}], [{"foo": 3, "bar": 3}]])
+        assert [document.foo for document in mongo_dn.read()] == [1, 2, 3]
+
+        chunks = list(mongo_dn.read_chunks(chunksize=2, columns=["foo"]))
+        assert [[document.__dict__ for document in chunk] for chunk in chunks] == [
+            [{"foo": 1}, {"foo": 2}],
+            [{"foo": 3}],
+        ]
+
+        chunks = list(mongo_dn.read_chunks(chunksize=2, columns=["bar"], operators=("foo", 1, Operator.GREATER_THAN)))
+        assert [[document.__dict__ for document in chunk] for chunk in chunks] == [[{}, {"bar": 3}]]
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_write_in_batches(self, properties):
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties={**properties, "batch_size": 2})
+        with patch.object(mongo_dn.collection, "insert_many", wraps=mongo_dn.collection.insert_many) as insert_many:
+            mongo_dn.write([{"foo": i} for i in range(5)])
+        assert [len(call.args[0]) for call in insert_many.call_args_list] == [2, 2, 1]
+        assert all(call.kwargs["ordered"] is False for call in insert_many.call_args_list)
+        assert [document.foo for document in mongo_dn.read()] == [0, 1, 2, 3, 4]
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_write_and_append_upsert_on_id_field(self, properties):
+        mongo_dn = MongoCollectionDataNode(
+            "foo", Scope.SCENARIO, properties={**properties, "id_field": "key", "batch_size": 2}
+        )
+        mongo_dn.write([{"key": 1, "foo": "a"}, {"key": 2, "foo": "b"}, {"key": 3, "foo": "c"}])
+        object_ids = {document.key: document._id for document in mongo_dn.read()}
+
+        with patch.object(mongo_dn.collection, "drop") as drop:
+            mongo_dn.write([{"key": 2, "foo": "B"}, {"key": 3, "foo": "c"}, {"key": 4, "foo": "d"}, {"foo": "e"}])
+        drop.assert_not_called()
+        documents = {getattr(document, "key", None): document for document in mongo_dn.read()}
+        assert {key: document.foo for key, document in documents.items()} == {2: "B", 3: "c", 4: "d", None: "e"}
+        # The documents that are written again keep their identity.
+        assert documents[2]._id == object_ids[2]
+        assert documents[3]._id == object_ids[3]
+
+        mongo_dn.append([{"key": 4, "foo": "D"}, {"key": 5, "foo": "f"}])
+        assert sorted(document.foo for document in mongo_dn.read()) == ["B", "D", "c", "e", "f"]
+
+        index = mongo_dn.collection.index_information()["key_1"]
+        assert index["unique"]
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_write_on_id_field_without_batch_size(self, properties):
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties={**properties, "id_field": "key"})
+        mongo_dn.write([{"key": 1, "foo": "a"}, {"key": 2, "foo": "b"}])
+        assert sorted(document.foo for document in mongo_dn.read()) == ["a", "b"]
+
+        with patch.object(mongo_dn.collection, "delete_many", wraps=mongo_dn.collection.delete_many) as delete_many:
+            mongo_dn.write([{"key": 2, "foo": "B"}, {"key": 3, "foo": "c"}])
+            delete_many.assert_called_once_with({"key": {"$nin": [2, 3]}})
+        assert sorted(document.foo for document in mongo_dn.read()) == ["B", "c"]
+
+        mongo_dn.write([{"foo": "d"}])
+        assert [document.foo for document in mongo_dn.read()] == ["d"]
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_create_indexes(self, properties):
+        indexes = ["foo", [("bar", pymongo.DESCENDING), ("foo", pymongo.ASCENDING)], {"keys": "baz", "unique": True}]
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties={**properties, "indexes": indexes})
+        mongo_dn.write([{"foo": 1, "bar": 1, "baz": 1}])
+        mongo_dn.write([{"foo": 1, "bar": 1, "baz": 1}])
+
+        index_information = mongo_dn.collection.index_information()
+        assert list(index_information["foo_1"]["key"]) == [("foo", 1)]
+        assert list(index_information["bar_-1_foo_1"]["key"]) == [("bar", -1), ("foo", 1)]
+        assert index_information["baz_1"]["unique"]
+
+        with pytest.raises(pymongo.errors.BulkWriteError):
+            mongo_dn.append([{"baz": 1}])
+
+        mongo_dn.write([])
+        assert "baz_1" in mongo_dn.collection.index_information()
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_read_with_projection_and_batch_size(self, properties):
+        mongo_dn = MongoCollectionDataNode(
+            "foo", Scope.SCENARIO, properties={**properties, "projection": ["foo"], "batch_size": 10}
+        )
+        mongo_dn.write([{"foo": 1, "bar": 1}, {"foo": 2, "bar": 2}])
+
+        with patch.object(mongo_dn.collection, "find", wraps=mongo_dn.collection.find) as find:
+            assert [document.__dict__ for document in mongo_dn.read()] == [{"foo": 1}, {"foo": 2}]
+        assert find.call_args.kwargs["batch_size"] == 10
+
+        assert [document.__dict__ for document in mongo_dn.filter(("bar", 2, Operator.EQUAL))] == [{"foo": 2}]
+        assert [document.__dict__ for document in mongo_dn.read(columns=["bar"])] == [{"bar": 1}, {"bar": 2}]
@@ -0,0 +1,126 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+import os
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data.npy import NpyDataNode
+from taipy.core.exceptions.exceptions import InvalidMmapMode
+
+
+class TestNpyDataNode:
+    def test_create(self):
+        npy_dn_config = Config.configure_npy_data_node(id="foo_bar", default_path="data/node/path.npy")
+        dn = _DataManagerFactory._build_manager()._create_and_set(npy_dn_config, None, None)
+        assert isinstance(dn, NpyDataNode)
+        assert dn.storage_type() == "npy"
+        assert dn.config_id == "foo_bar"
+        assert dn.path == "data/node/path.npy"
+        assert dn.properties["mmap_mode"] == ("r" if os.name != "nt" else None)
+        assert not dn.is_ready_for_reading
+        assert dn._get_user_properties() == {}
+
+    def test_generated_path_has_npy_extension(self):
+        dn = NpyDataNode("foo", Scope.SCENARIO, properties={"default_data": np.arange(3)})
+        assert dn.path.endswith(".npy")
+        assert dn.is_ready_for_reading
+        os.remove(dn.path)
+
+    def test_invalid_mmap_mode(self):
+        with pytest.raises(InvalidMmapMode):
+            NpyDataNode("foo", Scope.SCENARIO, properties={"mmap_mode": "w+"})
+
+    def test_read_is_memory_mapped(self, tmp_path):
+        path = str(tmp_path / "array.npy")
+        np.save(path, np.arange(12).reshape(4, 3))
+
+        dn = NpyDataNode("foo", Scope.SCENARIO, properties={"path": path, "mmap_mode": "r"})
+        data = dn.read()
+        assert isinstance(data, np.memmap)
+        np.testing.assert_array_equal(data, np.arange(12).reshape(4, 3))
+        with pytest.raises(ValueError):
+            data[0, 0] = 42
+
+        dn_copy_on_write = NpyDataNode("bar", Scope.SCENARIO, properties={"path": path, "mmap_mode": "c"})
+        data = dn_copy_on_write.read()
+        data[0, 0] = 42
+        assert np.load(path)[0, 0] == 0
+
+        dn_in_memory = NpyDataNode("baz", Scope.SCENARIO, properties={"path": path, "mmap_mode": None})
+        assert not isinstance(dn_in_memory.read(), np.memmap)
+
+    def test_write(self, tmp_path):
+        path = str(tmp_path / "array.npy")
+        dn = NpyDataNode("foo", Scope.SCENARIO, properties={"path": path})
+
+        dn.write(np.ones((2, 2)))
+        np.testing.assert_array_equal(dn.read(), np.ones((2, 2)))
+
+        dn.write(pd.DataFrame({"a": [1, 2], "b": [3, 4]}))
+        np.testing.assert_array_equal(dn.read(), np.array([[1, 3], [2, 4]]))
+
+        dn.write([1.5, 2.5])
+        np.testing.assert_array_equal(dn.read(), np.array([1.5, 2.5]))
+        assert os.listdir(tmp_path) == ["array.npy"]
+
+    def test_write_keeps_previous_read_valid(self, tmp_path):
+        path = str(tmp_path / "array.npy")
+        dn = NpyDataNode("foo", Scope.SCENARIO, properties={"path": path})
+        dn.write(np.arange(5))
+        previous = dn.read()
+
+        dn.write(np.zeros(10))
+        np.testing.assert_array_equal(previous, np.arange(5))
+        np.testing.assert_array_equal(dn.read(), np.zeros(10))
+
+    def test_write_object_array_fails(self, tmp_path):
+        path = str(tmp_path / "array.npy")
+        dn = NpyDataNode("foo", Scope.SCENARIO, properties={"path": path})
+        with pytest.raises(ValueError):
+            dn.write(np.array([{"a": 1}], dtype=object))
+        assert not os.path.exists(path)
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.skipif(not os.path.exists("/proc/self/maps"), reason="The memory maps cannot be listed")
+    def test_append_releases_the_memory_maps_before_replacing_the_file(self, tmp_path):
+        path = str(tmp_path / "array.npy")
+        dn = NpyDataNode("foo", Scope.SCENARIO, properties={"path": path, "mmap_mode": "r"})
+        dn.write(np.arange(3))
+        os_replace = os.replace
+
+        def replace(src, dst):
+            with open("/proc/self/maps") as maps:
+                assert str(tmp_path) not in maps.read()
+            os_replace(src, dst)
+
+        with mock.patch("os.replace", side_effect=replace) as mck_replace:
+            dn.append(np.arange(3, 5))
+            assert mck_replace.call_count == 1
+        np.testing.assert_array_equal(dn.read(), np.arange(5))
+
+    def test_append(self, tmp_path):
+        path = str(tmp_path / "array.npy")
+        dn = NpyDataNode("foo", Scope.SCENARIO, properties={"path": path})
+
+        dn.append(np.array([[1, 2], [3, 4]]))
+        np.testing.assert_array_equal(dn.read(), np.array([[1, 2], [3, 4]]))
+
+        dn.append(np.array([5, 6]))
+        dn.append([[7.0, 8.0]])
+        data = dn.read()
+        assert data.dtype == np.dtype(int)
+        np.testing.assert_array_equal(data, np.array([[1, 2], [3, 4], [5, 6], [7, 8]]))
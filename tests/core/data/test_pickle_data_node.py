@@ -13,9 +13,11 @@ import os
 import pathlib
 import pickle
 from datetime import datetime, timedelta
+from importlib import util
 from time import sleep
 
 import freezegun
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
@@ -26,7 +28,7 @@ from taipy.common.config.exceptions.exceptions import InvalidConfigurationId
 from taipy.core.data._data_manager import _DataManager
 from taipy.core.data._data_manager_factory import _DataManagerFactory
 from taipy.core.data.pickle import PickleDataNode
-from taipy.core.exceptions.exceptions import NoData
+from taipy.core.exceptions.exceptions import NoData, UnknownCompressionAlgorithm
 from taipy.core.reason import NoFileToDownload, NotAFile
 
 
@@ -135,6 +137,75 @@ class TestPickleDataNodeEntity:
         assert isinstance(pickle_dict.read(), dict)
         assert pickle_dict.read() == {"bar": 12, "baz": "qux", "quux": [13]}
 
+    @pytest.mark.parametrize(
+        "compression",
+        [
+            None,
+            "gzip",
+            pytest.param("lz4", marks=pytest.mark.skipif(not util.find_spec("lz4"), reason="lz4 is not installed")),
+            pytest.param(
+                "zstd", marks=pytest.mark.skipif(not util.find_spec("zstandard"), reason="zstandard is not installed")
+            ),
+        ],
+    )
+    def test_read_and_write_compressed(self, compression, tmp_path):
+        path = str(tmp_path / "data.p")
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties={"path": path, "compression": compression})
+        array = np.repeat(np.arange(100, dtype=np.float64), 1000)
+        df = pd.DataFrame({"a": np.arange(1000), "b": ["x"] * 1000})
+        dn.write({"array": array, "df": df, "text": "bar"})
+
+        data = dn.read()
+        np.testing.assert_array_equal(data["array"], array)
+        assert_frame_equal(data["df"], df)
+        assert data["text"] == "bar"
+        data["array"][0] = 42.0  # The arrays loaded from out-of-band buffers are writable.
+        if compression:
+            assert os.path.getsize(path) < array.nbytes / 2
+
+        dn.write("baz")
+        assert dn.read() == "baz"
+
+    def test_compression_level(self, tmp_path):
+        data = list(range(100_000))
+        sizes = []
+        for level in [1, 9]:
+            path = str(tmp_path / f"data_{level}.p")
+            dn = PickleDataNode(
+                "foo", Scope.SCENARIO, properties={"path": path, "compression": "gzip", "compression_level": level}
+            )
+            dn.write(data)
+            assert dn.read() == data
+            sizes.append(os.path.getsize(path))
+        assert sizes[1] < sizes[0]
+
+    def test_read_plain_pickle_file(self, tmp_path):
+        path = str(tmp_path / "data.p")
+        with open(path, "wb") as f:
+            pickle.dump({"foo": np.arange(3)}, f)
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties={"path": path})
+        np.testing.assert_array_equal(dn.read()["foo"], np.arange(3))
+
+    def test_write_plain_pickle_file_by_default(self, tmp_path):
+        path = str(tmp_path / "data.p")
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties={"path": path})
+        dn.write({"foo": np.arange(3)})
+        with open(path, "rb") as f:
+            np.testing.assert_array_equal(pickle.load(f)["foo"], np.arange(3))
+
+    def test_write_out_of_band_buffers(self, tmp_path):
+        path = str(tmp_path / "data.p")
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties={"path": path, "out_of_band": True})
+        dn.write({"foo": np.arange(3)})
+        with open(path, "rb") as f:
+            with pytest.raises(pickle.UnpicklingError):
+                pickle.load(f)
+        np.testing.assert_array_equal(dn.read()["foo"], np.arange(3))
+
+    def test_invalid_compression(self):
+        with pytest.raises(UnknownCompressionAlgorithm):
+            PickleDataNode("foo", Scope.SCENARIO, properties={"compression": "bz2"})
+
     def test_path_overrides_default_path(self):
         dn = PickleDataNode(
             "foo",
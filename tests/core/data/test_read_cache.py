@@ -0,0 +1,133 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
+from taipy.core.data._data_manager import _DataManager
+from taipy.core.data._read_cache import _ReadCache
+from taipy.core.data.csv import CSVDataNode
+from taipy.core.data.pickle import PickleDataNode
+
+
+@pytest.fixture(autouse=True)
+def clear_read_cache():
+    _ReadCache._clear()
+    yield
+    _ReadCache._clear()
+
+
+def create_csv_data_node(tmpdir_factory, **properties):
+    path = str(tmpdir_factory.mktemp("data").join("data.csv"))
+    dn_config = Config.configure_csv_data_node("csv", path=path, scope=Scope.GLOBAL, **properties)
+    dn = _DataManager._bulk_get_or_create([dn_config])[dn_config]
+    dn.write(pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}))
+    return dn
+
+
+def test_read_is_not_cached_by_default(tmpdir_factory):
+    Config.configure_core(read_cache_budget=10_000)
+    dn = create_csv_data_node(tmpdir_factory)
+
+    with mock.patch.object(CSVDataNode, "_read", autospec=True, side_effect=CSVDataNode._read) as mck_read:
+        dn.read()
+        dn.read()
+        assert mck_read.call_count == 2
+
+
+def test_read_is_not_cached_without_budget(tmpdir_factory):
+    dn = create_csv_data_node(tmpdir_factory, read_cache=True)
+
+    with mock.patch.object(CSVDataNode, "_read", autospec=True, side_effect=CSVDataNode._read) as mck_read:
+        dn.read()
+        dn.read()
+        assert mck_read.call_count == 2
+
+
+def test_read_is_cached_until_next_write(tmpdir_factory):
+    Config.configure_core(read_cache_budget=10_000)
+    dn = create_csv_data_node(tmpdir_factory, read_cache=True)
+
+    with mock.patch.object(CSVDataNode, "_read", autospec=True, side_effect=CSVDataNode._read) as mck_read:
+        data = dn.read()
+        data["a"] = 0  # The cached data is not modified by the caller
+        pd.testing.assert_frame_equal(dn.read(), pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}))
+        assert mck_read.call_count == 1
+
+        dn.write(pd.DataFrame({"a": [7]}))
+        pd.testing.assert_frame_equal(dn.read(), pd.DataFrame({"a": [7]}))
+        assert mck_read.call_count == 2
+
+
+def test_read_columns_are_cached_separately(tmpdir_factory):
+    Config.configure_core(read_cache_budget=10_000)
+    dn = create_csv_data_node(tmpdir_factory, read_cache=True)
+
+    with mock.patch.object(CSVDataNode, "_read_columns", autospec=True, side_effect=CSVDataNode._read_columns) as mck:
+        pd.testing.assert_frame_equal(dn.read(columns=["b"]), pd.DataFrame({"b": [4, 5, 6]}))
+        pd.testing.assert_frame_equal(dn.read(columns=["b"]), pd.DataFrame({"b": [4, 5, 6]}))
+        pd.testing.assert_frame_equal(dn.read(columns=["a"]), pd.DataFrame({"a": [1, 2, 3]}))
+        assert mck.call_count == 2
+    pd.testing.assert_frame_equal(dn.read(), pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}))
+
+
+def test_view_mode_returns_read_only_arrays():
+    Config.configure_core(read_cache_budget=10_000, read_cache_mode="view")
+    dn_config = Config.configure_pickle_data_node("array", scope=Scope.GLOBAL, read_cache=True)
+    dn = _DataManager._bulk_get_or_create([dn_config])[dn_config]
+    dn.write(np.arange(10))
+
+    data = dn.read()
+    assert not data.flags.writeable
+    with pytest.raises(ValueError):
+        data[0] = 1
+
+    dn.properties["read_cache_mode"] = "copy"
+    data = dn.read()
+    data[0] = 1
+    np.testing.assert_array_equal(dn.read(), np.arange(10))
+
+
+def test_least_recently_used_data_is_evicted_first():
+    Config.configure_core(read_cache_budget=2000)
+    dn_configs = [Config.configure_pickle_data_node(f"dn_{i}", scope=Scope.GLOBAL, read_cache=True) for i in range(3)]
+    dns = _DataManager._bulk_get_or_create(dn_configs)
+    dn_1, dn_2, dn_3 = (dns[dn_config] for dn_config in dn_configs)
+    for dn in [dn_1, dn_2, dn_3]:
+        dn.write(np.zeros(100, dtype=np.int64))  # 800 bytes
+
+    with mock.patch.object(PickleDataNode, "_read", autospec=True, side_effect=PickleDataNode._read) as mck_read:
+        dn_1.read()
+        dn_2.read()
+        dn_1.read()  # dn_1 becomes the most recently used
+        dn_3.read()  # dn_2 is evicted
+        assert [call.args[0].id for call in mck_read.call_args_list] == [dn_1.id, dn_2.id, dn_3.id]
+
+        dn_1.read()
+        dn_2.read()
+        assert [call.args[0].id for call in mck_read.call_args_list] == [dn_1.id, dn_2.id, dn_3.id, dn_2.id]
+
+
+def test_unsupported_data_is_not_cached():
+    Config.configure_core(read_cache_budget=10_000)
+    dn_config = Config.configure_pickle_data_node("list", scope=Scope.GLOBAL, read_cache=True)
+    dn = _DataManager._bulk_get_or_create([dn_config])[dn_config]
+    dn.write([1, 2, 3])
+
+    with mock.patch.object(PickleDataNode, "_read", autospec=True, side_effect=PickleDataNode._read) as mck_read:
+        assert dn.read() == [1, 2, 3]
+        assert dn.read() == [1, 2, 3]
+        assert mck_read.call_count == 2
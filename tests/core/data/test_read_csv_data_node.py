@@ -12,13 +12,17 @@
 import dataclasses
 import os
 import pathlib
+from importlib import util
+from unittest import mock
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from taipy.common.config.common.scope import Scope
 from taipy.core.data.csv import CSVDataNode
+from taipy.core.data.operator import Operator
 from taipy.core.exceptions.exceptions import NoData
 
 csv_file_path = os.path.join(pathlib.Path(__file__).parent.resolve(), "data_sample/example.csv")
@@ -114,3 +118,86 @@ def test_read_without_header_custom_exposed_type():
         assert row_pandas[0] == row_custom.id
         assert str(row_pandas[1]) == row_custom.integer
         assert row_pandas[2] == row_custom.text
+
+
+def test_read_arrow():
+    dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path, "exposed_type": "arrow"})
+    data = dn.read()
+    assert isinstance(data, pa.Table)
+    assert data.equals(pa.Table.from_pandas(pd.read_csv(csv_file_path)))
+    assert dn.read(columns=["text", "id"]).equals(pa.Table.from_pandas(pd.read_csv(csv_file_path)[["text", "id"]]))
+    assert dn.filter(("integer", 500, Operator.GREATER_THAN)).column("id").to_pylist() == (
+        pd.read_csv(csv_file_path).query("integer > 500")["id"].tolist()
+    )
+
+    dn = CSVDataNode(
+        "bar", Scope.SCENARIO, properties={"path": csv_file_path, "has_header": False, "exposed_type": "arrow"}
+    )
+    assert dn.read().column_names == ["0", "1", "2"]
+    assert dn.read().num_rows == 11
+    assert dn.read(columns=[2, 0]).column_names == ["2", "0"]
+
+
+@pytest.mark.skipif(not util.find_spec("polars"), reason="The polars exposed type requires polars to be installed")
+def test_read_polars():
+    import polars as pl
+
+    dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path, "exposed_type": "polars"})
+    data = dn.read()
+    assert isinstance(data, pl.DataFrame)
+    assert data.to_pandas().equals(pd.read_csv(csv_file_path))
+    assert dn.filter(("integer", 500, Operator.GREATER_THAN))["id"].to_list() == (
+        pd.read_csv(csv_file_path).query("integer > 500")["id"].tolist()
+    )
+
+
+def test_read_columns():
+    dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path})
+    with mock.patch("pandas.read_csv", wraps=pd.read_csv) as mck_read_csv:
+        data_pandas = dn.read(columns=["text", "id"])
+        assert mck_read_csv.call_args.kwargs["usecols"] == ["text", "id"]
+    assert pd.DataFrame.equals(data_pandas, pd.read_csv(csv_file_path)[["text", "id"]])
+
+    dn.properties["exposed_type"] = "numpy"
+    assert np.array_equal(dn.read(columns=[2, 0]), pd.read_csv(csv_file_path)[["text", "id"]].to_numpy())
+
+    dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path, "exposed_type": MyCustomObject})
+    assert dn.read(columns=["id"])[0] == {"id": "Ibelfu5"}
+
+
+def test_read_columns_without_header():
+    dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path, "has_header": False})
+    assert pd.DataFrame.equals(dn.read(columns=[2, 0]), pd.read_csv(csv_file_path, header=None)[[2, 0]])
+
+
+def test_read_chunks():
+    df = pd.read_csv(csv_file_path)
+    dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path})
+    with mock.patch("pandas.read_csv", wraps=pd.read_csv) as mck_read_csv:
+        chunks = list(dn.read_chunks(chunksize=4, columns=["text", "id"]))
+        assert mck_read_csv.call_args.kwargs["chunksize"] == 4
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert pd.concat(chunks).equals(df[["text", "id"]])
+
+    chunks = list(dn.read_chunks(chunksize=4, columns=["id"], operators=[("integer", 500, Operator.GREATER_THAN)]))
+    assert pd.concat(chunks).equals(df[df["integer"] > 500][["id"]])
+
+    dn.properties["exposed_type"] = "numpy"
+    chunks = list(dn.read_chunks(chunksize=4, operators=(1, 500, Operator.GREATER_THAN)))
+    assert all(isinstance(chunk, np.ndarray) for chunk in chunks)
+    assert np.array_equal(np.concatenate(chunks), df[df["integer"] > 500].to_numpy())
+
+    dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path, "exposed_type": MyCustomObject})
+    chunks = list(dn.read_chunks(chunksize=6))
+    assert [len(chunk) for chunk in chunks] == [6, 4]
+    assert all(isinstance(row, MyCustomObject) for chunk in chunks for row in chunk)
+
+
+def test_read_chunks_raises_errors():
+    dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": "WRONG.csv"})
+    with pytest.raises(NoData):
+        dn.read_chunks()
+
+    dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path})
+    with pytest.raises(ValueError):
+        dn.read_chunks(chunksize=0)
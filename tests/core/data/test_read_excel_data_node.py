@@ -11,14 +11,18 @@
 
 import os
 import pathlib
+from importlib import util
 from typing import Dict
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
 import pytest
 
 from taipy.common.config.common.scope import Scope
+from taipy.core.data._lazy_sheets import _LazySheets
 from taipy.core.data.excel import ExcelDataNode
+from taipy.core.data.operator import Operator
 from taipy.core.exceptions.exceptions import (
     ExposedTypeLengthMismatch,
     NoData,
@@ -164,6 +168,16 @@ def test_read_with_header_numpy():
     assert np.array_equal(data_numpy, pd.read_excel(excel_file_path).to_numpy())
 
 
+def test_read_columns():
+    dn = ExcelDataNode("bar", Scope.SCENARIO, properties={"path": excel_file_path, "sheet_name": "Sheet1"})
+    assert dn.read(columns=["text", "id"]).equals(pd.read_excel(excel_file_path)[["text", "id"]])
+
+    dn = ExcelDataNode("bar", Scope.SCENARIO, properties={"path": excel_file_path, "exposed_type": "numpy"})
+    data_numpy = dn.read(columns=[2, 0])
+    assert list(data_numpy.keys()) == sheet_names
+    assert np.array_equal(data_numpy["Sheet1"], pd.read_excel(excel_file_path)[["text", "id"]].to_numpy())
+
+
 def test_read_with_header_custom_exposed_type():
     excel_data_node_as_custom_object = ExcelDataNode(
         "bar",
@@ -734,3 +748,72 @@ def test_read_multi_sheet_without_header_multiple_custom_pandas_numpy_exposed_ty
     multi_data_custom_no_sheet_name = excel_dn_as_pandas_numpy.read()
     assert isinstance(multi_data_custom_no_sheet_name["Sheet1"], pd.DataFrame)
     assert isinstance(multi_data_custom_no_sheet_name["Sheet2"], np.ndarray)
+
+
+def test_read_sheet_names():
+    dn = ExcelDataNode("bar", Scope.SCENARIO, properties={"path": excel_file_path, "sheet_name": "Sheet1"})
+    data = dn.read(sheet_names=["Sheet2"])
+    assert list(data.keys()) == ["Sheet2"]
+    assert data["Sheet2"].equals(pd.read_excel(excel_file_path, sheet_name="Sheet2"))
+    data = dn.read(columns=["text"], sheet_names=["Sheet2"])
+    assert data["Sheet2"].equals(pd.read_excel(excel_file_path, sheet_name="Sheet2")[["text"]])
+
+    dn = ExcelDataNode("bar", Scope.SCENARIO, properties={"path": excel_file_path, "exposed_type": MyCustomObject})
+    data = dn.read(sheet_names=["Sheet2"])
+    assert list(data.keys()) == ["Sheet2"]
+    assert [row.text for row in data["Sheet2"]] == pd.read_excel(excel_file_path, sheet_name="Sheet2")["text"].tolist()
+
+    with pytest.raises(NonExistingExcelSheet):
+        dn.read(sheet_names=["abc"])
+
+
+def test_read_lazy_sheets():
+    dn = ExcelDataNode("bar", Scope.SCENARIO, properties={"path": excel_file_path, "lazy_sheets": True})
+
+    with patch.object(ExcelDataNode, "_do_read_excel", autospec=True, side_effect=ExcelDataNode._do_read_excel) as mck:
+        data = dn.read()
+        assert isinstance(data, _LazySheets)
+        assert list(data.keys()) == sheet_names
+        assert mck.call_count == 0
+
+        assert data["Sheet2"].equals(pd.read_excel(excel_file_path, sheet_name="Sheet2"))
+        assert mck.call_count == 1
+        assert mck.call_args.args[2] == ["Sheet2"]
+        assert not data._is_read("Sheet1")
+        data["Sheet2"]
+        assert mck.call_count == 1
+
+    assert dn.read(columns=["id"])["Sheet1"].equals(pd.read_excel(excel_file_path)[["id"]])
+    filtered_data = dn.filter(("integer", 100, Operator.GREATER_THAN))
+    assert {sheet_name: len(sheet) for sheet_name, sheet in filtered_data.items()} == {"Sheet1": 3, "Sheet2": 3}
+
+    with pytest.raises(NonExistingExcelSheet):
+        dn.read(sheet_names=["abc"])
+
+    # A single sheet is still read eagerly.
+    dn = ExcelDataNode(
+        "bar", Scope.SCENARIO, properties={"path": excel_file_path, "lazy_sheets": True, "sheet_name": "Sheet1"}
+    )
+    assert isinstance(dn.read(), pd.DataFrame)
+
+
+@pytest.mark.skipif(not util.find_spec("python_calamine"), reason="python-calamine is not installed")
+@pytest.mark.parametrize("has_header", [True, False])
+def test_read_with_calamine_engine(has_header):
+    properties = {"path": excel_file_path, "has_header": has_header}
+    openpyxl_dn = ExcelDataNode("bar", Scope.SCENARIO, properties=properties)
+    calamine_dn = ExcelDataNode("bar", Scope.SCENARIO, properties={**properties, "engine": "calamine"})
+
+    with patch("openpyxl.load_workbook") as mck:
+        calamine_data = calamine_dn.read()
+        mck.assert_not_called()
+    openpyxl_data = openpyxl_dn.read()
+    assert list(calamine_data.keys()) == sheet_names
+    for sheet_name in sheet_names:
+        pd.testing.assert_frame_equal(calamine_data[sheet_name], openpyxl_data[sheet_name])
+
+    properties["exposed_type"] = MyCustomObject
+    calamine_rows = ExcelDataNode("bar", Scope.SCENARIO, properties={**properties, "engine": "calamine"}).read()
+    openpyxl_rows = ExcelDataNode("bar", Scope.SCENARIO, properties=properties).read()
+    for sheet_name in sheet_names:
+        assert [vars(row) for row in calamine_rows[sheet_name]] == [vars(row) for row in openpyxl_rows[sheet_name]]
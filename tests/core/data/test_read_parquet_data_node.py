@@ -12,12 +12,15 @@
 import os
 import pathlib
 from importlib import util
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from taipy.common.config.common.scope import Scope
+from taipy.core.data.operator import Operator
 from taipy.core.data.parquet import ParquetDataNode
 from taipy.core.exceptions.exceptions import NoData
 
@@ -93,6 +96,55 @@ class TestReadParquetDataNode:
         assert len(data_numpy) == 2
         assert np.array_equal(data_numpy, df.to_numpy())
 
+    def test_read_columns(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]}, index=[10, 11])
+        dn = ParquetDataNode("bar", Scope.SCENARIO, properties={"path": temp_file_path, "read_kwargs": {}})
+        dn.write(df)
+
+        with patch("pandas.read_parquet", wraps=pd.read_parquet) as mck_read_parquet:
+            assert dn.read(columns=["c", "a"]).equals(df[["c", "a"]])
+            assert mck_read_parquet.call_args.kwargs["columns"] == ["c", "a"]
+        assert dn.properties["read_kwargs"] == {}
+
+        dn.properties["exposed_type"] = "numpy"
+        assert np.array_equal(dn.read(columns=[2, 0]), df[["c", "a"]].to_numpy())
+
+    def test_read_chunks(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        df = pd.DataFrame({"a": range(10), "b": range(10, 20), "c": [str(i) for i in range(10)]})
+        dn = ParquetDataNode("bar", Scope.SCENARIO, properties={"path": temp_file_path})
+        dn._write_with_kwargs(df, row_group_size=5)
+
+        with patch("pandas.read_parquet") as mck_read_parquet:
+            chunks = list(dn.read_chunks(chunksize=5, columns=["c", "a"]))
+            mck_read_parquet.assert_not_called()
+        assert [len(chunk) for chunk in chunks] == [5, 5]
+        assert pd.concat(chunks, ignore_index=True).equals(df[["c", "a"]])
+
+        chunks = list(dn.read_chunks(chunksize=5, columns=["c"], operators=("a", 7, Operator.GREATER_OR_EQUAL)))
+        assert pd.concat(chunks, ignore_index=True).equals(df[df["a"] >= 7][["c"]].reset_index(drop=True))
+
+        dn.properties["exposed_type"] = "numpy"
+        chunks = list(dn.read_chunks(chunksize=5, columns=[2, 0], operators=(1, 12, Operator.LESS_THAN)))
+        assert np.array_equal(np.concatenate(chunks), df[df["b"] < 12][["c", "a"]].to_numpy())
+
+    def test_read_arrow(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        df = pd.DataFrame({"a": range(10), "b": range(10, 20), "c": [str(i) for i in range(10)]})
+        dn = ParquetDataNode("bar", Scope.SCENARIO, properties={"path": temp_file_path, "exposed_type": "arrow"})
+        dn._write_with_kwargs(df, row_group_size=5)
+
+        with patch("pandas.read_parquet") as mck_read_parquet:
+            table = dn.read()
+            assert dn.read(columns=["c", "a"]).equals(table.select(["c", "a"]))
+            chunks = list(dn.read_chunks(chunksize=5, columns=["a"], operators=("a", 7, Operator.GREATER_OR_EQUAL)))
+            mck_read_parquet.assert_not_called()
+        assert isinstance(table, pa.Table)
+        assert table.column_names == ["a", "b", "c"]
+        assert table.to_pandas().equals(df)
+        assert pa.concat_tables(chunks).column("a").to_pylist() == [7, 8, 9]
+
     def test_read_custom_exposed_type(self):
         example_parquet_path = os.path.join(pathlib.Path(__file__).parent.resolve(), "data_sample/example.parquet")
 
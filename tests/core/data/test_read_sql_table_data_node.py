@@ -14,6 +14,7 @@ from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from taipy.common.config.common.scope import Scope
@@ -21,6 +22,11 @@ from taipy.core.data.operator import JoinOperator, Operator
 from taipy.core.data.sql_table import SQLTableDataNode
 
 
+def compile_query(query):
+    compiled = query.compile()
+    return " ".join(str(compiled).split()), compiled.params
+
+
 class MyCustomObject:
     def __init__(self, foo=None, bar=None, *args, **kwargs):
         self.foo = foo
@@ -170,19 +176,34 @@ class TestReadSQLTableDataNode:
             properties=custom_properties,
         )
 
-        assert sql_data_node._get_read_query(("key", 1, Operator.EQUAL)) == "SELECT * FROM example WHERE key = '1'"
-        assert sql_data_node._get_read_query(("key", 1, Operator.NOT_EQUAL)) == "SELECT * FROM example WHERE key <> '1'"
-        assert (
-            sql_data_node._get_read_query(("key", 1, Operator.GREATER_THAN)) == "SELECT * FROM example WHERE key > '1'"
+        assert compile_query(sql_data_node._get_read_query()) == ("SELECT * FROM example", {})
+        assert compile_query(sql_data_node._get_read_query(("key", 1, Operator.EQUAL))) == (
+            "SELECT * FROM example WHERE key = :key_1",
+            {"key_1": 1},
         )
-        assert (
-            sql_data_node._get_read_query(("key", 1, Operator.GREATER_OR_EQUAL))
-            == "SELECT * FROM example WHERE key >= '1'"
+        assert compile_query(sql_data_node._get_read_query(("key", 1, Operator.NOT_EQUAL))) == (
+            "SELECT * FROM example WHERE key != :key_1",
+            {"key_1": 1},
         )
-        assert sql_data_node._get_read_query(("key", 1, Operator.LESS_THAN)) == "SELECT * FROM example WHERE key < '1'"
-        assert (
-            sql_data_node._get_read_query(("key", 1, Operator.LESS_OR_EQUAL))
-            == "SELECT * FROM example WHERE key <= '1'"
+        assert compile_query(sql_data_node._get_read_query(("key", 1, Operator.GREATER_THAN))) == (
+            "SELECT * FROM example WHERE key > :key_1",
+            {"key_1": 1},
+        )
+        assert compile_query(sql_data_node._get_read_query(("key", 1, Operator.GREATER_OR_EQUAL))) == (
+            "SELECT * FROM example WHERE key >= :key_1",
+            {"key_1": 1},
+        )
+        assert compile_query(sql_data_node._get_read_query(("key", 1, Operator.LESS_THAN))) == (
+            "SELECT * FROM example WHERE key < :key_1",
+            {"key_1": 1},
+        )
+        assert compile_query(sql_data_node._get_read_query(("key", np.int64(1), Operator.LESS_OR_EQUAL))) == (
+            "SELECT * FROM example WHERE key <= :key_1",
+            {"key_1": 1},
+        )
+        assert compile_query(sql_data_node._get_read_query(("key", None, Operator.EQUAL))) == (
+            "SELECT * FROM example WHERE key IS NULL",
+            {},
         )
 
         with pytest.raises(NotImplementedError):
@@ -190,18 +211,107 @@ class TestReadSQLTableDataNode:
                 [("key", 1, Operator.EQUAL), ("key2", 2, Operator.GREATER_THAN)], "SOME JoinOperator"
             )
 
-        assert (
+        assert compile_query(
             sql_data_node._get_read_query(
                 [("key", 1, Operator.EQUAL), ("key2", 2, Operator.GREATER_THAN)], JoinOperator.AND
             )
-            == "SELECT * FROM example WHERE key = '1' AND key2 > '2'"
-        )
-        assert (
+        ) == ("SELECT * FROM example WHERE key = :key_1 AND key2 > :key2_1", {"key_1": 1, "key2_1": 2})
+        assert compile_query(
             sql_data_node._get_read_query(
                 [("key", 1, Operator.EQUAL), ("key2", 2, Operator.GREATER_THAN)], JoinOperator.OR
             )
-            == "SELECT * FROM example WHERE key = '1' OR key2 > '2'"
+        ) == ("SELECT * FROM example WHERE key = :key_1 OR key2 > :key2_1", {"key_1": 1, "key2_1": 2})
+        assert compile_query(sql_data_node._get_read_query(limit=10, offset=20, order_by=["key", ("key2", False)])) == (
+            "SELECT * FROM example ORDER BY key ASC, key2 DESC LIMIT :param_1 OFFSET :param_2",
+            {"param_1": 10, "param_2": 20},
+        )
+
+    def test_read_columns(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+
+        assert compile_query(dn._get_read_query(("foo", 1, Operator.EQUAL), columns=["bar", "foo"])) == (
+            "SELECT bar, foo FROM example WHERE foo = :foo_1",
+            {"foo_1": 1},
         )
+        assert dn.read(columns=["bar", "foo"]).equals(pd.DataFrame({"bar": [2, 4], "foo": [1, 3]}))
+
+    def test_read_chunks(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+
+        chunks = list(dn.read_chunks(chunksize=1))
+        assert [chunk.to_dict(orient="records") for chunk in chunks] == [[{"foo": 1, "bar": 2}], [{"foo": 3, "bar": 4}]]
+        chunks = list(dn.read_chunks(chunksize=10, columns=["bar"], operators=("foo", 1, Operator.GREATER_THAN)))
+        assert [chunk.to_dict(orient="records") for chunk in chunks] == [[{"bar": 4}]]
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties={**properties, "exposed_type": "numpy"})
+        assert np.array_equal(np.concatenate(list(dn.read_chunks(chunksize=1))), np.array([[1, 2], [3, 4]]))
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties={**properties, "exposed_type": MyCustomObject})
+        chunks = list(dn.read_chunks(chunksize=1))
+        assert [(row.foo, row.bar) for chunk in chunks for row in chunk] == [(1, 2), (3, 4)]
+
+    def test_read_arrow(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+            "exposed_type": "arrow",
+        }
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+
+        table = dn.read()
+        assert isinstance(table, pa.Table)
+        assert table.to_pylist() == [{"foo": 1, "bar": 2}, {"foo": 3, "bar": 4}]
+        assert dn.read(columns=["bar"]).to_pylist() == [{"bar": 2}, {"bar": 4}]
+        assert dn.filter(("foo", 1, Operator.GREATER_THAN)).to_pylist() == [{"foo": 3, "bar": 4}]
+        chunks = list(dn.read_chunks(chunksize=1))
+        assert [chunk.to_pylist() for chunk in chunks] == [[{"foo": 1, "bar": 2}], [{"foo": 3, "bar": 4}]]
+
+    def test_read_page_and_count(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+
+        assert dn.read(limit=1, order_by="foo").to_dict(orient="records") == [{"foo": 1, "bar": 2}]
+        assert dn.read(limit=1, offset=1, order_by="foo").to_dict(orient="records") == [{"foo": 3, "bar": 4}]
+        assert dn.read(limit=1, order_by=("foo", False)).to_dict(orient="records") == [{"foo": 3, "bar": 4}]
+        assert dn.read(columns=["bar"], limit=1, order_by="foo").to_dict(orient="records") == [{"bar": 2}]
+        assert dn.count() == 2
+        assert dn.count(("foo", 1, Operator.GREATER_THAN)) == 1
+        assert dn.count([("foo", 1, Operator.EQUAL), ("foo", 3, Operator.EQUAL)], JoinOperator.OR) == 2
+
+        # Paged reads do not load the whole table.
+        with patch.object(SQLTableDataNode, "_read") as read_mock:
+            dn.read(limit=1, offset=1, order_by="foo")
+            assert read_mock.call_count == 0
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties={**properties, "exposed_type": "numpy"})
+        assert np.array_equal(dn.read(limit=1, offset=1, order_by="foo"), np.array([[3, 4]]))
 
     @pytest.mark.parametrize("sql_properties", __sql_properties)
     def test_read_numpy(self, sql_properties):
@@ -280,6 +280,66 @@ class TestSQLDataNode:
         with pytest.raises(MissingAppendQueryBuilder):
             dn.append(pd.DataFrame([{"foo": 1, "bar": 2}, {"foo": 3, "bar": 4}]))
 
+    def test_read_page_and_count(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "read_query": "SELECT * FROM example WHERE foo > 0;",
+            "write_query_builder": my_write_query_builder_with_pandas,
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+        dn = SQLDataNode("foo", Scope.SCENARIO, properties=properties)
+
+        assert dn.read(limit=1, offset=1, order_by="foo").to_dict(orient="records") == [{"foo": 3, "bar": 4}]
+        assert dn.read(limit=1, order_by=("bar", False)).to_dict(orient="records") == [{"foo": 3, "bar": 4}]
+        assert dn.count() == 2
+        assert dn.count(("bar", 2, Operator.NOT_EQUAL)) == 1
+        assert dn.filter(("foo", None, Operator.EQUAL)).empty
+
+    def test_mssql_read_query_with_order_by_is_not_wrapped(self):
+        properties = {
+            "db_engine": "mssql",
+            "db_username": "sa",
+            "db_password": "Passw0rd",
+            "db_name": "taipy",
+            "read_query": "SELECT * FROM example ORDER BY foo;",
+            "write_query_builder": my_write_query_builder_with_pandas,
+        }
+        dn = SQLDataNode("foo", Scope.SCENARIO, properties=properties)
+        assert not dn._can_wrap_base_read_query()
+
+        dn.properties["read_query"] = "SELECT * FROM example ORDER BY foo OFFSET 0 ROWS"
+        assert dn._can_wrap_base_read_query()
+        dn.properties["read_query"] = "SELECT * FROM example"
+        assert dn._can_wrap_base_read_query()
+        dn.properties["db_engine"] = "postgresql"
+        dn.properties["read_query"] = "SELECT * FROM example ORDER BY foo"
+        assert dn._can_wrap_base_read_query()
+
+    def test_read_page_and_count_in_memory_when_read_query_cannot_be_wrapped(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "read_query": "SELECT * FROM example WHERE foo > 0 ORDER BY foo DESC",
+            "write_query_builder": my_write_query_builder_with_pandas,
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+        dn = SQLDataNode("foo", Scope.SCENARIO, properties=properties)
+
+        with patch.object(SQLDataNode, "_can_wrap_base_read_query", return_value=False):
+            with patch.object(SQLDataNode, "_get_base_read_from_clause") as mck_from_clause:
+                assert dn.read(limit=1, offset=1, order_by="foo").to_dict(orient="records") == [{"foo": 3, "bar": 4}]
+                assert dn.read(limit=1).to_dict(orient="records") == [{"foo": 3, "bar": 4}]
+                assert dn.read(columns=["bar"], order_by=("bar", False))["bar"].tolist() == [4, 2]
+                assert dn.count() == 2
+                assert dn.count(("bar", 2, Operator.NOT_EQUAL)) == 1
+                assert dn.filter(("foo", 1, Operator.EQUAL)).to_dict(orient="records") == [{"foo": 1, "bar": 2}]
+                mck_from_clause.assert_not_called()
+
     def test_filter_pandas_exposed_type(self, tmp_sqlite_sqlite3_file_path):
         folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
         properties = {
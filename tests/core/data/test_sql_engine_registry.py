@@ -0,0 +1,88 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import multiprocessing
+import os
+
+import pandas as pd
+import pytest
+
+from taipy.common.config.common.scope import Scope
+from taipy.core.data._sql_engine_registry import _SQLEngineRegistry
+from taipy.core.data.sql_table import SQLTableDataNode
+
+
+@pytest.fixture(autouse=True)
+def clear_engine_registry():
+    _SQLEngineRegistry._clear()
+    yield
+    _SQLEngineRegistry._clear()
+
+
+@pytest.fixture
+def sqlite_properties(tmp_sqlite_sqlite3_file_path):
+    folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+    return {
+        "db_engine": "sqlite",
+        "table_name": "example",
+        "db_name": db_name,
+        "sqlite_folder_path": folder_path,
+        "sqlite_file_extension": file_extension,
+    }
+
+
+def test_engine_is_shared_by_data_nodes_of_the_same_database(sqlite_properties):
+    dn_1 = SQLTableDataNode("dn_1", Scope.SCENARIO, properties=sqlite_properties)
+    dn_2 = SQLTableDataNode("dn_2", Scope.SCENARIO, properties=sqlite_properties)
+    assert dn_1._get_engine() is dn_2._get_engine()
+
+    dn_3 = SQLTableDataNode("dn_3", Scope.SCENARIO, properties={**sqlite_properties, "db_pool_size": 2})
+    assert dn_3._get_engine() is not dn_1._get_engine()
+    assert dn_3._get_engine().pool.size() == 2
+
+    dn_4 = SQLTableDataNode("dn_4", Scope.SCENARIO, properties={**sqlite_properties, "db_max_overflow": 3})
+    assert dn_4._get_engine() is not dn_1._get_engine()
+    assert dn_4._get_engine() is not dn_3._get_engine()
+    assert dn_4._get_engine().pool._max_overflow == 3
+
+
+def test_pool_statistics(sqlite_properties):
+    dn = SQLTableDataNode("dn", Scope.SCENARIO, properties={**sqlite_properties, "db_pool_size": 2})
+    pd.testing.assert_frame_equal(dn.read(), pd.DataFrame({"foo": [1, 3], "bar": [2, 4]}))
+
+    statistics = _SQLEngineRegistry._get_statistics()
+    assert statistics == {str(dn._get_engine().url): {"size": 2, "checked_in": 1, "checked_out": 0, "overflow": -1}}
+
+
+def _read_in_child_process(dn, queue):
+    engine = dn._get_engine()
+    checked_in_before_read = engine.pool.checkedin()
+    queue.put((checked_in_before_read, dn.read().to_dict(orient="records")))
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is not available on this platform")
+def test_pool_is_reset_in_forked_process(sqlite_properties):
+    dn = SQLTableDataNode("dn", Scope.SCENARIO, properties=sqlite_properties)
+    dn.read()
+    assert dn._get_engine().pool.checkedin() == 1
+
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    process = context.Process(target=_read_in_child_process, args=(dn, queue))
+    process.start()
+    checked_in_before_read, data = queue.get(timeout=30)
+    process.join()
+
+    # The child process does not reuse the connection opened by its parent.
+    assert checked_in_before_read == 0
+    assert data == [{"foo": 1, "bar": 2}, {"foo": 3, "bar": 4}]
+    assert dn._get_engine().pool.checkedin() == 1
+    pd.testing.assert_frame_equal(dn.read(), pd.DataFrame({"foo": [1, 3], "bar": [2, 4]}))
@@ -15,6 +15,7 @@ import pathlib
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 from pandas.testing import assert_frame_equal
 
@@ -113,6 +114,24 @@ def test_write_with_header_custom_exposed_type(tmp_csv_file):
     assert csv_dn.read() == []
 
 
+def test_write_chunks(tmp_csv_file):
+    csv_dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": tmp_csv_file})
+    df = pd.DataFrame({"a": range(10), "b": range(10, 20)})
+
+    csv_dn.write_chunks(df.iloc[start : start + 4] for start in range(0, 10, 4))
+    assert_frame_equal(csv_dn.read(), df)
+    assert len(csv_dn.edits) == 1
+
+    csv_dn.write_chunks([])
+    assert_frame_equal(csv_dn.read(), df)
+    assert len(csv_dn.edits) == 1
+
+    csv_dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": tmp_csv_file, "exposed_type": MyCustomObject})
+    data = [MyCustomObject(0, 1, "hi"), MyCustomObject(1, 2, "world"), MyCustomObject(2, 3, "text")]
+    csv_dn.write_chunks([data[:2], data[2:]])
+    assert all(actual == expected for actual, expected in zip(csv_dn.read(), data))
+
+
 def test_write_without_header_pandas(tmp_csv_file):
     csv_dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": tmp_csv_file, "has_header": False})
 
@@ -188,3 +207,17 @@ def test_write_with_column_names(tmp_csv_file):
     csv_dn.write_with_column_names(data, columns)
     df = pd.DataFrame(data, columns=columns)
     assert pd.DataFrame.equals(df, csv_dn.read())
+
+
+def test_write_arrow(tmp_csv_file):
+    dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": tmp_csv_file, "exposed_type": "arrow"})
+    table = pa.table({"a": [1, 2], "b": ["x", "y"]})
+    dn.write(table)
+    assert dn.read().equals(table)
+    assert pd.read_csv(tmp_csv_file).equals(table.to_pandas())
+
+    dn.append(pa.table({"a": [3], "b": ["z"]}))
+    assert dn.read().equals(pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]}))
+
+    dn.write(pd.DataFrame({"a": [4]}))
+    assert dn.read().equals(pa.table({"a": [4]}))
@@ -12,9 +12,12 @@
 import os
 import pathlib
 from importlib import util
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from pandas.testing import assert_frame_equal
 
@@ -122,6 +125,57 @@ class TestWriteParquetDataNode:
         parquet_dn.write(None)
         assert parquet_dn.read() == []
 
+    def test_write_chunks(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        parquet_dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+        df = pd.DataFrame({"a": range(10), "b": [str(i) for i in range(10)]})
+
+        parquet_dn.write_chunks(df.iloc[start : start + 4] for start in range(0, 10, 4))
+
+        assert_frame_equal(parquet_dn.read(), df)
+        assert pq.ParquetFile(temp_file_path).num_row_groups == 3
+        assert len(parquet_dn.edits) == 1
+
+    def test_write_chunks_evolves_the_schema(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        parquet_dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+        chunks = [
+            pd.DataFrame({"a": [1, 2]}),
+            pd.DataFrame({"a": [None, None]}),
+            pd.DataFrame({"a": [3.5], "b": ["x"]}),
+            pd.DataFrame({"a": [4]}),
+        ]
+
+        parquet_dn.write_chunks(chunks)
+
+        expected = pd.DataFrame({"a": [1.0, 2.0, None, None, 3.5, 4.0], "b": [None, None, None, None, "x", None]})
+        assert_frame_equal(parquet_dn.read(), expected)
+        assert pq.ParquetFile(temp_file_path).num_row_groups == 4
+        assert not [path for path in os.listdir(os.path.dirname(temp_file_path)) if path != "temp.parquet"]
+
+    def test_write_chunks_with_incompatible_schemas(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        parquet_dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+
+        with pytest.raises(ValueError, match="not compatible with the schema of the previous chunks"):
+            parquet_dn.write_chunks([pd.DataFrame({"a": [1]}), pd.DataFrame({"a": ["x"]})])
+
+    def test_write_arrow(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        parquet_dn = ParquetDataNode(
+            "foo", Scope.SCENARIO, properties={"path": temp_file_path, "exposed_type": "arrow"}
+        )
+        table = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+        with patch("pandas.DataFrame.to_parquet") as mck_to_parquet:
+            parquet_dn.write(table)
+            mck_to_parquet.assert_not_called()
+        assert pq.read_table(temp_file_path).equals(table)
+        assert parquet_dn.read().equals(table)
+
+        parquet_dn.append(pa.table({"a": [4], "b": ["w"]}))
+        assert parquet_dn.read().column("a").to_pylist() == [1, 2, 3, 4]
+
     @pytest.mark.parametrize("engine", __engine)
     def test_write_kwarg_precedence(self, engine, tmpdir_factory, default_data_frame):
         # Precedence:
@@ -217,6 +271,29 @@ class TestWriteParquetDataNode:
             check_categorical=False,
         )
 
+    def test_write_and_append_partitioned_dataset(self, tmpdir_factory):
+        temp_dir_path = pathlib.Path(tmpdir_factory.mktemp("data").join("temp_dir"))
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": str(temp_dir_path), "partition_cols": ["day"]})
+        dn.write(pd.DataFrame({"day": ["d1", "d2"], "value": [1, 2]}))
+        dn.write(pd.DataFrame({"day": ["d1", "d2"], "value": [3, 4]}))
+        files = {path: path.stat().st_mtime_ns for path in temp_dir_path.rglob("*.parquet")}
+        assert {path.parent.name for path in files} == {"day=d1", "day=d2"}
+        assert len(files) == 2
+
+        dn.append(pd.DataFrame({"day": ["d2", "d3"], "value": [5, 6]}))
+        # The existing files are left untouched, the appended rows are written as new files in their partitions
+        new_files = set(temp_dir_path.rglob("*.parquet")) - set(files)
+        assert {path.parent.name for path in new_files} == {"day=d2", "day=d3"}
+        assert all(path.stat().st_mtime_ns == mtime for path, mtime in files.items())
+
+        df = dn.read().sort_values("value", ignore_index=True)
+        assert df["value"].tolist() == [3, 4, 5, 6]
+        assert df["day"].astype(str).tolist() == ["d1", "d2", "d2", "d3"]
+
+        dn.write_chunks([pd.DataFrame({"day": ["d1"], "value": [7]}), pd.DataFrame({"day": ["d4"], "value": [8]})])
+        assert {path.parent.name for path in temp_dir_path.rglob("*.parquet")} == {"day=d1", "day=d4"}
+        assert sorted(dn.read()["value"].tolist()) == [7, 8]
+
     @pytest.mark.skipif(not util.find_spec("fastparquet"), reason="Append parquet requires fastparquet to be installed")
     @pytest.mark.parametrize(
         "content",
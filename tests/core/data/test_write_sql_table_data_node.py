@@ -9,13 +9,18 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import os
+import sqlite3
 from importlib import util
 from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 from pandas.testing import assert_frame_equal
+from sqlalchemy import Table
+from sqlalchemy.engine import Connection
 
 from taipy.common.config.common.scope import Scope
 from taipy.core.data.sql_table import SQLTableDataNode
@@ -187,3 +192,109 @@ class TestWriteSQLTableDataNode:
         append_data_1 = pd.DataFrame([{"foo": 5, "bar": 6}, {"foo": 7, "bar": 8}])
         dn.append(append_data_1)
         assert_frame_equal(dn.read(), pd.concat([original_data, append_data_1]).reset_index(drop=True))
+
+    def test_sqlite_write_in_batches(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+            "insert_batch_size": 2,
+        }
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+        data = pd.DataFrame({"foo": range(5), "bar": range(5, 10)})
+
+        with patch.object(
+            Connection, "exec_driver_sql", autospec=True, side_effect=Connection.exec_driver_sql
+        ) as mck_exec_driver_sql:
+            dn.write(data)
+            dn.write(pa.Table.from_pandas(data))
+            inserts = [call.args[2] for call in mck_exec_driver_sql.call_args_list if "INSERT" in call.args[1]]
+            assert [len(rows) for rows in inserts] == [2, 2, 1, 2, 2, 1]
+        assert_frame_equal(dn.read(), data)
+
+    def test_sqlite_reflected_table_is_cached(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+
+        with patch("taipy.core.data.sql_table.Table", wraps=Table) as mck_table:
+            SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties).write(pd.DataFrame({"foo": [1]}))
+            SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties).append(pd.DataFrame({"foo": [2]}))
+            assert mck_table.call_count == 1
+
+            with sqlite3.connect(os.path.join(folder_path, f"{db_name}{file_extension}")) as connection:
+                connection.execute("ALTER TABLE example ADD COLUMN baz int")
+            dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+            data = pd.DataFrame({"foo": [3], "bar": [4], "baz": [5]})
+            # The table is reflected again when the data has new columns.
+            dn.write(data)
+            assert mck_table.call_count == 2
+
+            # The table is reflected again once expired, since it may have been altered by another process.
+            with patch.object(SQLTableDataNode, "_SQLTableDataNode__REFLECTED_TABLE_TTL", 0):
+                dn.write(data)
+            assert mck_table.call_count == 3
+            dn._invalidate_reflected_table()
+            dn.write(data)
+            assert mck_table.call_count == 4
+        assert_frame_equal(dn.read(), data)
+
+    def test_format_copy_value(self):
+        format_copy_value = SQLTableDataNode._SQLTableDataNode__format_copy_value
+        assert [format_copy_value(value) for value in [None, pd.NaT, pd.NA]] == ["\\N"] * 3
+        assert format_copy_value(b"\x00ab") == "\\\\x006162"
+        assert format_copy_value(memoryview(b"a")) == "\\\\x61"
+        assert format_copy_value("a\tb\\c\nd") == "a\\tb\\\\c\\nd"
+        assert format_copy_value(pd.Timestamp("2024-01-02 03:04:05")) == "2024-01-02 03:04:05"
+        assert format_copy_value(1.5) == "1.5"
+
+    def test_sqlite_write_arrow(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+            "exposed_type": "arrow",
+        }
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+
+        table = pa.table({"foo": [5, 7], "bar": [6, 8]})
+        dn.write(table)
+        assert dn.read().equals(table)
+
+        dn.append(pa.table({"foo": [9], "bar": [10]}))
+        assert dn.read().to_pylist() == [{"foo": 5, "bar": 6}, {"foo": 7, "bar": 8}, {"foo": 9, "bar": 10}]
+
+    def test_sqlite_write_chunks(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+        chunks = [pd.DataFrame([{"foo": 5, "bar": 6}]), pd.DataFrame([{"foo": 7, "bar": 8}, {"foo": 9, "bar": 10}])]
+
+        dn.write_chunks(iter(chunks))
+        assert_frame_equal(dn.read(), pd.concat(chunks).reset_index(drop=True))
+
+        def failing_chunks():
+            yield pd.DataFrame([{"foo": 0, "bar": 0}])
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            dn.write_chunks(failing_chunks())
+        # The chunks are written in a single transaction, rolled back on failure.
+        assert_frame_equal(dn.read(), pd.concat(chunks).reset_index(drop=True))
@@ -10,10 +10,11 @@
 # specific language governing permissions and limitations under the License.
 
 import multiprocessing
+import os
 import random
 import string
 from functools import partial
-from time import sleep
+from time import sleep, time_ns
 from typing import cast
 from unittest import mock
 
@@ -29,6 +30,7 @@ from taipy.core.data._data_manager_factory import _DataManagerFactory
 from taipy.core.data.in_memory import InMemoryDataNode
 from taipy.core.exceptions.exceptions import JobNotDeletedException
 from taipy.core.job._job_manager import _JobManager
+from taipy.core.job.job import Job
 from taipy.core.job.job_id import JobId
 from taipy.core.job.status import Status
 from taipy.core.scenario.scenario import Scenario
@@ -109,6 +111,47 @@ def test_get_latest_job():
     assert _JobManager._get_latest(task_2).id == job_2.id
 
 
+def test_get_latest_job_is_indexed():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+
+    task = _create_task(multiply, name="get_latest_job_indexed")
+    # No other process changes the job repository.
+    with mock.patch.object(_JobManager._repository, "_get_change_marker", return_value=1):
+        job_1 = _OrchestratorFactory._orchestrator.submit_task(task).jobs[0]
+        assert _JobManager._get_latest(task) == job_1
+
+        with mock.patch.object(_JobManager, "_get_all", wraps=_JobManager._get_all) as get_all:
+            sleep(0.01)  # Comparison is based on time, precision on Windows is not enough important
+            job_2 = _OrchestratorFactory._orchestrator.submit_task(task).jobs[0]
+            assert _JobManager._get_latest(task) == job_2
+            _JobManager._delete(job_1)
+            assert _JobManager._get_latest(task) == job_2
+            assert get_all.call_count == 0
+
+            _JobManager._delete(job_2)
+            assert _JobManager._get_latest(task) is None
+            assert get_all.call_count == 1
+
+
+def test_get_latest_job_created_by_another_process():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+
+    task = _create_task(multiply, name="get_latest_job_other_process")
+    job_1 = _OrchestratorFactory._orchestrator.submit_task(task).jobs[0]
+    jobs_dir = _JobManager._repository.dir_path
+    past_ns = time_ns() - 60_000_000_000
+    os.utime(jobs_dir, ns=(past_ns, past_ns))
+    assert _JobManager._get_latest(task) == job_1
+
+    # Another process saves a job of the same task.
+    sleep(0.01)  # Comparison is based on time, precision on Windows is not enough important
+    job_2 = Job(JobId("JOB_other_process"), task, "submit_id", task.id, version=job_1.version)
+    _JobManager._repository._save(job_2)
+    os.utime(jobs_dir, ns=(past_ns + 1_000_000_000, past_ns + 1_000_000_000))
+
+    assert _JobManager._get_latest(task) == job_2
+
+
 def test_get_job_unknown():
     assert _JobManager._get(JobId("Unknown")) is None
 
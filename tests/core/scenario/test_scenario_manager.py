@@ -9,6 +9,8 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import os
+import time
 from datetime import datetime, timedelta
 from typing import Callable, Iterable, Optional
 from unittest.mock import ANY, patch
@@ -33,6 +35,7 @@ from taipy.core.exceptions.exceptions import (
     DeletingPrimaryScenario,
     DifferentScenarioConfigs,
     InsufficientScenarioToCompare,
+    InvalidScenario,
     NonExistingComparator,
     NonExistingScenario,
     NonExistingScenarioConfig,
@@ -252,7 +255,9 @@ def test_get_all_on_multiple_versions_environment():
     for version in range(1, 3):
         for i in range(5):
             _ScenarioManager._set(
-                Scenario(f"config_id_{i+version}", [], {}, [], ScenarioId(f"id{i}_v{version}"), version=f"{version}.0")
+                Scenario(
+                    f"config_id_{i + version}", [], {}, [], ScenarioId(f"id{i}_v{version}"), version=f"{version}.0"
+                )
             )
 
     _VersionManager._set_experiment_version("1.0")
@@ -607,6 +612,112 @@ def test_scenario_manager_only_creates_data_node_once():
     assert len(_ScenarioManager._get_all()) == 2
 
 
+def test_bulk_create_scenarios():
+    dn_config_1 = Config.configure_data_node("foo", "in_memory", Scope.GLOBAL, default_data=1)
+    dn_config_2 = Config.configure_data_node("bar", "in_memory", Scope.CYCLE, default_data=0)
+    dn_config_6 = Config.configure_data_node("baz", "in_memory", Scope.CYCLE, default_data=0)
+    dn_config_4 = Config.configure_data_node("qux", "in_memory", Scope.SCENARIO, default_data=0)
+    dn_config_5 = Config.configure_data_node("quux", "in_memory", Scope.SCENARIO, default_data=5)
+    task_mult_by_2_config = Config.configure_task("mult_by_2", mult_by_2, [dn_config_1], dn_config_2)
+    task_mult_by_3_config = Config.configure_task("mult_by_3", mult_by_3, [dn_config_2], dn_config_6)
+    task_mult_by_4_config = Config.configure_task("mult_by_4", mult_by_4, [dn_config_1], dn_config_4)
+    scenario_config = Config.configure_scenario(
+        "awesome_scenario",
+        [task_mult_by_2_config, task_mult_by_3_config, task_mult_by_4_config],
+        [dn_config_5],
+        Frequency.DAILY,
+    )
+    scenario_config.add_sequences(
+        {"by_6": [task_mult_by_2_config, task_mult_by_3_config], "by_4": [task_mult_by_4_config]}
+    )
+    existing_scenario = _ScenarioManager._create(scenario_config)
+
+    scenarios = _ScenarioManager._bulk_create(scenario_config, [None, "second", None])
+
+    assert len(scenarios) == 3
+    assert len(_DataManager._get_all()) == 5 + 2 * 3
+    assert len(_TaskManager._get_all()) == 3 + 3
+    assert len(_SequenceManager._get_all()) == 2 * 4
+    assert len(_ScenarioManager._get_all()) == 4
+    assert len(_CycleManager._get_all()) == 1
+    assert scenarios[1].name == "second"
+    assert not any(scenario.is_primary for scenario in scenarios)
+
+    for scenario in scenarios:
+        loaded = _ScenarioManager._get(scenario.id)
+        assert loaded.cycle == existing_scenario.cycle
+        assert loaded.foo == existing_scenario.foo
+        assert loaded.mult_by_2 == existing_scenario.mult_by_2
+        assert loaded.qux != existing_scenario.qux
+        assert loaded.quux.read() == 5
+        assert loaded.qux.owner_id == scenario.id
+        assert loaded.mult_by_4.owner_id == scenario.id
+        assert loaded.sequences.keys() == {"by_6", "by_4"}
+        assert loaded.by_4._get_sorted_tasks()[0][0] == loaded.mult_by_4
+        assert tp.get_parents(loaded.qux)["scenario"] == {loaded}
+        assert tp.get_parents(loaded.mult_by_4)["sequence"] == {loaded.by_4}
+        assert loaded.id in _TaskManager._get(loaded.mult_by_2.id).parent_ids
+        assert loaded.id in _DataManager._get(loaded.quux.id).parent_ids
+        assert loaded.mult_by_4.id in _DataManager._get(loaded.foo.id).parent_ids
+
+
+def test_bulk_create_scenarios_sets_the_first_one_primary():
+    dn_config = Config.configure_data_node("foo", "in_memory", Scope.SCENARIO)
+    task_config = Config.configure_task("print", print, [dn_config], [])
+    scenario_config = Config.configure_scenario("sc", [task_config], frequency=Frequency.DAILY)
+
+    scenarios = _ScenarioManager._bulk_create(scenario_config, [None, None])
+
+    assert [scenario.is_primary for scenario in scenarios] == [True, False]
+    assert _ScenarioManager._get_primary(scenarios[0].cycle) == scenarios[0]
+
+
+def test_bulk_create_scenarios_publishes_creation_events():
+    dn_config = Config.configure_data_node("foo", "in_memory", Scope.SCENARIO)
+    task_config = Config.configure_task("print", print, [dn_config], [])
+    scenario_config = Config.configure_scenario("sc", [task_config])
+    scenario_config.add_sequences({"seq": [task_config]})
+
+    with patch("taipy.core.scenario._scenario_manager.Notifier.publish") as publish:
+        scenarios = _ScenarioManager._bulk_create(scenario_config, [None, None])
+
+    published = [(event.entity_type.name, event.entity_id) for event in (c.args[0] for c in publish.call_args_list)]
+    expected = []
+    for scenario in scenarios:
+        expected.append(("DATA_NODE", scenario.foo.id))
+        expected.append(("TASK", scenario.print.id))
+        expected.append(("SEQUENCE", scenario.seq.id))
+        expected.append(("SCENARIO", scenario.id))
+    assert published == expected
+
+
+def test_bulk_create_inconsistent_scenarios_saves_nothing():
+    dn_config_1 = Config.configure_data_node("foo", "in_memory", Scope.SCENARIO, default_data=1)
+    dn_config_2 = Config.configure_data_node("bar", "in_memory", Scope.SCENARIO)
+    task_config_1 = Config.configure_task("t_1", print, [dn_config_1], [dn_config_2])
+    task_config_2 = Config.configure_task("t_2", print, [dn_config_2], [dn_config_1])
+    scenario_config = Config.configure_scenario("sc", [task_config_1, task_config_2])
+
+    with patch("taipy.core.scenario._scenario_manager.Notifier.publish") as publish:
+        with pytest.raises(InvalidScenario):
+            _ScenarioManager._bulk_create(scenario_config, [None, None])
+
+    publish.assert_not_called()
+    assert _ScenarioManager._get_all() == []
+    assert _TaskManager._get_all() == []
+    assert _DataManager._get_all() == []
+
+
+def test_bulk_create_scenarios_warns_if_inputs_not_ready(caplog):
+    dn_config = Config.configure_pickle_data_node("wrong_path", default_path="wrong_path.pickle")
+    task_config = Config.configure_task("print", print, [dn_config], [])
+    scenario_config = Config.configure_scenario("sc", [task_config])
+
+    scenarios = _ScenarioManager._bulk_create(scenario_config, [None, None])
+
+    assert f"{scenarios[0].wrong_path.id} cannot be read because it has never been written." in caplog.text
+
+
 def test_notification_subscribe(mocker):
     mocker.patch("taipy.core._entity._reload._Reloader._reload", side_effect=lambda m, o: o)
 
@@ -850,6 +961,63 @@ def test_get_set_primary_scenario():
     assert _ScenarioManager._get_primary(cycle_1) == scenario_2
 
 
+def test_primary_scenario_and_scenarios_of_cycle_are_indexed():
+    scenario_config = Config.configure_scenario("sc", frequency=Frequency.DAILY)
+    # No other process changes the scenario repository.
+    with patch.object(_ScenarioManager._repository, "_get_change_marker", return_value=1):
+        scenario_1 = _ScenarioManager._create(scenario_config)
+
+        with patch.object(_ScenarioManager, "_get_all_by_cycle", wraps=_ScenarioManager._get_all_by_cycle) as scan:
+            scenario_2 = _ScenarioManager._create(scenario_config)
+            scenario_3 = _ScenarioManager._create(scenario_config)
+            cycle = scenario_1.cycle
+            assert _ScenarioManager._get_primary(cycle) == scenario_1
+            assert not _ScenarioManager._is_deletable(scenario_1)
+
+            _ScenarioManager._set_primary(scenario_2)
+            assert _ScenarioManager._get_primary(cycle) == scenario_2
+            assert not _ScenarioManager._get(scenario_1.id).is_primary
+
+            _ScenarioManager._hard_delete(scenario_1.id)
+            _ScenarioManager._hard_delete(scenario_3.id)
+            assert _ScenarioManager._is_deletable(scenario_2)
+            assert scan.call_count == 0
+
+    _ScenarioManager._hard_delete(scenario_2.id)
+    assert len(_CycleManager._get_all()) == 0
+
+
+def test_get_primary_falls_back_to_the_repository():
+    scenario_config = Config.configure_scenario("sc", frequency=Frequency.DAILY)
+    scenario_1 = _ScenarioManager._create(scenario_config)
+    scenario_2 = _ScenarioManager._create(scenario_config)
+
+    # The primary scenario is changed behind the back of the manager, e.g. by another process.
+    scenario_1._primary_scenario = False
+    scenario_2._primary_scenario = True
+    _ScenarioManager._repository._save(scenario_1)
+    _ScenarioManager._repository._save(scenario_2)
+
+    assert _ScenarioManager._get_primary(scenario_1.cycle) == scenario_2
+
+
+def test_scenarios_of_cycle_created_by_another_process_are_reloaded():
+    scenario_config = Config.configure_scenario("sc", frequency=Frequency.DAILY)
+    scenario_1 = _ScenarioManager._create(scenario_config)
+    scenarios_dir = _ScenarioManager._repository.dir_path
+    past_ns = time.time_ns() - 60_000_000_000
+    os.utime(scenarios_dir, ns=(past_ns, past_ns))
+    assert _ScenarioManager._is_deletable(scenario_1)
+
+    # Another process saves a scenario of the same cycle.
+    scenario_2 = Scenario(scenario_config.id, set(), {}, set(), ScenarioId("SCENARIO_other"), cycle=scenario_1.cycle)
+    _ScenarioManager._repository._save(scenario_2)
+    os.utime(scenarios_dir, ns=(past_ns + 1_000_000_000, past_ns + 1_000_000_000))
+
+    assert not _ScenarioManager._is_deletable(scenario_1)
+    assert not _ScenarioManager._create(scenario_config).is_primary
+
+
 def test_get_primary_scenarios_sorted():
     scenario_1_cfg = Config.configure_scenario(id="scenario_1", frequency=Frequency.DAILY)
     scenario_2_cfg = Config.configure_scenario(id="scenario_2", frequency=Frequency.DAILY)
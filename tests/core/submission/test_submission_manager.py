@@ -117,6 +117,32 @@ def test_get_latest_submission():
     assert submission_manager._get_latest(task_2) == submission_4
 
 
+def test_get_latest_submission_deleted_from_the_repository():
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    submission_1 = submission_manager._create("task_id", "TASK", "task_config")
+    sleep(0.01)  # Comparison is based on time, precision on Windows is not enough important
+    submission_2 = submission_manager._create("task_id", "TASK", "task_config")
+    assert submission_manager._get_latest("task_id") == submission_2
+
+    # The latest submission is deleted behind the back of the manager, e.g. by another process.
+    submission_manager._repository._delete(submission_2.id)
+
+    assert submission_manager._get_latest("task_id") == submission_1
+
+
+def test_get_latest_submission_created_by_another_process():
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    submission_1 = submission_manager._create("task_id", "TASK", "task_config")
+    assert submission_manager._get_latest("task_id") == submission_1
+
+    # Another process saves a submission of the same entity.
+    sleep(0.01)  # Comparison is based on time, precision on Windows is not enough important
+    submission_2 = Submission("task_id", "TASK", "task_config", "SUBMISSION_other_process")
+    submission_manager._repository._save(submission_2)
+
+    assert submission_manager._get_latest("task_id") == submission_2
+
+
 def test_delete_submission():
     submission_manager = _SubmissionManagerFactory._build_manager()
 
@@ -422,18 +422,15 @@ class TestTaipy:
             mck.assert_called_once_with(cycle_id)
 
     def test_get_scenarios(self, cycle):
-        with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._get_all") as mck:
+        with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._get_all_by_criteria") as mck:
             tp.get_scenarios()
-            mck.assert_called_once_with()
-        with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._get_all_by_cycle") as mck:
-            tp.get_scenarios(cycle)
-            mck.assert_called_once_with(cycle)
-        with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._get_all_by_tag") as mck:
-            tp.get_scenarios(tag="tag")
-            mck.assert_called_once_with("tag")
-        with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._filter_by_creation_time") as mck:
-            tp.get_scenarios(created_start_time=datetime.datetime(2021, 1, 1))
-            mck.assert_called_once_with([], datetime.datetime(2021, 1, 1), None)
+            mck.assert_called_once_with(None, None, False, False, None, None, "name", 0, None)
+        with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._get_all_by_criteria") as mck:
+            tp.get_scenarios(cycle, "tag")
+            mck.assert_called_once_with(cycle, "tag", False, False, None, None, "name", 0, None)
+        with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._get_all_by_criteria") as mck:
+            tp.get_scenarios(created_start_time=datetime.datetime(2021, 1, 1), offset=10, limit=5)
+            mck.assert_called_once_with(None, None, False, False, datetime.datetime(2021, 1, 1), None, "name", 10, 5)
 
     def test_get_scenarios_sorted(self):
         scenario_1_cfg = Config.configure_scenario(id="scenario_1")
@@ -482,6 +479,35 @@ class TestTaipy:
             is_sorted=True, descending=True, sort_key="name"
         )
 
+    def test_get_scenarios_paginated(self):
+        scenario_config = Config.configure_scenario(id="sc")
+        now = datetime.datetime.now()
+        scenarios = [
+            _ScenarioManager._create(scenario_config, now + datetime.timedelta(seconds=i), f"scenario_{i}")
+            for i in range(5)
+        ]
+        _ScenarioManager._tag(scenarios[1], "kiwi")
+        _ScenarioManager._tag(scenarios[2], "kiwi")
+        _ScenarioManager._tag(scenarios[4], "kiwi")
+
+        assert tp.get_scenarios(is_sorted=True, sort_key="creation_date", limit=2) == scenarios[:2]
+        assert tp.get_scenarios(is_sorted=True, sort_key="creation_date", offset=2, limit=2) == scenarios[2:4]
+        assert tp.get_scenarios(is_sorted=True, sort_key="creation_date", offset=4, limit=2) == scenarios[4:]
+        assert tp.get_scenarios(is_sorted=True, descending=True, sort_key="name", offset=1) == scenarios[3::-1]
+        assert tp.get_scenarios(tag="kiwi", is_sorted=True, sort_key="name", offset=1, limit=1) == [scenarios[2]]
+        assert tp.get_scenarios(
+            tag="kiwi", created_start_time=now + datetime.timedelta(seconds=2), is_sorted=True, sort_key="name"
+        ) == [scenarios[2], scenarios[4]]
+
+        pages = [tp.get_scenarios(offset=offset, limit=2) for offset in range(0, 6, 2)]
+        assert [scenario for page in pages for scenario in page] == sorted(scenarios, key=lambda x: x.id)
+
+    def test_get_scenarios_with_negative_offset_or_limit(self):
+        with pytest.raises(ValueError):
+            tp.get_scenarios(offset=-1)
+        with pytest.raises(ValueError):
+            tp.get_scenarios(limit=-1)
+
     def test_get_scenario(self, scenario):
         with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._get") as mck:
             scenario_id = ScenarioId("SCENARIO_id")
@@ -503,9 +529,6 @@ class TestTaipy:
         with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._get_primary_scenarios") as mck:
             tp.get_primary_scenarios()
             mck.assert_called_once_with()
-        with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._filter_by_creation_time") as mck:
-            tp.get_scenarios(created_end_time=datetime.datetime(2021, 1, 1))
-            mck.assert_called_once_with([], None, datetime.datetime(2021, 1, 1))
 
     def test_set_primary(self, scenario):
         with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._set_primary") as mck:
@@ -730,6 +753,17 @@ class TestTaipy:
             tp.create_scenario(scenario_config, datetime.datetime(2022, 2, 5), "displayable_name")
             mck.assert_called_once_with(scenario_config, datetime.datetime(2022, 2, 5), "displayable_name")
 
+    def test_create_scenarios(self):
+        scenario_config = ScenarioConfig("scenario_config")
+        with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._bulk_create") as mck:
+            with mock.patch("taipy.core.orchestrator.Orchestrator._manage_version_and_block_config") as mv_mock:
+                tp.create_scenarios(scenario_config, 3)
+                mck.assert_called_once_with(scenario_config, [None, None, None], None)
+                mv_mock.assert_called_once()
+        with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._bulk_create") as mck:
+            tp.create_scenarios(scenario_config, ["a", "b"], datetime.datetime(2022, 2, 5))
+            mck.assert_called_once_with(scenario_config, ["a", "b"], datetime.datetime(2022, 2, 5))
+
     def test_get_parents(self):
         def assert_result_parents_and_expected_parents(parents, expected_parents):
             for key, items in expected_parents.items():
@@ -0,0 +1,63 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from unittest import mock
+
+import pyarrow as pa
+
+from taipy.gui import Gui
+from taipy.gui.data.arrow_data_accessor import _ArrowDataAccessor
+from taipy.gui.data.data_format import _DataFormat
+from taipy.gui.data.pandas_data_accessor import _PandasDataAccessor
+
+
+def test_simple_data(gui: Gui, helpers, small_dataframe):
+    accessor = _ArrowDataAccessor(gui)
+    table = pa.Table.from_pydict(small_dataframe)
+    ret_data = accessor.get_data("x", table, {"start": 0, "end": -1}, _DataFormat.JSON)
+    value = ret_data["value"]
+    assert value["rowcount"] == 3
+    assert [row["name"] for row in value["data"]] == ["A", "B", "C"]
+
+
+def test_only_the_page_is_converted(gui: Gui, helpers, small_dataframe):
+    accessor = _ArrowDataAccessor(gui)
+    table = pa.concat_tables([pa.Table.from_pydict(small_dataframe)] * 100)
+    with mock.patch.object(
+        _PandasDataAccessor, "get_data", autospec=True, side_effect=_PandasDataAccessor.get_data
+    ) as mck_get_data:
+        value = accessor.get_data("x", table, {"start": 10, "end": 14}, _DataFormat.JSON)["value"]
+        assert len(mck_get_data.call_args.args[2]) == 5
+    assert value["rowcount"] == 300
+    assert value["start"] == 10
+    assert [row["_tp_index"] for row in value["data"]] == [10, 11, 12, 13, 14]
+    assert [row["name"] for row in value["data"]] == ["B", "C", "A", "B", "C"]
+
+
+def test_sort(gui: Gui, helpers, small_dataframe):
+    accessor = _ArrowDataAccessor(gui)
+    table = pa.Table.from_pydict(small_dataframe)
+    query = {"columns": ["name", "value"], "start": 0, "end": -1, "orderby": "name", "sort": "desc"}
+    data = accessor.get_data("x", table, query, _DataFormat.JSON)["value"]["data"]
+    assert data[0]["name"] == "C"
+
+
+def test_col_types(gui: Gui, small_dataframe):
+    accessor = _ArrowDataAccessor(gui)
+    assert accessor.get_col_types("x", pa.Table.from_pydict(small_dataframe)) == {"name": "object", "value": "int64"}
+
+
+def test_edit(gui, small_dataframe):
+    accessor = _ArrowDataAccessor(gui)
+    table = pa.Table.from_pydict(small_dataframe)
+    ret_data = accessor.on_edit(table, {"index": 0, "col": "value", "value": 10})
+    assert isinstance(ret_data, pa.Table)
+    assert ret_data.column("value").to_pylist() == [10, 2, 3]
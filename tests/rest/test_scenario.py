@@ -74,6 +74,23 @@ def test_get_all_scenarios(client, default_sequence, default_scenario_config_lis
     assert len(results) == 10
 
 
+def test_get_scenarios_paginated(client, default_sequence, default_scenario_config_list):
+    for ds in range(10):
+        with mock.patch("taipy.rest.api.resources.scenario.ScenarioList.fetch_config") as config_mock:
+            config_mock.return_value = default_scenario_config_list[ds]
+            scenarios_url = url_for("api.scenarios", config_id=config_mock.name)
+            client.post(scenarios_url)
+
+    all_ids = sorted(scenario["id"] for scenario in client.get(url_for("api.scenarios")).get_json())
+    first_page = client.get(url_for("api.scenarios", limit=4)).get_json()
+    last_page = client.get(url_for("api.scenarios", offset=8, limit=4)).get_json()
+
+    assert [scenario["id"] for scenario in first_page] == all_ids[:4]
+    assert [scenario["id"] for scenario in last_page] == all_ids[8:]
+    assert client.get(url_for("api.scenarios", offset=-1)).status_code == 400
+    assert client.get(url_for("api.scenarios", limit=-1)).status_code == 400
+
+
 def test_execute_scenario(client, default_scenario_config):
     # test 404
     user_url = url_for("api.scenario_submit", scenario_id="foo")
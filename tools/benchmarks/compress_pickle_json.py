@@ -0,0 +1,85 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Measure the file size and the write and read times of the compressed pickle and JSON data nodes.
+
+The data is written and read with each compression algorithm:
+- a pandas DataFrame of 5 million rows by the pickle data nodes, with and without out-of-band buffers;
+- a list of 500 thousand records by the JSON data nodes.
+
+The algorithms whose package is not installed are skipped. Run the script on two revisions to compare them:
+
+    python tools/benchmarks/compress_pickle_json.py --rows 5000000 --records 500000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from importlib import util
+
+import numpy as np
+import pandas as pd
+
+from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data.json import JSONDataNode
+from taipy.core.data.pickle import PickleDataNode
+
+_PACKAGES = {"zstd": "zstandard", "lz4": "lz4"}
+
+
+def _measure(label: str, dn, data):
+    _DataManagerFactory._build_manager()._set(dn)
+    start = time.perf_counter()
+    dn._write(data)
+    write_time = time.perf_counter() - start
+    start = time.perf_counter()
+    dn._read()
+    read_time = time.perf_counter() - start
+    size = os.path.getsize(dn._path) / 2**20
+    print(f"{label:24}: {size:7.1f} MB, write {write_time:.2f}s, read {read_time:.2f}s")  # noqa: T201
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the compressed pickle and JSON data nodes.")
+    parser.add_argument("--rows", type=int, default=5_000_000, help="Number of rows of the pickled DataFrame.")
+    parser.add_argument("--records", type=int, default=500_000, help="Number of records of the JSON list.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "id": np.arange(args.rows),
+            "cat": rng.integers(0, 100, args.rows),
+            "value": rng.random(args.rows).round(3),
+        }
+    )
+    records = df.head(args.records).to_dict("records")
+    algorithms = [None, *(a for a in ["lz4", "zstd", "gzip"] if util.find_spec(_PACKAGES.get(a, a)))]
+
+    with tempfile.TemporaryDirectory() as folder:
+        Config.configure_core(taipy_storage_folder=os.path.join(folder, ".taipy"))
+        for out_of_band in [False, True]:
+            properties = {"path": os.path.join(folder, f"{out_of_band}.p"), "out_of_band": out_of_band}
+            dn = PickleDataNode("p", Scope.SCENARIO, properties=properties)
+            _measure(f"pickle out_of_band={out_of_band}", dn, df)
+        for algorithm in algorithms[1:]:
+            properties = {"path": os.path.join(folder, f"{algorithm}.p"), "compression": algorithm}
+            _measure(f"pickle {algorithm}", PickleDataNode("p", Scope.SCENARIO, properties=properties), df)
+        for algorithm in algorithms:
+            properties = {"path": os.path.join(folder, f"{algorithm}.json"), "compression": algorithm}
+            _measure(f"json {algorithm}", JSONDataNode("j", Scope.SCENARIO, properties=properties), records)
+
+
+if __name__ == "__main__":
+    main()
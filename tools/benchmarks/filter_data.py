@@ -0,0 +1,64 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Measure the in-memory filter of the data nodes.
+
+The data is filtered with two conditions joined with AND, then with OR:
+- a pandas DataFrame of 10 million rows;
+- a list of 1 million objects.
+
+Run the script on two revisions to compare them:
+
+    python tools/benchmarks/filter_data.py --rows 10000000 --objects 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from taipy.core.data._filter import _FilterDataNode
+from taipy.core.data.operator import JoinOperator, Operator
+
+
+class _Row:
+    def __init__(self, foo, bar):
+        self.foo = foo
+        self.bar = bar
+
+
+def _measure(label: str, data, operators, join_operator: JoinOperator):
+    start = time.perf_counter()
+    result = _FilterDataNode._filter(data, operators, join_operator)
+    print(f"{label} {join_operator.name}: {time.perf_counter() - start:.2f}s ({len(result)} rows)")  # noqa: T201
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the in-memory filter of the data nodes.")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="Number of rows of the DataFrame.")
+    parser.add_argument("--objects", type=int, default=1_000_000, help="Number of objects of the list.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    operators = [("foo", 50, Operator.GREATER_THAN), ("bar", 0.5, Operator.LESS_THAN)]
+
+    df = pd.DataFrame({"foo": rng.integers(0, 100, args.rows), "bar": rng.random(args.rows)})
+    for join_operator in [JoinOperator.AND, JoinOperator.OR]:
+        _measure(f"DataFrame of {args.rows} rows", df, operators, join_operator)
+
+    objects = [_Row(foo, bar) for foo, bar in zip(df["foo"].head(args.objects), df["bar"].head(args.objects))]
+    for join_operator in [JoinOperator.AND, JoinOperator.OR]:
+        _measure(f"List of {len(objects)} objects", objects, operators, join_operator)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Measure the writes of a SQL table data node to a SQLite file.
+
+A DataFrame of (int, float, str) rows is written twice to the table, so that the second write overwrites
+the rows of the first one, then a thousand rows are appended.
+
+Run the script on two revisions to compare them:
+
+    python tools/benchmarks/write_sql_table.py --rows 1000000
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data.sql_table import SQLTableDataNode
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the writes of a SQL table data node to a SQLite file.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of rows written.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        Config.configure_core(taipy_storage_folder=os.path.join(folder, ".taipy"))
+        with sqlite3.connect(os.path.join(folder, "benchmark.db")) as connection:
+            connection.execute("CREATE TABLE example (a INTEGER, b REAL, c TEXT)")
+        properties = {
+            "db_engine": "sqlite",
+            "db_name": "benchmark",
+            "sqlite_folder_path": folder,
+            "table_name": "example",
+        }
+        dn = SQLTableDataNode("benchmark", Scope.SCENARIO, properties=properties)
+        _DataManagerFactory._build_manager()._set(dn)
+
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {"a": np.arange(args.rows), "b": rng.random(args.rows), "c": [f"s{i}" for i in range(args.rows)]}
+        )
+        for label in ["write", "overwrite"]:
+            start = time.perf_counter()
+            dn.write(df)
+            print(f"{label} {args.rows} rows: {time.perf_counter() - start:.2f}s")  # noqa: T201
+        start = time.perf_counter()
+        dn.append(df.head(1000))
+        print(f"append 1000 rows: {time.perf_counter() - start:.3f}s")  # noqa: T201
+        assert len(dn.read()) == args.rows + 1000
+
+
+if __name__ == "__main__":
+    main()